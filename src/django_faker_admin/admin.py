@@ -0,0 +1,231 @@
+from django.urls import path, reverse
+from django.http import HttpResponse, HttpResponseRedirect
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.shortcuts import get_object_or_404
+from django.utils.translation import gettext_lazy, ngettext
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import require_POST
+
+from django_faker_admin.conf import settings
+from django_faker_admin.models import PopulationJob, PopulationRun
+
+
+@admin.register(PopulationRun)
+class PopulationRunAdmin(admin.ModelAdmin):
+    """
+    Lists the population runs, with their progress, resumes interrupted bulk runs and cancels running ones.
+
+    The page of a run shows its status, and a button asking a running run to stop after its current chunk. The page
+    of a profiled run shows its top cumulative functions. The ``metrics/`` page serves the generation metrics to
+    Prometheus.
+    """
+    list_display = (
+        '__str__', 'content_type', 'status', 'strategy', 'size', 'rows_written', 'chunks_written', 'created_at',
+        'updated_at', 'finished_at'
+    )
+    list_filter = ('status', 'strategy', 'content_type')
+    readonly_fields = (
+        'content_type', 'status', 'strategy', 'size', 'rows_written', 'chunks_written', 'seed', 'factory_path',
+        'options', 'created_at', 'updated_at', 'finished_at', 'profile_path'
+    )
+    exclude = ('profile_stats',)
+    actions = ('resume_runs',)
+    change_form_template = 'admin/faker_population_run_change_form.html'
+
+    def has_add_permission(self, request):
+        """
+        Runs are only created by population, never by hand.
+        """
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """
+        Runs are read-only records.
+        """
+        return False
+
+    def has_run_permission(self, request, run):
+        """
+        Checks if the user may resume or cancel a run: runs add objects to their model.
+
+        Args:
+            - request: The HttpRequest object.
+            - run (PopulationRun): The run.
+
+        Returns:
+            - bool: True if the user has the add permission of the run's model, False otherwise.
+        """
+        model = run.content_type.model_class()
+        return model is not None and request.user.has_perm(f"{model._meta.app_label}.add_{model._meta.model_name}")
+
+    def get_urls(self):
+        """
+        Adds the URLs of the metrics and cancel views to the admin's URLs.
+
+        Returns:
+            - list: The URL patterns.
+        """
+        info = self.opts.app_label, self.opts.model_name
+        return [
+            path('metrics/', self.admin_site.admin_view(self.metrics_view), name='%s_%s_metrics' % info),
+            path(
+                '<path:object_id>/cancel/',
+                self.admin_site.admin_view(self.cancel_view),
+                name='%s_%s_cancel' % info
+            ),
+            *super().get_urls()
+        ]
+
+    def change_view(self, request, object_id, form_url='', extra_context=None):
+        """
+        Shows the status page of a run, with a cancel button while it is running.
+        """
+        run = self.get_object(request, object_id)
+        extra_context = {
+            **(extra_context or {}),
+            'can_cancel': (
+                run is not None
+                and run.status == PopulationRun.Status.RUNNING
+                and not run.cancel_requested
+                and self.has_run_permission(request, run)
+            ),
+        }
+        return super().change_view(request, object_id, form_url, extra_context)
+
+    def metrics_view(self, request):
+        """
+        Serves the generation metrics in the Prometheus text format, to users who may view the runs.
+
+        Args:
+            - request: The HttpRequest object.
+
+        Returns:
+            - HttpResponse: The exposition text.
+
+        Raises:
+            - PermissionDenied: If the user may not view the runs.
+        """
+        from django_faker_admin.metrics import render_metrics
+
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+    @method_decorator(require_POST)
+    def cancel_view(self, request, object_id):
+        """
+        Asks a running run to stop after its current chunk, and redirects to its page.
+
+        Args:
+            - request: The HttpRequest object.
+            - object_id (str): The primary key of the run.
+
+        Returns:
+            - HttpResponseRedirect: A redirect response to the page of the run.
+
+        Raises:
+            - PermissionDenied: If the user may not cancel the run.
+        """
+        from django_faker_admin.tracking import request_cancel
+
+        run = get_object_or_404(self.get_queryset(request), pk=object_id)
+        if not self.has_run_permission(request, run):
+            raise PermissionDenied
+
+        if request_cancel(run):
+            self.message_user(
+                request, gettext_lazy("The run will stop after its current chunk."), messages.SUCCESS
+            )
+        else:
+            self.message_user(request, gettext_lazy("The run is not running."), messages.WARNING)
+
+        info = self.opts.app_label, self.opts.model_name
+        return HttpResponseRedirect(reverse('admin:%s_%s_change' % info, args=(run.pk,)))
+
+    @admin.action(description=gettext_lazy("Resume selected runs"), permissions=('view',))
+    def resume_runs(self, request, queryset):
+        """
+        Resumes the selected runs from their last checkpoint. Runs still being written are left alone, see `resume`.
+
+        When `FAKER_ADMIN_USE_QUEUE` is enabled, the runs are queued for the ``faker_worker`` processes. Otherwise, the
+        run is resumed inside the request, which blocks until all its rows are written, so only one run may be
+        selected.
+
+        Args:
+            - request: The HttpRequest object.
+            - queryset: The selected runs.
+        """
+        from django_faker_admin.bulk import resume
+        from django_faker_admin.jobs import enqueue_resume
+
+        use_queue = settings.FAKER_ADMIN_USE_QUEUE
+        runs = list(queryset.exclude(status=PopulationRun.Status.FINISHED))
+        if len(runs) > 1 and not use_queue:
+            self.message_user(
+                request,
+                gettext_lazy("Select a single run: runs are resumed inside the request, unless they are queued."),
+                messages.ERROR
+            )
+            return
+
+        resumed = 0
+        for run in runs:
+            if not self.has_run_permission(request, run):
+                self.message_user(
+                    request, gettext_lazy("You don't have permission to resume %s.") % run, messages.ERROR
+                )
+                continue
+            try:
+                if use_queue:
+                    enqueue_resume(run)
+                else:
+                    resume(run)
+            except (ValueError, ImportError) as e:
+                self.message_user(request, str(e), messages.ERROR)
+            else:
+                resumed += 1
+
+        if resumed and use_queue:
+            self.message_user(
+                request,
+                ngettext(
+                    "%d run was queued to be resumed by a worker.", "%d runs were queued to be resumed by a worker.",
+                    resumed
+                ) % resumed,
+                messages.SUCCESS
+            )
+        elif resumed:
+            self.message_user(
+                request,
+                ngettext("%d run was successfully resumed.", "%d runs were successfully resumed.", resumed) % resumed,
+                messages.SUCCESS
+            )
+
+
+@admin.register(PopulationJob)
+class PopulationJobAdmin(admin.ModelAdmin):
+    """
+    Lists the population jobs queued for the ``faker_worker`` processes, with their status and worker.
+    """
+    list_display = (
+        '__str__', 'content_type', 'status', 'size', 'database', 'worker', 'attempts', 'rows_written', 'created_at',
+        'heartbeat_at', 'finished_at'
+    )
+    list_filter = ('status', 'content_type')
+    readonly_fields = (
+        'content_type', 'factory_path', 'size', 'database', 'options', 'status', 'attempts', 'worker', 'run_pk',
+        'rows_written', 'error', 'created_at', 'claimed_at', 'heartbeat_at', 'finished_at'
+    )
+
+    def has_add_permission(self, request):
+        """
+        Jobs are only queued by population, never by hand.
+        """
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """
+        Jobs are read-only records.
+        """
+        return False
@@ -4,7 +4,13 @@ from django.utils.text import gettext_lazy as _
 
 class DjangoFakerAdminConfig(AppConfig):
     name = 'django_faker_admin'
+    default_auto_field = 'django.db.models.BigAutoField'
     verbose_name = _("Django Faker Admin")
 
     def ready(self):
         from .checks import check_settings
+        from .conf import settings
+        from .fakers import registry
+
+        # Build the Faker instances of the configured locales now rather than on the first request
+        registry.prewarm(settings.FAKER_ADMIN_FAKER_LOCALES or ())
@@ -0,0 +1,113 @@
+from typing import Type
+
+from django.db import models
+from django.contrib.contenttypes.models import ContentType
+
+from django_faker_admin.conf import settings
+from django_faker_admin.models import TunedChunkSize
+
+
+class ChunkSizeTuner:
+    """
+    Adjusts the bulk insert chunk size of a run toward a target commit latency.
+
+    After every chunk, the measured throughput (rows per second, smoothed with an exponential moving average) is turned
+    into the chunk size that would commit in `target_latency` seconds. The size changes by at most a factor of two per
+    chunk and stays between `min_size` and `max_size`. Django's ``bulk_create`` already splits every chunk into as many
+    ``INSERT`` statements as the backend's parameter limits require, so a chunk only bounds the size of a transaction.
+    The size a run settles on is saved per model in the tuned database, and the next run starts from it.
+    """
+    #: Weight of the latest measurement in the moving average of the throughput.
+    smoothing = 0.5
+
+    def __init__(
+            self,
+            model: Type[models.Model],
+            using: str,
+            target_latency: float = None,
+            min_size: int = None,
+            max_size: int = None
+        ) -> None:
+        """
+        Initializes the tuner, starting from the last size saved for the model and database.
+
+        Args:
+            - model (Type[Model]): The model of the generated objects.
+            - using (str): The database alias the objects are written to.
+            - target_latency (float): The target duration of a chunk, in seconds.
+              Defaults to `FAKER_ADMIN_AUTOTUNE_TARGET_LATENCY`.
+            - min_size (int): The smallest chunk size. Defaults to `FAKER_ADMIN_AUTOTUNE_MIN_CHUNK_SIZE`.
+            - max_size (int): The largest chunk size. Defaults to `FAKER_ADMIN_AUTOTUNE_MAX_CHUNK_SIZE`.
+        """
+        self.model = model
+        self.using = using
+        self.target_latency = target_latency or settings.FAKER_ADMIN_AUTOTUNE_TARGET_LATENCY
+        self.min_size = min_size or settings.FAKER_ADMIN_AUTOTUNE_MIN_CHUNK_SIZE
+        self.max_size = max_size or settings.FAKER_ADMIN_AUTOTUNE_MAX_CHUNK_SIZE
+        self.rows_per_second = None
+
+        record = self.get_queryset().first()
+        self.chunk_size = self.clamp(record.chunk_size if record else settings.FAKER_ADMIN_BULK_CHUNK_SIZE)
+
+    def get_queryset(self) -> models.QuerySet:
+        """
+        Returns the saved sizes of the tuned model and database.
+
+        Returns:
+            - QuerySet: The matching `TunedChunkSize` records.
+        """
+        return TunedChunkSize.objects.using(self.using).filter(
+            content_type=ContentType.objects.db_manager(self.using).get_for_model(self.model),
+            database=self.using
+        )
+
+    def clamp(self, size: float) -> int:
+        """
+        Bounds a chunk size to the tuner's limits.
+
+        Args:
+            - size (float): The unbounded chunk size.
+
+        Returns:
+            - int: The chunk size, between `min_size` and `max_size`.
+        """
+        return int(max(self.min_size, min(self.max_size, size)))
+
+    def record(self, rows: int, elapsed: float) -> int:
+        """
+        Records the duration of a chunk and computes the size of the next one.
+
+        Args:
+            - rows (int): The number of rows inserted by the chunk.
+            - elapsed (float): The duration of the chunk, including its commit, in seconds.
+
+        Returns:
+            - int: The size of the next chunk.
+        """
+        if rows <= 0 or elapsed <= 0:
+            return self.chunk_size
+
+        rate = rows / elapsed
+        if self.rows_per_second is None:
+            self.rows_per_second = rate
+        else:
+            self.rows_per_second = self.smoothing * rate + (1 - self.smoothing) * self.rows_per_second
+
+        ideal = self.rows_per_second * self.target_latency
+        self.chunk_size = self.clamp(min(max(ideal, self.chunk_size / 2), self.chunk_size * 2))
+        return self.chunk_size
+
+    def save(self) -> None:
+        """
+        Saves the size the tuner settled on, unless no chunk was measured.
+        """
+        if self.rows_per_second is None:
+            return
+        TunedChunkSize.objects.using(self.using).update_or_create(
+            content_type=ContentType.objects.db_manager(self.using).get_for_model(self.model),
+            database=self.using,
+            defaults={
+                'chunk_size': self.chunk_size,
+                'rows_per_second': self.rows_per_second,
+            }
+        )
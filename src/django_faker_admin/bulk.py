@@ -0,0 +1,888 @@
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Sequence, Tuple, Type
+
+import factory.random
+import faker.generator
+from django.db import DEFAULT_DB_ALIAS, connections, models, router, transaction
+from django.core.exceptions import FieldDoesNotExist
+from django.utils.module_loading import import_string
+from factory.django import DjangoModelFactory
+
+from django_faker_admin.conf import settings
+from django_faker_admin.metrics import CHUNK_INSERT_DURATION, record_run
+from django_faker_admin.plans import get_plan
+
+if TYPE_CHECKING:
+    from django_faker_admin.models import PopulationRun
+    from django_faker_admin.distributions import Distribution
+    from django_faker_admin.timeseries import TimeSeries
+
+
+#: Create objects one by one through ``factory_class.create_batch``, so every object goes through ``save()``.
+PER_ROW_STRATEGY = 'per_row'
+#: Build objects in memory and write them with a single ``bulk_create`` per chunk.
+BULK_STRATEGY = 'bulk'
+
+STRATEGIES = (PER_ROW_STRATEGY, BULK_STRATEGY)
+
+#: The number of related objects per generated object: either an exact count or an inclusive ``(min, max)`` range.
+type FanOut = int | Tuple[int, int]
+
+
+def get_random_state() -> Dict[str, Any]:
+    """
+    Returns the state of the random generators used by factory_boy and Faker, in a JSON-friendly form.
+
+    Returns:
+        - dict: The states of factory_boy's and Faker's random generators.
+    """
+    return {
+        'factory': factory.random.randgen.getstate(),
+        'faker': faker.generator.random.getstate(),
+    }
+
+
+def set_random_state(state: Dict[str, Any]) -> None:
+    """
+    Restores the state of the random generators saved by `get_random_state`.
+
+    Args:
+        - state (dict): The states of factory_boy's and Faker's random generators.
+    """
+    for key, randgen in (('factory', factory.random.randgen), ('faker', faker.generator.random)):
+        version, internal_state, gauss_next = state[key]
+        randgen.setstate((version, tuple(internal_state), gauss_next))
+
+
+#: Held while drawing from the random generators shared by the whole process, see `RandomStream`.
+_random_lock = threading.Lock()
+
+
+class RandomStream:
+    """
+    The own state of the factory_boy and Faker random generators of a run generating alongside others, in other
+    threads.
+
+    The generators are shared by the whole process, so runs drawing from them at the same time would interleave their
+    draws. A run only draws while holding a process-wide lock, after restoring its own state, which is saved back
+    once it is done: the run draws exactly what it would draw alone.
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        """
+        Initializes the stream.
+
+        Args:
+            - seed (int): Seed of the stream. Defaults to the state of the generators at the first draw.
+        """
+        self.seed = seed
+        self.state = None
+
+    @contextmanager
+    def drawing(self) -> Iterator[None]:
+        """
+        Lets the current thread draw from the random generators with the state of the stream.
+
+        Yields:
+            - None
+        """
+        with _random_lock:
+            if self.state is not None:
+                set_random_state(self.state)
+            elif self.seed is not None:
+                factory.random.reseed_random(self.seed)
+            try:
+                yield
+            finally:
+                self.state = get_random_state()
+
+
+def get_factory_path(factory_class: Type[DjangoModelFactory]) -> str:
+    """
+    Returns the dotted path of a factory class.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class.
+
+    Returns:
+        - str: The dotted path, importable with ``import_string`` for module level classes.
+    """
+    return f'{factory_class.__module__}.{factory_class.__qualname__}'
+
+
+def resolve_database(factory_class: Type[DjangoModelFactory], using: str = None) -> str:
+    """
+    Returns the database alias the objects of a factory class are written to.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class.
+        - using (str): An explicit database alias, which takes precedence.
+
+    Returns:
+        - str: The explicit alias if one was given, otherwise the factory's ``Meta.database`` if it is not the default
+          alias, otherwise the alias picked by the database routers.
+    """
+    if using:
+        return using
+    database = getattr(factory_class._meta, 'database', DEFAULT_DB_ALIAS)
+    if database != DEFAULT_DB_ALIAS:
+        return database
+    return router.db_for_write(factory_class._meta.model)
+
+
+def get_factory_for_database(factory_class: Type[DjangoModelFactory], using: str) -> Type[DjangoModelFactory]:
+    """
+    Returns a factory class that saves its objects to the given database.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class.
+        - using (str): The database alias.
+
+    Returns:
+        - Type[DjangoModelFactory]: The factory class itself if it already uses the alias, otherwise a subclass of it
+          whose ``Meta.database`` is the alias.
+    """
+    if getattr(factory_class._meta, 'database', DEFAULT_DB_ALIAS) == using:
+        return factory_class
+    meta = type('Meta', (), {'database': using})
+    return type(f'{factory_class.__name__}_{using}', (factory_class,), {'Meta': meta})
+
+
+def get_samplers(
+        model: Type[models.Model],
+        value_profile: Dict[str, Any] = None,
+        distributions: Dict[str, 'Distribution'] = None,
+        using: str = None
+    ) -> Dict[str, Callable]:
+    """
+    Returns the samplers of the fields of a value profile and of the fields drawn from distributions.
+
+    Args:
+        - model (Type[Model]): The model of the generated objects.
+        - value_profile (dict): The value profile, if any.
+        - distributions (dict): The distributions, by field name, if any. They take precedence over the value profile.
+        - using (str): The database alias the rows sampled foreign keys point at are read from.
+
+    Returns:
+        - dict: The samplers, by field attribute name, or an empty dict without a value profile nor distributions.
+
+    Raises:
+        - ValueError: If the value profile does not fit the model, or a distribution is invalid.
+    """
+    from django_faker_admin.learning import get_value_samplers
+    from django_faker_admin.distributions import get_distribution_samplers
+
+    samplers = {}
+    if value_profile:
+        samplers.update(get_value_samplers(model, value_profile))
+    if distributions:
+        samplers.update(get_distribution_samplers(model, distributions, using))
+    return samplers
+
+
+class ManyToManyFiller:
+    """
+    Populates a many-to-many relation of generated objects by writing its through table directly.
+
+    The primary keys of the related table are fetched once, on first use. Each object's targets are sampled from that
+    pool by `pick`, on the thread generating the objects, before the chunk is handed to a writer, so that the writers
+    never draw from the random generators. Once the chunk is inserted, the through rows of the whole chunk are built in
+    memory and written with a single ``bulk_create`` call. Extra fields of a custom through model must have defaults.
+    """
+
+    def __init__(self, model: Type[models.Model], field_name: str, fan_out: FanOut, using: str) -> None:
+        """
+        Initializes the filler for a many-to-many field.
+
+        Args:
+            - model (Type[Model]): The model of the generated objects.
+            - field_name (str): The name of the ManyToManyField on the model.
+            - fan_out (FanOut): The number of related objects per generated object.
+            - using (str): The database alias to read from and write to.
+
+        Raises:
+            - ValueError: If the field is not a many-to-many field of the model.
+        """
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            field = None
+        if not isinstance(field, models.ManyToManyField):
+            raise ValueError(f"'{field_name}' is not a many-to-many field of '{model._meta.label}'.")
+
+        self.field = field
+        self.through = field.remote_field.through
+        self.source_attname = self.through._meta.get_field(field.m2m_field_name()).attname
+        self.target_attname = self.through._meta.get_field(field.m2m_reverse_field_name()).attname
+        self.fan_out = (fan_out, fan_out) if isinstance(fan_out, int) else tuple(fan_out)
+        self.using = using
+        self.pool = None
+        self.targets = {}
+
+    def get_pool(self) -> List[Any]:
+        """
+        Returns the primary keys of the related table, fetching them on first use.
+
+        Returns:
+            - list: The primary keys of the related objects.
+        """
+        if self.pool is None:
+            related_model = self.field.remote_field.model
+            self.pool = list(related_model._default_manager.using(self.using).values_list('pk', flat=True))
+        return self.pool
+
+    def sample(self) -> List[Any]:
+        """
+        Samples the targets of an object.
+
+        Sampling uses factory_boy's random generator, so seeded runs produce the same relations.
+
+        Returns:
+            - list: The primary keys of the related objects.
+        """
+        pool = self.get_pool()
+        randgen = factory.random.randgen
+        return randgen.sample(pool, min(randgen.randint(*self.fan_out), len(pool)))
+
+    def pick(self, objs: List[models.Model]) -> None:
+        """
+        Samples the targets of the given objects before they are inserted.
+
+        Args:
+            - objs (list): The unsaved objects.
+        """
+        for obj in objs:
+            self.targets[id(obj)] = self.sample()
+
+    def fill(self, objs: List[models.Model]) -> List[models.Model]:
+        """
+        Relates each of the given objects to its targets, sampled by `pick`, or sampled now for the objects that were
+        not picked.
+
+        Args:
+            - objs (list): The inserted objects.
+
+        Returns:
+            - list: The created through model instances.
+        """
+        through_objs = []
+        for obj in objs:
+            targets = self.targets.pop(id(obj), None)
+            for target in self.sample() if targets is None else targets:
+                through_objs.append(self.through(**{self.source_attname: obj.pk, self.target_attname: target}))
+        return self.through._default_manager.using(self.using).bulk_create(through_objs)
+
+
+class BulkGenerator:
+    """
+    Generate model instances with a factory class and write them to the database in chunks.
+
+    Instead of saving each object on its own, as ``factory_class.create_batch`` does, the generator builds a chunk of
+    unsaved objects in memory and inserts the whole chunk with one ``bulk_create`` call inside a transaction.
+    Callables registered in `chunk_callbacks` are called with the inserted objects after every chunk, inside the chunk's
+    transaction. The targets of the many-to-many relations of a chunk are sampled as soon as it is built.
+
+    With more than one writer, chunks are still built one after the other, but are inserted concurrently by a
+    `WriterPool`, each writer through its own connection. Chunk callbacks are then called from the writer threads.
+
+    When `cancel_check` is set, it is called before every chunk is built, and the run stops as soon as it returns True.
+    Chunks already handed to the writers are still committed.
+
+    With a `TimeSeries`, the timestamp fields of the objects are spread over its date range, ``auto_now`` and
+    ``auto_now_add`` being turned off during the run, and chunks are inserted by a single writer, in time order.
+
+    With `isolate_random`, chunks are built with the generator's own `RandomStream`, so that runs generating at the
+    same time in other threads do not change the objects; only the inserts run concurrently.
+    """
+
+    def __init__(
+            self,
+            factory_class: Type[DjangoModelFactory],
+            size: int,
+            overrides: Dict[str, Any] = None,
+            seed: int = None,
+            chunk_size: int = None,
+            using: str = None,
+            m2m_fan_out: Dict[str, FanOut] = None,
+            autotune: bool = False,
+            writers: int = None,
+            samplers: Dict[str, Callable[[Any, Any], Any]] = None,
+            time_series: 'TimeSeries' = None,
+            isolate_random: bool = False
+        ) -> None:
+        """
+        Initializes the generator with the factory class and the number of objects to generate.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class used to build the objects.
+            - size (int): The number of objects to generate.
+            - overrides (dict): Field values passed to the factory for every object.
+            - seed (int): Seed for the factory and Faker random generators, making the run reproducible.
+            - chunk_size (int): The number of objects inserted per chunk. Defaults to `FAKER_ADMIN_BULK_CHUNK_SIZE`.
+            - using (str): The database alias to write to. Defaults to the factory's ``Meta.database``, then to the
+              alias picked by the database routers.
+            - m2m_fan_out (dict): The number of related objects per generated object, by many-to-many field name.
+            - autotune (bool): Adjust the chunk size after every chunk with a `ChunkSizeTuner`, starting from the size
+              the previous run settled on. `chunk_size` is ignored.
+            - writers (int): The number of threads inserting chunks concurrently. Defaults to `FAKER_ADMIN_WRITERS`.
+            - samplers (dict): Callables replacing the values built by the factory, by field attribute name, called
+              with factory_boy's random generator and the built value. Sampled foreign keys are overridden with None
+              when building, so that a ``SubFactory`` does not create a related row for every object.
+            - time_series (TimeSeries): The time series setting the timestamp fields of the objects, if any.
+            - isolate_random (bool): Build the chunks with the generator's own `RandomStream`, seeded with `seed`.
+        """
+        self.factory_class = factory_class
+        self.model = factory_class._meta.model
+        self.size = size
+        self.overrides = overrides or {}
+        self.samplers = samplers or {}
+        for field in self.model._meta.concrete_fields:
+            if field.is_relation and field.attname in self.samplers:
+                self.overrides = {**self.overrides, field.name: None}
+        self.seed = seed
+        self.chunk_size = chunk_size or settings.FAKER_ADMIN_BULK_CHUNK_SIZE
+        self.using = using
+        self.time_series = time_series
+        # Concurrent writers would commit the chunks out of time order
+        self.writers = 1 if time_series is not None else writers or settings.FAKER_ADMIN_WRITERS
+        self.plan = get_plan(factory_class)
+        if self.plan is not None and not self.plan.supports(self.overrides):
+            self.plan = None
+        self.rows_written = 0
+        self.lock = threading.Lock()
+        self.tuner = None
+        if autotune:
+            from django_faker_admin.autotune import ChunkSizeTuner
+
+            self.tuner = ChunkSizeTuner(self.model, using=self.get_using())
+            self.chunk_size = self.tuner.chunk_size
+        self.chunk_callbacks: List[Callable[[List[models.Model]], None]] = []
+        self.cancel_check: Callable[[], bool] = None
+        self.cancelled = False
+        self.random_stream = RandomStream(seed) if isolate_random else None
+        self.fillers = [
+            ManyToManyFiller(self.model, field_name, fan_out, using=self.get_using())
+            for field_name, fan_out in (m2m_fan_out or {}).items()
+        ]
+        self.chunk_callbacks.extend(filler.fill for filler in self.fillers)
+
+    def get_using(self) -> str:
+        """
+        Returns the database alias the objects are written to.
+
+        Returns:
+            - str: The alias resolved by `resolve_database`.
+        """
+        return resolve_database(self.factory_class, self.using)
+
+    def save_related(self, obj: models.Model) -> None:
+        """
+        Saves the unsaved related objects built by ``SubFactory`` declarations.
+
+        ``bulk_create`` refuses objects that point at unsaved related objects, so these are saved first, recursively.
+
+        Args:
+            - obj (Model): The object whose forward relations should be saved.
+        """
+        for field in obj._meta.concrete_fields:
+            if not field.is_relation or not field.is_cached(obj):
+                continue
+            related = field.get_cached_value(obj)
+            if related is not None and related.pk is None:
+                self.save_related(related)
+                related.save(using=self.get_using())
+                # Re-assign so that the foreign key column picks up the new primary key
+                setattr(obj, field.name, related)
+
+    def build_objects(self, count: int) -> List[models.Model]:
+        """
+        Builds unsaved objects with the compiled plan of the factory class, or with the factory class itself when it
+        cannot be compiled, then replaces the values of the sampled fields and stamps the objects with the time series.
+
+        Args:
+            - count (int): The number of objects to build.
+
+        Returns:
+            - list: The unsaved model instances.
+        """
+        if self.plan is not None:
+            objs = self.plan.build(count, self.overrides)
+        else:
+            objs = self.factory_class.build_batch(count, **self.overrides)
+        if self.samplers:
+            randgen = factory.random.randgen
+            for obj in objs:
+                for attname, sampler in self.samplers.items():
+                    setattr(obj, attname, sampler(randgen, getattr(obj, attname)))
+        if self.time_series is not None:
+            self.time_series.stamp(objs, factory.random.randgen)
+        for obj in objs:
+            self.save_related(obj)
+        return objs
+
+    def iter_chunks(self) -> Iterator[List[models.Model]]:
+        """
+        Yields chunks of unsaved objects until `size` objects have been built, or the run is cancelled.
+
+        Yields:
+            - list: A chunk of at most `chunk_size` unsaved model instances.
+        """
+        remaining = self.size
+        while remaining > 0:
+            if self.cancel_check is not None and self.cancel_check():
+                self.cancelled = True
+                return
+            count = min(self.chunk_size, remaining)
+            with self.random_stream.drawing() if self.random_stream is not None else nullcontext():
+                objs = self.build_objects(count)
+            yield objs
+            remaining -= count
+
+    def pick_related(self, objs: List[models.Model]) -> List[models.Model]:
+        """
+        Samples the targets of the many-to-many relations of a chunk, on the thread generating the chunks.
+
+        Args:
+            - objs (list): The unsaved model instances.
+
+        Returns:
+            - list: The same instances.
+        """
+        if self.fillers:
+            with self.random_stream.drawing() if self.random_stream is not None else nullcontext():
+                for filler in self.fillers:
+                    filler.pick(objs)
+        return objs
+
+    def insert_chunk(self, objs: List[models.Model]) -> List[models.Model]:
+        """
+        Inserts a chunk of objects with a single ``bulk_create`` call inside a transaction.
+
+        The duration of the chunk, commit included, is passed to the tuner, which sets the size of the next chunk.
+
+        Args:
+            - objs (list): The unsaved model instances to insert.
+
+        Returns:
+            - list: The inserted model instances.
+        """
+        using = self.get_using()
+        started = time.perf_counter()
+        with transaction.atomic(using=using):
+            created = self.model._default_manager.using(using).bulk_create(objs, batch_size=self.chunk_size)
+            for callback in self.chunk_callbacks:
+                callback(created)
+        elapsed = time.perf_counter() - started
+        CHUNK_INSERT_DURATION.observe(elapsed, model=self.model._meta.label_lower)
+
+        with self.lock:
+            self.rows_written += len(created)
+            if self.tuner is not None:
+                self.chunk_size = self.tuner.record(len(created), elapsed)
+        return created
+
+    def run(self) -> int:
+        """
+        Generates and inserts all the objects, chunk by chunk.
+
+        Returns:
+            - int: The number of rows written.
+        """
+        if self.seed is not None and self.random_stream is None:
+            factory.random.reseed_random(self.seed)
+
+        with self.time_series.disable_auto_now() if self.time_series is not None else nullcontext():
+            if self.writers > 1:
+                from django_faker_admin.writers import WriterPool
+
+                with WriterPool(self.insert_chunk, workers=self.writers) as pool:
+                    for objs in self.iter_chunks():
+                        pool.submit(self.pick_related(objs))
+            else:
+                for objs in self.iter_chunks():
+                    self.insert_chunk(self.pick_related(objs))
+
+        if self.tuner is not None:
+            self.tuner.save()
+        return self.rows_written
+
+
+def generate(
+        factory_class: Type[DjangoModelFactory],
+        size: int,
+        overrides: Dict[str, Any] = None,
+        seed: int = None,
+        strategy: str = None,
+        chunk_size: int = None,
+        using: str = None,
+        use_snapshots: bool = True,
+        m2m_fan_out: Dict[str, FanOut] = None,
+        writers: int = None,
+        on_start: Callable[['PopulationRun'], Any] = None,
+        value_profile: Dict[str, Any] = None,
+        distributions: Dict[str, 'Distribution'] = None,
+        time_series: Dict[str, Any] = None,
+        cancel_check: Callable[[], bool] = None,
+        isolate_random: bool = False
+    ) -> int:
+    """
+    Generates `size` objects with the given factory class, using the requested strategy.
+
+    With the bulk strategy and a seed, the run goes through the snapshot cache (when `FAKER_ADMIN_SNAPSHOT_DIR` is set):
+    a cached snapshot of the same run is bulk-loaded instead of being generated again, and a fresh run is saved as a
+    snapshot for the next time. The run is recorded as a `PopulationRun`, along with the primary key ranges of the
+    created rows, in the database the rows are written to. Bulk runs are checkpointed after every chunk, and an
+    interrupted run can be continued with `resume`.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class used to generate the objects.
+        - size (int): The number of objects to generate.
+        - overrides (dict): Field values passed to the factory for every object.
+        - seed (int): Seed for the factory and Faker random generators.
+        - strategy (str): Either `PER_ROW_STRATEGY` or `BULK_STRATEGY`. Defaults to `FAKER_ADMIN_STRATEGY`.
+        - chunk_size (int): The number of objects inserted per chunk, for the bulk strategy. When not given and
+          `FAKER_ADMIN_AUTOTUNE` is enabled, the chunk size is tuned during the run.
+        - using (str): The database alias to write to. Defaults to the factory's ``Meta.database``, then to the alias
+          picked by the database routers.
+        - use_snapshots (bool): Whether the snapshot cache may be used.
+        - m2m_fan_out (dict): The number of related objects per generated object, by many-to-many field name, for the
+          bulk strategy. Runs that populate many-to-many relations are not cached.
+        - writers (int): The number of threads inserting chunks concurrently, for the bulk strategy. Defaults to
+          `FAKER_ADMIN_WRITERS`.
+        - on_start (Callable): Called with the `PopulationRun` once it is recorded, before any row is written.
+        - value_profile (dict): A value profile learned by `learn_value_profile`, which the values of the profiled
+          fields are sampled from, for the bulk strategy.
+        - distributions (dict): The distributions the values of fields with choices and foreign keys are drawn from,
+          by field name, for the bulk strategy, e.g. ``{'customer': {'kind': 'zipf', 'exponent': 1.2}}``. Sampled
+          foreign keys point at existing rows. Runs sampling from a value profile or distributions are not cached.
+        - time_series (dict): The date range, rate curve and timestamp fields the timestamps of the objects are
+          spread with, for the bulk strategy, e.g. ``{'start': '2024-01-01', 'end': '2025-01-01', 'curve': 'linear'}``
+          (see `TimeSeries`). ``auto_now`` and ``auto_now_add`` fields are set too, and chunks are inserted in time
+          order by a single writer. Time series runs are not cached.
+        - cancel_check (Callable): Called before every chunk of a bulk run, on top of the cancellation requested on the
+          run: the run is cancelled as soon as it returns True.
+        - isolate_random (bool): Draw from the random generators with the run's own `RandomStream`, so that runs
+          generating at the same time in other threads neither change the objects nor are changed by them. Bulk runs
+          only hold the generators while building a chunk, per-row runs for the whole run.
+
+    Returns:
+        - int: The number of rows written.
+
+    Raises:
+        - ValueError: If a value profile, distributions or a time series are given to the per-row strategy, or are
+          invalid.
+    """
+    from django_faker_admin.tracking import start_run, encode_overrides
+    from django_faker_admin.snapshots import get_snapshot_cache
+    from django_faker_admin.timeseries import TimeSeries
+
+    overrides = overrides or {}
+    strategy = strategy or settings.FAKER_ADMIN_STRATEGY
+    using = resolve_database(factory_class, using)
+    writers = writers or settings.FAKER_ADMIN_WRITERS
+    if (value_profile or distributions or time_series) and strategy == PER_ROW_STRATEGY:
+        raise ValueError("Value profiles, distributions and time series are only supported by the bulk strategy.")
+    samplers = get_samplers(factory_class._meta.model, value_profile, distributions, using=using)
+    if time_series:
+        time_series = TimeSeries(factory_class._meta.model, time_series, size)
+        writers = 1
+    cache = (
+        get_snapshot_cache()
+        if use_snapshots and not m2m_fan_out and not samplers and not time_series and seed is not None else None
+    )
+    if cache is not None and not cache.supports(factory_class):
+        cache = None
+    key = cache.get_key(factory_class, size=size, seed=seed, overrides=overrides) if cache is not None else None
+    loads_snapshot = key is not None and cache.has(key)
+
+    run, tracker = start_run(
+        factory_class._meta.model,
+        size=size,
+        strategy=strategy,
+        seed=seed,
+        using=using,
+        factory_path=get_factory_path(factory_class),
+        options={
+            'overrides': encode_overrides(overrides),
+            'chunk_size': chunk_size,
+            'm2m_fan_out': m2m_fan_out,
+            'value_profile': value_profile,
+            'distributions': distributions,
+            'time_series': time_series.time_series if time_series else None,
+        },
+        # Only chunks generated and committed in order can be resumed from the random state of the last one
+        resumable=strategy == BULK_STRATEGY and writers == 1 and not loads_snapshot
+    )
+    if on_start is not None:
+        on_start(run)
+
+    if strategy == PER_ROW_STRATEGY:
+        def create_objects() -> int:
+            with RandomStream(seed).drawing() if isolate_random else nullcontext():
+                if seed is not None:
+                    factory.random.reseed_random(seed)
+                plan = get_plan(factory_class)
+                if plan is not None and plan.supports(overrides):
+                    objs = plan.create(size, overrides, using=using)
+                else:
+                    objs = get_factory_for_database(factory_class, using).create_batch(size, **overrides)
+            tracker.track(objs)
+            return len(objs)
+
+        return run_tracked(run, create_objects)
+
+    generator = BulkGenerator(
+        factory_class=factory_class,
+        size=size,
+        overrides=overrides,
+        seed=seed,
+        chunk_size=chunk_size,
+        using=using,
+        m2m_fan_out=m2m_fan_out,
+        autotune=chunk_size is None and settings.FAKER_ADMIN_AUTOTUNE,
+        writers=writers,
+        samplers=samplers,
+        time_series=time_series or None,
+        isolate_random=isolate_random
+    )
+    generator.chunk_callbacks.extend([tracker.track, tracker.checkpoint])
+    tracker.cancel_check = cancel_check
+    tracker.random_stream = generator.random_stream
+    generator.cancel_check = tracker.is_cancel_requested
+
+    if cache is None:
+        return run_tracked(run, generator.run)
+
+    if loads_snapshot:
+        return run_tracked(run, lambda: cache.load(
+            key,
+            model=generator.model,
+            using=generator.get_using(),
+            chunk_size=generator.chunk_size,
+            chunk_callbacks=generator.chunk_callbacks
+        ))
+
+    with cache.writer(key, model=generator.model) as writer:
+        # The snapshot line of a chunk is written before the checkpoint that commits it
+        generator.chunk_callbacks.insert(-1, writer.write_chunk)
+        written = run_tracked(run, generator.run)
+        if generator.cancelled or written < size:
+            # Part of the dataset must not be loaded as the whole of it by the next run with the same key
+            writer.discard()
+        return written
+
+
+def run_tracked(run: 'PopulationRun', write: Callable[[], int], rows_written: int = 0) -> int:
+    """
+    Writes the rows of a population run, recording its end, its cancellation or its failure, along with the
+    ``faker_admin_runs_total`` and ``faker_admin_run_duration_seconds`` metrics. The adjacent ranges of the rows are
+    merged once they are written, and the cached counts of the model are invalidated either way.
+
+    Args:
+        - run (PopulationRun): The run.
+        - write (Callable): Writes the rows and returns their number.
+        - rows_written (int): The number of rows written before, by an interrupted attempt of the run.
+
+    Returns:
+        - int: The total number of rows written by the run.
+    """
+    from django_faker_admin.tracking import compact_ranges, finish_run, fail_run, cancel_run
+    from django_faker_admin.pagination import invalidate_counts
+
+    started = time.perf_counter()
+    try:
+        written = write()
+    except BaseException:
+        fail_run(run)
+        record_run(run, run.status, time.perf_counter() - started)
+        raise
+    finally:
+        # Failed runs may have committed chunks too
+        invalidate_counts(run.content_type.model_class(), run._state.db)
+    rows_written += written
+    compact_ranges(run)
+    run.refresh_from_db(fields=['cancel_requested'])
+    if run.cancel_requested and rows_written < run.size:
+        rows_written = cancel_run(run, rows_written=rows_written)
+    else:
+        rows_written = finish_run(run, rows_written=rows_written)
+    record_run(run, run.status, time.perf_counter() - started)
+    return rows_written
+
+
+def check_resumable(run: 'PopulationRun', stale_after: float = None) -> None:
+    """
+    Checks that a population run can be resumed by `resume`.
+
+    Args:
+        - run (PopulationRun): The run.
+        - stale_after (float): The number of seconds without checkpoint after which a running run may be resumed.
+          Defaults to `FAKER_ADMIN_STALE_RUN_TIMEOUT`.
+
+    Raises:
+        - ValueError: If the run is finished or still running, is not a bulk run, or cannot be resumed from its
+          checkpoint.
+    """
+    from django_faker_admin.models import PopulationRun
+    from django_faker_admin.tracking import is_stale
+
+    if run.status == PopulationRun.Status.FINISHED:
+        raise ValueError(f"Population run #{run.pk} is already finished.")
+    stale_after = settings.FAKER_ADMIN_STALE_RUN_TIMEOUT if stale_after is None else stale_after
+    if run.status == PopulationRun.Status.RUNNING and not is_stale(run, stale_after):
+        raise ValueError(f"Population run #{run.pk} is still running.")
+    if run.strategy != BULK_STRATEGY or not run.factory_path:
+        raise ValueError(f"Population run #{run.pk} is not a resumable bulk run.")
+    if run.rows_written and run.random_state is None:
+        raise ValueError(f"Population run #{run.pk} has no checkpoint to resume from.")
+
+
+def resume(
+        run: 'PopulationRun', writers: int = None, stale_after: float = None, cancel_check: Callable[[], bool] = None
+    ) -> int:
+    """
+    Resumes an interrupted bulk population run from its last checkpoint.
+
+    The factory class, overrides, chunk size, many-to-many fan-out, value profile, distributions and time series of
+    the run are restored, and so is the state of the random generators at the end of the last committed chunk: the
+    remaining objects are the ones the run would have generated, and committed chunks are neither generated again nor
+    duplicated.
+
+    Failed and cancelled runs can be resumed. A run still recorded as running is only resumed once its last checkpoint
+    is `stale_after` seconds old, as its process is then assumed to be dead: resuming a run that is still being written
+    would write every chunk after the checkpoint twice.
+
+    Args:
+        - run (PopulationRun): The run to resume.
+        - writers (int): The number of threads inserting chunks concurrently. Defaults to `FAKER_ADMIN_WRITERS`.
+        - stale_after (float): The number of seconds without checkpoint after which a running run may be resumed.
+          Defaults to `FAKER_ADMIN_STALE_RUN_TIMEOUT`.
+        - cancel_check (Callable): Called before every chunk, on top of the cancellation requested on the run: the run
+          is cancelled as soon as it returns True.
+
+    Returns:
+        - int: The total number of rows written by the run.
+
+    Raises:
+        - ValueError: If the run is finished or still running, is not a bulk run, or cannot be resumed from its
+          checkpoint.
+        - ImportError: If the factory class of the run cannot be imported.
+    """
+    from django_faker_admin.models import PopulationRun
+    from django_faker_admin.tracking import RunTracker, decode_overrides
+    from django_faker_admin.timeseries import TimeSeries
+
+    run.refresh_from_db()
+    check_resumable(run, stale_after)
+
+    factory_class = import_string(run.factory_path)
+    using = run._state.db
+    writers = writers or settings.FAKER_ADMIN_WRITERS
+    options = run.options
+    chunk_size = options.get('chunk_size')
+    time_series = None
+    if options.get('time_series'):
+        # The next object takes the position following the committed rows
+        time_series = TimeSeries(
+            factory_class._meta.model, options['time_series'], run.size, position=run.rows_written
+        )
+
+    generator = BulkGenerator(
+        factory_class=factory_class,
+        size=run.size - run.rows_written,
+        overrides=decode_overrides(options.get('overrides'), using),
+        chunk_size=chunk_size,
+        using=using,
+        m2m_fan_out=options.get('m2m_fan_out'),
+        autotune=chunk_size is None and settings.FAKER_ADMIN_AUTOTUNE,
+        writers=writers,
+        samplers=get_samplers(
+            factory_class._meta.model, options.get('value_profile'), options.get('distributions'), using=using
+        ),
+        time_series=time_series
+    )
+    tracker = RunTracker(run, resumable=generator.writers == 1)
+    generator.chunk_callbacks.extend([tracker.track, tracker.checkpoint])
+    tracker.cancel_check = cancel_check
+    generator.cancel_check = tracker.is_cancel_requested
+
+    if run.random_state is not None:
+        set_random_state(run.random_state)
+    else:
+        generator.seed = run.seed
+
+    run.status = PopulationRun.Status.RUNNING
+    run.cancel_requested = False
+    run.save(update_fields=['status', 'cancel_requested', 'updated_at'])
+    return run_tracked(run, generator.run, rows_written=run.rows_written)
+
+
+def split_size(size: int, parts: int) -> List[int]:
+    """
+    Splits a number of objects as evenly as possible, the first parts taking the remainder.
+
+    Args:
+        - size (int): The number of objects.
+        - parts (int): The number of parts.
+
+    Returns:
+        - list: The size of every part.
+    """
+    quotient, remainder = divmod(size, parts)
+    return [quotient + (index < remainder) for index in range(parts)]
+
+
+def generate_sharded(
+        factory_class: Type[DjangoModelFactory],
+        size: int,
+        databases: Sequence[str],
+        seed: int = None,
+        **kwargs
+    ) -> Dict[str, int]:
+    """
+    Splits `size` objects across several databases and populates them in parallel, one worker thread per database.
+
+    Every worker runs `generate` against its own alias, on its own connection, and is recorded as a separate
+    `PopulationRun` in that database. Workers draw from the random generators, which are shared by the threads, with
+    their own `RandomStream`: with a seed, the shard at position ``i`` is seeded with ``seed + i`` and gets the rows
+    ``generate`` writes alone with that seed, so seeded runs are reproducible, shard by shard. Bulk shards build their
+    chunks one at a time and only insert them in parallel; per-row shards are generated one after the other.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class used to generate the objects.
+        - size (int): The total number of objects to generate.
+        - databases (Sequence[str]): The database aliases to populate.
+        - seed (int): Seed of the first shard.
+        - kwargs: Extra keyword arguments passed to `generate`.
+
+    Returns:
+        - dict: The number of rows written, by database alias.
+
+    Raises:
+        - ValueError: If no database is given, or a database is given twice.
+    """
+    databases = list(databases)
+    if not databases:
+        raise ValueError("At least one database is required.")
+    if len(set(databases)) != len(databases):
+        raise ValueError("Every database should only be given once.")
+
+    def populate(using: str, shard_size: int, shard_seed: int) -> int:
+        try:
+            return generate(factory_class, shard_size, seed=shard_seed, using=using, isolate_random=True, **kwargs)
+        finally:
+            # Worker threads open their own connections, which Django only closes at the end of a request
+            connections.close_all()
+
+    sizes = split_size(size, len(databases))
+    with ThreadPoolExecutor(max_workers=len(databases)) as executor:
+        futures = {
+            using: executor.submit(populate, using, shard_size, None if seed is None else seed + index)
+            for index, (using, shard_size) in enumerate(zip(databases, sizes))
+            if shard_size > 0
+        }
+        # ``result`` re-raises the exception of a failed worker
+        return {using: future.result() for using, future in futures.items()}
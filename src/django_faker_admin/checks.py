@@ -1,5 +1,8 @@
-from typing import List
+from typing import List, Set, Type
 
+import factory
+from django.db import models
+from django.db.models.signals import post_save
 from django.core.checks import Tags, Warning, register
 
 
@@ -67,3 +70,171 @@ def check_settings(app_configs, **kwargs) -> List[Warning]:
         )
 
     return errors
+
+
+def get_subfactory_depth(factory_class: Type[factory.Factory], seen: Set[Type[factory.Factory]] = None) -> int:
+    """
+    Returns the length of the longest chain of ``SubFactory`` declarations starting from a factory class.
+
+    Args:
+        - factory_class (Type[Factory]): The factory class.
+        - seen (set): The factory classes of the chain so far, to stop on cycles.
+
+    Returns:
+        - int: 0 if the factory declares no ``SubFactory``, 1 if none of its sub-factories does, and so on.
+    """
+    seen = (seen or set()) | {factory_class}
+    depth = 0
+    for declaration in factory_class._meta.pre_declarations.declarations.values():
+        if isinstance(declaration, factory.SubFactory):
+            sub_factory = declaration.get_factory()
+            sub_depth = 0 if sub_factory in seen else get_subfactory_depth(sub_factory, seen)
+            depth = max(depth, 1 + sub_depth)
+    return depth
+
+
+def get_form_relation_fields(model_admin) -> List[models.Field]:
+    """
+    Returns the relation fields of the populate form that are rendered by a plain select.
+
+    These are the editable ``ForeignKey`` and ``ManyToManyField`` fields of the model which are neither excluded, nor
+    unique (unique fields are never on the populate form), nor listed in ``raw_id_fields`` or ``autocomplete_fields``.
+
+    Args:
+        - model_admin (FakerModelAdminMixin): The model admin.
+
+    Returns:
+        - list: The fields.
+    """
+    exclude = set(model_admin.exclude or ())
+    widget_fields = {*model_admin.raw_id_fields, *model_admin.autocomplete_fields}
+    return [
+        field for field in model_admin.model._meta.get_fields()
+        if isinstance(field, (models.ForeignKey, models.ManyToManyField))
+        and field.editable
+        and not field.unique
+        and field.name not in exclude
+        and field.name not in widget_fields
+    ]
+
+
+def check_model_admin(model_admin) -> List[Warning]:
+    """
+    Checks a faker-enabled model admin for configurations that are slow at scale.
+
+    Args:
+        - model_admin (FakerModelAdminMixin): The model admin.
+
+    Returns:
+        - list: A list of Warning objects.
+    """
+    from django_faker_admin.conf import settings
+    from django_faker_admin.bulk import PER_ROW_STRATEGY
+
+    errors = []
+    model = model_admin.model
+    obj = model_admin.__class__
+    per_row = (model_admin.faker_strategy or settings.FAKER_ADMIN_STRATEGY) == PER_ROW_STRATEGY
+
+    threshold = settings.FAKER_ADMIN_RELATION_WIDGET_THRESHOLD
+    for field in get_form_relation_fields(model_admin):
+        errors.append(
+            Warning(
+                msg=f"The populate form of '{model._meta.label}' renders the relation '{field.name}' without "
+                    f"'raw_id_fields' or 'autocomplete_fields'.",
+                id='django_faker_admin.W005',
+                obj=obj,
+                hint=(
+                    "Every rendering of the form lists the related rows in a select."
+                    if threshold is None else
+                    "Every rendering of the form counts the related rows to choose a widget."
+                ) + f" Add '{field.name}' to 'raw_id_fields' or 'autocomplete_fields'."
+            )
+        )
+
+    factory_class = model_admin.factory_class
+    if factory_class is None:
+        return errors
+
+    depth = get_subfactory_depth(factory_class)
+    if depth:
+        errors.append(
+            Warning(
+                msg=f"'{factory_class.__name__}' creates a chain of {depth} SubFactory object(s) for every "
+                    f"'{model._meta.label}' object.",
+                id='django_faker_admin.W006',
+                obj=obj,
+                hint="Related objects are saved one by one, even by the bulk strategy. Pass existing related objects "
+                     "through the populate form, or pick them with a 'LazyFunction' instead."
+            )
+        )
+
+    post_declarations = list(factory_class._meta.post_declarations.declarations)
+    if post_declarations:
+        errors.append(
+            Warning(
+                msg=f"'{factory_class.__name__}' has post-generation declarations: {', '.join(post_declarations)}.",
+                id='django_faker_admin.W007',
+                obj=obj,
+                hint="They run for every object, with their own queries, and prevent the factory from being compiled "
+                     "into a generation plan. Use 'faker_m2m_fan_out' for many-to-many relations."
+            )
+        )
+
+    if per_row and settings.FAKER_ADMIN_MAX_LIMIT > settings.FAKER_ADMIN_PER_ROW_WARNING_THRESHOLD:
+        errors.append(
+            Warning(
+                msg=f"'{model._meta.label}' is populated with the per-row strategy, with up to "
+                    f"{settings.FAKER_ADMIN_MAX_LIMIT} objects per request.",
+                id='django_faker_admin.W008',
+                obj=obj,
+                hint="Every object is saved with its own query. Set 'faker_strategy' to 'bulk', or lower "
+                     "'FAKER_ADMIN_MAX_LIMIT'."
+            )
+        )
+
+    if per_row and post_save.has_listeners(model):
+        errors.append(
+            Warning(
+                msg=f"'{model._meta.label}' is populated with the per-row strategy, and has post_save receivers.",
+                id='django_faker_admin.W009',
+                obj=obj,
+                hint="Every generated object is sent to the receivers, which may run queries of their own. Set "
+                     "'faker_strategy' to 'bulk' if they are not needed for dummy data."
+            )
+        )
+
+    return errors
+
+
+@register(Tags.admin)
+def check_model_admins(app_configs, **kwargs) -> List[Warning]:
+    """
+    Check every faker-enabled model admin, of every admin site, for configurations that are slow at scale.
+
+    It checks for the following:
+        - Relation fields of the populate form that are not in `raw_id_fields` or `autocomplete_fields`.
+        - Factories creating ``SubFactory`` objects, which are saved one by one.
+        - Factories with post-generation declarations, which run for every object.
+        - The per-row strategy combined with a `FAKER_ADMIN_MAX_LIMIT` above `FAKER_ADMIN_PER_ROW_WARNING_THRESHOLD`.
+        - The per-row strategy on a model with ``post_save`` receivers.
+
+    Args:
+        - app_configs: A list of app configurations, to only check their models. Defaults to every app.
+        - kwargs: Additional keyword arguments.
+
+    Returns:
+        - list: A list of Warning objects.
+    """
+    from django.contrib.admin.sites import all_sites
+    from django_faker_admin.mixins import FakerModelAdminMixin
+
+    errors = []
+    for site in all_sites:
+        for model, model_admin in site._registry.items():
+            if not isinstance(model_admin, FakerModelAdminMixin):
+                continue
+            if app_configs is not None and model._meta.app_config not in app_configs:
+                continue
+            errors.extend(check_model_admin(model_admin))
+    return errors
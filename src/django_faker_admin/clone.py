@@ -0,0 +1,279 @@
+from typing import Any, Dict, Iterable, Iterator, List, Type
+
+from django.db import connections, models
+from django.core.exceptions import FieldDoesNotExist
+from factory.django import DjangoModelFactory
+
+from django_faker_admin.conf import settings
+from django_faker_admin.bulk import BulkGenerator, get_factory_path, resolve_database, run_tracked
+from django_faker_admin.plans import PlanResolver, Step
+
+
+#: Copy existing rows, generating only the varying fields with the factory's declarations.
+CLONE_STRATEGY = 'clone'
+
+
+def get_unique_fields(model: Type[models.Model]) -> List[str]:
+    """
+    Returns the names of the fields whose values must not be copied as they are.
+
+    These are the unique fields other than the primary key, and the fields of ``unique_together`` and unconditional
+    ``UniqueConstraint`` sets. A primary key that is neither generated by the database nor has a default is included.
+
+    Args:
+        - model (Type[Model]): The model class.
+
+    Returns:
+        - list: The field names, in the order of the model's fields.
+    """
+    opts = model._meta
+    names = {field.name for field in opts.concrete_fields if field.unique and not field.primary_key}
+    for field_names in opts.unique_together:
+        names.update(field_names)
+    for constraint in opts.total_unique_constraints:
+        names.update(constraint.fields)
+    if not opts.pk.db_returning and not opts.pk.has_default():
+        names.add(opts.pk.name)
+    return [field.name for field in opts.concrete_fields if field.name in names]
+
+
+def get_varying_fields(model: Type[models.Model], vary: Iterable[str] = ()) -> List[models.Field]:
+    """
+    Returns the fields that are generated for every clone instead of being copied.
+
+    Args:
+        - model (Type[Model]): The model class.
+        - vary (Iterable[str]): The names of the fields to generate, on top of the fields returned by
+          `get_unique_fields`.
+
+    Returns:
+        - list: The fields, in the order of the model's fields.
+
+    Raises:
+        - ValueError: If a field does not exist, is not a concrete field, or is a relation.
+    """
+    opts = model._meta
+    names = {*vary, *get_unique_fields(model)}
+    for name in names:
+        try:
+            field = opts.get_field(name)
+        except FieldDoesNotExist:
+            raise ValueError(f"{opts.label} has no field named '{name}'.")
+        if not field.concrete or field.many_to_many:
+            raise ValueError(f"The field '{name}' of {opts.label} is not a concrete field.")
+        if field.is_relation:
+            raise ValueError(f"The relation '{name}' of {opts.label} cannot be generated for every clone.")
+    return [field for field in opts.concrete_fields if field.name in names]
+
+
+class CloneGenerator(BulkGenerator):
+    """
+    Multiplies existing rows: every source row is copied `times` times and the copies are written in chunks.
+
+    Only the varying fields are generated, with the factory's declarations of the same name; every other concrete
+    field is copied from the source row, foreign keys included, which is much cheaper than building whole objects on
+    wide models. Unique fields always vary. The primary keys of the source rows are fetched up-front and the rows
+    themselves page by page, so the copies inserted meanwhile are never read back as sources. Many-to-many relations
+    are not copied, but can be filled with `m2m_fan_out` like generated objects.
+
+    With a compiled plan, a varying field's step is evaluated with the source row's values, so that a ``LazyAttribute``
+    reading a copied field sees the copied value, and the related object of a copied relation; ``_adjust_kwargs`` is
+    not applied. Otherwise every clone is built
+    with the factory class, the copied fields being passed as overrides and relations overridden with None, and only
+    the varying fields are kept.
+    """
+
+    def __init__(
+            self,
+            factory_class: Type[DjangoModelFactory],
+            queryset: models.QuerySet,
+            times: int,
+            vary: Iterable[str] = (),
+            **kwargs
+        ) -> None:
+        """
+        Initializes the generator with the rows to clone.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class declaring the varying fields.
+            - queryset (QuerySet): The source rows.
+            - times (int): The number of copies of every source row.
+            - vary (Iterable[str]): The names of the fields to generate for every copy, on top of the unique fields.
+            - kwargs: Extra keyword arguments passed to `BulkGenerator`.
+
+        Raises:
+            - ValueError: If the model uses multi-table inheritance, or a varying field cannot be generated.
+        """
+        model = factory_class._meta.model
+        if model._meta.parents:
+            raise ValueError(f"Rows of {model._meta.label} cannot be cloned: it inherits from another model.")
+
+        self.varying = get_varying_fields(model, vary)
+        declarations = factory_class._meta.pre_declarations.declarations
+        missing = [field.name for field in self.varying if field.name not in declarations]
+        if missing:
+            raise ValueError(
+                f"{factory_class.__name__} has no declaration for the varying fields: {', '.join(missing)}."
+            )
+
+        self.queryset = queryset
+        self.times = times
+        self.copied = [
+            field for field in model._meta.concrete_fields
+            if not field.primary_key and field not in self.varying
+        ]
+        self.source_pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+        self.steps = None
+        super().__init__(factory_class, size=len(self.source_pks) * times, **kwargs)
+
+    def iter_source_values(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the values of the copied fields of every source row, in primary key order.
+
+        Yields:
+            - dict: The values of a source row, by attribute name.
+        """
+        attnames = [field.attname for field in self.copied]
+        using = self.queryset.db
+        manager = self.model._base_manager.using(using)
+        page_size = max(1, connections[using].ops.bulk_batch_size(['pk'], self.source_pks))
+        for start in range(0, len(self.source_pks), page_size):
+            rows = manager.filter(pk__in=self.source_pks[start:start + page_size]).order_by('pk')
+            for row in rows.values_list(*attnames):
+                yield dict(zip(attnames, row))
+
+    def get_steps(self) -> Dict[str, Step]:
+        """
+        Returns the steps of the plan, with the copied relations replaced by steps fetching the related object of the
+        copied key, only when a declaration reads it.
+
+        Returns:
+            - dict: The steps, by field name.
+        """
+        if self.steps is None:
+            using = self.queryset.db
+
+            def compile_relation(field: models.ForeignKey) -> Step:
+                manager = field.related_model._base_manager.using(using)
+
+                def step(resolver: PlanResolver, sequence: int) -> Any:
+                    key = getattr(resolver, field.attname)
+                    return None if key is None else manager.get(**{field.target_field.attname: key})
+                return step
+
+            self.steps = {
+                **self.plan.steps,
+                **{field.name: compile_relation(field) for field in self.copied if field.is_relation},
+            }
+        return self.steps
+
+    def generate_values(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generates the varying fields of a copy.
+
+        Args:
+            - values (dict): The copied values, by attribute name.
+
+        Returns:
+            - dict: The generated values, by attribute name.
+        """
+        if self.plan is not None:
+            # Declarations read fields by name, so a copied relation is read as the related object
+            known = {field.name: values[field.attname] for field in self.copied if not field.is_relation}
+            known.update((field.attname, values[field.attname]) for field in self.copied if field.is_relation)
+            resolver = PlanResolver(self.get_steps(), self.factory_class._meta.next_sequence(), known)
+            return {field.attname: getattr(resolver, field.name) for field in self.varying}
+
+        declarations = self.factory_class._meta.pre_declarations.declarations
+        overrides = {
+            field.name: None if field.is_relation else values[field.attname]
+            for field in self.copied
+            if field.name in declarations
+        }
+        obj = self.factory_class.build(**overrides)
+        return {field.attname: getattr(obj, field.attname) for field in self.varying}
+
+    def iter_chunks(self) -> Iterator[List[models.Model]]:
+        """
+        Yields chunks of unsaved copies until every source row has been copied, or the run is cancelled.
+
+        Yields:
+            - list: A chunk of at most `chunk_size` unsaved model instances.
+        """
+        model = self.model
+        chunk = []
+        for values in self.iter_source_values():
+            for _ in range(self.times):
+                if not chunk and self.cancel_check is not None and self.cancel_check():
+                    self.cancelled = True
+                    return
+                chunk.append(model(**values, **self.generate_values(values)))
+                if len(chunk) >= self.chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+
+def clone(
+        factory_class: Type[DjangoModelFactory],
+        queryset: models.QuerySet,
+        times: int,
+        vary: Iterable[str] = (),
+        seed: int = None,
+        chunk_size: int = None,
+        using: str = None,
+        writers: int = None
+    ) -> int:
+    """
+    Copies every row of the queryset `times` times, generating only the varying and unique fields.
+
+    The run is recorded as a `PopulationRun` with the clone strategy, along with the primary key ranges of the copies,
+    so that the copies can be purged like generated rows. Clone runs can be cancelled, but not resumed.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class declaring the varying fields.
+        - queryset (QuerySet): The source rows.
+        - times (int): The number of copies of every source row.
+        - vary (Iterable[str]): The names of the fields to generate for every copy, on top of the unique fields.
+        - seed (int): Seed for the factory and Faker random generators.
+        - chunk_size (int): The number of copies inserted per chunk. When not given and `FAKER_ADMIN_AUTOTUNE` is
+          enabled, the chunk size is tuned during the run.
+        - using (str): The database alias to write to. Defaults to the factory's ``Meta.database``, then to the alias
+          picked by the database routers.
+        - writers (int): The number of threads inserting chunks concurrently. Defaults to `FAKER_ADMIN_WRITERS`.
+
+    Returns:
+        - int: The number of rows written.
+
+    Raises:
+        - ValueError: If the rows of the model cannot be cloned, see `CloneGenerator`.
+    """
+    from django_faker_admin.tracking import start_run
+
+    using = resolve_database(factory_class, using)
+    vary = list(vary)
+    generator = CloneGenerator(
+        factory_class=factory_class,
+        queryset=queryset,
+        times=times,
+        vary=vary,
+        seed=seed,
+        chunk_size=chunk_size,
+        using=using,
+        autotune=chunk_size is None and settings.FAKER_ADMIN_AUTOTUNE,
+        writers=writers
+    )
+    run, tracker = start_run(
+        generator.model,
+        size=generator.size,
+        strategy=CLONE_STRATEGY,
+        seed=seed,
+        using=using,
+        factory_path=get_factory_path(factory_class),
+        options={'times': times, 'vary': vary, 'chunk_size': chunk_size},
+        resumable=False
+    )
+    generator.chunk_callbacks.extend([tracker.track, tracker.checkpoint])
+    generator.cancel_check = tracker.is_cancel_requested
+    return run_tracked(run, generator.run)
@@ -1,10 +1,10 @@
-from typing import Dict
+from typing import Dict, Sequence
 
 from django.utils.functional import LazyObject
 from django.core.signals import setting_changed
 
 
-type SettingType = str | int
+type SettingType = str | int | float | Sequence[str] | None
 type SettingsType = Dict[str, SettingType]
 
 
@@ -13,6 +13,27 @@ DEFAULTS = {
     'FAKER_ADMIN_URL': 'populate-dummy-data/',
     'FAKER_ADMIN_TEMPLATE_NAME': 'admin/faker_admin.html',
     'FAKER_ADMIN_CHANGE_LIST_TEMPLATE': 'admin/faker_admin_change_list.html',
+    'FAKER_ADMIN_STRATEGY': 'per_row',
+    'FAKER_ADMIN_BULK_CHUNK_SIZE': 500,
+    'FAKER_ADMIN_WRITERS': 1,
+    'FAKER_ADMIN_STALE_RUN_TIMEOUT': 300,
+    'FAKER_ADMIN_USE_QUEUE': False,
+    'FAKER_ADMIN_COMPILE_PLANS': True,
+    'FAKER_ADMIN_FAKER_LOCALES': None,
+    'FAKER_ADMIN_AUTOTUNE': False,
+    'FAKER_ADMIN_AUTOTUNE_TARGET_LATENCY': 0.5,
+    'FAKER_ADMIN_AUTOTUNE_MIN_CHUNK_SIZE': 50,
+    'FAKER_ADMIN_AUTOTUNE_MAX_CHUNK_SIZE': 10000,
+    'FAKER_ADMIN_SNAPSHOT_DIR': None,
+    'FAKER_ADMIN_SNAPSHOT_MAX_SIZE': 512 * 1024 * 1024,
+    'FAKER_ADMIN_RELATION_WIDGET_THRESHOLD': 100,
+    'FAKER_ADMIN_DISTRIBUTION_MAX_ROWS': 100000,
+    'FAKER_ADMIN_PER_ROW_WARNING_THRESHOLD': 1000,
+    'FAKER_ADMIN_PROFILE_DIR': None,
+    'FAKER_ADMIN_METRICS_DIR': None,
+    'FAKER_ADMIN_COUNT_CACHE': 'default',
+    'FAKER_ADMIN_COUNT_CACHE_TTL': 60,
+    'FAKER_ADMIN_ESTIMATED_COUNT_THRESHOLD': 10000,
 }
 
 
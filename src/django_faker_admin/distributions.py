@@ -0,0 +1,341 @@
+import math
+import random
+from typing import Any, Dict, List, Sequence, Type
+
+from django.db import models
+from django.core.exceptions import FieldDoesNotExist
+
+from django_faker_admin.conf import settings
+
+
+#: Every value is as likely as the others.
+UNIFORM = 'uniform'
+#: The value of rank ``k`` is drawn with a probability proportional to ``1 / k ** exponent``: a few hot values.
+ZIPF = 'zipf'
+#: Values are drawn around a relative position of their list, with a relative standard deviation.
+NORMAL = 'normal'
+#: Values are drawn with explicit weights.
+WEIGHTS = 'weights'
+
+DISTRIBUTIONS = (UNIFORM, ZIPF, NORMAL, WEIGHTS)
+
+#: A distribution: its kind, either alone or in a dict with its parameters, e.g. ``{'kind': 'zipf', 'exponent': 1.2}``,
+#: ``{'kind': 'normal', 'mean': 0.5, 'stddev': 0.1}`` or ``{'kind': 'weights', 'weights': {'paid': 8, 'refunded': 1}}``.
+type Distribution = str | Dict[str, Any]
+
+
+class AliasTable:
+    """
+    Samples indexes with given weights in constant time, with Vose's alias method.
+
+    The table is built once, in linear time: every index gets a probability of being kept and an alias drawn
+    otherwise. Drawing an index then takes two random numbers, whatever the number of weights.
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """
+        Builds the table.
+
+        Args:
+            - weights (Sequence[float]): The non-negative weights of the indexes.
+
+        Raises:
+            - ValueError: If there is no weight, a weight is negative, or every weight is zero.
+        """
+        count = len(weights)
+        total = math.fsum(weights)
+        if not count or total <= 0 or any(weight < 0 for weight in weights):
+            raise ValueError("The weights should be non-negative, with at least one positive weight.")
+
+        self.count = count
+        self.probabilities = [weight * count / total for weight in weights]
+        self.aliases = list(range(count))
+        small = [index for index, probability in enumerate(self.probabilities) if probability < 1.0]
+        large = [index for index, probability in enumerate(self.probabilities) if probability >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.aliases[less] = more
+            self.probabilities[more] -= 1.0 - self.probabilities[less]
+            (small if self.probabilities[more] < 1.0 else large).append(more)
+        # What is left only differs from 1 by rounding errors
+        for index in small + large:
+            self.probabilities[index] = 1.0
+
+    def sample(self, randgen: random.Random) -> int:
+        """
+        Draws an index.
+
+        Args:
+            - randgen (random.Random): The random generator.
+
+        Returns:
+            - int: The index.
+        """
+        index = int(randgen.random() * self.count)
+        return index if randgen.random() < self.probabilities[index] else self.aliases[index]
+
+
+def normalize_distribution(distribution: Distribution) -> Dict[str, Any]:
+    """
+    Returns a distribution as a dict, with the default values of its parameters.
+
+    Args:
+        - distribution (Distribution): The distribution.
+
+    Returns:
+        - dict: The ``kind`` of the distribution and its parameters.
+
+    Raises:
+        - ValueError: If the kind is unknown, or a parameter is invalid.
+    """
+    if isinstance(distribution, str):
+        distribution = {'kind': distribution}
+    kind = distribution.get('kind')
+    if kind == UNIFORM:
+        return {'kind': UNIFORM}
+    if kind == ZIPF:
+        exponent = float(distribution.get('exponent', 1.0))
+        if exponent < 0:
+            raise ValueError("The exponent of a Zipf distribution should not be negative.")
+        return {'kind': ZIPF, 'exponent': exponent}
+    if kind == NORMAL:
+        mean, stddev = float(distribution.get('mean', 0.5)), float(distribution.get('stddev', 0.15))
+        if stddev <= 0:
+            raise ValueError("The standard deviation of a normal distribution should be positive.")
+        return {'kind': NORMAL, 'mean': mean, 'stddev': stddev}
+    if kind == WEIGHTS:
+        weights = distribution.get('weights')
+        if not isinstance(weights, dict) or not weights:
+            raise ValueError("A weights distribution needs the weights of its values.")
+        return {'kind': WEIGHTS, 'weights': {str(value): float(weight) for value, weight in weights.items()}}
+    raise ValueError(f"Unknown distribution '{kind}', expected one of {', '.join(DISTRIBUTIONS)}.")
+
+
+def get_weights(distribution: Distribution, values: Sequence[Any]) -> List[float]:
+    """
+    Returns the weights a distribution gives to a list of values, ranked in order.
+
+    Args:
+        - distribution (Distribution): The distribution.
+        - values (Sequence): The values.
+
+    Returns:
+        - list: The weight of every value.
+
+    Raises:
+        - ValueError: If the distribution is invalid, or weighs values that are not in the list.
+    """
+    distribution = normalize_distribution(distribution)
+    kind, count = distribution['kind'], len(values)
+    if kind == ZIPF:
+        return [1.0 / rank ** distribution['exponent'] for rank in range(1, count + 1)]
+    if kind == NORMAL:
+        mean, stddev = distribution['mean'], distribution['stddev']
+        # The value at position ``i`` stands for the middle of the ``i``-th slice of [0, 1]
+        return [math.exp(-0.5 * (((index + 0.5) / count - mean) / stddev) ** 2) for index in range(count)]
+    if kind == WEIGHTS:
+        weights = distribution['weights']
+        unknown = set(weights) - {str(value) for value in values}
+        if unknown:
+            raise ValueError(f"Unknown value(s) {', '.join(sorted(unknown))}.")
+        return [weights.get(str(value), 0.0) for value in values]
+    return [1.0] * count
+
+
+class DistributionSampler:
+    """
+    Draws values from a list with the weights of a distribution, in constant time per value.
+
+    It replaces the values built by the factory, which are ignored, so it can be used as a sampler of `BulkGenerator`.
+    """
+
+    def __init__(self, values: Sequence[Any], distribution: Distribution) -> None:
+        """
+        Initializes the sampler.
+
+        Args:
+            - values (Sequence): The values, ranked in order, e.g. from the hottest to the coldest for Zipf.
+            - distribution (Distribution): The distribution.
+
+        Raises:
+            - ValueError: If the distribution is invalid, weighs values that are not in the list, or gives no weight to
+              any value.
+        """
+        self.values = list(values)
+        self.table = AliasTable(get_weights(distribution, self.values))
+
+    def __call__(self, randgen: random.Random, value: Any = None) -> Any:
+        return self.values[self.table.sample(randgen)]
+
+
+def get_distribution_field(model: Type[models.Model], field_name: str) -> models.Field:
+    """
+    Returns a field of a model whose values can be drawn from a distribution.
+
+    Args:
+        - model (Type[Model]): The model.
+        - field_name (str): The name of the field.
+
+    Returns:
+        - Field: The field.
+
+    Raises:
+        - ValueError: If the field does not exist, or is neither a field with choices nor a many-to-one foreign key.
+    """
+    try:
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        field = None
+    if field is None or not field.concrete or not (field.choices or field.many_to_one):
+        raise ValueError(
+            f"'{field_name}' is neither a field with choices nor a foreign key of {model._meta.label}."
+        )
+    return field
+
+
+def get_distribution_fields(model: Type[models.Model]) -> List[models.Field]:
+    """
+    Returns the fields of a model whose values can be drawn from a distribution.
+
+    Args:
+        - model (Type[Model]): The model.
+
+    Returns:
+        - list: The fields with choices and the many-to-one foreign keys, in declaration order.
+    """
+    return [
+        field for field in model._meta.concrete_fields
+        if (field.choices or field.many_to_one) and not field.primary_key
+    ]
+
+
+def get_distribution_values(field: models.Field, using: str, max_rows: int = None) -> List[Any]:
+    """
+    Returns the values a field may take, ranked in order.
+
+    The values of a foreign key are all read into memory, so the number of rows it may point at is capped.
+
+    Args:
+        - field (Field): A field with choices, or a foreign key.
+        - using (str): The database alias the rows a foreign key points at are read from.
+        - max_rows (int): The maximum number of rows a foreign key may point at. Defaults to the
+          ``FAKER_ADMIN_DISTRIBUTION_MAX_ROWS`` setting, which sets no limit when None.
+
+    Returns:
+        - list: The values of the choices, in declaration order, or the values of the column the foreign key points at,
+          ordered by primary key.
+
+    Raises:
+        - ValueError: If the foreign key points at more rows than the maximum.
+    """
+    if not field.many_to_one:
+        return [value for value, _ in field.flatchoices]
+    max_rows = settings.FAKER_ADMIN_DISTRIBUTION_MAX_ROWS if max_rows is None else max_rows
+    related_model = field.related_model
+    values = (
+        related_model._default_manager.using(using)
+        .complex_filter(field.get_limit_choices_to())
+        .order_by('pk')
+        .values_list(field.target_field.attname, flat=True)
+    )
+    if max_rows is None:
+        return list(values)
+    values = list(values[:max_rows + 1])
+    if len(values) > max_rows:
+        raise ValueError(
+            f"'{field.name}' points at more than {max_rows} rows of {related_model._meta.label}, too many to draw "
+            f"from a distribution."
+        )
+    return values
+
+
+def get_distribution_samplers(
+        model: Type[models.Model],
+        distributions: Dict[str, Distribution],
+        using: str
+    ) -> Dict[str, DistributionSampler]:
+    """
+    Returns the samplers of the fields of a model drawn from distributions.
+
+    The rows a foreign key points at are read once, when the sampler is built, and the foreign key is assigned from
+    them: no related row is created.
+
+    Args:
+        - model (Type[Model]): The model.
+        - distributions (dict): The distributions, by field name.
+        - using (str): The database alias the rows foreign keys point at are read from.
+
+    Returns:
+        - dict: The samplers, by field attribute name.
+
+    Raises:
+        - ValueError: If a field cannot be drawn from a distribution, a distribution is invalid, or a foreign key points
+          at an empty table.
+    """
+    samplers = {}
+    for field_name, distribution in (distributions or {}).items():
+        field = get_distribution_field(model, field_name)
+        values = get_distribution_values(field, using)
+        if not values:
+            raise ValueError(f"There are no rows to point '{field_name}' at.")
+        try:
+            samplers[field.attname] = DistributionSampler(values, distribution)
+        except ValueError as e:
+            raise ValueError(f"Invalid distribution of '{field_name}': {e}")
+    return samplers
+
+
+def parse_distribution(kind: str, parameters: str = '') -> Dict[str, Any]:
+    """
+    Parses a distribution from its kind and its parameters written as text, as in the populate form.
+
+    Parameters are the exponent for Zipf, e.g. ``1.2``, the relative mean and standard deviation for normal, e.g.
+    ``0.5, 0.1``, and ``value=weight`` pairs for weights, e.g. ``paid=8, refunded=1``. Missing parameters take their
+    default values.
+
+    Args:
+        - kind (str): The kind of distribution.
+        - parameters (str): The parameters.
+
+    Returns:
+        - dict: The distribution.
+
+    Raises:
+        - ValueError: If the kind is unknown, or the parameters are invalid.
+    """
+    values = [value.strip() for value in (parameters or '').split(',') if value.strip()]
+    distribution = {'kind': kind}
+    if kind == ZIPF and values:
+        distribution['exponent'] = values[0]
+    elif kind == NORMAL and values:
+        distribution.update(zip(('mean', 'stddev'), values))
+    elif kind == WEIGHTS:
+        weights = {}
+        for value in values:
+            key, separator, weight = value.rpartition('=')
+            if not separator or not key:
+                raise ValueError(f"Invalid weight '{value}', expected 'value=weight'.")
+            weights[key.strip()] = weight
+        distribution['weights'] = weights
+    return normalize_distribution(distribution)
+
+
+def format_parameters(distribution: Distribution) -> str:
+    """
+    Writes the parameters of a distribution as text, the reverse of `parse_distribution`.
+
+    Args:
+        - distribution (Distribution): The distribution.
+
+    Returns:
+        - str: The parameters.
+    """
+    distribution = normalize_distribution(distribution)
+    kind = distribution['kind']
+    if kind == ZIPF:
+        return f"{distribution['exponent']:g}"
+    if kind == NORMAL:
+        return f"{distribution['mean']:g}, {distribution['stddev']:g}"
+    if kind == WEIGHTS:
+        return ', '.join(f'{value}={weight:g}' for value, weight in distribution['weights'].items())
+    return ''
@@ -0,0 +1,226 @@
+import random
+from typing import Any, Dict, Iterator, List, Tuple, Type
+
+from django.db import models
+from django.core.exceptions import FieldDoesNotExist
+from factory.django import DjangoModelFactory
+
+from django_faker_admin.conf import settings
+from django_faker_admin.bulk import BulkGenerator, FanOut, get_factory_path, resolve_database, run_tracked
+
+
+#: Generate a number of child rows for every parent row, through a foreign key of the children.
+FAN_OUT_STRATEGY = 'fan_out'
+
+
+def get_parent_field(model: Type[models.Model], field_name: str) -> models.ForeignKey:
+    """
+    Returns the foreign key of a child model pointing at its parents.
+
+    Args:
+        - model (Type[Model]): The child model.
+        - field_name (str): The name of the foreign key.
+
+    Returns:
+        - ForeignKey: The field.
+
+    Raises:
+        - ValueError: If the field does not exist, or is not a many-to-one foreign key.
+    """
+    try:
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        raise ValueError(f"{model._meta.label} has no field named '{field_name}'.")
+    if not field.many_to_one:
+        raise ValueError(
+            f"'{field_name}' is not a foreign key of {model._meta.label} allowing several rows per parent."
+        )
+    return field
+
+
+def get_fan_out_relations(model: Type[models.Model]) -> List[models.ForeignKey]:
+    """
+    Returns the foreign keys of other models that point at a model and allow several rows per row of the model.
+
+    Args:
+        - model (Type[Model]): The parent model.
+
+    Returns:
+        - list: The foreign keys of the child models.
+    """
+    return [
+        relation.remote_field
+        for relation in model._meta.related_objects
+        if relation.one_to_many and relation.remote_field.concrete
+    ]
+
+
+class FanOutGenerator(BulkGenerator):
+    """
+    Generates a random number of child rows for every parent row, in chunks of bulk inserts.
+
+    The parents are streamed as the values of the column the foreign key points at, never as model instances. The
+    number of children of every parent is drawn from its own random generator, seeded with the run's seed, so the
+    parents are read twice: once to count the rows of the run, then to generate them. Rows inserted meanwhile, e.g.
+    by a self-referencing foreign key, never raise the number of rows past the count of the first pass.
+
+    Children are built by the factory class with the foreign key overridden with None, so that a ``SubFactory`` does
+    not create a parent for every child, then pointed at their parent.
+    """
+
+    def __init__(
+            self,
+            factory_class: Type[DjangoModelFactory],
+            field_name: str,
+            parents: models.QuerySet,
+            fan_out: FanOut,
+            overrides: Dict[str, Any] = None,
+            seed: int = None,
+            **kwargs
+        ) -> None:
+        """
+        Initializes the generator and counts the rows to generate.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class of the child model.
+            - field_name (str): The name of the child model's foreign key pointing at the parents.
+            - parents (QuerySet): The parent rows.
+            - fan_out (FanOut): The number of children per parent.
+            - overrides (dict): Field values passed to the factory for every child.
+            - seed (int): Seed for the random generators, making the run reproducible.
+            - kwargs: Extra keyword arguments passed to `BulkGenerator`.
+
+        Raises:
+            - ValueError: If the foreign key cannot hold several children per parent, the parents are not rows of the
+              model it points at, or the number of children is invalid.
+        """
+        model = factory_class._meta.model
+        self.field = get_parent_field(model, field_name)
+        if not issubclass(parents.model, self.field.related_model):
+            raise ValueError(
+                f"The parents should be {self.field.related_model._meta.label} rows, not {parents.model._meta.label}."
+            )
+        self.fan_out = (fan_out, fan_out) if isinstance(fan_out, int) else tuple(fan_out)
+        if not 0 <= self.fan_out[0] <= self.fan_out[1]:
+            raise ValueError(f"Invalid number of children per parent: {fan_out}.")
+
+        self.parents = parents
+        self.counts_seed = seed if seed is not None else random.randrange(2 ** 32)
+        size = sum(count for _, count in self.iter_counts())
+        super().__init__(
+            factory_class, size=size, overrides={**(overrides or {}), self.field.name: None}, seed=seed, **kwargs
+        )
+
+    def iter_counts(self) -> Iterator[Tuple[Any, int]]:
+        """
+        Yields every parent with its number of children, the same every time.
+
+        Yields:
+            - tuple: The value the foreign key of the children takes, and the number of children.
+        """
+        randgen = random.Random(self.counts_seed)
+        values = self.parents.order_by('pk').values_list(self.field.target_field.attname, flat=True)
+        for value in values.iterator(chunk_size=settings.FAKER_ADMIN_BULK_CHUNK_SIZE):
+            yield value, randgen.randint(*self.fan_out)
+
+    def iter_chunks(self) -> Iterator[List[models.Model]]:
+        """
+        Yields chunks of unsaved children until every parent has its children, or the run is cancelled.
+
+        The children of a parent may be split across two chunks.
+
+        Yields:
+            - list: A chunk of at most `chunk_size` unsaved model instances.
+        """
+        remaining = self.size
+        chunk = []
+        for value, count in self.iter_counts():
+            count = min(count, remaining)
+            remaining -= count
+            while count > 0:
+                if not chunk and self.cancel_check is not None and self.cancel_check():
+                    self.cancelled = True
+                    return
+                objs = self.build_objects(min(count, max(1, self.chunk_size - len(chunk))))
+                for obj in objs:
+                    setattr(obj, self.field.attname, value)
+                chunk.extend(objs)
+                count -= len(objs)
+                if len(chunk) >= self.chunk_size:
+                    yield chunk
+                    chunk = []
+            if remaining <= 0:
+                break
+        if chunk:
+            yield chunk
+
+
+def fan_out(
+        factory_class: Type[DjangoModelFactory],
+        field_name: str,
+        parents: models.QuerySet,
+        counts: FanOut,
+        overrides: Dict[str, Any] = None,
+        seed: int = None,
+        chunk_size: int = None,
+        using: str = None,
+        writers: int = None
+    ) -> int:
+    """
+    Generates a random number of child rows for every parent row, e.g. 5 to 50 orders for every customer.
+
+    The run is recorded as a `PopulationRun` with the fan-out strategy, along with the primary key ranges of the
+    children, so that they can be purged like other generated rows. Fan-out runs can be cancelled, but not resumed.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class of the child model.
+        - field_name (str): The name of the child model's foreign key pointing at the parents.
+        - parents (QuerySet): The parent rows, e.g. the rows selected in a change list, or every row.
+        - counts (FanOut): The number of children per parent: an exact count or an inclusive ``(min, max)`` range.
+        - overrides (dict): Field values passed to the factory for every child.
+        - seed (int): Seed for the random generators.
+        - chunk_size (int): The number of children inserted per chunk. When not given and `FAKER_ADMIN_AUTOTUNE` is
+          enabled, the chunk size is tuned during the run.
+        - using (str): The database alias to write to. Defaults to the factory's ``Meta.database``, then to the alias
+          picked by the database routers.
+        - writers (int): The number of threads inserting chunks concurrently. Defaults to `FAKER_ADMIN_WRITERS`.
+
+    Returns:
+        - int: The number of rows written.
+
+    Raises:
+        - ValueError: If the children cannot be generated, see `FanOutGenerator`.
+    """
+    from django_faker_admin.tracking import start_run, encode_overrides
+
+    using = resolve_database(factory_class, using)
+    generator = FanOutGenerator(
+        factory_class=factory_class,
+        field_name=field_name,
+        parents=parents,
+        fan_out=counts,
+        overrides=overrides,
+        seed=seed,
+        chunk_size=chunk_size,
+        using=using,
+        autotune=chunk_size is None and settings.FAKER_ADMIN_AUTOTUNE,
+        writers=writers
+    )
+    run, tracker = start_run(
+        generator.model,
+        size=generator.size,
+        strategy=FAN_OUT_STRATEGY,
+        seed=seed,
+        using=using,
+        factory_path=get_factory_path(factory_class),
+        options={
+            'field': field_name,
+            'counts': counts,
+            'overrides': encode_overrides(overrides or {}),
+            'chunk_size': chunk_size,
+        },
+        resumable=False
+    )
+    generator.chunk_callbacks.extend([tracker.track, tracker.checkpoint])
+    generator.cancel_check = tracker.is_cancel_requested
+    return run_tracked(run, generator.run)
@@ -0,0 +1,27 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+
+
+class GeneratedListFilter(admin.SimpleListFilter):
+    """
+    A change list filter that shows either the rows created by population runs or the other ones.
+
+    The filter matches rows against the tracked primary key ranges, so it is a cheap range query even on large tables.
+    """
+    title = _("dummy data")
+    parameter_name = 'generated'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('yes', _("Generated")),
+            ('no', _("Not generated")),
+        )
+
+    def queryset(self, request, queryset):
+        from django_faker_admin.tracking import generated_condition
+
+        if self.value() == 'yes':
+            return queryset.filter(generated_condition(queryset.model, queryset.db))
+        if self.value() == 'no':
+            return queryset.exclude(generated_condition(queryset.model, queryset.db))
+        return queryset
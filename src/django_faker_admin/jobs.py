@@ -0,0 +1,437 @@
+import os
+import socket
+import threading
+import traceback
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterator, Optional, Type
+
+from django.db import connections, router, transaction
+from django.db.models import F
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from factory.django import DjangoModelFactory
+
+from django_faker_admin.bulk import FanOut, check_resumable, generate, get_factory_path, resolve_database, resume
+from django_faker_admin.models import PopulationJob, PopulationRun
+from django_faker_admin.tracking import decode_overrides, encode_overrides
+
+
+def get_worker_name() -> str:
+    """
+    Returns a name identifying the current worker process across hosts.
+
+    Returns:
+        - str: The host name and the process id.
+    """
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def get_queue_database() -> str:
+    """
+    Returns the database alias holding the job queue.
+
+    Returns:
+        - str: The alias picked by the database routers for `PopulationJob`.
+    """
+    return router.db_for_write(PopulationJob)
+
+
+def enqueue(
+        factory_class: Type[DjangoModelFactory],
+        size: int,
+        overrides: Dict[str, Any] = None,
+        seed: int = None,
+        strategy: str = None,
+        chunk_size: int = None,
+        using: str = None,
+        m2m_fan_out: Dict[str, FanOut] = None,
+        writers: int = None,
+        value_profile: Dict[str, Any] = None,
+        distributions: Dict[str, Any] = None,
+        time_series: Dict[str, Any] = None
+    ) -> PopulationJob:
+    """
+    Queues a population for a worker process, with the arguments of `generate`.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class used to generate the objects. It must be
+          importable from its module.
+        - size (int): The number of objects to generate.
+        - overrides (dict): Field values passed to the factory for every object.
+        - seed (int): Seed for the factory and Faker random generators.
+        - strategy (str): The generation strategy. Defaults to `FAKER_ADMIN_STRATEGY` when the job runs.
+        - chunk_size (int): The number of objects inserted per chunk, for the bulk strategy.
+        - using (str): The database alias to write to. Defaults to the alias resolved when the job runs.
+        - m2m_fan_out (dict): The number of related objects per generated object, by many-to-many field name.
+        - writers (int): The number of threads inserting chunks concurrently, for the bulk strategy.
+        - value_profile (dict): The value profile the values of the profiled fields are sampled from.
+        - distributions (dict): The distributions the values of fields are drawn from, by field name.
+        - time_series (dict): The date range, rate curve and timestamp fields the timestamps of the objects are spread
+          with.
+
+    Returns:
+        - PopulationJob: The queued job.
+
+    Raises:
+        - ValueError: If the time series is invalid.
+    """
+    from django_faker_admin.timeseries import normalize_time_series
+
+    queue_database = get_queue_database()
+    return PopulationJob.objects.using(queue_database).create(
+        content_type=ContentType.objects.db_manager(queue_database).get_for_model(factory_class._meta.model),
+        factory_path=get_factory_path(factory_class),
+        size=size,
+        database=using or '',
+        options={
+            'overrides': encode_overrides(overrides or {}),
+            'seed': seed,
+            'strategy': strategy,
+            'chunk_size': chunk_size,
+            'm2m_fan_out': m2m_fan_out,
+            'writers': writers,
+            'value_profile': value_profile,
+            'distributions': distributions,
+            'time_series': normalize_time_series(time_series) if time_series else None,
+        }
+    )
+
+
+def enqueue_resume(run: PopulationRun, writers: int = None) -> PopulationJob:
+    """
+    Queues the resumption of an interrupted bulk population run for a worker process, which resumes it from its last
+    checkpoint.
+
+    Args:
+        - run (PopulationRun): The run to resume.
+        - writers (int): The number of threads inserting chunks concurrently. Defaults to `FAKER_ADMIN_WRITERS`.
+
+    Returns:
+        - PopulationJob: The queued job.
+
+    Raises:
+        - ValueError: If the run cannot be resumed, see `check_resumable`, or a job of the run is already queued or
+          running.
+    """
+    run.refresh_from_db()
+    check_resumable(run)
+    queue_database = get_queue_database()
+    jobs = PopulationJob.objects.using(queue_database)
+    active = (PopulationJob.Status.QUEUED, PopulationJob.Status.RUNNING)
+    if jobs.filter(run_pk=run.pk, database=run._state.db, status__in=active).exists():
+        raise ValueError(f"Population run #{run.pk} is already queued.")
+    return jobs.create(
+        content_type=ContentType.objects.db_manager(queue_database).get_for_model(run.content_type.model_class()),
+        factory_path=run.factory_path,
+        size=run.size,
+        database=run._state.db,
+        run_pk=run.pk,
+        options={**run.options, 'seed': run.seed, 'strategy': run.strategy, 'writers': writers}
+    )
+
+
+def claim_job(worker: str, using: str = None) -> Optional[PopulationJob]:
+    """
+    Claims the oldest queued job for a worker, safely when several workers poll the queue at once.
+
+    On backends supporting ``SELECT ... FOR UPDATE SKIP LOCKED``, the job is locked, skipping the jobs other workers are
+    claiming. Elsewhere, as on SQLite, the job is claimed with an update conditioned on it still being queued, which
+    only one worker can win; the losers try the next job.
+
+    Args:
+        - worker (str): The name of the worker.
+        - using (str): The database alias holding the queue. Defaults to `get_queue_database`.
+
+    Returns:
+        - PopulationJob: The claimed job, or None if the queue is empty.
+    """
+    using = using or get_queue_database()
+    jobs = PopulationJob.objects.using(using)
+    queued = jobs.filter(status=PopulationJob.Status.QUEUED).order_by('pk')
+    now = timezone.now()
+    claim = {
+        'status': PopulationJob.Status.RUNNING,
+        'worker': worker,
+        'claimed_at': now,
+        'heartbeat_at': now,
+        'attempts': F('attempts') + 1,
+    }
+
+    if connections[using].features.has_select_for_update_skip_locked:
+        with transaction.atomic(using=using):
+            job = queued.select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            jobs.filter(pk=job.pk).update(**claim)
+        return jobs.get(pk=job.pk)
+
+    while True:
+        pk = queued.values_list('pk', flat=True).first()
+        if pk is None:
+            return None
+        if jobs.filter(pk=pk, status=PopulationJob.Status.QUEUED).update(**claim):
+            return jobs.get(pk=pk)
+
+
+def heartbeat(job: PopulationJob) -> bool:
+    """
+    Records that the worker of a job is still running it.
+
+    Args:
+        - job (PopulationJob): The running job.
+
+    Returns:
+        - bool: False if the job is no longer held by its worker, e.g. because it was re-queued as stalled.
+    """
+    return bool(
+        PopulationJob.objects.using(job._state.db).filter(
+            pk=job.pk, worker=job.worker, status=PopulationJob.Status.RUNNING
+        ).update(heartbeat_at=timezone.now())
+    )
+
+
+def requeue_stalled(timeout: float, max_attempts: int = 3, using: str = None) -> int:
+    """
+    Puts back in the queue the running jobs whose worker sent no heartbeat for `timeout` seconds.
+
+    Jobs that already stalled `max_attempts` times are marked as failed instead.
+
+    Args:
+        - timeout (float): The number of seconds without heartbeat after which a job is stalled.
+        - max_attempts (int): The number of times a job may be claimed.
+        - using (str): The database alias holding the queue. Defaults to `get_queue_database`.
+
+    Returns:
+        - int: The number of re-queued jobs.
+    """
+    using = using or get_queue_database()
+    now = timezone.now()
+    stalled = PopulationJob.objects.using(using).filter(
+        status=PopulationJob.Status.RUNNING, heartbeat_at__lt=now - timedelta(seconds=timeout)
+    )
+    stalled.filter(attempts__gte=max_attempts).update(
+        status=PopulationJob.Status.FAILED,
+        finished_at=now,
+        error=f"The job stalled {max_attempts} times."
+    )
+    return stalled.filter(attempts__lt=max_attempts).update(status=PopulationJob.Status.QUEUED, worker='')
+
+
+def run_job(job: PopulationJob, cancel_check: Callable[[], bool] = None, stale_after: float = None) -> int:
+    """
+    Runs a claimed job.
+
+    A job whose previous attempt stalled after recording its population run resumes that run from its last
+    checkpoint, so committed chunks are neither generated again nor duplicated.
+
+    Args:
+        - job (PopulationJob): The claimed job.
+        - cancel_check (Callable): Called before every chunk of a bulk run: the run is cancelled as soon as it returns
+          True.
+        - stale_after (float): The number of seconds without checkpoint after which the run of a previous attempt,
+          still recorded as running, may be resumed. Defaults to `FAKER_ADMIN_STALE_RUN_TIMEOUT`.
+
+    Returns:
+        - int: The total number of rows written by the job's run.
+
+    Raises:
+        - ValueError: If the run of a previous attempt cannot be resumed.
+        - ImportError: If the factory class cannot be imported.
+    """
+    factory_class = import_string(job.factory_path)
+    options = job.options
+    using = resolve_database(factory_class, job.database or None)
+
+    run = None
+    if job.run_pk is not None:
+        run = PopulationRun.objects.using(using).filter(pk=job.run_pk).first()
+    if run is not None:
+        if run.status == PopulationRun.Status.FINISHED:
+            return run.rows_written
+        return resume(run, writers=options.get('writers'), stale_after=stale_after, cancel_check=cancel_check)
+
+    def on_start(run: PopulationRun) -> None:
+        job.run_pk = run.pk
+        PopulationJob.objects.using(job._state.db).filter(pk=job.pk).update(run_pk=run.pk)
+
+    return generate(
+        factory_class,
+        job.size,
+        overrides=decode_overrides(options.get('overrides'), using),
+        seed=options.get('seed'),
+        strategy=options.get('strategy'),
+        chunk_size=options.get('chunk_size'),
+        using=using,
+        m2m_fan_out=options.get('m2m_fan_out'),
+        writers=options.get('writers'),
+        on_start=on_start,
+        value_profile=options.get('value_profile'),
+        distributions=options.get('distributions'),
+        time_series=options.get('time_series'),
+        cancel_check=cancel_check
+    )
+
+
+class Worker:
+    """
+    Runs queued population jobs, one at a time, out of the web processes.
+
+    Every poll first re-queues the stalled jobs, then claims the oldest queued job and runs it, sending heartbeats from
+    a background thread while it runs. The worker's connection is kept open between jobs. `stall_timeout` should be
+    several times `heartbeat_interval`, so that a slow heartbeat is not mistaken for a dead worker.
+
+    A worker whose heartbeat fails, e.g. because its job was re-queued as stalled meanwhile, no longer holds the job:
+    its bulk run is cancelled after the current chunk, and the job is left to the worker that claims it next, which
+    resumes the cancelled run. The run of a stalled job still recorded as running is resumed once its last checkpoint
+    is `stall_timeout - heartbeat_interval` seconds old, the least a dead worker leaves between its last checkpoint and
+    the re-queuing of its job.
+    """
+
+    def __init__(
+            self,
+            name: str = None,
+            using: str = None,
+            poll_interval: float = 1.0,
+            heartbeat_interval: float = 10.0,
+            stall_timeout: float = 60.0,
+            max_attempts: int = 3
+        ) -> None:
+        """
+        Initializes the worker.
+
+        Args:
+            - name (str): The name of the worker. Defaults to `get_worker_name`.
+            - using (str): The database alias holding the queue. Defaults to `get_queue_database`.
+            - poll_interval (float): The number of seconds to wait when the queue is empty.
+            - heartbeat_interval (float): The number of seconds between heartbeats.
+            - stall_timeout (float): The number of seconds without heartbeat after which a job is re-queued.
+            - max_attempts (int): The number of times a job may be claimed before it is marked as failed.
+        """
+        self.name = name or get_worker_name()
+        self.using = using or get_queue_database()
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stall_timeout = stall_timeout
+        self.max_attempts = max_attempts
+        self.stop_event = threading.Event()
+
+    @contextmanager
+    def heartbeats(self, job: PopulationJob) -> Iterator[threading.Event]:
+        """
+        Sends heartbeats for a job from a background thread, with its own connection, until the block exits.
+
+        Heartbeats stop at the first one that fails, either because the job is no longer held by the worker or because
+        it could not be recorded: the worker cannot tell whether the job was re-queued meanwhile.
+
+        Args:
+            - job (PopulationJob): The running job.
+
+        Yields:
+            - Event: Set once a heartbeat failed.
+        """
+        stop, lost = threading.Event(), threading.Event()
+
+        def beat() -> None:
+            try:
+                while not stop.wait(self.heartbeat_interval):
+                    try:
+                        alive = heartbeat(job)
+                    except Exception:
+                        alive = False
+                    if not alive:
+                        lost.set()
+                        break
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=beat, name=f'faker-heartbeat-{job.pk}', daemon=True)
+        thread.start()
+        try:
+            yield lost
+        finally:
+            stop.set()
+            thread.join()
+
+    def finish(self, job: PopulationJob, status: str, **values) -> None:
+        """
+        Records the end of a job, unless it was re-queued meanwhile.
+
+        Args:
+            - job (PopulationJob): The job.
+            - status (str): The final status.
+            - values: Other fields to update.
+        """
+        PopulationJob.objects.using(self.using).filter(pk=job.pk, worker=self.name).update(
+            status=status, finished_at=timezone.now(), **values
+        )
+        job.refresh_from_db()
+
+    def run_once(self) -> Optional[PopulationJob]:
+        """
+        Re-queues the stalled jobs, then claims and runs the oldest queued job.
+
+        A job interrupted by ``KeyboardInterrupt`` or ``SystemExit`` is put back in the queue before the exception
+        propagates. The end of a job whose heartbeat failed is not recorded, the job being left to `requeue_stalled`.
+
+        Returns:
+            - PopulationJob: The job that was run, or None if the queue was empty.
+        """
+        requeue_stalled(self.stall_timeout, self.max_attempts, using=self.using)
+        job = claim_job(self.name, using=self.using)
+        if job is None:
+            return None
+
+        stale_after = max(self.stall_timeout - self.heartbeat_interval, 0)
+        with self.heartbeats(job) as lost:
+            try:
+                written = run_job(job, cancel_check=lost.is_set, stale_after=stale_after)
+            except Exception:
+                if not lost.is_set():
+                    self.finish(job, PopulationJob.Status.FAILED, error=traceback.format_exc())
+            except BaseException:
+                PopulationJob.objects.using(self.using).filter(pk=job.pk, worker=self.name).update(
+                    status=PopulationJob.Status.QUEUED, worker=''
+                )
+                raise
+            else:
+                if not lost.is_set():
+                    self.finish(job, PopulationJob.Status.FINISHED, rows_written=written)
+        return job
+
+    def run(
+            self,
+            max_jobs: int = None,
+            burst: bool = False,
+            on_job: Callable[[PopulationJob], Any] = None
+        ) -> int:
+        """
+        Runs jobs until `stop` is called, `max_jobs` jobs have run, or, in burst mode, the queue is empty.
+
+        Args:
+            - max_jobs (int): The maximum number of jobs to run.
+            - burst (bool): Stop as soon as the queue is empty instead of polling it.
+            - on_job (Callable): Called with every job once it has run.
+
+        Returns:
+            - int: The number of jobs run.
+        """
+        processed = 0
+        while not self.stop_event.is_set() and (max_jobs is None or processed < max_jobs):
+            job = self.run_once()
+            if job is None:
+                if burst:
+                    break
+                self.stop_event.wait(self.poll_interval)
+                continue
+            processed += 1
+            if on_job is not None:
+                on_job(job)
+        return processed
+
+    def stop(self) -> None:
+        """
+        Asks the worker to stop once its current job has run.
+        """
+        self.stop_event.set()
@@ -0,0 +1,502 @@
+import bisect
+import json
+import math
+import random
+from decimal import Decimal
+from datetime import date, datetime, timezone as dt_timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+
+from django.conf import settings
+from django.db import models, router
+from django.db.models import Count, Max, Min, Q
+from django.db.models.functions import Length
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from django_faker_admin.distributions import AliasTable
+
+#: The version of the value profile format.
+PROFILE_VERSION = 1
+
+#: The internal types of the fields whose values are profiled, by kind of histogram.
+NUMBER_TYPES = (
+    'IntegerField', 'BigIntegerField', 'SmallIntegerField', 'PositiveIntegerField', 'PositiveBigIntegerField',
+    'PositiveSmallIntegerField', 'FloatField', 'DecimalField',
+)
+TEXT_TYPES = ('CharField', 'TextField', 'SlugField', 'EmailField', 'URLField')
+DATE_TYPES = ('DateField',)
+DATETIME_TYPES = ('DateTimeField',)
+BOOLEAN_TYPES = ('BooleanField', 'NullBooleanField')
+
+#: A sampler of generated values: called with the random generator and the value built by the factory.
+type ValueSampler = Callable[[random.Random, Any], Any]
+
+
+def get_field_kind(field: models.Field) -> Optional[str]:
+    """
+    Returns the kind of values of a field, which tells how they are profiled.
+
+    Args:
+        - field (Field): The model field.
+
+    Returns:
+        - str: ``'number'``, ``'text'``, ``'date'``, ``'datetime'`` or ``'boolean'``, or None if the values of the
+          field are not profiled.
+    """
+    internal_type = field.get_internal_type()
+    for kind, types in (
+        ('number', NUMBER_TYPES),
+        ('text', TEXT_TYPES),
+        ('date', DATE_TYPES),
+        ('datetime', DATETIME_TYPES),
+        ('boolean', BOOLEAN_TYPES),
+    ):
+        if internal_type in types:
+            return kind
+    return None
+
+
+def get_profiled_fields(model: Type[models.Model]) -> List[models.Field]:
+    """
+    Returns the fields of a model whose values can be profiled and sampled.
+
+    Primary keys, relations, unique fields, and ``auto_now`` or ``auto_now_add`` fields are left out: sampled values
+    would collide, point at missing rows, or be overwritten on insert.
+
+    Args:
+        - model (Type[Model]): The model.
+
+    Returns:
+        - list: The fields, in declaration order.
+    """
+    return [
+        field for field in model._meta.concrete_fields
+        if not field.primary_key
+        and not field.is_relation
+        and not field.unique
+        and not getattr(field, 'auto_now', False)
+        and not getattr(field, 'auto_now_add', False)
+        and get_field_kind(field) is not None
+    ]
+
+
+def to_number(kind: str, value: Any) -> float:
+    """
+    Converts a value to the number its histogram is computed on.
+
+    Args:
+        - kind (str): The kind of values.
+        - value (Any): A number, a date or a datetime.
+
+    Returns:
+        - float: The number, the ordinal of the date, or the POSIX timestamp of the datetime.
+    """
+    if kind == 'date':
+        return float(value.toordinal())
+    if kind == 'datetime':
+        if timezone.is_naive(value):
+            value = value.replace(tzinfo=dt_timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+def from_number(field: models.Field, kind: str, number: float) -> Any:
+    """
+    Converts a number back to a value of a field, the reverse of `to_number`.
+
+    Args:
+        - field (Field): The model field.
+        - kind (str): The kind of values.
+        - number (float): The number.
+
+    Returns:
+        - Any: The value, rounded to the precision of the field.
+    """
+    if kind == 'date':
+        return date.fromordinal(int(number))
+    if kind == 'datetime':
+        value = datetime.fromtimestamp(number, tz=dt_timezone.utc)
+        return value if settings.USE_TZ else value.replace(tzinfo=None)
+    internal_type = field.get_internal_type()
+    if internal_type == 'FloatField':
+        return number
+    if internal_type == 'DecimalField':
+        return Decimal(str(round(number, field.decimal_places)))
+    return math.floor(number)
+
+
+def to_bound(field: models.Field, kind: str, number: float) -> Any:
+    """
+    Converts a histogram edge to the smallest value of a field that is not below it.
+
+    Args:
+        - field (Field): The model field.
+        - kind (str): The kind of values.
+        - number (float): The edge.
+
+    Returns:
+        - Any: The value, rounded up for integers and dates, so that buckets hold the same values as when sampled.
+    """
+    if kind == 'date' or (kind == 'number' and field.get_internal_type() not in ('FloatField', 'DecimalField')):
+        return from_number(field, kind, math.ceil(number))
+    return from_number(field, kind, number)
+
+
+def get_edges(low: float, high: float, bins: int) -> List[float]:
+    """
+    Splits a range into equal-width histogram buckets.
+
+    Args:
+        - low (float): The smallest value.
+        - high (float): The largest value.
+        - bins (int): The number of buckets.
+
+    Returns:
+        - list: The ``bins + 1`` bucket edges, or the single value when the range is empty.
+    """
+    if high <= low:
+        return [low]
+    width = (high - low) / bins
+    return [low + width * index for index in range(bins)] + [high]
+
+
+def count_buckets(
+        queryset: models.QuerySet,
+        expression: str,
+        edges: List[float],
+        convert: Callable[[float], Any]
+    ) -> List[int]:
+    """
+    Counts the rows of every histogram bucket with a single aggregate query.
+
+    Buckets include their lower edge and exclude their upper edge, but for the last one; the first and last buckets
+    are open-ended, so that rounding the edges never leaves the smallest or the largest values out.
+
+    Args:
+        - queryset (QuerySet): The rows.
+        - expression (str): The field or annotation the buckets are computed on.
+        - edges (list): The bucket edges, as numbers.
+        - convert (Callable): Converts an edge to a value of the expression.
+
+    Returns:
+        - list: The number of rows of every bucket.
+    """
+    last = len(edges) - 2
+    aggregates = {}
+    for index in range(last + 1):
+        condition = Q(**{f'{expression}__isnull': False})
+        if index > 0:
+            condition &= Q(**{f'{expression}__gte': convert(edges[index])})
+        if index < last:
+            condition &= Q(**{f'{expression}__lt': convert(edges[index + 1])})
+        aggregates[f'bucket_{index}'] = Count('pk', filter=condition)
+    counts = queryset.aggregate(**aggregates)
+    return [counts[f'bucket_{index}'] for index in range(last + 1)]
+
+
+def learn_histogram(
+        queryset: models.QuerySet,
+        expression: str,
+        kind: str,
+        field: models.Field,
+        bins: int
+    ) -> Optional[Dict[str, List]]:
+    """
+    Computes the equal-width histogram of the values of a field or annotation.
+
+    Args:
+        - queryset (QuerySet): The rows.
+        - expression (str): The field or annotation.
+        - kind (str): The kind of values.
+        - field (Field): The field the values are converted with.
+        - bins (int): The number of buckets.
+
+    Returns:
+        - dict: The bucket ``edges``, as numbers, and the ``counts`` of the buckets, or None if every value is null.
+    """
+    bounds = queryset.aggregate(low=Min(expression), high=Max(expression))
+    if bounds['low'] is None:
+        return None
+    edges = get_edges(to_number(kind, bounds['low']), to_number(kind, bounds['high']), bins)
+    if len(edges) == 1:
+        return {'edges': edges, 'counts': [queryset.filter(**{f'{expression}__isnull': False}).count()]}
+    return {
+        'edges': edges,
+        'counts': count_buckets(queryset, expression, edges, lambda number: to_bound(field, kind, number)),
+    }
+
+
+def learn_field(queryset: models.QuerySet, field: models.Field, rows: int, top: int, bins: int) -> Dict[str, Any]:
+    """
+    Learns the distribution of the values of a field.
+
+    Args:
+        - queryset (QuerySet): The rows.
+        - field (Field): The field.
+        - rows (int): The number of rows.
+        - top (int): The maximum number of most frequent values kept.
+        - bins (int): The number of histogram buckets.
+
+    Returns:
+        - dict: The profile of the field, see the module documentation.
+    """
+    kind = get_field_kind(field)
+    name = field.attname
+    counts = queryset.aggregate(non_null=Count(name), distinct=Count(name, distinct=True))
+    profile = {
+        'kind': kind,
+        'nulls': (rows - counts['non_null']) / rows if rows else 0.0,
+        'distinct': counts['distinct'],
+    }
+    # Values seen once are not frequent, and could be personal data
+    frequent = (
+        queryset.exclude(**{f'{name}__isnull': True})
+        .values_list(name)
+        .annotate(count=Count('pk'))
+        .filter(count__gt=1)
+        .order_by('-count', name)[:top]
+    )
+    profile['top'] = [[value, count] for value, count in frequent]
+    if kind in ('number', 'date', 'datetime'):
+        profile['histogram'] = learn_histogram(queryset, name, kind, field, bins)
+    elif kind == 'text':
+        lengths = queryset.annotate(faker_length=Length(name))
+        profile['lengths'] = learn_histogram(lengths, 'faker_length', 'number', models.IntegerField(), bins)
+    return profile
+
+
+def learn_value_profile(
+        model: Type[models.Model],
+        using: str = None,
+        fields: Iterable[str] = None,
+        top: int = 20,
+        bins: int = 20
+    ) -> Dict[str, Any]:
+    """
+    Learns the distributions of the values of a model's table, with aggregate queries only.
+
+    For every field, the profile holds the ratio of null values, the number of distinct values, the most frequent
+    values with their number of rows, and either the equal-width histogram of the values, for numbers, dates and
+    datetimes, or the histogram of their lengths, for text. Every field costs a handful of aggregate queries, each
+    scanning the table or one of its indexes once, and no row is ever read as such. The profile is a JSON-friendly
+    dict, e.g.:
+
+    .. code-block:: python
+
+        {
+            'version': 1,
+            'model': 'shop.order',
+            'rows': 1250000,
+            'fields': {
+                'status': {
+                    'kind': 'text', 'nulls': 0.0, 'distinct': 4,
+                    'top': [['paid', 900000], ['shipped', 250000], ...],
+                    'lengths': {'edges': [4.0, 4.2, ...], 'counts': [...]},
+                },
+                'total': {
+                    'kind': 'number', 'nulls': 0.02, 'distinct': 48211,
+                    'top': [['9.99', 31000], ...],
+                    'histogram': {'edges': [0.5, 25.3, ...], 'counts': [...]},
+                },
+            },
+        }
+
+    Args:
+        - model (Type[Model]): The model.
+        - using (str): The database alias to read from. Defaults to the alias picked by the database routers.
+        - fields (Iterable[str]): The names of the fields to profile. Defaults to `get_profiled_fields`.
+        - top (int): The maximum number of most frequent values kept per field.
+        - bins (int): The number of histogram buckets.
+
+    Returns:
+        - dict: The value profile.
+
+    Raises:
+        - ValueError: If a field does not exist or cannot be profiled.
+    """
+    profiled = {field.name: field for field in get_profiled_fields(model)}
+    if fields is not None:
+        unknown = [name for name in fields if name not in profiled]
+        if unknown:
+            raise ValueError(f"Cannot profile the field(s) {', '.join(unknown)} of {model._meta.label}.")
+        profiled = {name: profiled[name] for name in fields}
+
+    queryset = model._default_manager.using(using or router.db_for_read(model)).order_by()
+    rows = queryset.count()
+    return {
+        'version': PROFILE_VERSION,
+        'model': model._meta.label_lower,
+        'rows': rows,
+        'fields': {name: learn_field(queryset, field, rows, top, bins) for name, field in profiled.items()},
+    }
+
+
+def save_value_profile(profile: Dict[str, Any], path: str | Path) -> None:
+    """
+    Saves a value profile to a JSON file.
+
+    Args:
+        - profile (dict): The value profile.
+        - path (str | Path): The file path.
+    """
+    Path(path).write_text(json.dumps(profile, cls=DjangoJSONEncoder, indent=2), encoding='utf-8')
+
+
+def load_value_profile(path: str | Path) -> Dict[str, Any]:
+    """
+    Loads a value profile saved by `save_value_profile`.
+
+    Args:
+        - path (str | Path): The file path.
+
+    Returns:
+        - dict: The value profile.
+
+    Raises:
+        - ValueError: If the file is not a value profile of a supported version.
+    """
+    profile = json.loads(Path(path).read_text(encoding='utf-8'))
+    if not isinstance(profile, dict) or profile.get('version') != PROFILE_VERSION:
+        raise ValueError(f"'{path}' is not a value profile of version {PROFILE_VERSION}.")
+    return profile
+
+
+def reshape_text(value: Any, length: int, max_length: int = None) -> str:
+    """
+    Stretches or cuts a generated text to a given length.
+
+    Args:
+        - value (Any): The text built by the factory.
+        - length (int): The length to reach.
+        - max_length (int): The maximum length of the field.
+
+    Returns:
+        - str: The text, repeated as needed, then cut to the length.
+    """
+    text = str(value or '') or 'x'
+    if max_length is not None:
+        length = min(length, max_length)
+    if len(text) < length:
+        text = ' '.join([text] * math.ceil((length + 1) / (len(text) + 1)))
+    return text[:length]
+
+
+def remove_top_rows(histogram: Dict[str, List], kind: str, top: List[tuple]) -> Dict[str, List]:
+    """
+    Removes the rows of the most frequent values from the buckets holding them, so that the histogram only describes
+    the remaining values.
+
+    Args:
+        - histogram (dict): The bucket ``edges`` and ``counts``.
+        - kind (str): The kind of values.
+        - top (list): The most frequent values, converted to the field, with their number of rows.
+
+    Returns:
+        - dict: The bucket ``edges`` and the remaining ``counts``, never below zero.
+    """
+    counts = list(histogram['counts'])
+    for value, rows in top:
+        number = len(str(value)) if kind == 'text' else to_number(kind, value)
+        index = min(max(bisect.bisect_right(histogram['edges'], number) - 1, 0), len(counts) - 1)
+        counts[index] = max(counts[index] - rows, 0)
+    return {'edges': histogram['edges'], 'counts': counts}
+
+
+class HistogramSampler:
+    """
+    Samples numbers from an equal-width histogram: a bucket is drawn by its number of rows, with an alias table, then a
+    number uniformly within the bucket.
+    """
+
+    def __init__(self, histogram: Dict[str, List]) -> None:
+        """
+        Initializes the sampler.
+
+        Args:
+            - histogram (dict): The bucket ``edges`` and ``counts``.
+        """
+        self.edges = histogram['edges']
+        self.buckets = AliasTable(histogram['counts'])
+
+    def __call__(self, randgen: random.Random) -> float:
+        if len(self.edges) == 1:
+            return self.edges[0]
+        index = self.buckets.sample(randgen)
+        return randgen.uniform(self.edges[index], self.edges[index + 1])
+
+
+class FieldSampler:
+    """
+    Samples the values of a field from its learned profile.
+
+    A value is null with the learned ratio of nulls. Otherwise, it is one of the most frequent values, drawn by its
+    number of rows, with the probability of the most frequent values overall. Otherwise, numbers, dates and datetimes
+    are drawn from the histogram, and the text built by the factory is stretched or cut to a length drawn from the
+    histogram of lengths, both without the rows of the most frequent values, which are already drawn. Fields whose
+    distinct values were all kept as most frequent values only take these values.
+    """
+
+    def __init__(self, field: models.Field, profile: Dict[str, Any]) -> None:
+        """
+        Initializes the sampler.
+
+        Args:
+            - field (Field): The model field.
+            - profile (dict): The profile of the field.
+        """
+        self.field = field
+        self.kind = profile['kind']
+        self.nulls = profile['nulls'] if field.null else 0.0
+        top = profile.get('top') or []
+        self.top_values = [field.to_python(value) for value, _ in top]
+        self.top_table = AliasTable([count for _, count in top]) if top else None
+        histogram = profile.get('histogram') if self.kind != 'text' else profile.get('lengths')
+        histogram_rows = sum(histogram['counts']) if histogram else 0
+        if histogram_rows:
+            histogram = remove_top_rows(
+                histogram, self.kind, [(value, count) for value, (_, count) in zip(self.top_values, top)]
+            )
+        self.histogram = HistogramSampler(histogram) if histogram_rows and sum(histogram['counts']) else None
+
+        top_rows = sum(count for _, count in top)
+        if len(top) >= profile['distinct'] or (self.histogram is None and (self.kind != 'text' or histogram_rows)):
+            self.top_ratio = 1.0 if top else 0.0
+        else:
+            self.top_ratio = min(top_rows / histogram_rows, 1.0) if histogram_rows else 0.0
+
+    def __call__(self, randgen: random.Random, value: Any) -> Any:
+        if self.nulls and randgen.random() < self.nulls:
+            return None
+        if self.top_values and (self.top_ratio >= 1.0 or randgen.random() < self.top_ratio):
+            return self.top_values[self.top_table.sample(randgen)]
+        if self.histogram is None:
+            return value
+        number = self.histogram(randgen)
+        if self.kind == 'text':
+            return reshape_text(value, round(number), self.field.max_length)
+        return from_number(self.field, self.kind, number)
+
+
+def get_value_samplers(model: Type[models.Model], profile: Dict[str, Any]) -> Dict[str, ValueSampler]:
+    """
+    Returns the samplers of the profiled fields of a model.
+
+    Args:
+        - model (Type[Model]): The model.
+        - profile (dict): The value profile, learned from this model or a model with the same fields.
+
+    Returns:
+        - dict: The samplers, by field attribute name.
+
+    Raises:
+        - ValueError: If a profiled field is not a field of the model that can be sampled.
+    """
+    fields = {field.name: field for field in get_profiled_fields(model)}
+    samplers = {}
+    for name, field_profile in profile['fields'].items():
+        field = fields.get(name)
+        if field is None or get_field_kind(field) != field_profile['kind']:
+            raise ValueError(f"The profiled field '{name}' cannot be sampled for {model._meta.label}.")
+        samplers[field.attname] = FieldSampler(field, field_profile)
+    return samplers
@@ -0,0 +1,408 @@
+import math
+import random
+import time
+from typing import Any, Callable, Dict, List, Type
+
+import factory.random
+from django.db import models, transaction
+from factory.django import DjangoModelFactory
+
+from django_faker_admin.bulk import get_factory_for_database, get_factory_path, resolve_database, run_tracked
+from django_faker_admin.plans import get_plan
+
+
+#: Insert rows one by one at a target rate, for a given duration.
+LOAD_STRATEGY = 'load'
+
+
+class TokenBucket:
+    """
+    Paces events at a given rate.
+
+    The bucket fills with `rate` tokens per second, up to `capacity` tokens, and every event takes `cost` tokens, one by
+    default. The capacity bounds the bursts that follow an idle period: a capacity of one allows none.
+    """
+    #: The number of missing tokens an event may take anyway.
+    tolerance = 1e-9
+
+    def __init__(self, rate: float, capacity: float = 1, now: float = 0.0) -> None:
+        """
+        Initializes a full bucket.
+
+        Args:
+            - rate (float): The number of tokens added per second.
+            - capacity (float): The maximum number of tokens.
+            - now (float): The current time, in seconds.
+
+        Raises:
+            - ValueError: If the rate or the capacity is not positive.
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("The rate and the capacity of a token bucket should be positive.")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def set_rate(self, rate: float, now: float) -> None:
+        """
+        Changes the rate.
+
+        The tokens accumulated since the last update are added at the mean of the previous and the new rate, which is
+        exact when the rate changes linearly, as it does during a ramp-up.
+
+        Args:
+            - rate (float): The new number of tokens added per second.
+            - now (float): The current time, in seconds.
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * (self.rate + rate) / 2)
+        self.updated = now
+        self.rate = rate
+
+    def consume(self, now: float, cost: float = 1) -> float:
+        """
+        Takes the tokens of an event, if the bucket holds enough of them.
+
+        Args:
+            - now (float): The current time, in seconds.
+            - cost (float): The number of tokens the event takes, at most `capacity`.
+
+        Returns:
+            - float: 0 if the tokens were taken, otherwise the number of seconds until the bucket holds enough of them
+              at the current rate, after which the event should try again.
+        """
+        self.set_rate(self.rate, now)
+        # Rounding errors would otherwise ask for waits too short for the clock to move
+        if self.tokens >= cost - self.tolerance:
+            self.tokens = max(self.tokens - cost, 0.0)
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+
+class LoadReport:
+    """
+    The outcome of a load run: how close the achieved rate came to the target, and the distribution of insert latencies.
+    """
+
+    def __init__(self, target_rate: float, expected_rows: float, rows: int, elapsed: float, latencies: List[float]):
+        """
+        Initializes the report.
+
+        Args:
+            - target_rate (float): The target number of rows per second, after the ramp-up.
+            - expected_rows (float): The number of rows the target rate and ramp-up called for during the run.
+            - rows (int): The number of rows inserted.
+            - elapsed (float): The duration of the run, in seconds.
+            - latencies (list): The duration of every insert, in seconds.
+        """
+        self.target_rate = target_rate
+        self.expected_rows = expected_rows
+        self.rows = rows
+        self.elapsed = elapsed
+        self.latencies = sorted(latencies)
+
+    @property
+    def achieved_rate(self) -> float:
+        """
+        The number of rows inserted per second.
+        """
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def accuracy(self) -> float:
+        """
+        The number of rows inserted relative to the number of rows expected, 1.0 meaning on target.
+        """
+        return self.rows / self.expected_rows if self.expected_rows > 0 else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns a percentile of the insert latencies, with the nearest-rank method.
+
+        Args:
+            - percent (float): The percentile, between 0 and 100.
+
+        Returns:
+            - float: The latency, in seconds, or 0 if nothing was inserted.
+        """
+        if not self.latencies:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * len(self.latencies)))
+        return self.latencies[rank - 1]
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Returns the figures of the report.
+
+        Returns:
+            - dict: The rates, counts, and latency percentiles in seconds.
+        """
+        return {
+            'target_rate': self.target_rate,
+            'achieved_rate': self.achieved_rate,
+            'expected_rows': self.expected_rows,
+            'rows': self.rows,
+            'accuracy': self.accuracy,
+            'elapsed': self.elapsed,
+            'latency_mean': sum(self.latencies) / len(self.latencies) if self.latencies else 0.0,
+            'latency_p50': self.percentile(50),
+            'latency_p90': self.percentile(90),
+            'latency_p99': self.percentile(99),
+            'latency_max': self.percentile(100),
+        }
+
+
+class LoadGenerator:
+    """
+    Inserts objects one at a time at a target rate, to reproduce a steady write pattern rather than one burst.
+
+    Inserts are paced by a `TokenBucket`. During the optional ramp-up, the rate grows linearly from zero (at least one
+    row per second) to the target. With jitter, every insert takes a random number of tokens between ``1 - jitter``
+    and ``1 + jitter``, which keeps the average rate but not the regularity. The loop sleeps at most `tick` seconds at
+    a time, so that rate changes are picked up while waiting. Every insert goes through ``save()``, like the per-row
+    strategy, and is timed on its own.
+
+    Inserted objects are passed to `flush` every `flush_interval` seconds, and at the end of the run. When
+    `cancel_check` is set, it is called after every flush, and the run stops as soon as it returns True.
+    """
+    #: The clock used for pacing, in seconds.
+    clock = staticmethod(time.monotonic)
+    #: The function used to wait between inserts.
+    sleep = staticmethod(time.sleep)
+    #: The longest sleep between two updates of the rate, in seconds.
+    tick = 0.1
+
+    def __init__(
+            self,
+            factory_class: Type[DjangoModelFactory],
+            rate: float,
+            duration: float,
+            ramp_up: float = 0,
+            jitter: float = 0,
+            overrides: Dict[str, Any] = None,
+            seed: int = None,
+            using: str = None,
+            flush_interval: float = 1.0
+        ) -> None:
+        """
+        Initializes the generator.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class used to create the objects.
+            - rate (float): The target number of rows per second.
+            - duration (float): The duration of the run, in seconds, ramp-up included.
+            - ramp_up (float): The number of seconds over which the rate grows to the target.
+            - jitter (float): The maximum random fraction by which a wait is stretched or shortened, between 0 and 1.
+            - overrides (dict): Field values passed to the factory for every object.
+            - seed (int): Seed for the factory and Faker random generators, and for the jitter.
+            - using (str): The database alias to write to. Defaults to the factory's ``Meta.database``, then to the
+              alias picked by the database routers.
+            - flush_interval (float): The number of seconds between calls to `flush`.
+
+        Raises:
+            - ValueError: If the rate or the duration is not positive, the ramp-up is negative, or the jitter is not
+              between 0 and 1.
+        """
+        if rate <= 0 or duration <= 0:
+            raise ValueError("The rate and the duration should be positive.")
+        if ramp_up < 0:
+            raise ValueError("The ramp-up should not be negative.")
+        if not 0 <= jitter < 1:
+            raise ValueError("The jitter should be between 0 and 1.")
+        self.factory_class = factory_class
+        self.model = factory_class._meta.model
+        self.rate = rate
+        self.duration = duration
+        self.ramp_up = min(ramp_up, duration)
+        self.jitter = jitter
+        self.overrides = overrides or {}
+        self.seed = seed
+        self.using = resolve_database(factory_class, using)
+        self.flush_interval = flush_interval
+        self.plan = get_plan(factory_class)
+        if self.plan is not None and not self.plan.supports(self.overrides):
+            self.plan = None
+        self.random = random.Random(seed)
+        self.flush: Callable[[List[models.Model]], None] = None
+        self.cancel_check: Callable[[], bool] = None
+        self.cancelled = False
+
+    def rate_at(self, elapsed: float) -> float:
+        """
+        Returns the target rate at a point of the run.
+
+        Args:
+            - elapsed (float): The number of seconds since the start of the run.
+
+        Returns:
+            - float: The target number of rows per second.
+        """
+        if elapsed >= self.ramp_up:
+            return self.rate
+        return max(self.rate * elapsed / self.ramp_up, min(self.rate, 1.0))
+
+    def expected_rows(self, elapsed: float) -> float:
+        """
+        Returns the number of rows the target rate calls for, from the start of the run to a point of it.
+
+        Args:
+            - elapsed (float): The number of seconds since the start of the run.
+
+        Returns:
+            - float: The number of rows.
+        """
+        if elapsed <= self.ramp_up:
+            return self.rate * elapsed ** 2 / (2 * self.ramp_up) if self.ramp_up else 0.0
+        return self.rate * (elapsed - self.ramp_up / 2)
+
+    def insert(self) -> models.Model:
+        """
+        Creates one object, with the compiled plan of the factory class or with the factory class itself.
+
+        Returns:
+            - Model: The saved object.
+        """
+        if self.plan is not None:
+            return self.plan.create(1, self.overrides, using=self.using)[0]
+        return get_factory_for_database(self.factory_class, self.using).create(**self.overrides)
+
+    def run(self) -> LoadReport:
+        """
+        Inserts objects at the target rate until the duration is over, or the run is cancelled.
+
+        Returns:
+            - LoadReport: The achieved rate and the latency distribution of the run.
+        """
+        if self.seed is not None:
+            factory.random.reseed_random(self.seed)
+
+        clock = self.clock
+        started = clock()
+        # The bucket holds enough tokens for the costliest insert
+        bucket = TokenBucket(self.rate_at(0), capacity=1 + self.jitter, now=started)
+        last_flush = started
+        pending = []
+        latencies = []
+        rows = 0
+        cost = None
+
+        while True:
+            now = clock()
+            elapsed = now - started
+            if elapsed >= self.duration:
+                break
+            bucket.set_rate(self.rate_at(elapsed), now)
+            if cost is None:
+                cost = 1 + self.random.uniform(-self.jitter, self.jitter) if self.jitter else 1
+            wait = bucket.consume(now, cost)
+            if wait > 0:
+                self.sleep(min(wait, self.tick, self.duration - elapsed))
+                continue
+            cost = None
+
+            insert_started = clock()
+            pending.append(self.insert())
+            latencies.append(clock() - insert_started)
+            rows += 1
+
+            if clock() - last_flush >= self.flush_interval:
+                self.flush_pending(pending)
+                pending = []
+                last_flush = clock()
+                if self.cancel_check is not None and self.cancel_check():
+                    self.cancelled = True
+                    break
+
+        self.flush_pending(pending)
+        elapsed = clock() - started
+        return LoadReport(
+            target_rate=self.rate,
+            expected_rows=self.expected_rows(elapsed),
+            rows=rows,
+            elapsed=elapsed,
+            latencies=latencies
+        )
+
+    def flush_pending(self, objs: List[models.Model]) -> None:
+        """
+        Passes the objects inserted since the last flush to `flush`.
+
+        Args:
+            - objs (list): The inserted objects.
+        """
+        if objs and self.flush is not None:
+            self.flush(objs)
+
+
+def generate_load(
+        factory_class: Type[DjangoModelFactory],
+        rate: float,
+        duration: float,
+        ramp_up: float = 0,
+        jitter: float = 0,
+        overrides: Dict[str, Any] = None,
+        seed: int = None,
+        using: str = None
+    ) -> LoadReport:
+    """
+    Inserts objects at a target rate for a given duration, see `LoadGenerator`.
+
+    The run is recorded as a `PopulationRun` with the load strategy. The primary key ranges of the inserted rows are
+    recorded, and the progress of the run checkpointed, about once per second, so that a long run can be followed and
+    cancelled from the admin, and its rows purged like generated rows.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class used to create the objects.
+        - rate (float): The target number of rows per second.
+        - duration (float): The duration of the run, in seconds, ramp-up included.
+        - ramp_up (float): The number of seconds over which the rate grows to the target.
+        - jitter (float): The maximum random fraction by which a wait is stretched or shortened, between 0 and 1.
+        - overrides (dict): Field values passed to the factory for every object.
+        - seed (int): Seed for the factory and Faker random generators, and for the jitter.
+        - using (str): The database alias to write to. Defaults to the factory's ``Meta.database``, then to the alias
+          picked by the database routers.
+
+    Returns:
+        - LoadReport: The achieved rate and the latency distribution of the run.
+
+    Raises:
+        - ValueError: If an argument is out of range, see `LoadGenerator`.
+    """
+    from django_faker_admin.tracking import start_run, encode_overrides
+
+    generator = LoadGenerator(
+        factory_class, rate, duration, ramp_up=ramp_up, jitter=jitter, overrides=overrides, seed=seed, using=using
+    )
+    run, tracker = start_run(
+        generator.model,
+        size=round(generator.expected_rows(duration)),
+        strategy=LOAD_STRATEGY,
+        seed=seed,
+        using=generator.using,
+        factory_path=get_factory_path(factory_class),
+        options={
+            'rate': rate,
+            'duration': duration,
+            'ramp_up': ramp_up,
+            'jitter': jitter,
+            'overrides': encode_overrides(generator.overrides),
+        },
+        resumable=False
+    )
+
+    def flush(objs: List[models.Model]) -> None:
+        with transaction.atomic(using=generator.using):
+            tracker.track(objs)
+            tracker.checkpoint(objs)
+
+    generator.flush = flush
+    generator.cancel_check = tracker.is_cancel_requested
+    report = None
+
+    def write() -> int:
+        nonlocal report
+        report = generator.run()
+        return report.rows
+
+    run_tracked(run, write)
+    return report
@@ -0,0 +1,62 @@
+import json
+
+from django.db import connections
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_faker_admin.learning import learn_value_profile, save_value_profile
+from django_faker_admin.utils import get_model
+
+
+class Command(BaseCommand):
+    help = (
+        "Learn the distributions of the values of a model's table with aggregate queries, and save them as a value "
+        "profile to generate data from."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help="The model to profile, in the 'app_label.ModelName' form.")
+        parser.add_argument(
+            '--database', default=None, metavar='ALIAS',
+            help="The database to read from. Defaults to the alias picked by the database routers."
+        )
+        parser.add_argument(
+            '--field', action='append', dest='fields', default=None, metavar='NAME',
+            help="A field to profile. Can be repeated. Defaults to every field whose values can be sampled."
+        )
+        parser.add_argument(
+            '--top', type=int, default=20, help="The maximum number of most frequent values kept per field."
+        )
+        parser.add_argument('--bins', type=int, default=20, help="The number of histogram buckets per field.")
+        parser.add_argument(
+            '--output', default=None, metavar='FILE', help="The file to save the profile to, instead of printing it."
+        )
+
+    def handle(self, *args, **options):
+        if options['top'] < 0:
+            raise CommandError("'--top' should not be negative.")
+        if options['bins'] <= 0:
+            raise CommandError("'--bins' should be a positive integer.")
+        if options['database'] is not None and options['database'] not in connections:
+            raise CommandError(f"Unknown database: {options['database']}.")
+
+        try:
+            model = get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+
+        try:
+            profile = learn_value_profile(
+                model, using=options['database'], fields=options['fields'], top=options['top'], bins=options['bins']
+            )
+        except ValueError as e:
+            raise CommandError(e)
+
+        if options['output'] is None:
+            self.stdout.write(json.dumps(profile, cls=DjangoJSONEncoder, indent=2))
+            return
+        save_value_profile(profile, options['output'])
+        self.stdout.write(self.style.SUCCESS(
+            f"The profile of {len(profile['fields'])} fields of {profile['rows']} {model._meta.label} rows was saved "
+            f"to {options['output']}."
+        ))
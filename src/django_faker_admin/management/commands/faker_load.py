@@ -0,0 +1,76 @@
+from django.db import connections
+from django.core.management.base import BaseCommand, CommandError
+
+from django_faker_admin.load import generate_load
+from django_faker_admin.utils import get_model, get_factory_class
+
+
+class Command(BaseCommand):
+    help = "Insert dummy objects of a model at a steady rate, and report the achieved rate and the insert latencies."
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help="The model to populate, in the 'app_label.ModelName' form.")
+        parser.add_argument('--rate', type=float, required=True, help="The target number of rows per second.")
+        parser.add_argument(
+            '--duration', type=float, required=True, help="The duration of the run in seconds, ramp-up included."
+        )
+        parser.add_argument(
+            '--ramp-up', type=float, default=0, help="The number of seconds over which the rate grows to the target."
+        )
+        parser.add_argument(
+            '--jitter', type=float, default=0,
+            help="The maximum random fraction, between 0 and 1, by which a wait between inserts is stretched or "
+                 "shortened."
+        )
+        parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible runs.")
+        parser.add_argument(
+            '--factory', default=None,
+            help="Dotted path to the factory class. Defaults to the one set on the model's admin."
+        )
+        parser.add_argument(
+            '--database', default=None,
+            help="The database to write to. Defaults to the factory's database, then to the alias picked by the "
+                 "database routers."
+        )
+
+    def handle(self, *args, **options):
+        if options['database'] is not None and options['database'] not in connections:
+            raise CommandError(f"Unknown database: {options['database']}.")
+
+        try:
+            model = get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+
+        try:
+            factory_class = get_factory_class(model, options['factory'])
+        except (LookupError, ValueError, ImportError) as e:
+            raise CommandError(e)
+
+        try:
+            report = generate_load(
+                factory_class,
+                rate=options['rate'],
+                duration=options['duration'],
+                ramp_up=options['ramp_up'],
+                jitter=options['jitter'],
+                seed=options['seed'],
+                using=options['database']
+            )
+        except ValueError as e:
+            raise CommandError(e)
+
+        figures = report.as_dict()
+        self.stdout.write(self.style.SUCCESS(
+            f"{report.rows} {model._meta.label} objects were successfully created in {report.elapsed:.1f}s."
+        ))
+        self.stdout.write(
+            f"Rate: {figures['achieved_rate']:.2f} rows/s achieved, {figures['target_rate']:.2f} rows/s targeted "
+            f"({figures['accuracy']:.1%} of the {figures['expected_rows']:.0f} expected rows)."
+        )
+        self.stdout.write(
+            "Latency: mean {latency_mean:.2f}ms, p50 {latency_p50:.2f}ms, p90 {latency_p90:.2f}ms, "
+            "p99 {latency_p99:.2f}ms, max {latency_max:.2f}ms.".format(
+                **{name: value * 1000 for name, value in figures.items() if name.startswith('latency_')}
+            )
+        )
@@ -0,0 +1,337 @@
+from django.db import connections, router
+from django.core.management.base import BaseCommand, CommandError
+
+from django_faker_admin.bulk import STRATEGIES, BULK_STRATEGY, generate, generate_sharded, resume
+from django_faker_admin.learning import load_value_profile
+from django_faker_admin.timeseries import CURVES, normalize_time_series
+from django_faker_admin.utils import get_model, get_factory_class
+
+
+class Command(BaseCommand):
+    help = "Populate a model with dummy data generated by its factory class."
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help="The model to populate, in the 'app_label.ModelName' form.")
+        parser.add_argument('--size', type=int, default=None, help="The number of objects to create.")
+        parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible runs.")
+        parser.add_argument(
+            '--factory', default=None,
+            help="Dotted path to the factory class. Defaults to the one set on the model's admin."
+        )
+        parser.add_argument(
+            '--strategy', choices=STRATEGIES, default=BULK_STRATEGY,
+            help="Create the objects one by one ('per_row') or with bulk inserts ('bulk')."
+        )
+        parser.add_argument('--chunk-size', type=int, default=None, help="The number of objects per bulk insert.")
+        parser.add_argument(
+            '--m2m', action='append', default=[], metavar='FIELD=MIN[:MAX]',
+            help="Relate every object to MIN to MAX random objects through a many-to-many field. Can be repeated."
+        )
+        parser.add_argument(
+            '--per-parent', default=None, metavar='FIELD=MIN[:MAX]',
+            help="Create MIN to MAX objects for every row of the model the foreign key FIELD points at, instead of "
+                 "'--size' objects."
+        )
+        parser.add_argument(
+            '--database', action='append', dest='databases', default=[], metavar='ALIAS',
+            help="The database to populate. Can be repeated to split the size across several databases, populated in "
+                 "parallel. Defaults to the factory's database, then to the alias picked by the database routers."
+        )
+        parser.add_argument(
+            '--writers', type=int, default=None,
+            help="The number of threads inserting chunks concurrently, each with its own database connection."
+        )
+        parser.add_argument(
+            '--resume', type=int, default=None, metavar='RUN',
+            help="Resume an interrupted bulk population run of the model from its last checkpoint, instead of starting "
+                 "a new one."
+        )
+        parser.add_argument(
+            '--enqueue', action='store_true',
+            help="Queue the population for a 'faker_worker' process instead of running it, one job per database."
+        )
+        parser.add_argument(
+            '--profile', action='store_true',
+            help="Run the population under cProfile, save the .prof file and print the top cumulative functions."
+        )
+        parser.add_argument(
+            '--value-profile', default=None, metavar='FILE',
+            help="Sample the values of the profiled fields from a value profile saved by 'faker_learn', for the bulk "
+                 "strategy."
+        )
+        parser.add_argument(
+            '--time-series', nargs=2, default=None, metavar=('START', 'END'),
+            help="Spread the timestamps of the objects from START to END, dates or datetimes in ISO 8601 format, "
+                 "overriding 'auto_now' and 'auto_now_add', and insert them in time order, for the bulk strategy."
+        )
+        parser.add_argument(
+            '--curve', choices=CURVES, default=None,
+            help="The rate curve of '--time-series'. Defaults to 'constant'."
+        )
+        parser.add_argument(
+            '--growth', type=float, default=None,
+            help="The ratio of the final rate to the initial rate of the 'linear' and 'exponential' curves."
+        )
+        parser.add_argument(
+            '--timestamp-field', action='append', dest='timestamp_fields', default=None, metavar='NAME',
+            help="A date or datetime field set by '--time-series'. Can be repeated. Defaults to the 'auto_now' and "
+                 "'auto_now_add' fields."
+        )
+        parser.add_argument(
+            '--no-snapshot', action='store_false', dest='use_snapshots',
+            help="Do not read from or write to the snapshot cache."
+        )
+
+    @staticmethod
+    def parse_fan_out(values, option='--m2m'):
+        """
+        Parses the '--m2m' or '--per-parent' options into a fan-out mapping.
+
+        Args:
+            - values (list): The option values, in the 'FIELD=MIN[:MAX]' form.
+            - option (str): The name of the option, for error messages.
+
+        Returns:
+            - dict: The fan-out, by many-to-many field name.
+
+        Raises:
+            - CommandError: If a value is malformed.
+        """
+        fan_out = {}
+        for value in values:
+            try:
+                field_name, counts = value.split('=', 1)
+                low, _, high = counts.partition(':')
+                fan_out[field_name] = (int(low), int(high or low))
+            except ValueError:
+                raise CommandError(f"Invalid '{option}' value '{value}', expected 'FIELD=MIN[:MAX]'.")
+        return fan_out
+
+    def handle_resume(self, model, run_id, using, writers):
+        """
+        Resumes an interrupted population run of the model.
+
+        Args:
+            - model (Type[Model]): The populated model.
+            - run_id (int): The primary key of the run.
+            - using (str): The database alias holding the run.
+            - writers (int): The number of threads inserting chunks concurrently.
+        """
+        from django.contrib.contenttypes.models import ContentType
+        from django_faker_admin.models import PopulationRun
+
+        try:
+            run = PopulationRun.objects.using(using).get(
+                pk=run_id,
+                content_type=ContentType.objects.db_manager(using).get_for_model(model)
+            )
+        except PopulationRun.DoesNotExist:
+            raise CommandError(f"No population run #{run_id} of {model._meta.label} in '{using}'.")
+
+        previous = run.rows_written
+        try:
+            written = resume(run, writers=writers)
+        except (ValueError, ImportError) as e:
+            raise CommandError(e)
+        self.stdout.write(self.style.SUCCESS(
+            f"Population run #{run.pk} resumed: {written - previous} {model._meta.label} objects were successfully "
+            f"created, {written} in total."
+        ))
+
+    def handle_enqueue(self, factory_class, size, databases, m2m_fan_out, value_profile, time_series, options):
+        """
+        Queues the population for worker processes, splitting the size across the databases.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class.
+            - size (int): The total number of objects to create.
+            - databases (list): The database aliases to populate.
+            - m2m_fan_out (dict): The number of related objects per generated object, by many-to-many field name.
+            - value_profile (dict): The value profile the values of the profiled fields are sampled from.
+            - time_series (dict): The time series the timestamps of the objects are spread with.
+            - options (dict): The command options.
+        """
+        from django_faker_admin.bulk import split_size
+        from django_faker_admin.jobs import enqueue
+
+        databases = databases or [None]
+        for index, (using, job_size) in enumerate(zip(databases, split_size(size, len(databases)))):
+            if job_size <= 0:
+                continue
+            seed = options['seed'] if options['seed'] is None else options['seed'] + index
+            job = enqueue(
+                factory_class,
+                job_size,
+                seed=seed,
+                strategy=options['strategy'],
+                chunk_size=options['chunk_size'],
+                using=using,
+                m2m_fan_out=m2m_fan_out,
+                writers=options['writers'],
+                value_profile=value_profile,
+                time_series=time_series
+            )
+            target = f" for '{using}'" if using else ""
+            self.stdout.write(self.style.SUCCESS(f"Job #{job.pk} queued{target}: {job_size} objects."))
+
+    def handle_profile(self, factory_class, size, databases, kwargs):
+        """
+        Populates the model under cProfile, then prints the top cumulative functions and the path of the profile.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class.
+            - size (int): The number of objects to create.
+            - databases (list): The database alias to populate, if any.
+            - kwargs (dict): The keyword arguments of `generate`.
+        """
+        from django_faker_admin.profiling import profile_generate
+
+        kwargs.pop('use_snapshots')
+        try:
+            written, run, path = profile_generate(
+                factory_class, size, using=databases[0] if databases else None, **kwargs
+            )
+        except ValueError as e:
+            raise CommandError(e)
+
+        self.stdout.write(run.profile_stats)
+        self.stdout.write(self.style.SUCCESS(
+            f"{written} {factory_class._meta.model._meta.label} objects were successfully created. "
+            f"Profile saved to {path}."
+        ))
+
+    def handle_per_parent(self, factory_class, value, databases, options):
+        """
+        Creates a random number of objects for every row of the model a foreign key points at.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class.
+            - value (str): The '--per-parent' option value.
+            - databases (list): The database alias to populate, if any.
+            - options (dict): The command options.
+        """
+        from django_faker_admin.fanout import fan_out, get_parent_field
+
+        (field_name, counts), = self.parse_fan_out([value], option='--per-parent').items()
+        using = databases[0] if databases else None
+        model = factory_class._meta.model
+        try:
+            parent_model = get_parent_field(model, field_name).related_model
+            written = fan_out(
+                factory_class,
+                field_name,
+                parent_model._default_manager.using(using or router.db_for_read(parent_model)),
+                counts=counts,
+                seed=options['seed'],
+                chunk_size=options['chunk_size'],
+                using=using,
+                writers=options['writers']
+            )
+        except ValueError as e:
+            raise CommandError(e)
+        self.stdout.write(self.style.SUCCESS(
+            f"{written} {model._meta.label} objects were successfully created for the {parent_model._meta.label} rows."
+        ))
+
+    def handle(self, *args, **options):
+        if options['resume'] is None and options['per_parent'] is None and options['size'] is None:
+            raise CommandError("'--size' is required, unless '--resume' or '--per-parent' is given.")
+        if options['size'] is not None and options['size'] <= 0:
+            raise CommandError("'--size' should be a positive integer.")
+        if options['writers'] is not None and options['writers'] <= 0:
+            raise CommandError("'--writers' should be a positive integer.")
+
+        m2m_fan_out = self.parse_fan_out(options['m2m'])
+
+        unknown = set(options['databases']) - set(connections)
+        if unknown:
+            raise CommandError(f"Unknown database(s): {', '.join(sorted(unknown))}.")
+
+        try:
+            model = get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+
+        if options['resume'] is not None:
+            # The run knows its factory and options
+            using = options['databases'][0] if options['databases'] else router.db_for_write(model)
+            return self.handle_resume(model, options['resume'], using, options['writers'])
+
+        try:
+            factory_class = get_factory_class(model, options['factory'])
+        except (LookupError, ValueError, ImportError) as e:
+            raise CommandError(e)
+
+        if m2m_fan_out and options['strategy'] != BULK_STRATEGY:
+            raise CommandError("'--m2m' is only supported by the bulk strategy.")
+
+        value_profile = None
+        if options['value_profile'] is not None:
+            if options['strategy'] != BULK_STRATEGY:
+                raise CommandError("'--value-profile' is only supported by the bulk strategy.")
+            try:
+                value_profile = load_value_profile(options['value_profile'])
+            except (OSError, ValueError) as e:
+                raise CommandError(e)
+
+        time_series = None
+        if options['time_series'] is not None:
+            if options['strategy'] != BULK_STRATEGY:
+                raise CommandError("'--time-series' is only supported by the bulk strategy.")
+            start, end = options['time_series']
+            try:
+                time_series = normalize_time_series({
+                    'start': start,
+                    'end': end,
+                    'curve': options['curve'],
+                    'growth': options['growth'],
+                    'fields': options['timestamp_fields'],
+                })
+            except ValueError as e:
+                raise CommandError(e)
+
+        if options['per_parent'] is not None:
+            if len(options['databases']) > 1:
+                raise CommandError("'--per-parent' needs a single '--database'.")
+            if value_profile is not None:
+                raise CommandError("'--value-profile' is not supported with '--per-parent'.")
+            if time_series is not None:
+                raise CommandError("'--time-series' is not supported with '--per-parent'.")
+            return self.handle_per_parent(factory_class, options['per_parent'], options['databases'], options)
+
+        if options['enqueue']:
+            if options['profile']:
+                raise CommandError("'--profile' is not supported with '--enqueue'.")
+            return self.handle_enqueue(
+                factory_class, options['size'], options['databases'], m2m_fan_out, value_profile, time_series, options
+            )
+
+        kwargs = {
+            'seed': options['seed'],
+            'strategy': options['strategy'],
+            'chunk_size': options['chunk_size'],
+            'use_snapshots': options['use_snapshots'],
+            'm2m_fan_out': m2m_fan_out,
+            'writers': options['writers'],
+            'value_profile': value_profile,
+            'time_series': time_series,
+        }
+        if options['profile']:
+            if len(options['databases']) > 1:
+                raise CommandError("'--profile' needs a single '--database'.")
+            return self.handle_profile(factory_class, options['size'], options['databases'], kwargs)
+
+        try:
+            if len(options['databases']) > 1:
+                per_database = generate_sharded(factory_class, options['size'], options['databases'], **kwargs)
+            else:
+                using = options['databases'][0] if options['databases'] else None
+                per_database = {using: generate(factory_class, options['size'], using=using, **kwargs)}
+        except ValueError as e:
+            raise CommandError(e)
+
+        for using, written in per_database.items():
+            target = f" in '{using}'" if using else ""
+            self.stdout.write(
+                self.style.SUCCESS(f"{written} {model._meta.label} objects were successfully created{target}.")
+            )
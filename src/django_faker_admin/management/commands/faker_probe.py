@@ -0,0 +1,108 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_faker_admin.bulk import STRATEGIES
+from django_faker_admin.probe import probe_changelist, probe_population
+from django_faker_admin.utils import get_model, get_faker_model_admin
+
+
+class Command(BaseCommand):
+    help = "Measure the latency and the queries of a model's admin change list, optionally as its table grows."
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help="The model to probe, in the 'app_label.ModelName' form.")
+        parser.add_argument('--repeat', type=int, default=3, help="The number of renderings per probe.")
+        parser.add_argument(
+            '--param', action='append', default=[], metavar='NAME=VALUE',
+            help="A query string parameter of the change list, e.g. 'q=smith' to probe a search. Can be repeated."
+        )
+        parser.add_argument(
+            '--steps', type=int, default=0,
+            help="Alternate this number of population steps with probes, starting with a probe of the current data."
+        )
+        parser.add_argument(
+            '--step-size', type=int, default=None, help="The number of objects created by every step."
+        )
+        parser.add_argument('--seed', type=int, default=None, help="Seed of the population steps.")
+        parser.add_argument(
+            '--strategy', choices=STRATEGIES, default=None, help="The strategy of the population steps."
+        )
+        parser.add_argument('--slowest', type=int, default=3, help="The number of slowest queries to show.")
+        parser.add_argument(
+            '--csv', action='store_true',
+            help="Print one CSV line per probe, to plot the latency against the row count."
+        )
+
+    @staticmethod
+    def parse_params(values):
+        """
+        Parses the '--param' options into query string parameters.
+
+        Args:
+            - values (list): The option values, in the 'NAME=VALUE' form.
+
+        Returns:
+            - dict: The parameters.
+
+        Raises:
+            - CommandError: If a value is malformed.
+        """
+        params = {}
+        for value in values:
+            name, separator, param = value.partition('=')
+            if not separator or not name:
+                raise CommandError(f"Invalid '--param' value '{value}', expected 'NAME=VALUE'.")
+            params[name] = param
+        return params
+
+    def handle(self, *args, **options):
+        if options['repeat'] <= 0:
+            raise CommandError("'--repeat' should be a positive integer.")
+        if options['steps'] < 0:
+            raise CommandError("'--steps' should not be negative.")
+        if options['steps'] and not (options['step_size'] or 0) > 0:
+            raise CommandError("'--step-size' should be a positive integer when '--steps' is given.")
+
+        params = self.parse_params(options['param'])
+
+        try:
+            model = get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+
+        model_admin = get_faker_model_admin(model)
+        if model_admin is None:
+            raise CommandError(f"'{model._meta.label}' is not registered with a FakerModelAdminMixin admin.")
+
+        try:
+            if options['steps']:
+                results = probe_population(
+                    model_admin,
+                    steps=options['steps'],
+                    step_size=options['step_size'],
+                    params=params,
+                    repeat=options['repeat'],
+                    seed=options['seed'],
+                    **({'strategy': options['strategy']} if options['strategy'] else {})
+                )
+            else:
+                results = [probe_changelist(model_admin, params=params, repeat=options['repeat'])]
+        except ValueError as e:
+            raise CommandError(e)
+
+        if options['csv']:
+            self.stdout.write('rows,latency_ms,latency_max_ms,queries,slowest_query_ms')
+            for result in results:
+                figures = result.as_dict()
+                self.stdout.write(
+                    f"{figures['rows']},{figures['latency'] * 1000:.2f},{figures['latency_max'] * 1000:.2f},"
+                    f"{figures['queries']},{figures['slowest_query_time'] * 1000:.2f}"
+                )
+            return
+
+        for result in results:
+            self.stdout.write(
+                f"{result.rows} rows: {result.latency * 1000:.2f}ms median over {len(result.latencies)} renderings, "
+                f"{result.query_count} queries."
+            )
+            for duration, alias, sql in result.get_slowest_queries(options['slowest']):
+                self.stdout.write(f"  {duration * 1000:.2f}ms [{alias}] {sql}")
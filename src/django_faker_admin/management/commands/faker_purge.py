@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_faker_admin.purge import purge, can_skip_collection
+from django_faker_admin.utils import get_model
+
+
+class Command(BaseCommand):
+    help = "Delete the rows of a model that were created by population runs."
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help="The model to purge, in the 'app_label.ModelName' form.")
+        parser.add_argument(
+            '--run', type=int, action='append', dest='runs', default=None,
+            help="Only purge the rows of this population run. Can be repeated."
+        )
+        parser.add_argument('--chunk-size', type=int, default=None, help="The number of primary keys per delete.")
+        parser.add_argument(
+            '--database', default=None,
+            help="The database alias to purge. Defaults to the alias picked by the database routers."
+        )
+        parser.add_argument(
+            '--fast', action='store_true',
+            help="Delete with raw SQL, skipping cascade collection and delete signals, when the schema allows it."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+
+        if options['fast'] and not can_skip_collection(model):
+            self.stderr.write(
+                self.style.WARNING(
+                    f"Other tables cascade from '{model._meta.label}', falling back to collected deletes."
+                )
+            )
+
+        deleted = purge(
+            model,
+            runs=options['runs'],
+            chunk_size=options['chunk_size'],
+            fast=options['fast'],
+            using=options['database']
+        )
+        self.stdout.write(self.style.SUCCESS(f"{deleted} {model._meta.label} objects were successfully deleted."))
@@ -0,0 +1,67 @@
+from django.db import connections
+from django.core.management.base import BaseCommand, CommandError
+
+from django_faker_admin.jobs import Worker
+
+
+class Command(BaseCommand):
+    help = "Run the queued population jobs, polling the job queue. Several workers may run at once, on several hosts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--name', default=None, help="The name of the worker. Defaults to the host name and pid.")
+        parser.add_argument(
+            '--database', default=None,
+            help="The database holding the job queue. Defaults to the alias picked by the database routers."
+        )
+        parser.add_argument('--burst', action='store_true', help="Stop as soon as the queue is empty.")
+        parser.add_argument('--max-jobs', type=int, default=None, help="Stop after running this number of jobs.")
+        parser.add_argument(
+            '--poll-interval', type=float, default=1.0, help="The number of seconds to wait when the queue is empty."
+        )
+        parser.add_argument(
+            '--heartbeat-interval', type=float, default=10.0,
+            help="The number of seconds between the heartbeats of a running job."
+        )
+        parser.add_argument(
+            '--stall-timeout', type=float, default=60.0,
+            help="The number of seconds without heartbeat after which a running job is put back in the queue."
+        )
+        parser.add_argument(
+            '--max-attempts', type=int, default=3,
+            help="The number of times a job may be claimed before it is marked as failed."
+        )
+
+    def report(self, job):
+        """
+        Writes the outcome of a job.
+
+        Args:
+            - job (PopulationJob): The job that was run.
+        """
+        if job.status == job.Status.FINISHED:
+            self.stdout.write(self.style.SUCCESS(f"Job #{job.pk} finished: {job.rows_written} rows written."))
+        else:
+            error = job.error.strip().splitlines()[-1] if job.error.strip() else job.get_status_display()
+            self.stderr.write(self.style.ERROR(f"Job #{job.pk} {job.status}: {error}"))
+
+    def handle(self, *args, **options):
+        if options['database'] is not None and options['database'] not in connections:
+            raise CommandError(f"Unknown database: {options['database']}.")
+        if options['heartbeat_interval'] <= 0 or options['stall_timeout'] <= options['heartbeat_interval']:
+            raise CommandError("'--stall-timeout' should be longer than the positive '--heartbeat-interval'.")
+
+        worker = Worker(
+            name=options['name'],
+            using=options['database'],
+            poll_interval=options['poll_interval'],
+            heartbeat_interval=options['heartbeat_interval'],
+            stall_timeout=options['stall_timeout'],
+            max_attempts=options['max_attempts']
+        )
+        self.stdout.write(f"Worker {worker.name} polling the job queue of '{worker.using}'.")
+        try:
+            processed = worker.run(max_jobs=options['max_jobs'], burst=options['burst'], on_job=self.report)
+        except KeyboardInterrupt:
+            self.stdout.write("Worker interrupted, its current job was put back in the queue.")
+            return
+        self.stdout.write(f"Worker {worker.name} stopped after {processed} job(s).")
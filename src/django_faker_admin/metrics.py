@@ -0,0 +1,476 @@
+import os
+import json
+import time
+import atexit
+import socket
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Sequence, Tuple
+
+from django_faker_admin.conf import settings
+
+if TYPE_CHECKING:
+    from django_faker_admin.models import PopulationRun
+
+
+#: The upper bounds of the histogram buckets, in seconds: from a fast chunk insert to an hour-long run.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900, 3600)
+
+#: A metric sample: its name, its labels and its value.
+type Sample = Tuple[str, Dict[str, str], float]
+
+
+def escape_label_value(value: str) -> str:
+    """
+    Escapes a label value for the Prometheus text format.
+
+    Args:
+        - value (str): The label value.
+
+    Returns:
+        - str: The value with backslashes, double quotes and line feeds escaped.
+    """
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    """
+    Formats a sample as a line of the Prometheus text format.
+
+    Args:
+        - name (str): The sample name.
+        - labels (dict): The label values, by label name.
+        - value (float): The value.
+
+    Returns:
+        - str: The line, without line feed.
+    """
+    if labels:
+        name += '{%s}' % ','.join(f'{label}="{escape_label_value(text)}"' for label, text in labels.items())
+    return f'{name} {float(value)!r}'
+
+
+class Registry:
+    """
+    Holds the values of the metrics of the current process.
+
+    Updates are a dictionary operation under a lock. When `FAKER_ADMIN_METRICS_DIR` is set, the values of the process
+    are flushed to a file of that directory, replaced atomically, and `collect` sums the files of every process: web
+    workers, ``faker_worker`` processes and commands sharing the directory then add up to one view. Files are not
+    written on every update, which happens once per chunk and writer, but by the first update following
+    `flush_interval` seconds after the last flush, at the end of every run, before collecting, and at exit. The files
+    of dead processes are kept, so that counters never go backwards; clear the directory when the services are
+    redeployed. A process forked after an update starts over from zero, its parent's values being in the parent's file.
+    """
+
+    def __init__(self, flush_interval: float = 5.0) -> None:
+        """
+        Initializes an empty registry.
+
+        Args:
+            - flush_interval (float): The least number of seconds between two flushes triggered by updates.
+        """
+        self.metrics = {}
+        self.values = {}
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.flush_interval = flush_interval
+        self.flushed_at = None
+        self.dirty = False
+
+    def register(self, metric: 'Metric') -> 'Metric':
+        """
+        Adds a metric to the registry.
+
+        Args:
+            - metric (Metric): The metric.
+
+        Returns:
+            - Metric: The metric, for convenience.
+        """
+        self.metrics[metric.name] = metric
+        return metric
+
+    def get_directory(self) -> Path | None:
+        """
+        Returns the directory shared by the processes, if any.
+
+        Returns:
+            - Path | None: `FAKER_ADMIN_METRICS_DIR`, or None if the setting is not set.
+        """
+        directory = settings.FAKER_ADMIN_METRICS_DIR
+        return Path(directory) if directory else None
+
+    def get_path(self, directory: Path) -> Path:
+        """
+        Returns the file holding the values of the current process.
+
+        Args:
+            - directory (Path): The directory shared by the processes.
+
+        Returns:
+            - Path: The file path, unique per host and process.
+        """
+        return directory / f'faker-metrics-{socket.gethostname()}-{os.getpid()}.json'
+
+    def update(self, name: str, labels: Tuple[str, ...], values: Sequence[float]) -> None:
+        """
+        Adds values to a metric.
+
+        Args:
+            - name (str): The metric name.
+            - labels (tuple): The label values.
+            - values (Sequence[float]): The values to add, one per series of the metric: a single value for a counter,
+              the bucket counts, the sum and the count for a histogram.
+        """
+        with self.lock:
+            if os.getpid() != self.pid:
+                self.pid = os.getpid()
+                self.values = {}
+                self.flushed_at = None
+            series = self.values.setdefault(name, {})
+            current = series.get(labels) or [0.0] * len(values)
+            series[labels] = [a + b for a, b in zip(current, values)]
+            self.dirty = True
+
+            if self.flushed_at is None or time.monotonic() - self.flushed_at >= self.flush_interval:
+                directory = self.get_directory()
+                if directory is not None:
+                    self.write(directory)
+
+    def flush(self) -> None:
+        """
+        Writes the values of the current process to its file, if they changed since the last flush.
+        """
+        with self.lock:
+            directory = self.get_directory()
+            if self.dirty and directory is not None and os.getpid() == self.pid:
+                self.write(directory)
+
+    def write(self, directory: Path) -> None:
+        """
+        Writes the values of the current process to its file. The lock must be held.
+
+        Args:
+            - directory (Path): The directory shared by the processes.
+        """
+        self.dirty = False
+        self.flushed_at = time.monotonic()
+        directory.mkdir(parents=True, exist_ok=True)
+        path = self.get_path(directory)
+        data = {
+            name: [[list(labels), values] for labels, values in series.items()]
+            for name, series in self.values.items()
+        }
+        temporary = path.with_suffix('.tmp')
+        temporary.write_text(json.dumps(data))
+        os.replace(temporary, path)
+
+    def collect(self) -> Dict[str, Dict[Tuple[str, ...], List[float]]]:
+        """
+        Returns the values of the metrics, summed across processes when `FAKER_ADMIN_METRICS_DIR` is set.
+
+        Returns:
+            - dict: The values, by metric name and label values.
+        """
+        directory = self.get_directory()
+        if directory is None or not directory.is_dir():
+            with self.lock:
+                return {
+                    name: {labels: list(values) for labels, values in series.items()}
+                    for name, series in self.values.items()
+                }
+
+        self.flush()
+        collected = {}
+        for path in sorted(directory.glob('faker-metrics-*.json')):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                # Replaced or being written meanwhile
+                continue
+            for name, series in data.items():
+                merged = collected.setdefault(name, {})
+                for labels, values in series:
+                    labels = tuple(labels)
+                    current = merged.get(labels) or [0.0] * len(values)
+                    merged[labels] = [a + b for a, b in zip(current, values)]
+        return collected
+
+    def reset(self) -> None:
+        """
+        Forgets the values of the current process, and removes its file.
+        """
+        with self.lock:
+            self.values = {}
+            self.dirty = False
+            directory = self.get_directory()
+            if directory is not None:
+                self.get_path(directory).unlink(missing_ok=True)
+
+    def render(self, extra: Sequence['Metric'] = ()) -> str:
+        """
+        Renders the metrics in the Prometheus text format.
+
+        Args:
+            - extra (Sequence[Metric]): Metrics computed for this rendering only, such as gauges read from the
+              database.
+
+        Returns:
+            - str: The exposition text.
+        """
+        collected = self.collect()
+        lines = []
+        for metric in [*self.metrics.values(), *extra]:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            series = metric.values if metric in extra else collected.get(metric.name, {})
+            for labels, values in sorted(series.items()):
+                lines.extend(
+                    format_sample(name, labels, value)
+                    for name, labels, value in metric.get_samples(dict(zip(metric.labelnames, labels)), values)
+                )
+        return '\n'.join(lines) + '\n'
+
+
+#: The metrics of the package.
+registry = Registry()
+atexit.register(registry.flush)
+
+
+class Metric:
+    """
+    A named metric with labels, whose values are kept by a `Registry`.
+    """
+    #: The Prometheus metric type.
+    type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry: Registry = None):
+        """
+        Initializes the metric and registers it.
+
+        Args:
+            - name (str): The metric name.
+            - documentation (str): The help text of the metric.
+            - labelnames (Sequence[str]): The names of the labels.
+            - registry (Registry): The registry keeping the values. Metrics without registry keep their own values,
+              for a single rendering.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.registry = registry
+        self.values = {}
+        if registry is not None:
+            registry.register(self)
+
+    def get_labels(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        """
+        Returns the label values in the order of the label names.
+
+        Args:
+            - labels (dict): The label values, by label name.
+
+        Returns:
+            - tuple: The label values.
+
+        Raises:
+            - ValueError: If the labels do not match the label names.
+        """
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects the labels {', '.join(self.labelnames)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def add(self, labels: Dict[str, str], values: Sequence[float]) -> None:
+        """
+        Adds values to the series of the given labels.
+
+        Args:
+            - labels (dict): The label values, by label name.
+            - values (Sequence[float]): The values to add.
+        """
+        key = self.get_labels(labels)
+        if self.registry is not None:
+            self.registry.update(self.name, key, values)
+        else:
+            current = self.values.get(key) or [0.0] * len(values)
+            self.values[key] = [a + b for a, b in zip(current, values)]
+
+    def get_samples(self, labels: Dict[str, str], values: List[float]) -> Iterator[Sample]:
+        """
+        Yields the samples of a series.
+
+        Args:
+            - labels (dict): The label values of the series, by label name.
+            - values (list): The values of the series.
+
+        Yields:
+            - tuple: The name, labels and value of a sample.
+        """
+        yield self.name, labels, values[0]
+
+
+class Counter(Metric):
+    """
+    A value that only goes up, such as a number of rows.
+    """
+    type = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """
+        Increments the counter.
+
+        Args:
+            - amount (float): The increment.
+            - labels: The label values.
+        """
+        self.add(labels, [amount])
+
+
+class Gauge(Metric):
+    """
+    A value that goes up and down, such as a number of running runs. Gauges are computed for a rendering, not
+    accumulated: they are not registered, and `set` replaces the value.
+    """
+    type = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        """
+        Sets the value of the gauge.
+
+        Args:
+            - value (float): The value.
+            - labels: The label values.
+        """
+        self.values[self.get_labels(labels)] = [value]
+
+
+class Histogram(Metric):
+    """
+    The distribution of durations, counted in cumulative buckets, along with their sum and count.
+    """
+    type = 'histogram'
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs) -> None:
+        """
+        Initializes the histogram.
+
+        Args:
+            - args: The arguments of `Metric`.
+            - buckets (Sequence[float]): The upper bounds of the buckets, in increasing order.
+            - kwargs: The keyword arguments of `Metric`.
+        """
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        """
+        Records an observation.
+
+        Args:
+            - value (float): The observed value.
+            - labels: The label values.
+        """
+        self.add(labels, [*(1 if value <= bound else 0 for bound in self.buckets), value, 1])
+
+    def get_samples(self, labels: Dict[str, str], values: List[float]) -> Iterator[Sample]:
+        """
+        Yields the bucket, sum and count samples of a series.
+
+        Args:
+            - labels (dict): The label values of the series, by label name.
+            - values (list): The bucket counts, the sum and the count.
+
+        Yields:
+            - tuple: The name, labels and value of a sample.
+        """
+        *counts, total, count = values
+        for bound, bucket_count in zip(self.buckets, counts):
+            yield f'{self.name}_bucket', {**labels, 'le': repr(float(bound))}, bucket_count
+        yield f'{self.name}_bucket', {**labels, 'le': '+Inf'}, count
+        yield f'{self.name}_sum', labels, total
+        yield f'{self.name}_count', labels, count
+
+
+ROWS_GENERATED = Counter(
+    'faker_admin_rows_generated_total', "Rows written by population runs.", ['model'], registry=registry
+)
+RUNS = Counter(
+    'faker_admin_runs_total', "Population runs, by final status.", ['model', 'strategy', 'status'], registry=registry
+)
+RUN_DURATION = Histogram(
+    'faker_admin_run_duration_seconds', "Duration of population runs, in seconds.", ['model', 'strategy'],
+    registry=registry
+)
+CHUNK_INSERT_DURATION = Histogram(
+    'faker_admin_chunk_insert_seconds', "Duration of bulk chunk inserts, commit included, in seconds.", ['model'],
+    registry=registry
+)
+
+
+def get_run_model_label(run: 'PopulationRun') -> str:
+    """
+    Returns the label of the model populated by a run.
+
+    Args:
+        - run (PopulationRun): The run.
+
+    Returns:
+        - str: The lower-cased ``app_label.model_name`` label.
+    """
+    return f'{run.content_type.app_label}.{run.content_type.model}'
+
+
+def record_run(run: 'PopulationRun', status: str, duration: float) -> None:
+    """
+    Records the end of an attempt of a population run, and flushes the metrics of the process.
+
+    Args:
+        - run (PopulationRun): The run.
+        - status (str): The final status of the attempt.
+        - duration (float): The duration of the attempt, in seconds.
+    """
+    model = get_run_model_label(run)
+    RUNS.inc(model=model, strategy=run.strategy, status=status)
+    RUN_DURATION.observe(duration, model=model, strategy=run.strategy)
+    registry.flush()
+
+
+def get_state_gauges() -> List[Gauge]:
+    """
+    Reads the running population runs and the queued population jobs from the database.
+
+    Runs are counted in the database the `PopulationRun` admin reads from, jobs in the database holding the job queue.
+
+    Returns:
+        - list: The gauges of the active runs and of the queued and running jobs, by model.
+    """
+    from django.db import router
+    from django.db.models import Count
+    from django_faker_admin.models import PopulationJob, PopulationRun
+
+    active_runs = Gauge('faker_admin_active_runs', "Population runs currently running.", ['model'])
+    jobs = Gauge('faker_admin_jobs', "Population jobs waiting for or held by a worker, by status.", ['model', 'status'])
+
+    runs = PopulationRun.objects.using(router.db_for_read(PopulationRun)).filter(status=PopulationRun.Status.RUNNING)
+    for row in runs.values('content_type__app_label', 'content_type__model').annotate(count=Count('pk')):
+        active_runs.set(row['count'], model=f"{row['content_type__app_label']}.{row['content_type__model']}")
+
+    pending = PopulationJob.objects.using(router.db_for_read(PopulationJob)).filter(
+        status__in=[PopulationJob.Status.QUEUED, PopulationJob.Status.RUNNING]
+    )
+    for row in pending.values('content_type__app_label', 'content_type__model', 'status').annotate(count=Count('pk')):
+        model = f"{row['content_type__app_label']}.{row['content_type__model']}"
+        jobs.set(row['count'], model=model, status=row['status'])
+
+    return [active_runs, jobs]
+
+
+def render_metrics() -> str:
+    """
+    Renders the metrics of the package, and the gauges read from the database, in the Prometheus text format.
+
+    Returns:
+        - str: The exposition text.
+    """
+    return registry.render(extra=get_state_gauges())
@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-19 02:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PopulationRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('size', models.PositiveIntegerField(verbose_name='size')),
+                ('rows_written', models.PositiveIntegerField(default=0, verbose_name='rows written')),
+                ('strategy', models.CharField(max_length=20, verbose_name='strategy')),
+                ('seed', models.BigIntegerField(blank=True, null=True, verbose_name='seed')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='finished at')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype', verbose_name='content type')),
+            ],
+            options={
+                'verbose_name': 'population run',
+                'verbose_name_plural': 'population runs',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='GeneratedRange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_pk', models.BigIntegerField(verbose_name='start primary key')),
+                ('end_pk', models.BigIntegerField(verbose_name='end primary key')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype', verbose_name='content type')),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ranges', to='django_faker_admin.populationrun', verbose_name='run')),
+            ],
+            options={
+                'verbose_name': 'generated range',
+                'verbose_name_plural': 'generated ranges',
+                'ordering': ('content_type', 'start_pk'),
+                'indexes': [models.Index(fields=['content_type', 'start_pk'], name='django_fake_content_5e6f5b_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-19 02:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('django_faker_admin', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TunedChunkSize',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('database', models.CharField(max_length=100, verbose_name='database')),
+                ('chunk_size', models.PositiveIntegerField(verbose_name='chunk size')),
+                ('rows_per_second', models.FloatField(default=0, verbose_name='rows per second')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype', verbose_name='content type')),
+            ],
+            options={
+                'verbose_name': 'tuned chunk size',
+                'verbose_name_plural': 'tuned chunk sizes',
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'database'), name='unique_tuned_chunk_size')],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2 on 2026-10-19 02:42
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+def mark_finished_runs(apps, schema_editor):
+    PopulationRun = apps.get_model('django_faker_admin', 'PopulationRun')
+    PopulationRun.objects.using(schema_editor.connection.alias).filter(
+        finished_at__isnull=False
+    ).update(status='finished')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_faker_admin', '0002_tunedchunksize'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='populationrun',
+            name='chunks_written',
+            field=models.PositiveIntegerField(default=0, verbose_name='chunks written'),
+        ),
+        migrations.AddField(
+            model_name='populationrun',
+            name='factory_path',
+            field=models.CharField(blank=True, max_length=255, verbose_name='factory'),
+        ),
+        migrations.AddField(
+            model_name='populationrun',
+            name='options',
+            field=models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='options'),
+        ),
+        migrations.AddField(
+            model_name='populationrun',
+            name='random_state',
+            field=models.JSONField(blank=True, editable=False, null=True, verbose_name='random state'),
+        ),
+        migrations.AddField(
+            model_name='populationrun',
+            name='status',
+            field=models.CharField(choices=[('running', 'Running'), ('finished', 'Finished'), ('failed', 'Failed')], default='running', max_length=20, verbose_name='status'),
+        ),
+        migrations.AddField(
+            model_name='populationrun',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='updated at'),
+        ),
+        migrations.RunPython(mark_finished_runs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-19 02:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_faker_admin', '0003_population_run_checkpoints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='populationrun',
+            name='cancel_requested',
+            field=models.BooleanField(default=False, verbose_name='cancel requested'),
+        ),
+        migrations.AlterField(
+            model_name='populationrun',
+            name='status',
+            field=models.CharField(choices=[('running', 'Running'), ('finished', 'Finished'), ('failed', 'Failed'), ('cancelled', 'Cancelled')], default='running', max_length=20, verbose_name='status'),
+        ),
+    ]
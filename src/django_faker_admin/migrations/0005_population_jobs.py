@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-19 02:57
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('django_faker_admin', '0004_population_run_cancellation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PopulationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('factory_path', models.CharField(max_length=255, verbose_name='factory')),
+                ('size', models.PositiveIntegerField(verbose_name='size')),
+                ('database', models.CharField(blank=True, max_length=100, verbose_name='database')),
+                ('options', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='options')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('finished', 'Finished'), ('failed', 'Failed')], default='queued', max_length=20, verbose_name='status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='attempts')),
+                ('worker', models.CharField(blank=True, max_length=255, verbose_name='worker')),
+                ('run_pk', models.PositiveIntegerField(blank=True, null=True, verbose_name='run')),
+                ('rows_written', models.PositiveIntegerField(default=0, verbose_name='rows written')),
+                ('error', models.TextField(blank=True, verbose_name='error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('claimed_at', models.DateTimeField(blank=True, null=True, verbose_name='claimed at')),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True, verbose_name='heartbeat at')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='finished at')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype', verbose_name='content type')),
+            ],
+            options={
+                'verbose_name': 'population job',
+                'verbose_name_plural': 'population jobs',
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['status', 'id'], name='django_fake_status_6477de_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-19 03:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_faker_admin', '0005_population_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='populationrun',
+            name='profile_path',
+            field=models.CharField(blank=True, max_length=500, verbose_name='profile file'),
+        ),
+        migrations.AddField(
+            model_name='populationrun',
+            name='profile_stats',
+            field=models.TextField(blank=True, verbose_name='profile'),
+        ),
+    ]
@@ -1,7 +1,14 @@
 from django.urls import path
+from django.contrib import admin, messages
+from django.contrib.admin import helpers
+from django.contrib.admin.options import IS_POPUP_VAR
+from django.template.response import TemplateResponse
+from django.utils.translation import gettext_lazy, ngettext
 
 from django_faker_admin.conf import settings
-from django_faker_admin.views import FakerAdminView
+from django_faker_admin.filters import GeneratedListFilter
+from django_faker_admin.pagination import ApproximateCountChangeList, ApproximateCountPaginator
+from django_faker_admin.views import FakerAdminView, FakerCloneForm, FakerFanOutForm, FakerPurgeView
 
 
 class FakerModelAdminMixin:
@@ -13,27 +20,75 @@ class FakerModelAdminMixin:
     """
     #: The factory class used to generate dummy model instances.
     factory_class = None
+    #: The generation strategy, either 'per_row' or 'bulk'. Defaults to `FAKER_ADMIN_STRATEGY`.
+    faker_strategy = None
+    #: The number of related objects per generated object, by many-to-many field name, e.g. ``{'tags': (1, 5)}``.
+    #: Only used by the bulk strategy, which writes the through tables directly.
+    faker_m2m_fan_out = None
+    #: The database alias to populate. Defaults to the factory's ``Meta.database``, then to the alias picked by the
+    #: database routers. When several databases are configured, the populate form lets the user pick others.
+    faker_database = None
+    #: The number of threads inserting chunks concurrently, for the bulk strategy. Defaults to `FAKER_ADMIN_WRITERS`.
+    faker_writers = None
+    #: Whether the populate form queues the population for a ``faker_worker`` process instead of running it in the
+    #: request. Defaults to `FAKER_ADMIN_USE_QUEUE`.
+    faker_use_queue = None
+    #: The distributions the values of fields with choices and foreign keys are drawn from, by field name, e.g.
+    #: ``{'customer': {'kind': 'zipf', 'exponent': 1.2}, 'status': 'uniform'}``. Sampled foreign keys point at existing
+    #: rows. Only used by the bulk strategy; the populate form starts from them.
+    faker_distributions = None
+    #: The date range, rate curve and timestamp fields of time-series populations, e.g. ``{'start': '2024-01-01',
+    #: 'end': '2025-01-01', 'curve': 'linear', 'growth': 5}``. The fields default to the ``auto_now`` and
+    #: ``auto_now_add`` fields. Only used by the bulk strategy; the populate form starts from them.
+    faker_time_series = None
+    #: The fields generated for every copy by the "clone selected" action, on top of the unique fields. The action's
+    #: form lets the user pick others among the fields declared by the factory.
+    faker_clone_vary = ()
     #: The template used for the change list view in the admin interface.
     change_list_template = settings.FAKER_ADMIN_CHANGE_LIST_TEMPLATE
+    #: Whether to add the filter that shows or hides the rows created by population runs to the change list.
+    faker_list_filter = True
+    #: Whether the change list counts its rows approximately, from the statistics of the database or from counts cached
+    #: for `FAKER_ADMIN_COUNT_CACHE_TTL` seconds, instead of running an exact ``COUNT(*)`` on every page load.
+    faker_approximate_count = False
 
     def get_urls(self):
         """
         Extends the ModelAdmin's URLs to include a custom path for the dummy data population view.
 
-        This method adds a new URL pattern that points to the `populate_dummy_data_view` method. It ensures that
-        the custom view integrates seamlessly with the existing admin URLs.
+        This method adds new URL patterns that point to the `faker_view` and `faker_purge_view` methods. It ensures
+        that the custom views integrate seamlessly with the existing admin URLs.
 
         Returns:
-            - list: A list of URL patterns, including the new pattern for dummy data population.
+            - list: A list of URL patterns, including the new patterns for dummy data population and purging.
         """
         urls = super().get_urls()  # Retrieve the existing URLs from the superclass
         info = self.model._meta.app_label, self.model._meta.model_name  # Get the app label and model name
         # Add a new URL pattern for populating dummy data, at the beginning of the list
         return [
             path('populate-dummy-data/', self.faker_view, name='%s_%s_populate_dummy_data' % info),
+            path('purge-dummy-data/', self.faker_purge_view, name='%s_%s_purge_dummy_data' % info),
             *urls  # Include the existing URLs
         ]
 
+    def get_list_filter(self, request):
+        """
+        Adds the `GeneratedListFilter` to the change list filters, unless `faker_list_filter` is disabled or the rows of
+        the model cannot be tracked.
+
+        Args:
+            - request: The HttpRequest object.
+
+        Returns:
+            - list: The change list filters.
+        """
+        from django_faker_admin.tracking import supports_tracking
+
+        list_filter = list(super().get_list_filter(request))
+        if self.faker_list_filter and supports_tracking(self.model) and GeneratedListFilter not in list_filter:
+            list_filter.append(GeneratedListFilter)
+        return list_filter
+
     def get_faker_view_class(self, request):
         """
         Returns the view class used for populating dummy data.
@@ -59,6 +114,13 @@ class FakerModelAdminMixin:
             'model_admin': self,
             'factory_class': self.factory_class,
             'exclude': self.get_exclude(request=request),
+            'strategy': self.faker_strategy,
+            'm2m_fan_out': self.faker_m2m_fan_out,
+            'database': self.faker_database,
+            'writers': self.faker_writers,
+            'use_queue': self.faker_use_queue,
+            'distributions': self.faker_distributions,
+            'time_series': self.faker_time_series,
         }
 
     def faker_view(self, request, extra_context=None):
@@ -91,3 +153,263 @@ class FakerModelAdminMixin:
            **kwargs,
             extra_context=context  # Pass the combined context to the view
         )(request)  # Call the view with the request object
+
+    def get_faker_purge_view_class(self, request):
+        """
+        Returns the view class used for purging dummy data.
+        This method can be overridden to provide a custom view class if needed.
+
+        Args:
+            - request: The HttpRequest object.
+
+        Returns:
+            - class: The view class to be used for dummy data purging. By default, it returns the `FakerPurgeView`.
+        """
+        return FakerPurgeView
+
+    def faker_purge_view(self, request, extra_context=None):
+        """
+        View function to confirm and perform the deletion of the dummy data of the model.
+
+        Args:
+            - request: The HttpRequest object.
+            - extra_context (dict, optional): Additional context data to pass to the template. Defaults to None.
+
+        Returns:
+            - HttpResponse: The response generated by the `FakerPurgeView`.
+        """
+        context = {
+            **self.admin_site.each_context(request),
+            **(extra_context or {}),
+            "opts": self.opts,
+        }
+
+        klass = self.get_faker_purge_view_class(request=request)
+        return klass.as_view(
+            model_admin=self,
+            extra_context=context
+        )(request)
+
+    def changelist_view(self, request, extra_context=None):
+        """
+        Adds the delete permission to the change list context, which shows or hides the purge link.
+
+        Args:
+            - request: The HttpRequest object.
+            - extra_context (dict, optional): Additional context data to pass to the template. Defaults to None.
+
+        Returns:
+            - HttpResponse: The change list response.
+        """
+        extra_context = {
+            'has_delete_permission': self.has_delete_permission(request),
+            **(extra_context or {}),
+        }
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def get_changelist(self, request, **kwargs):
+        """
+        Returns the change list class, counting the total number of rows approximately with `faker_approximate_count`.
+
+        The change list class of the parent admin is kept, and extended to count its rows approximately.
+
+        Args:
+            - request: The HttpRequest object.
+            - **kwargs: Additional keyword arguments.
+
+        Returns:
+            - type: The change list class.
+        """
+        changelist = super().get_changelist(request, **kwargs)
+        if not self.faker_approximate_count or issubclass(changelist, ApproximateCountChangeList):
+            return changelist
+        return type(ApproximateCountChangeList.__name__, (ApproximateCountChangeList, changelist), {})
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        """
+        Returns the paginator of the change list, counting the rows approximately with `faker_approximate_count`.
+
+        Args:
+            - request: The HttpRequest object.
+            - queryset (QuerySet): The filtered rows.
+            - per_page (int): The number of rows per page.
+            - orphans (int): The minimum number of rows of the last page.
+            - allow_empty_first_page (bool): Whether the first page may be empty.
+
+        Returns:
+            - Paginator: The paginator.
+        """
+        if self.faker_approximate_count:
+            return ApproximateCountPaginator(queryset, per_page, orphans, allow_empty_first_page)
+        return super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+
+    def get_fan_out_relations(self, request):
+        """
+        Returns the relations the "generate children" action may populate: the foreign keys pointing at the model from
+        models registered in the same admin site with a factory class, whose objects the user may add.
+
+        Args:
+            - request: The HttpRequest object.
+
+        Returns:
+            - dict: The admins of the child models and the foreign keys, by ``app_label.model_name:field_name`` key.
+        """
+        from django_faker_admin.fanout import get_fan_out_relations
+
+        relations = {}
+        for field in get_fan_out_relations(self.model):
+            child_admin = self.admin_site._registry.get(field.model)
+            if getattr(child_admin, 'factory_class', None) is None or not child_admin.has_add_permission(request):
+                continue
+            relations[f'{field.model._meta.label_lower}:{field.name}'] = (child_admin, field)
+        return relations
+
+    def get_actions(self, request):
+        """
+        Adds the "clone selected" action to the change list actions, for users who may add objects of the model, and
+        the "generate children" action, when the user may add objects of a child model.
+
+        Args:
+            - request: The HttpRequest object.
+
+        Returns:
+            - dict: The actions, by name.
+        """
+        actions = super().get_actions(request)
+        if self.actions is None or IS_POPUP_VAR in request.GET:
+            return actions
+        if self.factory_class is not None and self.has_add_permission(request):
+            actions.setdefault('clone_selected', self.get_action('clone_selected'))
+        if self.get_fan_out_relations(request):
+            actions.setdefault('generate_children', self.get_action('generate_children'))
+        return actions
+
+    @admin.action(description=gettext_lazy("Clone selected %(verbose_name_plural)s"))
+    def clone_selected(self, request, queryset):
+        """
+        Copies the selected rows a number of times, generating only the varying and unique fields.
+
+        The first request renders a form asking for the number of copies and the varying fields; the confirmed form
+        runs the clone and goes back to the change list.
+
+        Args:
+            - request: The HttpRequest object.
+            - queryset: The selected rows.
+
+        Returns:
+            - TemplateResponse: The form, or None once the rows are cloned.
+        """
+        from django_faker_admin.clone import clone
+
+        form = FakerCloneForm(
+            request.POST if request.POST.get('post') else None,
+            factory_class=self.factory_class,
+            initial={'vary': list(self.faker_clone_vary)}
+        )
+        if form.is_valid():
+            try:
+                written = clone(
+                    self.factory_class,
+                    queryset,
+                    times=form.cleaned_data['times'],
+                    vary=form.cleaned_data['vary'],
+                    seed=form.cleaned_data['seed'],
+                    using=self.faker_database,
+                    writers=self.faker_writers
+                )
+            except ValueError as e:
+                self.message_user(request, str(e), messages.ERROR)
+            else:
+                self.message_user(
+                    request,
+                    ngettext(
+                        "%d %s object was successfully created.",
+                        "%d %s objects were successfully created.",
+                        written,
+                    ) % (written, self.model._meta.model_name),
+                    messages.SUCCESS
+                )
+            return None
+
+        # A selection across all pages is carried over as such rather than as a list of primary keys
+        select_across = request.POST.get('select_across') == '1'
+        context = {
+            **self.admin_site.each_context(request),
+            'title': gettext_lazy("Clone selected rows"),
+            'opts': self.opts,
+            'queryset': queryset,
+            'select_across': select_across,
+            'selected': [] if select_across else queryset.values_list('pk', flat=True),
+            'form': form,
+            'action_checkbox_name': helpers.ACTION_CHECKBOX_NAME,
+            'media': self.media + form.media,
+        }
+        request.current_app = self.admin_site.name
+        return TemplateResponse(request, 'admin/faker_clone.html', context)
+
+    @admin.action(description=gettext_lazy("Generate children of selected %(verbose_name_plural)s"))
+    def generate_children(self, request, queryset):
+        """
+        Generates a random number of child rows for every selected row, or for every row of the table.
+
+        The first request renders a form asking for the child relation and the number of children per parent; the
+        confirmed form generates the children in chunks of bulk inserts and goes back to the change list.
+
+        Args:
+            - request: The HttpRequest object.
+            - queryset: The selected rows.
+
+        Returns:
+            - TemplateResponse: The form, or None once the children are generated.
+        """
+        from django_faker_admin.fanout import fan_out
+
+        relations = self.get_fan_out_relations(request)
+        form = FakerFanOutForm(
+            request.POST if request.POST.get('post') else None,
+            relations={
+                key: f'{field.model._meta.verbose_name_plural} ({field.verbose_name})'
+                for key, (child_admin, field) in relations.items()
+            }
+        )
+        if form.is_valid():
+            child_admin, field = relations[form.cleaned_data['relation']]
+            parents = self.model._default_manager.using(queryset.db) if form.cleaned_data['all_rows'] else queryset
+            try:
+                written = fan_out(
+                    child_admin.factory_class,
+                    field.name,
+                    parents,
+                    counts=(form.cleaned_data['min_count'], form.cleaned_data['max_count']),
+                    seed=form.cleaned_data['seed'],
+                    using=child_admin.faker_database,
+                    writers=child_admin.faker_writers
+                )
+            except ValueError as e:
+                self.message_user(request, str(e), messages.ERROR)
+            else:
+                self.message_user(
+                    request,
+                    ngettext(
+                        "%d %s object was successfully created.",
+                        "%d %s objects were successfully created.",
+                        written,
+                    ) % (written, field.model._meta.model_name),
+                    messages.SUCCESS
+                )
+            return None
+
+        select_across = request.POST.get('select_across') == '1'
+        context = {
+            **self.admin_site.each_context(request),
+            'title': gettext_lazy("Generate children"),
+            'opts': self.opts,
+            'queryset': queryset,
+            'select_across': select_across,
+            'selected': [] if select_across else queryset.values_list('pk', flat=True),
+            'form': form,
+            'action_checkbox_name': helpers.ACTION_CHECKBOX_NAME,
+            'media': self.media + form.media,
+        }
+        request.current_app = self.admin_site.name
+        return TemplateResponse(request, 'admin/faker_fan_out.html', context)
@@ -0,0 +1,157 @@
+from django.db import models
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.translation import gettext_lazy as _
+
+
+class PopulationRun(models.Model):
+    """
+    A single population run: one request to generate dummy data for a model.
+
+    Bulk runs are checkpointed after every committed chunk, in the chunk's transaction: the number of rows and chunks
+    written, and the state of the random generators at the end of the chunk. Along with the factory path and the
+    generation `options`, that is enough to resume an interrupted run where it stopped. Setting `cancel_requested`
+    stops a running bulk run after its current chunk. A run profiled with ``cProfile`` keeps the path of its ``.prof``
+    file and its top cumulative functions.
+    """
+
+    class Status(models.TextChoices):
+        RUNNING = 'running', _("Running")
+        FINISHED = 'finished', _("Finished")
+        FAILED = 'failed', _("Failed")
+        CANCELLED = 'cancelled', _("Cancelled")
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_("content type")
+    )
+    size = models.PositiveIntegerField(_("size"))
+    rows_written = models.PositiveIntegerField(_("rows written"), default=0)
+    strategy = models.CharField(_("strategy"), max_length=20)
+    seed = models.BigIntegerField(_("seed"), null=True, blank=True)
+    status = models.CharField(_("status"), max_length=20, choices=Status.choices, default=Status.RUNNING)
+    factory_path = models.CharField(_("factory"), max_length=255, blank=True)
+    options = models.JSONField(_("options"), default=dict, blank=True, encoder=DjangoJSONEncoder)
+    chunks_written = models.PositiveIntegerField(_("chunks written"), default=0)
+    cancel_requested = models.BooleanField(_("cancel requested"), default=False)
+    random_state = models.JSONField(_("random state"), null=True, blank=True, editable=False)
+    profile_path = models.CharField(_("profile file"), max_length=500, blank=True)
+    profile_stats = models.TextField(_("profile"), blank=True)
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+    finished_at = models.DateTimeField(_("finished at"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("population run")
+        verbose_name_plural = _("population runs")
+        ordering = ('-created_at',)
+
+    def __str__(self):
+        return f"{self.content_type} #{self.pk}"
+
+
+class GeneratedRange(models.Model):
+    """
+    A contiguous range of primary keys, ``start_pk`` to ``end_pk`` inclusive, of rows created by a population run.
+    """
+    run = models.ForeignKey(
+        PopulationRun,
+        on_delete=models.CASCADE,
+        related_name='ranges',
+        verbose_name=_("run")
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_("content type")
+    )
+    start_pk = models.BigIntegerField(_("start primary key"))
+    end_pk = models.BigIntegerField(_("end primary key"))
+
+    class Meta:
+        verbose_name = _("generated range")
+        verbose_name_plural = _("generated ranges")
+        ordering = ('content_type', 'start_pk')
+        indexes = [
+            models.Index(fields=['content_type', 'start_pk']),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type} [{self.start_pk}, {self.end_pk}]"
+
+
+class TunedChunkSize(models.Model):
+    """
+    The bulk insert chunk size the autotuner settled on for a model and database, used as the start of the next run.
+    """
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_("content type")
+    )
+    database = models.CharField(_("database"), max_length=100)
+    chunk_size = models.PositiveIntegerField(_("chunk size"))
+    rows_per_second = models.FloatField(_("rows per second"), default=0)
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("tuned chunk size")
+        verbose_name_plural = _("tuned chunk sizes")
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'database'], name='unique_tuned_chunk_size'),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type} ({self.database}): {self.chunk_size}"
+
+
+class PopulationJob(models.Model):
+    """
+    A population queued for a worker process, run with ``faker_worker`` rather than inside a web request.
+
+    A worker claims a queued job, runs it as a `PopulationRun` in the target database and sends heartbeats while it
+    runs. A running job whose heartbeats stopped is put back in the queue by the other workers, and the next worker
+    resumes its run from the last checkpoint.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = 'queued', _("Queued")
+        RUNNING = 'running', _("Running")
+        FINISHED = 'finished', _("Finished")
+        FAILED = 'failed', _("Failed")
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_("content type")
+    )
+    factory_path = models.CharField(_("factory"), max_length=255)
+    size = models.PositiveIntegerField(_("size"))
+    database = models.CharField(_("database"), max_length=100, blank=True)
+    options = models.JSONField(_("options"), default=dict, blank=True, encoder=DjangoJSONEncoder)
+    status = models.CharField(_("status"), max_length=20, choices=Status.choices, default=Status.QUEUED)
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    worker = models.CharField(_("worker"), max_length=255, blank=True)
+    run_pk = models.PositiveIntegerField(_("run"), null=True, blank=True)
+    rows_written = models.PositiveIntegerField(_("rows written"), default=0)
+    error = models.TextField(_("error"), blank=True)
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    claimed_at = models.DateTimeField(_("claimed at"), null=True, blank=True)
+    heartbeat_at = models.DateTimeField(_("heartbeat at"), null=True, blank=True)
+    finished_at = models.DateTimeField(_("finished at"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("population job")
+        verbose_name_plural = _("population jobs")
+        ordering = ('-created_at',)
+        indexes = [
+            models.Index(fields=['status', 'id']),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type} job #{self.pk}"
@@ -0,0 +1,188 @@
+import hashlib
+from typing import Optional, Type
+
+from django.db import connections, models
+from django.contrib.admin.views.main import ChangeList
+from django.core.cache import BaseCache, caches
+from django.core.paginator import Paginator
+from django.core.exceptions import EmptyResultSet
+from django.utils.functional import cached_property
+
+from django_faker_admin.conf import settings
+
+
+def get_estimated_count(model: Type[models.Model], using: str) -> Optional[int]:
+    """
+    Returns the number of rows of a model's table estimated by the statistics of the database, without counting them.
+
+    Statistics are read from ``pg_class.reltuples`` on PostgreSQL, ``information_schema.TABLES`` on MySQL and MariaDB,
+    and ``sqlite_stat1`` on SQLite, which only exists once ``ANALYZE`` ran. They are as fresh as the last analysis of
+    the table.
+
+    Args:
+        - model (Type[Model]): The model.
+        - using (str): The database alias.
+
+    Returns:
+        - int: The estimated number of rows, or None if the backend has no statistics of the table.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)', [connection.ops.quote_name(table)]
+            )
+        elif connection.vendor == 'mysql':
+            cursor.execute(
+                'SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = %s',
+                [table]
+            )
+        elif connection.vendor == 'sqlite':
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                return None
+            # Every row of the table starts with the number of rows of the table, or of one of its indexes
+            cursor.execute('SELECT MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 WHERE tbl = %s', [table])
+        else:
+            return None
+        row = cursor.fetchone()
+    # PostgreSQL reports -1 for tables that were never analyzed
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def get_count_cache() -> BaseCache:
+    """
+    Returns the cache the row counts are kept in.
+
+    Returns:
+        - BaseCache: The cache named by `FAKER_ADMIN_COUNT_CACHE`.
+    """
+    return caches[settings.FAKER_ADMIN_COUNT_CACHE]
+
+
+def get_version_key(model: Type[models.Model], using: str) -> str:
+    """
+    Returns the cache key of the version of the cached counts of a model.
+
+    Args:
+        - model (Type[Model]): The model.
+        - using (str): The database alias.
+
+    Returns:
+        - str: The cache key.
+    """
+    return f'django_faker_admin:count-version:{using}:{model._meta.label_lower}'
+
+
+def invalidate_counts(model: Type[models.Model], using: str) -> None:
+    """
+    Invalidates the cached counts of a model, e.g. once a population run wrote or deleted rows.
+
+    The counts are not deleted, which would need their keys: the version the keys are built with is bumped instead, and
+    the stale counts expire with their timeout.
+
+    Args:
+        - model (Type[Model]): The model.
+        - using (str): The database alias.
+    """
+    cache, key = get_count_cache(), get_version_key(model, using)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # A missing version is version 0
+        cache.set(key, 1, timeout=None)
+
+
+def get_cached_count(queryset: models.QuerySet) -> int:
+    """
+    Returns the exact number of rows of a queryset, counted at most once every `FAKER_ADMIN_COUNT_CACHE_TTL` seconds.
+
+    The count is cached under a hash of the SQL of the queryset, so every filter of the change list has its own count.
+
+    Args:
+        - queryset (QuerySet): The queryset.
+
+    Returns:
+        - int: The number of rows.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    cache = get_count_cache()
+    version = cache.get(get_version_key(queryset.model, queryset.db), 0)
+    digest = hashlib.md5(f'{sql}{params!r}'.encode(), usedforsecurity=False).hexdigest()
+    key = f'django_faker_admin:count:{queryset.db}:{queryset.model._meta.label_lower}:{version}:{digest}'
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout=settings.FAKER_ADMIN_COUNT_CACHE_TTL)
+    return count
+
+
+def get_approximate_count(queryset: models.QuerySet) -> int:
+    """
+    Returns the number of rows of a queryset, estimated when counting them would be slow.
+
+    A queryset of the whole table gets the estimate of the database statistics when it is at least
+    `FAKER_ADMIN_ESTIMATED_COUNT_THRESHOLD` rows: estimates of small tables are both unreliable and cheap to replace
+    with an exact count. Other querysets, filtered ones included, get `get_cached_count`.
+
+    Args:
+        - queryset (QuerySet): The queryset.
+
+    Returns:
+        - int: The number of rows.
+    """
+    query = queryset.query
+    threshold = settings.FAKER_ADMIN_ESTIMATED_COUNT_THRESHOLD
+    whole_table = not query.where and not query.distinct and not query.is_sliced and not query.combinator
+    if threshold is not None and whole_table:
+        estimate = get_estimated_count(queryset.model, queryset.db)
+        if estimate is not None and estimate >= threshold:
+            return estimate
+    return get_cached_count(queryset)
+
+
+class ApproximateCountPaginator(Paginator):
+    """
+    A paginator counting querysets with `get_approximate_count` instead of a ``COUNT(*)`` query per page.
+
+    With an estimated count, the last pages may be shorter than the others, or empty.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        if isinstance(self.object_list, models.QuerySet):
+            return get_approximate_count(self.object_list)
+        return super().count
+
+
+class ApproximateCount:
+    """
+    Stands for a queryset whose only use is to be counted, counting it with `get_approximate_count`.
+    """
+
+    def __init__(self, queryset: models.QuerySet) -> None:
+        self.queryset = queryset
+
+    def count(self) -> int:
+        return get_approximate_count(self.queryset)
+
+
+class ApproximateCountChangeList(ChangeList):
+    """
+    A change list whose total count, shown next to the number of filtered results, is approximate as well.
+    """
+
+    def get_results(self, request):
+        # Django only counts the root queryset here, with no filter applied
+        root_queryset = self.root_queryset
+        self.root_queryset = ApproximateCount(root_queryset)
+        try:
+            super().get_results(request)
+        finally:
+            self.root_queryset = root_queryset
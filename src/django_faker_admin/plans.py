@@ -0,0 +1,329 @@
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+import factory
+from django.db import models
+from factory import declarations, enums
+from factory.django import DjangoModelFactory
+
+from django_faker_admin.conf import settings
+from django_faker_admin.fakers import get_faker
+
+
+#: A compiled declaration: called with the resolver of the object being built and its sequence number.
+type Step = Callable[['PlanResolver', int], Any]
+
+#: Factory hooks a plan reimplements; a factory overriding one of them is not compiled.
+OVERRIDABLE_HOOKS = ('_build', '_create', '_generate', '_after_postgeneration')
+
+
+class PlanResolver:
+    """
+    Resolves the field values of a single object from the steps of a plan.
+
+    Values are computed on first access and in the order of the steps otherwise, like factory_boy's ``Resolver``, so
+    `LazyAttribute` functions may read any other field of the object, including fields declared after them.
+    """
+    #: Objects built by a plan are never built by a ``SubFactory``.
+    factory_parent = None
+
+    def __init__(self, steps: Dict[str, Step], sequence: int, values: Dict[str, Any] = None) -> None:
+        """
+        Initializes the resolver.
+
+        Args:
+            - steps (dict): The steps of the plan, by field name.
+            - sequence (int): The sequence number of the object.
+            - values (dict): Values known in advance, by field name, which are not computed from their steps.
+        """
+        self._steps = steps
+        self._sequence = sequence
+        self._values = dict(values or {})
+        self._pending = []
+
+    def __getattr__(self, name: str) -> Any:
+        values = self._values
+        if name in values:
+            return values[name]
+        if name not in self._steps:
+            raise AttributeError(f"The parameter '{name}' is unknown.")
+        if name in self._pending:
+            raise factory.errors.CyclicDefinitionError(
+                f"Cyclic lazy attribute definition for '{name}'; cycle found in {self._pending}."
+            )
+        self._pending.append(name)
+        try:
+            values[name] = value = self._steps[name](self, self._sequence)
+        finally:
+            self._pending.pop()
+        return value
+
+    def resolve(self) -> Dict[str, Any]:
+        """
+        Computes every field value.
+
+        Returns:
+            - dict: The field values, in the order of the steps.
+        """
+        for name in self._steps:
+            getattr(self, name)
+        return {name: self._values[name] for name in self._steps}
+
+
+def compile_constant(value: Any) -> Step:
+    """
+    Compiles a plain value into a step.
+
+    Args:
+        - value (Any): The value.
+
+    Returns:
+        - Step: A step returning the value.
+    """
+    return lambda resolver, sequence: value
+
+
+class FakerStep:
+    """
+    A compiled ``Faker`` declaration.
+
+    The step is bound to the provider method of the shared Faker instance of its locale by `bind`, once per batch of
+    objects built by a plan, so that the default locale in effect when the objects are built applies, like with
+    factory_boy, e.g. inside ``factory.Faker.override_default_locale()``.
+    """
+
+    def __init__(self, provider: str, locale: Optional[str], kwargs: Dict[str, Any]) -> None:
+        """
+        Initializes the step.
+
+        Args:
+            - provider (str): The name of the provider method.
+            - locale (str): The locale of the declaration, None for the default locale.
+            - kwargs (dict): The keyword arguments of the provider method.
+        """
+        self.provider = provider
+        self.locale = locale
+        self.kwargs = kwargs
+
+    def bind(self) -> Step:
+        """
+        Returns a step calling the provider method of the Faker instance of the current locale.
+
+        Returns:
+            - Step: The bound step.
+        """
+        method, kwargs = getattr(get_faker(self.locale), self.provider), self.kwargs
+        if kwargs:
+            return lambda resolver, sequence: method(**kwargs)
+        return lambda resolver, sequence: method()
+
+    def __call__(self, resolver: PlanResolver, sequence: int) -> Any:
+        return self.bind()(resolver, sequence)
+
+
+def compile_declaration(declaration: Any) -> Optional[Step]:
+    """
+    Compiles a factory declaration into a step.
+
+    Supported declarations are plain values, ``Faker`` (with plain keyword arguments), ``Sequence``, ``LazyFunction``,
+    ``LazyAttribute`` and ``LazyAttributeSequence``. Subclasses of these are not supported, since they may change how
+    the value is evaluated. A ``Faker`` declaration is compiled into a `FakerStep`, which looks the provider method up
+    once per batch instead of once per object.
+
+    Args:
+        - declaration (Any): The declaration.
+
+    Returns:
+        - Step: The compiled step, or None if the declaration is not supported.
+    """
+    if enums.get_builder_phase(declaration) is None:
+        return compile_constant(declaration)
+
+    kind = type(declaration)
+    if kind is factory.Faker:
+        kwargs = dict(declaration._defaults)
+        locale = kwargs.pop('locale', None)
+        if any(enums.get_builder_phase(value) is not None for value in kwargs.values()):
+            return None
+        return FakerStep(declaration.provider, locale, kwargs)
+
+    function = getattr(declaration, 'function', None)
+    if kind is declarations.Sequence:
+        return lambda resolver, sequence: function(sequence)
+    if kind is declarations.LazyFunction:
+        return lambda resolver, sequence: function()
+    if kind is declarations.LazyAttribute:
+        return lambda resolver, sequence: function(resolver)
+    if kind is declarations.LazyAttributeSequence:
+        return lambda resolver, sequence: function(resolver, sequence)
+    return None
+
+
+class GenerationPlan:
+    """
+    A factory class compiled into a flat, ordered list of steps, one per declared field.
+
+    A plan builds the same objects as the factory, drawing from the same random generators in the same order, without
+    going through factory_boy's declaration resolution for every object. Plans are compiled with `compile_plan` and
+    shared through `get_plan`.
+    """
+
+    def __init__(self, factory_class: Type[DjangoModelFactory], steps: Dict[str, Step]) -> None:
+        """
+        Initializes the plan.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The compiled factory class.
+            - steps (dict): The compiled declarations, by field name, in declaration order.
+        """
+        self.factory_class = factory_class
+        self.model = factory_class._meta.model
+        self.steps = steps
+
+    @staticmethod
+    def supports(overrides: Dict[str, Any]) -> bool:
+        """
+        Checks whether the plan can build objects with the given overrides.
+
+        Args:
+            - overrides (dict): Field values passed to the factory for every object.
+
+        Returns:
+            - bool: False if an override is a declaration or sets a nested field, True otherwise.
+        """
+        return all(
+            enums.SPLITTER not in name and enums.get_builder_phase(value) is None
+            for name, value in overrides.items()
+        )
+
+    def get_steps(self, overrides: Dict[str, Any]) -> Dict[str, Step]:
+        """
+        Returns the steps of the plan with the overridden fields replaced by their values, and the ``Faker`` steps
+        bound to the Faker instances of the current locales.
+
+        Args:
+            - overrides (dict): Field values passed to the factory for every object.
+
+        Returns:
+            - dict: The steps, by field name.
+        """
+        steps = {name: step.bind() if isinstance(step, FakerStep) else step for name, step in self.steps.items()}
+        for name, value in overrides.items():
+            steps[name] = compile_constant(value)
+        return steps
+
+    def iter_kwargs(self, count: int, overrides: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the model keyword arguments of `count` objects.
+
+        Args:
+            - count (int): The number of objects.
+            - overrides (dict): Field values passed to the factory for every object.
+
+        Yields:
+            - dict: The keyword arguments of an object.
+        """
+        meta = self.factory_class._meta
+        steps = self.get_steps(overrides)
+        for _ in range(count):
+            values = PlanResolver(steps, meta.next_sequence()).resolve()
+            # Same preparation as factory_boy's ``FactoryOptions.prepare_arguments``
+            kwargs = self.factory_class._adjust_kwargs(**values)
+            kwargs = {
+                name: value for name, value in kwargs.items()
+                if name not in meta.exclude and value is not declarations.SKIP
+            }
+            for old_name, new_name in meta.rename.items():
+                if old_name in kwargs:
+                    kwargs[new_name] = kwargs.pop(old_name)
+            yield kwargs
+
+    def build(self, count: int, overrides: Dict[str, Any] = None) -> List[models.Model]:
+        """
+        Builds unsaved objects, like ``factory_class.build_batch``.
+
+        Args:
+            - count (int): The number of objects.
+            - overrides (dict): Field values passed to the factory for every object.
+
+        Returns:
+            - list: The unsaved model instances.
+        """
+        model = self.model
+        return [model(**kwargs) for kwargs in self.iter_kwargs(count, overrides or {})]
+
+    def create(self, count: int, overrides: Dict[str, Any] = None, using: str = None) -> List[models.Model]:
+        """
+        Creates objects one by one, like ``factory_class.create_batch``.
+
+        Args:
+            - count (int): The number of objects.
+            - overrides (dict): Field values passed to the factory for every object.
+            - using (str): The database alias. Defaults to the factory's database.
+
+        Returns:
+            - list: The saved model instances.
+        """
+        manager = self.factory_class._get_manager(self.model)
+        if using:
+            manager = manager.using(using)
+        return [manager.create(**kwargs) for kwargs in self.iter_kwargs(count, overrides or {})]
+
+
+def compile_plan(factory_class: Type[DjangoModelFactory]) -> Optional[GenerationPlan]:
+    """
+    Compiles a factory class into a generation plan.
+
+    Factories that use anything a plan does not reimplement are not compiled: parameters and traits, post-generation
+    declarations, nested declarations, inline arguments, ``django_get_or_create``, overridden build or create hooks, and
+    declarations not supported by `compile_declaration` (such as ``SubFactory``, ``Iterator`` or ``Maybe``).
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class.
+
+    Returns:
+        - GenerationPlan: The compiled plan, or None if the factory should be used as is.
+    """
+    meta = factory_class._meta
+    if (
+        meta.abstract
+        or meta.parameters
+        or meta.inline_args
+        or getattr(meta, 'django_get_or_create', ())
+        or meta.post_declarations.declarations
+        or any(meta.pre_declarations.contexts.values())
+        or any(getattr(factory_class, hook).__func__ is not getattr(DjangoModelFactory, hook).__func__
+               for hook in OVERRIDABLE_HOOKS)
+    ):
+        return None
+
+    steps = {}
+    for name, declaration in meta.pre_declarations.declarations.items():
+        step = compile_declaration(declaration)
+        if step is None:
+            return None
+        steps[name] = step
+    return GenerationPlan(factory_class, steps)
+
+
+_plans: Dict[Type[DjangoModelFactory], Optional[GenerationPlan]] = {}
+_plans_lock = threading.Lock()
+
+
+def get_plan(factory_class: Type[DjangoModelFactory]) -> Optional[GenerationPlan]:
+    """
+    Returns the generation plan of a factory class, compiling it on first use.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class.
+
+    Returns:
+        - GenerationPlan: The cached plan, or None if the factory cannot be compiled or `FAKER_ADMIN_COMPILE_PLANS` is
+          disabled.
+    """
+    if not settings.FAKER_ADMIN_COMPILE_PLANS:
+        return None
+    with _plans_lock:
+        if factory_class not in _plans:
+            _plans[factory_class] = compile_plan(factory_class)
+        return _plans[factory_class]
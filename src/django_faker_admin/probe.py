@@ -0,0 +1,197 @@
+import statistics
+import time
+from contextlib import ExitStack
+from typing import Any, Dict, List, Tuple
+
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.urls import reverse
+from django.contrib.admin import ModelAdmin
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from django_faker_admin.bulk import generate
+
+
+#: A query captured while rendering a change list: its duration in seconds, its database alias and its SQL.
+type ProbedQuery = Tuple[float, str, str]
+
+
+class ProbeResult:
+    """
+    The cost of rendering a change list at a given data size: latencies, number of queries and slowest queries.
+    """
+
+    def __init__(self, rows: int, latencies: List[float], query_count: int, queries: List[ProbedQuery]) -> None:
+        """
+        Initializes the result.
+
+        Args:
+            - rows (int): The number of rows matched by the change list, as it counted them.
+            - latencies (list): The duration of every rendering, in seconds, template included.
+            - query_count (int): The number of queries of a rendering.
+            - queries (list): The queries of every rendering.
+        """
+        self.rows = rows
+        self.latencies = latencies
+        self.query_count = query_count
+        self.queries = queries
+
+    @property
+    def latency(self) -> float:
+        """
+        The median duration of a rendering, in seconds.
+        """
+        return statistics.median(self.latencies)
+
+    def get_slowest_queries(self, count: int = 5) -> List[ProbedQuery]:
+        """
+        Returns the slowest queries, every statement counting once, with its slowest run.
+
+        Args:
+            - count (int): The number of queries.
+
+        Returns:
+            - list: The slowest queries, slowest first.
+        """
+        slowest = {}
+        for query in self.queries:
+            key = query[1:]
+            if key not in slowest or query[0] > slowest[key][0]:
+                slowest[key] = query
+        return sorted(slowest.values(), key=lambda query: query[0], reverse=True)[:count]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns the figures of the result.
+
+        Returns:
+            - dict: The number of rows, the median and maximum latencies in seconds, the number of queries, and the
+              duration and SQL of the slowest query.
+        """
+        slowest = self.get_slowest_queries(1)
+        return {
+            'rows': self.rows,
+            'latency': self.latency,
+            'latency_max': max(self.latencies),
+            'queries': self.query_count,
+            'slowest_query_time': slowest[0][0] if slowest else 0.0,
+            'slowest_query': slowest[0][2] if slowest else '',
+        }
+
+
+def get_probe_user():
+    """
+    Returns an unsaved active superuser, who may see every change list without touching the database.
+
+    Returns:
+        - User: The user.
+    """
+    User = get_user_model()
+    return User(**{User.USERNAME_FIELD: 'faker-probe'}, is_active=True, is_staff=True, is_superuser=True)
+
+
+def probe_changelist(
+        model_admin: ModelAdmin,
+        params: Dict[str, Any] = None,
+        user=None,
+        repeat: int = 3
+    ) -> ProbeResult:
+    """
+    Renders the change list of a model admin and measures how long it takes and which queries it runs.
+
+    The change list is rendered by the admin's own ``changelist_view``, from a `RequestFactory` request, so its
+    ``list_display``, ``search_fields``, filters and pagination apply as they would to a user's request; `params` are
+    the query string of that request, e.g. ``{'q': 'smith'}`` to probe a search. The queries are captured on the
+    database the model is read from and on the default database. Renderings are repeated, the latency of the result
+    being their median.
+
+    Args:
+        - model_admin (ModelAdmin): The admin of the model, registered in its admin site.
+        - params (dict): The query string parameters of the change list.
+        - user (User): The user rendering the change list. Defaults to an unsaved superuser.
+        - repeat (int): The number of renderings.
+
+    Returns:
+        - ProbeResult: The latencies and queries of the renderings.
+
+    Raises:
+        - ValueError: If `repeat` is not positive.
+    """
+    if repeat < 1:
+        raise ValueError("The change list should be rendered at least once.")
+
+    opts = model_admin.model._meta
+    url = reverse('%s:%s_%s_changelist' % (model_admin.admin_site.name, opts.app_label, opts.model_name))
+    request_factory = RequestFactory()
+    user = user or get_probe_user()
+    aliases = list(dict.fromkeys([router.db_for_read(model_admin.model), DEFAULT_DB_ALIAS]))
+
+    latencies = []
+    queries = []
+    query_count = 0
+    rows = 0
+    for _ in range(repeat):
+        request = request_factory.get(url, params or {})
+        request.user = user
+        with ExitStack() as stack:
+            contexts = [stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in aliases]
+            started = time.perf_counter()
+            response = model_admin.changelist_view(request)
+            if hasattr(response, 'render'):
+                response.render()
+            latencies.append(time.perf_counter() - started)
+
+        captured = [
+            (float(query['time']), context.connection.alias, query['sql'])
+            for context in contexts
+            for query in context.captured_queries
+        ]
+        queries.extend(captured)
+        query_count = len(captured)
+        context_data = getattr(response, 'context_data', None) or {}
+        if 'cl' in context_data:
+            rows = context_data['cl'].result_count
+
+    return ProbeResult(rows=rows, latencies=latencies, query_count=query_count, queries=queries)
+
+
+def probe_population(
+        model_admin: ModelAdmin,
+        steps: int,
+        step_size: int,
+        params: Dict[str, Any] = None,
+        user=None,
+        repeat: int = 3,
+        **kwargs
+    ) -> List[ProbeResult]:
+    """
+    Alternates population and probing, to follow the cost of a change list as its table grows.
+
+    The change list is probed once before the first population, then after every step.
+
+    Args:
+        - model_admin (ModelAdmin): The faker-enabled admin of the model.
+        - steps (int): The number of population steps.
+        - step_size (int): The number of objects created by every step.
+        - params (dict): The query string parameters of the change list.
+        - user (User): The user rendering the change list. Defaults to an unsaved superuser.
+        - repeat (int): The number of renderings per probe.
+        - kwargs: Extra keyword arguments passed to `generate`.
+
+    Returns:
+        - list: The result of every probe, by increasing data size.
+
+    Raises:
+        - ValueError: If the admin has no factory class.
+    """
+    if getattr(model_admin, 'factory_class', None) is None:
+        raise ValueError(f"The admin of {model_admin.model._meta.label} has no factory class.")
+
+    kwargs.setdefault('strategy', model_admin.faker_strategy)
+    kwargs.setdefault('using', model_admin.faker_database)
+    results = [probe_changelist(model_admin, params=params, user=user, repeat=repeat)]
+    for _ in range(steps):
+        generate(model_admin.factory_class, step_size, **kwargs)
+        results.append(probe_changelist(model_admin, params=params, user=user, repeat=repeat))
+    return results
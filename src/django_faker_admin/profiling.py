@@ -0,0 +1,91 @@
+import io
+import cProfile
+import pstats
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple, Type
+
+from django.utils import timezone
+from factory.django import DjangoModelFactory
+
+from django_faker_admin.conf import settings
+from django_faker_admin.bulk import generate
+
+if TYPE_CHECKING:
+    from django_faker_admin.models import PopulationRun
+
+
+def get_profile_directory() -> Path:
+    """
+    Returns the directory the profiles of population runs are saved to, creating it if needed.
+
+    Returns:
+        - Path: `FAKER_ADMIN_PROFILE_DIR`, or a ``django_faker_admin`` directory in the system's temporary directory.
+    """
+    directory = Path(settings.FAKER_ADMIN_PROFILE_DIR or Path(tempfile.gettempdir()) / 'django_faker_admin')
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def format_stats(profiler: cProfile.Profile, limit: int = 30, sort: str = 'cumulative') -> str:
+    """
+    Renders the top functions of a profile as ``pstats`` prints them.
+
+    Args:
+        - profiler (cProfile.Profile): The profile.
+        - limit (int): The number of functions.
+        - sort (str): The ``pstats`` sort key.
+
+    Returns:
+        - str: The table of the top functions, with the total number of calls and time.
+    """
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return stream.getvalue().strip()
+
+
+def profile_generate(
+        factory_class: Type[DjangoModelFactory],
+        size: int,
+        limit: int = 30,
+        **kwargs
+    ) -> Tuple[int, Optional['PopulationRun'], Path]:
+    """
+    Generates objects with `generate`, under ``cProfile``.
+
+    The profile is saved as a ``.prof`` file, which ``pstats``, snakeviz or gprof2dot can open, and its top
+    cumulative functions are stored on the population run, to be shown on its admin page. The snapshot cache is
+    bypassed, since loading a snapshot would not show where generating the rows takes time. Only the calling thread
+    is profiled: with several writers, the time spent inserting chunks shows as waits on the writers' queue.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class used to generate the objects.
+        - size (int): The number of objects to generate.
+        - limit (int): The number of functions stored on the run.
+        - kwargs: Extra keyword arguments passed to `generate`.
+
+    Returns:
+        - tuple: The number of objects created, the population run, and the path of the ``.prof`` file.
+    """
+    runs = []
+    kwargs['use_snapshots'] = False
+    kwargs['on_start'] = runs.append
+
+    profiler = cProfile.Profile()
+    try:
+        written = profiler.runcall(generate, factory_class, size, **kwargs)
+    finally:
+        run = runs[0] if runs else None
+        name = f"{factory_class._meta.model._meta.label_lower}-{timezone.now():%Y%m%d-%H%M%S}"
+        if run is not None:
+            name = f"{name}-run{run.pk}"
+        path = get_profile_directory() / f"{name}.prof"
+        profiler.dump_stats(path)
+        if run is not None:
+            run.refresh_from_db()
+            run.profile_path = str(path)
+            run.profile_stats = format_stats(profiler, limit)
+            run.save(update_fields=['profile_path', 'profile_stats'])
+    return written, run, path
+
@@ -0,0 +1,125 @@
+from typing import Iterable, Iterator, Type
+
+from django.db import connections, models, router, transaction
+from django.db.models.deletion import DO_NOTHING, get_candidate_relations_to_delete
+
+from django_faker_admin.conf import settings
+from django_faker_admin.models import GeneratedRange
+from django_faker_admin.pagination import invalidate_counts
+from django_faker_admin.tracking import PkRange, get_generated_ranges
+
+
+def can_skip_collection(model: Type[models.Model]) -> bool:
+    """
+    Checks whether the schema allows deleting rows of the model without collecting cascades in Python.
+
+    This is the schema part of Django's ``Collector.can_fast_delete``: the model has no multi-table inheritance
+    parents, every relation pointing at it is ``DO_NOTHING``, and it has no generic relations. Delete signal receivers
+    are not taken into account, since skipping them is the point of a fast purge.
+
+    Args:
+        - model (Type[Model]): The model class.
+
+    Returns:
+        - bool: True if the rows can be deleted with plain SQL, False otherwise.
+    """
+    opts = model._meta
+    return (
+        not opts.concrete_model._meta.parents
+        and all(
+            related.field.remote_field.on_delete is DO_NOTHING
+            for related in get_candidate_relations_to_delete(opts)
+        )
+        and not any(hasattr(field, 'bulk_related_objects') for field in opts.private_fields)
+    )
+
+
+def iter_windows(ranges: Iterable[PkRange], chunk_size: int) -> Iterator[PkRange]:
+    """
+    Splits primary key ranges into windows of at most `chunk_size` keys, in primary key order.
+
+    Args:
+        - ranges (Iterable[PkRange]): The inclusive ``(start, end)`` ranges, ordered by start.
+        - chunk_size (int): The maximum number of keys per window.
+
+    Yields:
+        - tuple: An inclusive ``(start, end)`` window.
+    """
+    for start, end in ranges:
+        while start <= end:
+            stop = min(start + chunk_size - 1, end)
+            yield start, stop
+            start = stop + 1
+
+
+def delete_window(model: Type[models.Model], window: PkRange, using: str, fast: bool) -> int:
+    """
+    Deletes the rows of the model whose primary keys fall in the given window.
+
+    Args:
+        - model (Type[Model]): The model class.
+        - window (PkRange): The inclusive ``(start, end)`` primary key window.
+        - using (str): The database alias.
+        - fast (bool): Delete with a single raw SQL statement instead of collecting cascades and sending signals.
+
+    Returns:
+        - int: The number of deleted rows of the model.
+    """
+    if not fast:
+        deleted, per_model = model._base_manager.using(using).filter(pk__range=window).delete()
+        return per_model.get(model._meta.label, 0)
+
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    sql = 'DELETE FROM %s WHERE %s BETWEEN %%s AND %%s' % (
+        quote_name(model._meta.db_table),
+        quote_name(model._meta.pk.column),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, window)
+        return cursor.rowcount
+
+
+def purge(
+        model: Type[models.Model],
+        runs: Iterable[int] = None,
+        chunk_size: int = None,
+        fast: bool = False,
+        using: str = None
+    ) -> int:
+    """
+    Deletes the rows of the model that were created by population runs.
+
+    Only the tracked primary key ranges are deleted, window by window in primary key order, each window in its own
+    transaction. The purged ranges are then forgotten, and the cached counts of the model are invalidated. With
+    `fast`, windows are deleted with raw SQL when the schema allows it (see `can_skip_collection`); otherwise the ORM
+    deletes them, collecting cascades and sending signals.
+
+    Args:
+        - model (Type[Model]): The model class.
+        - runs (Iterable[int]): Only purge the rows of these population runs. Defaults to all runs.
+        - chunk_size (int): The maximum number of primary keys per delete. Defaults to `FAKER_ADMIN_BULK_CHUNK_SIZE`.
+        - fast (bool): Skip cascade collection and delete signals when the schema allows it.
+        - using (str): The database alias. Defaults to the alias picked by the database routers.
+
+    Returns:
+        - int: The number of deleted rows of the model.
+    """
+    chunk_size = chunk_size or settings.FAKER_ADMIN_BULK_CHUNK_SIZE
+    using = using or router.db_for_write(model)
+    fast = fast and can_skip_collection(model)
+
+    ranges = get_generated_ranges(model, using)
+    if runs is not None:
+        ranges = ranges.filter(run__in=runs)
+
+    deleted = 0
+    # Ranges are compact, so they are fetched up-front rather than streamed while their rows are being deleted
+    for range_pk, start, end in list(ranges.values_list('pk', 'start_pk', 'end_pk')):
+        for window in iter_windows([(start, end)], chunk_size):
+            with transaction.atomic(using=using):
+                deleted += delete_window(model, window, using=using, fast=fast)
+        GeneratedRange.objects.using(using).filter(pk=range_pk).delete()
+
+    invalidate_counts(model, using)
+    return deleted
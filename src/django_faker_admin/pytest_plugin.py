@@ -0,0 +1,308 @@
+"""
+A pytest plugin populating the test database with the bulk engine, and caching the populated SQLite database.
+
+Enable it in a ``conftest.py`` with ``pytest_plugins = ['django_faker_admin.pytest_plugin']``, or on the command line
+with ``-p django_faker_admin.pytest_plugin``.
+"""
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable, List, Tuple, Type
+
+import faker
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connections, models
+from django.db.migrations.loader import MigrationLoader
+from django.core.management import call_command
+from django.contrib.contenttypes.models import ContentType
+from factory.django import DjangoModelFactory
+
+from django_faker_admin.bulk import BULK_STRATEGY, generate, get_factory_path
+from django_faker_admin.snapshots import get_factory_fingerprint
+from django_faker_admin.utils import get_factory_class, get_model
+
+
+#: File name suffix of the cached databases.
+DATABASE_SUFFIX = '.sqlite3'
+
+#: What to populate: a factory class, a model class or an ``app_label.ModelName`` label, with a number of objects.
+type Population = Tuple[Type[DjangoModelFactory] | Type[models.Model] | str, int]
+
+
+def resolve_populations(populations: Iterable[Population]) -> List[Tuple[Type[DjangoModelFactory], int]]:
+    """
+    Resolves the models of the populations into factory classes.
+
+    Args:
+        - populations (Iterable[Population]): The populations.
+
+    Returns:
+        - list: The factory classes and numbers of objects, in order.
+
+    Raises:
+        - LookupError: If a model is unknown or has no factory class.
+    """
+    resolved = []
+    for target, size in populations:
+        if isinstance(target, str):
+            target = get_model(target)
+        if issubclass(target, models.Model):
+            target = get_factory_class(target)
+        resolved.append((target, size))
+    return resolved
+
+
+def get_migration_state(using: str = DEFAULT_DB_ALIAS) -> List[str]:
+    """
+    Returns the migrations on disk, with a digest of their source, which the cached databases depend on.
+
+    Args:
+        - using (str): The database alias.
+
+    Returns:
+        - list: The sorted ``app_label.name:digest`` entries.
+    """
+    loader = MigrationLoader(connections[using], ignore_no_migrations=True, load=True)
+    state = []
+    for (app_label, name), migration in loader.graph.nodes.items():
+        path = getattr(sys.modules.get(type(migration).__module__), '__file__', None)
+        digest = hashlib.sha256(Path(path).read_bytes()).hexdigest() if path else ''
+        state.append(f'{app_label}.{name}:{digest}')
+    return sorted(state)
+
+
+def get_database_key(
+        populations: Iterable[Tuple[Type[DjangoModelFactory], int]],
+        seed: int,
+        using: str = DEFAULT_DB_ALIAS
+    ) -> str:
+    """
+    Computes the key of a populated database.
+
+    Args:
+        - populations (Iterable[tuple]): The factory classes and numbers of objects, in order.
+        - seed (int): The seed of the population.
+        - using (str): The database alias.
+
+    Returns:
+        - str: A hex digest of the factories, their declarations, the sizes, the seed, the Faker version and the
+          migration state.
+    """
+    payload = json.dumps(
+        {
+            'populations': [
+                [get_factory_path(factory_class), get_factory_fingerprint(factory_class), size]
+                for factory_class, size in populations
+            ],
+            'seed': seed,
+            'faker': faker.VERSION,
+            'migrations': get_migration_state(using),
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class DatabaseSnapshotCache:
+    """
+    Caches whole populated SQLite databases as files, keyed by `get_database_key`.
+
+    Databases are saved and restored with SQLite's online backup API, which copies the database page by page from or
+    into the live connection, so in-memory test databases are supported as well as files. A database is saved to a
+    temporary file first, then moved into place, so concurrent sessions, e.g. pytest-xdist workers, never read a
+    partial file; when several of them miss the cache at once, each populates its own database and the last one wins.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            - directory (str | Path): The directory the databases are stored in.
+        """
+        self.directory = Path(directory)
+
+    def get_path(self, key: str) -> Path:
+        """
+        Returns the path of the cached database for the given key.
+
+        Args:
+            - key (str): The database key.
+
+        Returns:
+            - Path: The database file path.
+        """
+        return self.directory / f'{key}{DATABASE_SUFFIX}'
+
+    @staticmethod
+    def get_connection(using: str) -> sqlite3.Connection:
+        """
+        Returns the SQLite connection of a database alias, outside of any transaction.
+
+        Args:
+            - using (str): The database alias.
+
+        Returns:
+            - sqlite3.Connection: The underlying connection.
+
+        Raises:
+            - RuntimeError: If the connection is inside an atomic block, e.g. of a ``TestCase``.
+        """
+        connection = connections[using]
+        if connection.in_atomic_block:
+            raise RuntimeError(
+                f"The '{using}' database cannot be saved or restored inside a transaction: populate it from a fixture "
+                f"that runs before the test case's transaction."
+            )
+        connection.ensure_connection()
+        return connection.connection
+
+    def save(self, key: str, using: str = DEFAULT_DB_ALIAS) -> Path:
+        """
+        Saves a database under the given key.
+
+        Args:
+            - key (str): The database key.
+            - using (str): The database alias.
+
+        Returns:
+            - Path: The path of the cached database.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.get_path(key)
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(descriptor)
+        try:
+            with sqlite3.connect(temporary) as target:
+                self.get_connection(using).backup(target)
+            target.close()
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        return path
+
+    def restore(self, key: str, using: str = DEFAULT_DB_ALIAS) -> bool:
+        """
+        Replaces the content of a database with the cached database of the given key.
+
+        Args:
+            - key (str): The database key.
+            - using (str): The database alias.
+
+        Returns:
+            - bool: True if the database was restored, False if the key is not cached.
+        """
+        path = self.get_path(key)
+        if not path.exists():
+            return False
+        source = sqlite3.connect(path)
+        try:
+            source.backup(self.get_connection(using))
+        finally:
+            source.close()
+        # Content types may have other primary keys in the restored database
+        ContentType.objects.clear_cache()
+        # Mark the database as recently used
+        os.utime(path)
+        return True
+
+
+def populate_database(
+        populations: Iterable[Population],
+        seed: int = 0,
+        using: str = DEFAULT_DB_ALIAS,
+        cache: DatabaseSnapshotCache = None
+    ) -> bool:
+    """
+    Fills a database with the given populations, from the cache when possible.
+
+    On a cache miss, the database is migrated and flushed, then every population is generated with the bulk strategy,
+    the population at position ``i`` with the seed ``seed + i``, and the database is saved to the cache. On a hit, the
+    content of the database is replaced by the cached one. Either way, the database holds exactly the migrated schema,
+    the data created by migrations and ``post_migrate`` receivers, and the generated rows. Only SQLite databases are
+    cached; other databases are populated every time.
+
+    Args:
+        - populations (Iterable[Population]): The factory classes, models or model labels, with numbers of objects.
+        - seed (int): The seed of the population.
+        - using (str): The database alias.
+        - cache (DatabaseSnapshotCache): The cache. Defaults to no cache.
+
+    Returns:
+        - bool: True if the database was restored from the cache, False if it was populated.
+    """
+    populations = resolve_populations(populations)
+    if connections[using].vendor != 'sqlite':
+        cache = None
+    key = get_database_key(populations, seed, using) if cache is not None else None
+    if key is not None and cache.restore(key, using):
+        return True
+
+    call_command('migrate', database=using, interactive=False, verbosity=0)
+    call_command('flush', database=using, interactive=False, verbosity=0)
+    ContentType.objects.clear_cache()
+    for index, (factory_class, size) in enumerate(populations):
+        generate(factory_class, size, seed=seed + index, strategy=BULK_STRATEGY, using=using, use_snapshots=False)
+
+    if key is not None:
+        cache.save(key, using)
+    return False
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('django_faker_admin')
+    group.addoption(
+        '--faker-db-cache', default=None, metavar='DIR',
+        help="The directory of the cached populated databases. Defaults to the pytest cache directory."
+    )
+    group.addoption(
+        '--faker-db-no-cache', action='store_true', help="Populate the databases without reading or writing the cache."
+    )
+
+
+@pytest.fixture(scope='session')
+def faker_db_cache(pytestconfig) -> DatabaseSnapshotCache | None:
+    """
+    The cache of populated databases, shared by sessions and xdist workers, or None with ``--faker-db-no-cache``.
+    """
+    if pytestconfig.getoption('faker_db_no_cache'):
+        return None
+    directory = pytestconfig.getoption('faker_db_cache')
+    # The cache provider plugin may be disabled, with ``-p no:cacheprovider``
+    cache = getattr(pytestconfig, 'cache', None)
+    if directory is None and cache is not None:
+        directory = cache.mkdir('django_faker_admin')
+    return DatabaseSnapshotCache(directory or Path(tempfile.gettempdir()) / 'django_faker_admin_databases')
+
+
+@pytest.fixture(scope='session')
+def faker_populate(request, faker_db_cache) -> Callable[..., bool]:
+    """
+    Returns a function filling a database with populations, with the arguments of `populate_database` but the cache,
+    to be called from module or session fixtures, e.g.:
+
+    .. code-block:: python
+
+        @pytest.fixture(scope='module', autouse=True)
+        def customers(faker_populate):
+            faker_populate([(CustomerFactory, 10000), ('shop.Order', 50000)], seed=42)
+
+    With pytest-django, the test databases are set up first and the function is allowed to access them.
+    """
+    blocker = None
+    if request.config.pluginmanager.hasplugin('django'):
+        request.getfixturevalue('django_db_setup')
+        blocker = request.getfixturevalue('django_db_blocker')
+
+    def populate(populations: Iterable[Population], seed: int = 0, using: str = DEFAULT_DB_ALIAS) -> bool:
+        if blocker is None:
+            return populate_database(populations, seed=seed, using=using, cache=faker_db_cache)
+        with blocker.unblock():
+            return populate_database(populations, seed=seed, using=using, cache=faker_db_cache)
+
+    return populate
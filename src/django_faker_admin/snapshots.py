@@ -0,0 +1,336 @@
+import os
+import gzip
+import json
+import hashlib
+import inspect
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Type
+
+import faker
+from django.db import models, transaction
+from django.utils.encoding import is_protected_type
+from django.core.serializers.json import DjangoJSONEncoder
+from factory.declarations import PostGenerationDeclaration, SubFactory, Dict as DictFactory, List as ListFactory
+from factory.django import DjangoModelFactory
+
+from django_faker_admin.conf import settings
+
+
+#: File name suffix of the snapshot files.
+SNAPSHOT_SUFFIX = '.jsonl.gz'
+
+
+def get_snapshot_fields(model: Type[models.Model]) -> List[models.Field]:
+    """
+    Returns the fields stored in a snapshot: every concrete field except the primary key.
+
+    The primary key is left out so that a snapshot can be loaded into a table that already has rows.
+
+    Args:
+        - model (Type[Model]): The model class.
+
+    Returns:
+        - list: The fields to store.
+    """
+    return [field for field in model._meta.concrete_fields if not field.primary_key]
+
+
+def get_factory_fingerprint(factory_class: Type[DjangoModelFactory]) -> str:
+    """
+    Returns a string that changes whenever the declarations of the factory class change.
+
+    The source code of the factory class and its factory bases is used when available. Factories created at runtime
+    have no source code, so their declaration names and types are used instead.
+
+    Args:
+        - factory_class (Type[DjangoModelFactory]): The factory class.
+
+    Returns:
+        - str: The fingerprint of the factory class.
+    """
+    parts = []
+    for klass in factory_class.__mro__:
+        if klass is DjangoModelFactory:
+            break
+        try:
+            parts.append(inspect.getsource(klass))
+        except (OSError, TypeError):
+            parts.append(repr(sorted(
+                (name, type(declaration).__qualname__)
+                for name, declaration in klass._meta.declarations.items()
+            )))
+    return '\n'.join(parts)
+
+
+class SnapshotWriter:
+    """
+    Streams generated objects into a compressed snapshot file.
+
+    Objects are written to a temporary file that is moved into place only when the run completes, so an interrupted run
+    never leaves a partial snapshot behind. A run that stops early without an error, e.g. a cancelled one, calls
+    `discard` for the same reason. Used as a context manager, and `write_chunk` is registered as a chunk callback of a
+    `BulkGenerator`.
+    """
+
+    def __init__(self, cache: 'SnapshotCache', key: str, model: Type[models.Model]) -> None:
+        """
+        Initializes the writer for the given snapshot key.
+
+        Args:
+            - cache (SnapshotCache): The cache the snapshot belongs to.
+            - key (str): The snapshot key.
+            - model (Type[Model]): The model of the written objects.
+        """
+        self.cache = cache
+        self.key = key
+        self.model = model
+        self.fields = get_snapshot_fields(model)
+        self.file = None
+        self.temp_path = None
+        self.discarded = False
+        # Chunks may be written from several writer threads
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> 'SnapshotWriter':
+        self.cache.directory.mkdir(parents=True, exist_ok=True)
+        fd, self.temp_path = tempfile.mkstemp(dir=self.cache.directory, suffix='.tmp')
+        os.close(fd)
+        self.file = gzip.open(self.temp_path, 'wt', encoding='utf-8')
+        header = {
+            'model': self.model._meta.label,
+            'fields': [field.attname for field in self.fields],
+        }
+        self.file.write(json.dumps(header) + '\n')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.file.close()
+        if exc_type is None and not self.discarded:
+            os.replace(self.temp_path, self.cache.get_path(self.key))
+            self.cache.evict()
+        else:
+            os.remove(self.temp_path)
+
+    def discard(self) -> None:
+        """
+        Drops the written objects instead of saving them as the snapshot, once the block exits.
+        """
+        self.discarded = True
+
+    def write_chunk(self, objs: List[models.Model]) -> None:
+        """
+        Appends a chunk of objects to the snapshot, one JSON array of field values per line.
+
+        Args:
+            - objs (list): The inserted objects.
+        """
+        lines = []
+        for obj in objs:
+            row = []
+            for field in self.fields:
+                value = field.value_from_object(obj)
+                # Same conversion as Django's serializers: keep JSON-friendly types, stringify the others
+                if not is_protected_type(value):
+                    value = field.value_to_string(obj)
+                row.append(value)
+            lines.append(json.dumps(row, cls=DjangoJSONEncoder) + '\n')
+        with self.lock:
+            self.file.write(''.join(lines))
+
+
+class SnapshotCache:
+    """
+    An on-disk cache of generated datasets.
+
+    A snapshot is keyed by the model, the factory declarations, the seed, the size and the field overrides of a run.
+    The first run with a given key writes the generated rows to a gzip-compressed snapshot, and later runs with the
+    same key bulk-load the snapshot instead of generating the rows again. The least recently used snapshots are
+    removed once the cache grows beyond `max_size` bytes.
+    """
+
+    def __init__(self, directory: str | Path, max_size: int) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            - directory (str | Path): The directory the snapshots are stored in.
+            - max_size (int): The maximum total size of the snapshots, in bytes.
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    @staticmethod
+    def supports(factory_class: Type[DjangoModelFactory]) -> bool:
+        """
+        Checks whether the runs of the factory class can be cached.
+
+        A snapshot only holds the rows of the factory's own model, so factories that create other rows through
+        ``SubFactory`` or post-generation declarations cannot be replayed from one.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class.
+
+        Returns:
+            - bool: True if the runs of the factory class can be cached, False otherwise.
+        """
+        for declaration in factory_class._meta.declarations.values():
+            if isinstance(declaration, SubFactory) and not isinstance(declaration, (DictFactory, ListFactory)):
+                return False
+            if isinstance(declaration, PostGenerationDeclaration):
+                return False
+        return True
+
+    def get_key(
+            self,
+            factory_class: Type[DjangoModelFactory],
+            size: int,
+            seed: int,
+            overrides: Dict[str, Any] = None
+        ) -> str:
+        """
+        Computes the snapshot key of a run.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class of the run.
+            - size (int): The number of generated objects.
+            - seed (int): The seed of the run.
+            - overrides (dict): The field overrides of the run.
+
+        Returns:
+            - str: A hex digest identifying the run.
+        """
+        payload = json.dumps(
+            {
+                'model': factory_class._meta.model._meta.label,
+                'factory': get_factory_fingerprint(factory_class),
+                'faker': faker.VERSION,
+                'seed': seed,
+                'size': size,
+                'overrides': {name: str(getattr(value, 'pk', value)) for name, value in (overrides or {}).items()},
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        """
+        Returns the path of the snapshot file for the given key.
+
+        Args:
+            - key (str): The snapshot key.
+
+        Returns:
+            - Path: The snapshot file path.
+        """
+        return self.directory / f'{key}{SNAPSHOT_SUFFIX}'
+
+    def has(self, key: str) -> bool:
+        """
+        Checks whether a snapshot exists for the given key.
+
+        Args:
+            - key (str): The snapshot key.
+
+        Returns:
+            - bool: True if the snapshot exists, False otherwise.
+        """
+        return self.get_path(key).exists()
+
+    def writer(self, key: str, model: Type[models.Model]) -> SnapshotWriter:
+        """
+        Returns a writer that saves a snapshot under the given key.
+
+        Args:
+            - key (str): The snapshot key.
+            - model (Type[Model]): The model of the written objects.
+
+        Returns:
+            - SnapshotWriter: The snapshot writer, to be used as a context manager.
+        """
+        return SnapshotWriter(self, key, model)
+
+    def load(
+            self,
+            key: str,
+            model: Type[models.Model],
+            using: str,
+            chunk_size: int,
+            chunk_callbacks: List[Callable[[List[models.Model]], None]] = ()
+        ) -> int:
+        """
+        Bulk-loads the snapshot of the given key into the database.
+
+        Args:
+            - key (str): The snapshot key.
+            - model (Type[Model]): The model of the stored objects.
+            - using (str): The database alias to write to.
+            - chunk_size (int): The number of objects inserted per ``bulk_create`` call.
+            - chunk_callbacks (list): Callables called with the inserted objects after every ``bulk_create`` call.
+
+        Returns:
+            - int: The number of rows written.
+        """
+        path = self.get_path(key)
+        fields_by_attname = {field.attname: field for field in get_snapshot_fields(model)}
+        manager = model._default_manager.using(using)
+        written = 0
+
+        def insert(objs):
+            created = manager.bulk_create(objs)
+            for callback in chunk_callbacks:
+                callback(created)
+            return len(created)
+
+        with gzip.open(path, 'rt', encoding='utf-8') as file, transaction.atomic(using=using):
+            header = json.loads(file.readline())
+            fields = [fields_by_attname[attname] for attname in header['fields']]
+            chunk = []
+            for line in file:
+                values = json.loads(line)
+                chunk.append(model(**{
+                    field.attname: field.to_python(value) for field, value in zip(fields, values)
+                }))
+                if len(chunk) >= chunk_size:
+                    written += insert(chunk)
+                    chunk = []
+            if chunk:
+                written += insert(chunk)
+
+        # Mark the snapshot as recently used, so it is the last one to be evicted
+        os.utime(path)
+        return written
+
+    def evict(self) -> List[Path]:
+        """
+        Removes the least recently used snapshots until the cache fits in `max_size` bytes.
+
+        Returns:
+            - list: The paths of the removed snapshots.
+        """
+        snapshots = sorted(self.directory.glob(f'*{SNAPSHOT_SUFFIX}'), key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in snapshots)
+        removed = []
+        for path in snapshots:
+            if total <= self.max_size:
+                break
+            total -= path.stat().st_size
+            path.unlink()
+            removed.append(path)
+        return removed
+
+
+def get_snapshot_cache() -> SnapshotCache | None:
+    """
+    Returns the snapshot cache configured in the settings.
+
+    Returns:
+        - SnapshotCache | None: The cache stored in `FAKER_ADMIN_SNAPSHOT_DIR`, or None if the setting is not set.
+    """
+    if not settings.FAKER_ADMIN_SNAPSHOT_DIR:
+        return None
+    return SnapshotCache(
+        directory=settings.FAKER_ADMIN_SNAPSHOT_DIR,
+        max_size=settings.FAKER_ADMIN_SNAPSHOT_MAX_SIZE
+    )
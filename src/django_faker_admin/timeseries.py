@@ -0,0 +1,296 @@
+import math
+import random
+import threading
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Sequence, Type
+
+from django.conf import settings
+from django.db import models
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+#: Rows are spread evenly over the date range.
+CONSTANT = 'constant'
+#: The rate grows linearly over the date range, from 1 to ``growth``.
+LINEAR = 'linear'
+#: The rate grows exponentially over the date range, from 1 to ``growth``.
+EXPONENTIAL = 'exponential'
+#: The rate follows the time of day, peaking in the afternoon and dropping at night.
+DAILY = 'daily'
+
+CURVES = (CONSTANT, LINEAR, EXPONENTIAL, DAILY)
+
+#: The ratio of the rate at the end of the date range to the rate at its start, for the growing curves.
+DEFAULT_GROWTH = 10.0
+
+#: The duration of the steps the rate curve is integrated over, shortened so that there are at most `MAX_STEPS`.
+STEP_SECONDS = 15 * 60
+MAX_STEPS = 100000
+
+
+#: The ids of the timestamp fields whose ``auto_now`` and ``auto_now_add`` are turned off in the current thread, with
+#: the number of time series turning them off.
+_overrides = threading.local()
+_overrides_lock = threading.Lock()
+
+
+def override_pre_save(field: models.DateField) -> None:
+    """
+    Wraps the ``pre_save`` of a timestamp field, once, so that it keeps the value of the object while a time series of
+    the current thread turns off ``auto_now`` and ``auto_now_add``.
+
+    Args:
+        - field (DateField): The field.
+    """
+    with _overrides_lock:
+        if 'pre_save' in vars(field):
+            return
+        pre_save = field.pre_save
+
+        def keep_value(model_instance: models.Model, add: bool) -> Any:
+            if getattr(_overrides, 'fields', {}).get(id(field)):
+                return getattr(model_instance, field.attname)
+            return pre_save(model_instance, add)
+
+        field.pre_save = keep_value
+
+
+def to_datetime(value: str | date | datetime) -> datetime:
+    """
+    Returns a date, a datetime or their ISO 8601 text as a datetime, aware in the current time zone if time zone
+    support is enabled.
+
+    Args:
+        - value (str | date | datetime): The value. A date stands for its midnight.
+
+    Returns:
+        - datetime: The datetime.
+
+    Raises:
+        - ValueError: If the text is neither a date nor a datetime.
+    """
+    if isinstance(value, str):
+        parsed = parse_datetime(value) or parse_date(value)
+        if parsed is None:
+            raise ValueError(f"'{value}' is neither a date nor a datetime.")
+        value = parsed
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    if settings.USE_TZ and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def normalize_time_series(time_series: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a time series with its dates as ISO 8601 text and the default values of its parameters, so that it can be
+    stored as JSON.
+
+    Args:
+        - time_series (dict): The ``start`` and ``end`` of the date range, as dates, datetimes or ISO 8601 text, the
+          ``curve`` of the rate, the ``growth`` of the growing curves, and the names of the timestamp ``fields``.
+
+    Returns:
+        - dict: The normalized time series.
+
+    Raises:
+        - ValueError: If a date is missing or invalid, the range is empty, the curve is unknown, or the growth is not
+          positive.
+    """
+    if not time_series.get('start') or not time_series.get('end'):
+        raise ValueError("A time series needs the start and the end of its date range.")
+    start, end = to_datetime(time_series['start']), to_datetime(time_series['end'])
+    if start >= end:
+        raise ValueError("The start of a time series should be before its end.")
+    curve = time_series.get('curve') or CONSTANT
+    if curve not in CURVES:
+        raise ValueError(f"Unknown rate curve '{curve}', expected one of {', '.join(CURVES)}.")
+    growth = float(time_series.get('growth') or DEFAULT_GROWTH)
+    if growth <= 0:
+        raise ValueError("The growth of a time series should be positive.")
+    fields = time_series.get('fields')
+    return {
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'curve': curve,
+        'growth': growth,
+        'fields': list(fields) if fields else None,
+    }
+
+
+def get_rate(curve: str, position: float, moment: datetime, growth: float = DEFAULT_GROWTH) -> float:
+    """
+    Returns the relative rate of rows of a curve at a moment of the date range.
+
+    Args:
+        - curve (str): The rate curve.
+        - position (float): The relative position of the moment in the date range, from 0 to 1.
+        - moment (datetime): The moment, whose local time of day drives the daily curve.
+        - growth (float): The ratio of the final rate to the initial rate of the growing curves.
+
+    Returns:
+        - float: The rate, always positive.
+    """
+    if curve == LINEAR:
+        return 1.0 + (growth - 1.0) * position
+    if curve == EXPONENTIAL:
+        return growth ** position
+    if curve == DAILY:
+        if timezone.is_aware(moment):
+            moment = timezone.localtime(moment)
+        hour = moment.hour + moment.minute / 60
+        # A bell around 14:00, over a floor so that nights are quiet but not empty
+        return 0.1 + math.exp(-0.5 * ((hour - 14) / 3.5) ** 2)
+    return 1.0
+
+
+def get_timestamp_field(model: Type[models.Model], field_name: str) -> models.DateField:
+    """
+    Returns a field of a model that a time series can set.
+
+    Args:
+        - model (Type[Model]): The model.
+        - field_name (str): The name of the field.
+
+    Returns:
+        - DateField: The field, a date or a datetime field.
+
+    Raises:
+        - ValueError: If the field does not exist, or is neither a date nor a datetime field.
+    """
+    try:
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        field = None
+    if not isinstance(field, models.DateField) or not field.concrete:
+        raise ValueError(f"'{field_name}' is neither a date nor a datetime field of {model._meta.label}.")
+    return field
+
+
+def get_timestamp_fields(model: Type[models.Model], field_names: Sequence[str] = None) -> List[models.DateField]:
+    """
+    Returns the fields of a model a time series sets.
+
+    Args:
+        - model (Type[Model]): The model.
+        - field_names (Sequence[str]): The names of the fields. Defaults to the date and datetime fields with
+          ``auto_now`` or ``auto_now_add``.
+
+    Returns:
+        - list: The fields, in declaration order by default.
+
+    Raises:
+        - ValueError: If a field cannot be set by a time series.
+    """
+    if field_names:
+        return [get_timestamp_field(model, field_name) for field_name in field_names]
+    return [
+        field for field in model._meta.concrete_fields
+        if isinstance(field, models.DateField) and (field.auto_now or field.auto_now_add)
+    ]
+
+
+class TimeSeries:
+    """
+    Spreads the timestamps of generated objects over a date range, following a rate curve.
+
+    The rate curve is integrated once, over steps of at most `STEP_SECONDS`, into a cumulative array. The object at
+    position ``i`` out of ``size`` gets the moment the cumulative rate reaches a random point of its own slice,
+    ``(i + u) / size``, found by binary search: timestamps increase with the position of the objects, so objects
+    generated in order are inserted in time order.
+    """
+
+    def __init__(self, model: Type[models.Model], time_series: Dict[str, Any], size: int, position: int = 0) -> None:
+        """
+        Initializes the time series.
+
+        Args:
+            - model (Type[Model]): The model of the generated objects.
+            - time_series (dict): The time series, as accepted by `normalize_time_series`.
+            - size (int): The total number of objects of the run.
+            - position (int): The position of the next object, e.g. the number of rows a resumed run already wrote.
+
+        Raises:
+            - ValueError: If the time series is invalid, or the model has no field it can set.
+        """
+        self.time_series = normalize_time_series(time_series)
+        self.fields = get_timestamp_fields(model, self.time_series['fields'])
+        if not self.fields:
+            raise ValueError(
+                f"{model._meta.label} has no 'auto_now' nor 'auto_now_add' field, name the fields of the time series."
+            )
+        self.size = size
+        self.position = position
+        self.start = to_datetime(self.time_series['start'])
+        self.end = to_datetime(self.time_series['end'])
+
+        duration = (self.end - self.start).total_seconds()
+        steps = max(1, min(MAX_STEPS, math.ceil(duration / STEP_SECONDS)))
+        self.step = duration / steps
+        curve, growth = self.time_series['curve'], self.time_series['growth']
+        self.rates = [
+            get_rate(curve, (index + 0.5) / steps, self.start + timedelta(seconds=(index + 0.5) * self.step), growth)
+            for index in range(steps)
+        ]
+        self.cumulative = [0.0, *accumulate(self.rates)]
+
+    def get_timestamp(self, position: int, randgen: random.Random) -> datetime:
+        """
+        Returns the timestamp of the object at a position of the run.
+
+        Args:
+            - position (int): The position of the object, from 0 to `size` excluded.
+            - randgen (random.Random): The random generator drawing the point of the object's slice.
+
+        Returns:
+            - datetime: The timestamp, in the date range.
+        """
+        target = (position + randgen.random()) / self.size * self.cumulative[-1]
+        index = min(bisect_right(self.cumulative, target) - 1, len(self.rates) - 1)
+        fraction = min((target - self.cumulative[index]) / self.rates[index], 1.0)
+        return min(self.start + timedelta(seconds=(index + fraction) * self.step), self.end)
+
+    def stamp(self, objs: List[models.Model], randgen: random.Random) -> None:
+        """
+        Sets the timestamp fields of the next objects of the run.
+
+        Args:
+            - objs (list): The objects, in generation order.
+            - randgen (random.Random): The random generator.
+        """
+        for obj in objs:
+            moment = self.get_timestamp(self.position, randgen)
+            day = (timezone.localtime(moment) if timezone.is_aware(moment) else moment).date()
+            for field in self.fields:
+                setattr(obj, field.attname, moment if isinstance(field, models.DateTimeField) else day)
+            self.position += 1
+
+    @contextmanager
+    def disable_auto_now(self) -> Iterator[None]:
+        """
+        Turns off ``auto_now`` and ``auto_now_add`` on the timestamp fields, so that inserts keep their values.
+
+        Only the saves of the current thread are affected: the fields are shared by the whole process, so their flags
+        are left untouched, and their values are kept by a wrapper of their ``pre_save``. Contexts may be nested, the
+        fields are only turned back on when the last one exits.
+
+        Yields:
+            - None
+        """
+        if not hasattr(_overrides, 'fields'):
+            _overrides.fields = {}
+        for field in self.fields:
+            override_pre_save(field)
+            _overrides.fields[id(field)] = _overrides.fields.get(id(field), 0) + 1
+        try:
+            yield
+        finally:
+            for field in self.fields:
+                _overrides.fields[id(field)] -= 1
+                if not _overrides.fields[id(field)]:
+                    del _overrides.fields[id(field)]
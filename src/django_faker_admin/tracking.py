@@ -0,0 +1,401 @@
+import threading
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.db.models import Exists, F, OuterRef, Q, Sum
+from django.utils import timezone
+from django.contrib.contenttypes.models import ContentType
+
+from django_faker_admin.metrics import ROWS_GENERATED, get_run_model_label
+from django_faker_admin.models import PopulationRun, GeneratedRange
+
+
+type PkRange = Tuple[int, int]
+
+
+def supports_tracking(model: Type[models.Model]) -> bool:
+    """
+    Checks whether the rows of the given model can be tracked by primary key ranges.
+
+    Args:
+        - model (Type[Model]): The model class.
+
+    Returns:
+        - bool: True if the model has an integer primary key, False otherwise.
+    """
+    return model._meta.pk.get_internal_type() in ('AutoField', 'BigAutoField', 'SmallAutoField')
+
+
+def to_ranges(pks: Iterable[int]) -> List[PkRange]:
+    """
+    Compresses primary keys into a sorted list of contiguous, inclusive ranges.
+
+    Args:
+        - pks (Iterable[int]): The primary keys, in any order.
+
+    Returns:
+        - list: The ``(start, end)`` ranges covering exactly the given primary keys.
+    """
+    ranges = []
+    for pk in sorted(set(pks)):
+        if ranges and ranges[-1][1] + 1 == pk:
+            ranges[-1] = (ranges[-1][0], pk)
+        else:
+            ranges.append((pk, pk))
+    return ranges
+
+
+class RunTracker:
+    """
+    Records the primary keys of the rows created by a population run as ranges.
+
+    `track` is registered as a chunk callback of a `BulkGenerator`, so the ranges are written in the same transaction
+    as the chunk they describe. Runs and ranges are stored in the database the rows were written to. A chunk whose keys
+    continue the last recorded range extends that range instead of adding a new one, so a bulk run with contiguous keys
+    is stored as a single row, whatever its size.
+
+    The last recorded range is kept per thread: when chunks are inserted by concurrent writers, a chunk only extends a
+    range recorded by an earlier, committed transaction of the same writer. The ranges of adjacent chunks committed by
+    different writers are merged by `compact_ranges` once the run is over.
+
+    Tracked rows are counted by the ``faker_admin_rows_generated_total`` metric as they are recorded.
+
+    `is_cancel_requested` is the cancel check of the generator, completed by the tracker's own `cancel_check` if it is
+    set.
+
+    `checkpoint`, registered as the last chunk callback, saves the progress of the run in the chunk's transaction. The
+    state of the random generators is only saved when the tracker is `resumable`, that is when chunks are generated and
+    committed one after the other. It is the state of `random_stream` when the run draws from its own stream.
+    """
+
+    def __init__(self, run: PopulationRun, resumable: bool = True) -> None:
+        """
+        Initializes the tracker for the given run.
+
+        Args:
+            - run (PopulationRun): The run the tracked rows belong to.
+            - resumable (bool): Whether checkpoints save the state of the random generators.
+        """
+        self.run = run
+        self.enabled = supports_tracking(run.content_type.model_class())
+        self.resumable = resumable
+        self.local = threading.local()
+        self.cancel_check = None
+        self.random_stream = None
+
+    @property
+    def last_range(self) -> GeneratedRange:
+        """
+        The range recorded by the last chunk of the current thread, if it can be extended.
+        """
+        return getattr(self.local, 'last_range', None)
+
+    @last_range.setter
+    def last_range(self, value: GeneratedRange) -> None:
+        self.local.last_range = value
+
+    def track(self, objs: List[models.Model]) -> List[GeneratedRange]:
+        """
+        Records the primary keys of the given objects.
+
+        Objects without a primary key are skipped: some database backends do not return the primary keys of the rows
+        inserted by ``bulk_create``.
+
+        Args:
+            - objs (list): The created objects.
+
+        Returns:
+            - list: The created or extended ranges.
+        """
+        ROWS_GENERATED.inc(len(objs), model=get_run_model_label(self.run))
+        if not self.enabled:
+            return []
+
+        ranges = to_ranges(obj.pk for obj in objs if obj.pk is not None)
+        if not ranges:
+            return []
+
+        tracked = []
+        if self.last_range is not None and self.last_range.end_pk + 1 == ranges[0][0]:
+            # Merge with the adjacent range recorded by the previous chunk
+            self.last_range.end_pk = ranges.pop(0)[1]
+            self.last_range.save(update_fields=['end_pk'])
+            tracked.append(self.last_range)
+
+        created = GeneratedRange.objects.using(self.run._state.db).bulk_create(
+            GeneratedRange(run=self.run, content_type_id=self.run.content_type_id, start_pk=start, end_pk=end)
+            for start, end in ranges
+        )
+        if created:
+            # Backends that do not return primary keys from bulk inserts cannot extend the range later on
+            self.last_range = created[-1] if created[-1].pk is not None else None
+        return tracked + created
+
+    def checkpoint(self, objs: List[models.Model]) -> None:
+        """
+        Saves the progress of the run after a chunk.
+
+        The counters are incremented in SQL, so concurrent writers never lose an update.
+
+        Args:
+            - objs (list): The created objects.
+        """
+        from django_faker_admin.bulk import get_random_state
+
+        values = {
+            'rows_written': F('rows_written') + len(objs),
+            'chunks_written': F('chunks_written') + 1,
+            'updated_at': timezone.now(),
+        }
+        if self.resumable:
+            values['random_state'] = self.random_stream.state if self.random_stream is not None else get_random_state()
+        PopulationRun.objects.using(self.run._state.db).filter(pk=self.run.pk).update(**values)
+
+    def is_cancel_requested(self) -> bool:
+        """
+        Checks whether the cancellation of the run was requested, e.g. from its admin page, or by `cancel_check`.
+
+        A cancellation requested by `cancel_check`, e.g. by a worker that lost its job, is recorded on the run, so that
+        the run is recorded as cancelled.
+
+        Returns:
+            - bool: True if the run should stop after the current chunk, False otherwise.
+        """
+        if self.cancel_check is not None and self.cancel_check():
+            request_cancel(self.run)
+            return True
+        return PopulationRun.objects.using(self.run._state.db).filter(pk=self.run.pk, cancel_requested=True).exists()
+
+
+def encode_overrides(overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts factory overrides into JSON-friendly values, so that they can be stored with a run.
+
+    Model instances are replaced by a reference to their model and primary key.
+
+    Args:
+        - overrides (dict): Field values passed to the factory for every object.
+
+    Returns:
+        - dict: The encoded overrides.
+    """
+    return {
+        name: {'model': value._meta.label, 'pk': value.pk} if isinstance(value, models.Model) else value
+        for name, value in overrides.items()
+    }
+
+
+def decode_overrides(data: Dict[str, Any], using: str = DEFAULT_DB_ALIAS) -> Dict[str, Any]:
+    """
+    Converts overrides encoded by `encode_overrides` back into factory overrides.
+
+    Args:
+        - data (dict): The encoded overrides.
+        - using (str): The database alias the referenced objects are fetched from.
+
+    Returns:
+        - dict: The overrides.
+    """
+    overrides = {}
+    for name, value in (data or {}).items():
+        if isinstance(value, dict) and value.keys() == {'model', 'pk'}:
+            value = apps.get_model(value['model'])._base_manager.using(using).get(pk=value['pk'])
+        overrides[name] = value
+    return overrides
+
+
+def start_run(
+        model: Type[models.Model],
+        size: int,
+        strategy: str,
+        seed: int = None,
+        using: str = DEFAULT_DB_ALIAS,
+        factory_path: str = '',
+        options: Dict[str, Any] = None,
+        resumable: bool = True
+    ) -> Tuple[PopulationRun, RunTracker]:
+    """
+    Records the start of a population run.
+
+    Args:
+        - model (Type[Model]): The populated model.
+        - size (int): The number of requested objects.
+        - strategy (str): The generation strategy.
+        - seed (int): The seed of the run.
+        - using (str): The database alias the rows are written to, where the run is recorded as well.
+        - factory_path (str): The dotted path to the factory class, used to resume the run.
+        - options (dict): The generation options, used to resume the run.
+        - resumable (bool): Whether checkpoints save the state of the random generators.
+
+    Returns:
+        - tuple: The created run and a tracker recording the rows created by it.
+    """
+    run = PopulationRun.objects.using(using).create(
+        content_type=ContentType.objects.db_manager(using).get_for_model(model),
+        size=size,
+        strategy=strategy,
+        seed=seed,
+        factory_path=factory_path,
+        options=options or {}
+    )
+    return run, RunTracker(run, resumable=resumable)
+
+
+def compact_ranges(run: PopulationRun) -> int:
+    """
+    Merges the adjacent ranges of a population run, e.g. the ranges of chunks committed by different writer threads,
+    or before and after the run was resumed.
+
+    Args:
+        - run (PopulationRun): The run, once no chunk of it is being written.
+
+    Returns:
+        - int: The number of ranges merged into others.
+    """
+    using = run._state.db
+    merged, extended, absorbed = [], set(), []
+    for generated_range in GeneratedRange.objects.using(using).filter(run=run).order_by('start_pk'):
+        if merged and merged[-1].end_pk + 1 == generated_range.start_pk:
+            merged[-1].end_pk = generated_range.end_pk
+            extended.add(merged[-1])
+            absorbed.append(generated_range.pk)
+        else:
+            merged.append(generated_range)
+    if absorbed:
+        with transaction.atomic(using=using):
+            GeneratedRange.objects.using(using).filter(pk__in=absorbed).delete()
+            GeneratedRange.objects.using(using).bulk_update(extended, ['end_pk'])
+    return len(absorbed)
+
+
+def finish_run(run: PopulationRun, rows_written: int) -> int:
+    """
+    Records the end of a population run.
+
+    Args:
+        - run (PopulationRun): The finished run.
+        - rows_written (int): The number of rows written by the run.
+
+    Returns:
+        - int: The number of rows written, for convenience.
+    """
+    run.rows_written = rows_written
+    run.status = PopulationRun.Status.FINISHED
+    run.finished_at = timezone.now()
+    run.save(update_fields=['rows_written', 'status', 'finished_at', 'updated_at'])
+    return rows_written
+
+
+def cancel_run(run: PopulationRun, rows_written: int) -> int:
+    """
+    Records that a population run stopped on request, before writing all of its rows.
+
+    Args:
+        - run (PopulationRun): The cancelled run.
+        - rows_written (int): The number of rows committed by the run.
+
+    Returns:
+        - int: The number of rows written, for convenience.
+    """
+    run.rows_written = rows_written
+    run.status = PopulationRun.Status.CANCELLED
+    run.finished_at = timezone.now()
+    run.save(update_fields=['rows_written', 'status', 'finished_at', 'updated_at'])
+    return rows_written
+
+
+def request_cancel(run: PopulationRun) -> bool:
+    """
+    Asks a running population run to stop after its current chunk.
+
+    Args:
+        - run (PopulationRun): The run.
+
+    Returns:
+        - bool: True if the run was running, False otherwise.
+    """
+    updated = PopulationRun.objects.using(run._state.db).filter(
+        pk=run.pk, status=PopulationRun.Status.RUNNING
+    ).update(cancel_requested=True, updated_at=timezone.now())
+    return bool(updated)
+
+
+def is_stale(run: PopulationRun, timeout: float) -> bool:
+    """
+    Checks whether a population run saved no checkpoint for a while, e.g. because its process died.
+
+    Args:
+        - run (PopulationRun): The run.
+        - timeout (float): The number of seconds without checkpoint after which the run is stale.
+
+    Returns:
+        - bool: True if the run was last updated `timeout` seconds ago or more, False otherwise.
+    """
+    return run.updated_at <= timezone.now() - timedelta(seconds=timeout)
+
+
+def fail_run(run: PopulationRun) -> None:
+    """
+    Records that a population run stopped on an error.
+
+    The progress saved by the last checkpoint is kept, so the run can be resumed.
+
+    Args:
+        - run (PopulationRun): The failed run.
+    """
+    run.status = PopulationRun.Status.FAILED
+    run.save(update_fields=['status', 'updated_at'])
+
+
+def get_generated_ranges(model: Type[models.Model], using: str = DEFAULT_DB_ALIAS) -> models.QuerySet:
+    """
+    Returns the tracked primary key ranges of the given model.
+
+    Args:
+        - model (Type[Model]): The model class.
+        - using (str): The database alias holding the rows.
+
+    Returns:
+        - QuerySet: The model's ranges, ordered by primary key.
+    """
+    return GeneratedRange.objects.using(using).filter(
+        content_type=ContentType.objects.db_manager(using).get_for_model(model)
+    ).order_by('start_pk')
+
+
+def count_generated(model: Type[models.Model], using: str = DEFAULT_DB_ALIAS) -> int:
+    """
+    Returns the number of tracked rows of the given model.
+
+    Rows deleted outside of a purge are still counted, so the result is an upper bound.
+
+    Args:
+        - model (Type[Model]): The model class.
+        - using (str): The database alias holding the rows.
+
+    Returns:
+        - int: The total length of the model's ranges.
+    """
+    total = get_generated_ranges(model, using).aggregate(total=Sum(F('end_pk') - F('start_pk') + 1))['total']
+    return total or 0
+
+
+def generated_condition(model: Type[models.Model], using: str = DEFAULT_DB_ALIAS) -> Q:
+    """
+    Returns a condition matching the rows of the given model that fall in a tracked range.
+
+    The condition is a correlated ``EXISTS`` subquery on the indexed ranges, so its cost does not depend on the number
+    of ranges.
+
+    Args:
+        - model (Type[Model]): The model class.
+        - using (str): The database alias the filtered queryset reads from.
+
+    Returns:
+        - Q: The condition, to be used in ``filter()`` or, negated, in ``exclude()``.
+    """
+    return Q(Exists(
+        get_generated_ranges(model, using).filter(start_pk__lte=OuterRef('pk'), end_pk__gte=OuterRef('pk'))
+    ))
@@ -0,0 +1,68 @@
+from typing import Type
+
+from django.apps import apps
+from django.db import models
+from django.contrib import admin
+from django.utils.module_loading import import_string
+from factory.django import DjangoModelFactory
+
+
+def get_model(label: str) -> Type[models.Model]:
+    """
+    Returns the model class for the given label.
+
+    Args:
+        - label (str): The model label, in the 'app_label.ModelName' form.
+
+    Returns:
+        - Type[Model]: The model class.
+
+    Raises:
+        - LookupError: If no installed model matches the label.
+    """
+    return apps.get_model(label)
+
+
+def get_faker_model_admin(model: Type[models.Model], site: admin.AdminSite = None):
+    """
+    Returns the faker-enabled ModelAdmin registered for the given model.
+
+    Args:
+        - model (Type[Model]): The model class.
+        - site (AdminSite): The admin site to look the model up in. Defaults to the default admin site.
+
+    Returns:
+        - FakerModelAdminMixin | None: The registered ModelAdmin if it uses `FakerModelAdminMixin`, None otherwise.
+    """
+    from django_faker_admin.mixins import FakerModelAdminMixin
+
+    model_admin = (site or admin.site)._registry.get(model)
+    if isinstance(model_admin, FakerModelAdminMixin):
+        return model_admin
+    return None
+
+
+def get_factory_class(model: Type[models.Model], factory_path: str = None) -> Type[DjangoModelFactory]:
+    """
+    Returns the factory class used to generate objects of the given model.
+
+    Args:
+        - model (Type[Model]): The model class.
+        - factory_path (str): A dotted path to a factory class, overriding the one configured on the ModelAdmin.
+
+    Returns:
+        - Type[DjangoModelFactory]: The factory class.
+
+    Raises:
+        - LookupError: If no factory class is configured for the model.
+    """
+    if factory_path:
+        return import_string(factory_path)
+
+    model_admin = get_faker_model_admin(model)
+    if model_admin is None or model_admin.factory_class is None:
+        raise LookupError(
+            f"No factory class is configured for '{model._meta.label}'. "
+            f"Register it with a FakerModelAdminMixin admin or pass a factory path."
+        )
+    return model_admin.factory_class
@@ -1,15 +1,90 @@
-from typing import Type, Tuple
+from typing import Any, Dict, Type, Tuple
 
 from django import forms
+from django.db import connections, models, router
 from django.urls import reverse
 from django.views.generic import FormView
-from django.contrib.admin import ModelAdmin
+from django.contrib.admin import ModelAdmin, widgets
 from django.contrib.admin.helpers import AdminForm
 from django.core.exceptions import PermissionDenied
 from django.utils.translation import gettext_lazy, ngettext
 from factory.django import DjangoModelFactory
 
 from django_faker_admin.conf import settings
+from django_faker_admin.bulk import BULK_STRATEGY, FanOut, generate, generate_sharded, resolve_database
+from django_faker_admin.distributions import (
+    DISTRIBUTIONS, Distribution, format_parameters, get_distribution_fields, get_distribution_samplers,
+    normalize_distribution, parse_distribution
+)
+from django_faker_admin.timeseries import CURVES, get_timestamp_fields, normalize_time_series
+
+
+#: The prefix of the names of the distribution fields of the populate form.
+DISTRIBUTION_PREFIX = 'distribution_'
+
+
+def is_blank(value: Any) -> bool:
+    """
+    Checks if the value of a populate form field was left blank: empty text, or no selected choice.
+
+    Args:
+        - value (Any): The cleaned value of the field.
+
+    Returns:
+        - bool: True if the field is left to the factory, False otherwise. False and 0 are values.
+    """
+    if isinstance(value, (list, tuple, models.QuerySet)):
+        return not value
+    return value is None or value == ''
+
+
+class DistributionWidget(forms.MultiWidget):
+    """
+    A select of the kind of distribution, followed by a text input of its parameters.
+    """
+
+    def __init__(self, attrs=None) -> None:
+        super().__init__(
+            [
+                forms.Select(choices=DistributionField.KIND_CHOICES),
+                forms.TextInput(attrs={'placeholder': gettext_lazy("Parameters")}),
+            ],
+            attrs
+        )
+
+    def decompress(self, value):
+        if not value:
+            return ['', '']
+        distribution = normalize_distribution(value)
+        return [distribution['kind'], format_parameters(distribution)]
+
+
+class DistributionField(forms.MultiValueField):
+    """
+    A form field for the distribution of the values of a field, cleaned to a distribution dict, or None when the values
+    are left to the factory.
+    """
+    KIND_CHOICES = [('', gettext_lazy("Factory")), *((kind, kind.capitalize()) for kind in DISTRIBUTIONS)]
+    widget = DistributionWidget
+
+    def __init__(self, **kwargs) -> None:
+        kwargs.setdefault('help_text', gettext_lazy(
+            "Zipf: exponent, e.g. 1.2. Normal: relative mean and standard deviation, e.g. 0.5, 0.1. "
+            "Weights: value=weight pairs, e.g. paid=8, refunded=1."
+        ))
+        super().__init__(
+            fields=[forms.ChoiceField(choices=self.KIND_CHOICES, required=False), forms.CharField(required=False)],
+            require_all_fields=False,
+            **kwargs
+        )
+
+    def compress(self, data_list) -> Distribution | None:
+        if not data_list or not data_list[0]:
+            return None
+        try:
+            return parse_distribution(data_list[0], data_list[1])
+        except ValueError as e:
+            raise forms.ValidationError(str(e))
 
 
 class FakerAdminView(FormView):
@@ -26,6 +101,21 @@ class FakerAdminView(FormView):
     model_admin: ModelAdmin = None
     #: URL to redirect to after form submission
     exclude: Tuple[str] = None
+    #: Generation strategy, either 'per_row' or 'bulk', defaults to `FAKER_ADMIN_STRATEGY`
+    strategy: str = None
+    #: Number of related objects per generated object, by many-to-many field name, for the bulk strategy
+    m2m_fan_out: Dict[str, FanOut] = None
+    #: Database alias to write to, defaults to the factory's database, then to the alias picked by the routers
+    database: str = None
+    #: Number of threads inserting chunks concurrently, for the bulk strategy, defaults to `FAKER_ADMIN_WRITERS`
+    writers: int = None
+    #: Whether to queue the population for a worker process instead of running it, defaults to `FAKER_ADMIN_USE_QUEUE`
+    use_queue: bool = None
+    #: Distributions the values of fields with choices and foreign keys are drawn from, by field name, for the bulk
+    #: strategy
+    distributions: Dict[str, Distribution] = None
+    #: Date range, rate curve and timestamp fields of time-series populations, for the bulk strategy
+    time_series: Dict[str, Any] = None
     #: Template name for the view
     template_name = settings.FAKER_ADMIN_TEMPLATE_NAME
 
@@ -34,6 +124,13 @@ class FakerAdminView(FormView):
             model_admin: ModelAdmin,
             factory_class: Type[DjangoModelFactory],
             exclude: Tuple[str] = None,
+            strategy: str = None,
+            m2m_fan_out: Dict[str, FanOut] = None,
+            database: str = None,
+            writers: int = None,
+            use_queue: bool = None,
+            distributions: Dict[str, Distribution] = None,
+            time_series: Dict[str, Any] = None,
             **kwargs
         ) -> None:
         """
@@ -43,6 +140,16 @@ class FakerAdminView(FormView):
             - model_admin (ModelAdmin): The admin class for the model to be populated.
             - factory_class (Type[DjangoModelFactory]): The factory class used to create dummy data.
             - exclude (Tuple[str]): A tuple of field names to be excluded from the form.
+            - strategy (str): The generation strategy, either 'per_row' or 'bulk'.
+            - m2m_fan_out (Dict[str, FanOut]): The number of related objects per generated object, by many-to-many
+              field name.
+            - database (str): The database alias to write to.
+            - writers (int): The number of threads inserting chunks concurrently, for the bulk strategy.
+            - use_queue (bool): Whether to queue the population for a worker process instead of running it.
+            - distributions (Dict[str, Distribution]): The distributions the values of fields are drawn from, by field
+              name, for the bulk strategy. The populate form starts from them.
+            - time_series (Dict[str, Any]): The date range, rate curve and timestamp fields of time-series
+              populations, for the bulk strategy. The populate form starts from them.
             - **kwargs: Additional keyword arguments.
         """
         super().__init__(**kwargs)
@@ -50,6 +157,13 @@ class FakerAdminView(FormView):
         self.model = self.model_admin.model
         self.factory_class = factory_class
         self.exclude = exclude
+        self.strategy = strategy or settings.FAKER_ADMIN_STRATEGY
+        self.m2m_fan_out = m2m_fan_out
+        self.database = database
+        self.writers = writers
+        self.use_queue = settings.FAKER_ADMIN_USE_QUEUE if use_queue is None else use_queue
+        self.distributions = distributions or {}
+        self.time_series = time_series or {}
 
     def has_add_permission(self, request):
         """
@@ -103,6 +217,94 @@ class FakerAdminView(FormView):
         # Combine the explicitly excluded fields with the unique fields.
         return self.exclude or () + unique_fields
 
+    def get_database(self):
+        """
+        Returns the database alias the populate form targets.
+
+        Returns:
+            - str: The first database selected on the submitted form, otherwise the view's `database`, otherwise the
+              alias the factory writes to.
+        """
+        request = getattr(self, 'request', None)
+        if request is not None and request.method == 'POST':
+            selected = [alias for alias in request.POST.getlist('databases') if alias in connections.settings]
+            if selected:
+                return selected[0]
+        return resolve_database(self.factory_class, self.database)
+
+    def is_large_relation(self, db_field):
+        """
+        Checks whether the related table of a relation field is too large to be rendered as a plain select.
+
+        Only the first `FAKER_ADMIN_RELATION_WIDGET_THRESHOLD` + 1 rows are counted, so the check costs the same
+        whatever the size of the related table. The related table is counted on the database the run targets.
+
+        Args:
+            - db_field: The ForeignKey or ManyToManyField.
+
+        Returns:
+            - bool: True if the related table has more rows than the threshold, False otherwise.
+        """
+        threshold = settings.FAKER_ADMIN_RELATION_WIDGET_THRESHOLD
+        if threshold is None:
+            return False
+        related_model = db_field.remote_field.model
+        return related_model._default_manager.using(self.get_database())[:threshold + 1].count() > threshold
+
+    def get_relation_widget(self, db_field):
+        """
+        Returns a widget for a relation field that renders in constant time.
+
+        An autocomplete widget is used when the related model is registered in the admin site with search fields, and a
+        raw id widget otherwise.
+
+        Args:
+            - db_field: The ForeignKey or ManyToManyField.
+
+        Returns:
+            - Widget: The autocomplete or raw id widget.
+        """
+        admin_site = self.model_admin.admin_site
+        related_admin = admin_site._registry.get(db_field.remote_field.model)
+        many = isinstance(db_field, models.ManyToManyField)
+
+        if related_admin is not None and related_admin.get_search_fields(getattr(self, 'request', None)):
+            widget_class = widgets.AutocompleteSelectMultiple if many else widgets.AutocompleteSelect
+            return widget_class(db_field, admin_site)
+
+        widget_class = widgets.ManyToManyRawIdWidget if many else widgets.ForeignKeyRawIdWidget
+        return widget_class(db_field.remote_field, admin_site)
+
+    def formfield_for_dbfield(self, db_field, **kwargs):
+        """
+        Returns the form field for a model field of the populate form.
+
+        Fields are built by the ModelAdmin, so that its `raw_id_fields`, `autocomplete_fields` and
+        `formfield_overrides` apply to the populate form as well. Other relation fields pointing at a large table get
+        an autocomplete or raw id widget instead of a select listing every related row.
+
+        Args:
+            - db_field: The model field.
+            - **kwargs: Additional keyword arguments passed to the form field.
+
+        Returns:
+            - Field: The form field, or None if the model field should not be on the form.
+        """
+        request = getattr(self, 'request', None)
+
+        if (
+            isinstance(db_field, (models.ForeignKey, models.ManyToManyField))
+            and 'widget' not in kwargs
+            and db_field.name not in self.model_admin.raw_id_fields
+            and db_field.name not in self.model_admin.get_autocomplete_fields(request)
+            and self.is_large_relation(db_field)
+        ):
+            kwargs['widget'] = self.get_relation_widget(db_field)
+
+        if request is None:
+            return db_field.formfield(**kwargs)
+        return self.model_admin.formfield_for_dbfield(db_field, request, **kwargs)
+
     def get_form_kwargs(self):
         """
         Returns the keyword arguments for instantiating the form.
@@ -133,7 +335,13 @@ class FakerAdminView(FormView):
 
         This method overrides the default form to include a 'size' field, which specifies the number of dummy instances
         to be created. It also sets all fields inherited from the base form class as not required, except for the
-        'size' field which is mandatory and constrained to a range between 1 and 20.
+        'size' field which is mandatory and constrained to a range between 1 and 20. An optional 'seed' field makes the
+        run reproducible, and lets bulk runs be served from the snapshot cache. When more than one database is
+        configured, a 'databases' field selects the databases to populate; the size is split across them. Superusers
+        get a 'profile' field, running the population under cProfile. With the bulk strategy, every field with choices
+        and every foreign key gets a 'distribution_<name>' field, which the values of the field are drawn from, and
+        models with timestamp fields get 'time_series_curve', 'time_series_start' and 'time_series_end' fields, which
+        spread the timestamps of the objects over a date range.
 
         Returns:
             - MainForm (forms.ModelForm): A dynamically created form class that inherits from the base form class
@@ -142,17 +350,21 @@ class FakerAdminView(FormView):
         # Dynamically generate a base form class using the model, excluding specified fields
         FromBase = forms.modelform_factory(
             self.model,
-            exclude=self.get_exclude()
+            exclude=self.get_exclude(),
+            formfield_callback=self.formfield_for_dbfield
         )
         # Get the base fields from the generated form class
         form_fields = FromBase.base_fields
+        view = self
 
         # Define a new form class that includes a 'size' field and sets all other fields as not required
         class MainForm(FromBase):
             # Define a 'size' field that is required, with a minimum value.
             size = forms.IntegerField(required=True, min_value=1, max_value=settings.FAKER_ADMIN_MAX_LIMIT)
-            # Specify the order of fields, placing 'size' at the beginning
-            field_order = ('size', *form_fields)
+            # Define an optional 'seed' field for reproducible runs
+            seed = forms.IntegerField(required=False, min_value=0)
+            # Specify the order of fields, placing 'size' and 'seed' at the beginning
+            field_order = ('size', 'seed', *form_fields)
 
             def __init__(self, *args, **kwargs):
                 # Call the superclass initializer
@@ -161,9 +373,141 @@ class FakerAdminView(FormView):
                 for field in form_fields:
                     self.fields[field].required = False
 
+            def clean(self):
+                cleaned_data = super(MainForm, self).clean()
+                # cProfile only sees the calling thread, not the threads populating several databases
+                if cleaned_data.get('profile') and len(cleaned_data.get('databases') or ()) > 1:
+                    raise forms.ValidationError(
+                        gettext_lazy("A profiled population must target a single database.")
+                    )
+                # The form offers no profiling when the population is queued, but the request may still ask for it
+                if view.use_queue and (cleaned_data.get('profile') or self.data.get('profile')):
+                    raise forms.ValidationError(gettext_lazy("A queued population cannot be profiled."))
+                # Gather the distributions of the fields shown on the form, drawn or left to the factory
+                distributions = {}
+                for name in list(cleaned_data):
+                    if not name.startswith(DISTRIBUTION_PREFIX):
+                        continue
+                    field_name = name[len(DISTRIBUTION_PREFIX):]
+                    distributions[field_name] = cleaned_data.pop(name)
+                    if distributions[field_name] is None:
+                        continue
+                    if cleaned_data.get(field_name) not in (None, ''):
+                        self.add_error(name, gettext_lazy("Set either a value or a distribution, not both."))
+                        continue
+                    # Catch weights of unknown values, and foreign keys pointing at too many rows, before the run
+                    try:
+                        get_distribution_samplers(
+                            view.model, {field_name: distributions[field_name]}, view.get_database()
+                        )
+                    except ValueError as e:
+                        self.add_error(name, str(e))
+                if distributions:
+                    cleaned_data['distributions'] = distributions
+                # Gather the time series, off unless a curve is picked
+                curve = cleaned_data.pop('time_series_curve', None)
+                start, end = cleaned_data.pop('time_series_start', None), cleaned_data.pop('time_series_end', None)
+                if curve:
+                    time_series = {'start': start, 'end': end, 'curve': curve}
+                    try:
+                        normalize_time_series(time_series)
+                        cleaned_data['time_series'] = time_series
+                    except ValueError as e:
+                        self.add_error('time_series_curve', str(e))
+                return cleaned_data
+
+        if len(connections.settings) > 1:
+            # Let the user pick the databases to populate, when there is a choice
+            MainForm.base_fields['databases'] = forms.MultipleChoiceField(
+                required=False,
+                choices=[(alias, alias) for alias in connections.settings],
+                initial=[self.database] if self.database else None,
+                help_text=gettext_lazy(
+                    "The size is split across the selected databases, which are populated in parallel."
+                )
+            )
+            MainForm.field_order = ('size', 'seed', 'databases', *form_fields)
+
+        distribution_fields = self.get_distribution_fields()
+        for field in distribution_fields:
+            MainForm.base_fields[DISTRIBUTION_PREFIX + field.name] = DistributionField(
+                required=False,
+                label=gettext_lazy("Distribution of %s") % field.verbose_name,
+                initial=self.distributions.get(field.name)
+            )
+        MainForm.field_order = (
+            *MainForm.field_order, *(DISTRIBUTION_PREFIX + field.name for field in distribution_fields)
+        )
+
+        timestamp_fields = self.get_time_series_fields()
+        if timestamp_fields:
+            MainForm.base_fields['time_series_curve'] = forms.ChoiceField(
+                required=False,
+                choices=[('', gettext_lazy("Off")), *((curve, curve.capitalize()) for curve in CURVES)],
+                initial=self.time_series.get('curve'),
+                label=gettext_lazy("Time series"),
+                help_text=gettext_lazy(
+                    "Spreads %s over the date range with this rate curve, and inserts the objects in time order."
+                ) % ', '.join(str(field.verbose_name) for field in timestamp_fields)
+            )
+            MainForm.base_fields['time_series_start'] = forms.DateTimeField(
+                required=False, label=gettext_lazy("From"), initial=self.time_series.get('start')
+            )
+            MainForm.base_fields['time_series_end'] = forms.DateTimeField(
+                required=False, label=gettext_lazy("To"), initial=self.time_series.get('end')
+            )
+            MainForm.field_order = (*MainForm.field_order, 'time_series_curve', 'time_series_start', 'time_series_end')
+
+        if self.can_profile():
+            # Let superusers run the population under cProfile
+            MainForm.base_fields['profile'] = forms.BooleanField(
+                required=False,
+                label=gettext_lazy("Profile the run"),
+                help_text=gettext_lazy(
+                    "Runs the population under cProfile and shows its top cumulative functions on the run's page."
+                )
+            )
+            leading = [name for name in MainForm.field_order if name not in form_fields]
+            MainForm.field_order = (*leading, 'profile', *form_fields)
+
         # Return the dynamically created form class
         return MainForm
 
+    def get_distribution_fields(self):
+        """
+        Returns the fields whose values the populate form lets the user draw from a distribution.
+
+        Returns:
+            - list: The fields with choices and the foreign keys of the model, but the excluded ones, with the bulk
+              strategy; an empty list otherwise.
+        """
+        if self.strategy != BULK_STRATEGY:
+            return []
+        exclude = self.get_exclude()
+        return [field for field in get_distribution_fields(self.model) if field.name not in exclude]
+
+    def get_time_series_fields(self):
+        """
+        Returns the timestamp fields the populate form lets the user spread over a date range.
+
+        Returns:
+            - list: The fields named by the view's `time_series`, by default the ``auto_now`` and ``auto_now_add``
+              fields of the model, with the bulk strategy; an empty list otherwise.
+        """
+        if self.strategy != BULK_STRATEGY:
+            return []
+        return get_timestamp_fields(self.model, self.time_series.get('fields'))
+
+    def can_profile(self):
+        """
+        Checks if the user may profile the population: only superusers may, and only runs made in the request.
+
+        Returns:
+            - bool: True if the populate form offers profiling, False otherwise.
+        """
+        request = getattr(self, 'request', None)
+        return request is not None and request.user.is_superuser and not self.use_queue
+
     def get_admin_form(self):
         """
         Creates and returns an admin form for the dummy data creation.
@@ -182,7 +526,7 @@ class FakerAdminView(FormView):
 
     def get_context_data(self, **kwargs):
         """
-        Adds the admin form to the context data.
+        Adds the admin form and its media to the context data.
 
         Args:
             - **kwargs: Additional keyword arguments passed to the superclass method.
@@ -191,7 +535,9 @@ class FakerAdminView(FormView):
             - dict: Context data including the admin form.
         """
         context = super().get_context_data(**kwargs)
-        context['adminform'] = self.get_admin_form()
+        context['adminform'] = admin_form = self.get_admin_form()
+        # Autocomplete and raw id widgets need the admin's JavaScript
+        context['media'] = self.model_admin.media + admin_form.media
         return context
 
     def form_valid(self, form):
@@ -204,10 +550,139 @@ class FakerAdminView(FormView):
         Returns:
             - HttpResponseRedirect: A redirect response to the success URL.
         """
-        cleaned_data = {k: v for k, v in form.cleaned_data.items() if v}
-        self.factory_class.create_batch(**cleaned_data)
+        # Blank fields are left to the factory, while False and 0, e.g. a seed of 0, are values. An untouched checkbox
+        # of a model field cleans to its initial value, so it is left to the factory too.
+        booleans = {field.name for field in self.model._meta.fields if isinstance(field, models.BooleanField)}
+        cleaned_data = {
+            k: v for k, v in form.cleaned_data.items()
+            if not is_blank(v) and (k not in booleans or k in form.changed_data)
+        }
+        self.populate(**cleaned_data)
         return super().form_valid(form)
 
+    def populate(
+            self, size, seed=None, databases=None, profile=False, distributions=None, time_series=None, **overrides
+        ):
+        """
+        Creates the dummy data with the view's generation strategy, or queues it when `use_queue` is set.
+
+        Args:
+            - size (int): The number of objects to create.
+            - seed (int): Seed for the random generators, making the run reproducible.
+            - databases (list): The database aliases to populate. Several aliases are populated in parallel, each with
+              its share of `size`. Defaults to the view's `database`.
+            - profile (bool): Whether to run the population under cProfile, on a single database.
+            - distributions (dict): The distributions of the fields shown on the form, by field name, None for the
+              fields left to the factory. The view's `distributions` apply to the other fields.
+            - time_series (dict): The date range and rate curve of the form, completed by the view's `time_series`.
+            - **overrides: Field values passed to the factory for every object.
+
+        Returns:
+            - int: The number of objects created, 0 when the population is queued.
+
+        Raises:
+            - ValueError: If a queued population is to be profiled.
+        """
+        if profile and self.use_queue:
+            raise ValueError("A queued population cannot be profiled.")
+        distributions = {
+            name: distribution
+            for name, distribution in {**self.distributions, **(distributions or {})}.items()
+            if distribution is not None
+        }
+        if time_series:
+            time_series = {**self.time_series, **time_series}
+        if self.use_queue:
+            self.enqueue(
+                size, seed=seed, databases=databases, distributions=distributions, time_series=time_series, **overrides
+            )
+            return 0
+
+        kwargs = {
+            'overrides': overrides,
+            'seed': seed,
+            'strategy': self.strategy,
+            'm2m_fan_out': self.m2m_fan_out,
+            'writers': self.writers,
+        }
+        if distributions and self.strategy == BULK_STRATEGY:
+            kwargs['distributions'] = distributions
+        if time_series and self.strategy == BULK_STRATEGY:
+            kwargs['time_series'] = time_series
+        if databases and len(databases) > 1:
+            return sum(generate_sharded(self.factory_class, size, databases, **kwargs).values())
+
+        using = databases[0] if databases else self.database
+        if profile:
+            return self.profile(size, using=using, **kwargs)
+        return generate(factory_class=self.factory_class, size=size, using=using, **kwargs)
+
+    def profile(self, size, **kwargs):
+        """
+        Creates the dummy data under cProfile, and tells the user where the profile was saved.
+
+        Args:
+            - size (int): The number of objects to create.
+            - **kwargs: Keyword arguments passed to `generate`.
+
+        Returns:
+            - int: The number of objects created.
+        """
+        from django_faker_admin.profiling import profile_generate
+
+        written, self.profiled_run, path = profile_generate(self.factory_class, size, **kwargs)
+        self.model_admin.message_user(
+            self.request, gettext_lazy("The profile was saved to %s.") % path, fail_silently=True
+        )
+        return written
+
+    def enqueue(self, size, seed=None, databases=None, distributions=None, time_series=None, **overrides):
+        """
+        Queues the dummy data for worker processes, one job per database, and tells the user.
+
+        Args:
+            - size (int): The number of objects to create.
+            - seed (int): Seed for the random generators. The job of the database at position ``i`` gets ``seed + i``.
+            - databases (list): The database aliases to populate, the size being split across them. Defaults to the
+              view's `database`.
+            - distributions (dict): The distributions the values of fields are drawn from, by field name.
+            - time_series (dict): The date range, rate curve and timestamp fields of the time series.
+            - **overrides: Field values passed to the factory for every object.
+
+        Returns:
+            - list: The queued jobs.
+        """
+        from django_faker_admin.bulk import split_size
+        from django_faker_admin.jobs import enqueue
+
+        databases = databases or [self.database]
+        jobs = [
+            enqueue(
+                self.factory_class,
+                job_size,
+                overrides=overrides,
+                seed=None if seed is None else seed + index,
+                strategy=self.strategy,
+                using=using,
+                m2m_fan_out=self.m2m_fan_out,
+                writers=self.writers,
+                distributions=(distributions or None) if self.strategy == BULK_STRATEGY else None,
+                time_series=(time_series or None) if self.strategy == BULK_STRATEGY else None
+            )
+            for index, (using, job_size) in enumerate(zip(databases, split_size(size, len(databases))))
+            if job_size > 0
+        ]
+        self.model_admin.message_user(
+            self.request,
+            ngettext(
+                "%d population job was queued.",
+                "%d population jobs were queued.",
+                len(jobs),
+            ) % len(jobs),
+            fail_silently=True
+        )
+        return jobs
+
     def get_success_message(self, cleaned_data):
         """
         Generates a success message after creating dummy data.
@@ -233,5 +708,217 @@ class FakerAdminView(FormView):
         Returns:
             - str: A URL to redirect to after form submission.
         """
+        from django_faker_admin.models import PopulationRun
+
+        run = getattr(self, 'profiled_run', None)
+        if run is not None and run._state.db == router.db_for_read(PopulationRun):
+            # The run's page shows the profile
+            return reverse('admin:django_faker_admin_populationrun_change', args=(run.pk,))
+
+        info = self.model._meta.app_label, self.model._meta.model_name
+        return reverse('admin:%s_%s_changelist' % info)
+
+
+class FakerCloneForm(forms.Form):
+    """
+    The options of the "clone selected" action: the number of copies per row and the fields generated for every copy.
+    """
+    times = forms.IntegerField(
+        label=gettext_lazy("Copies per row"), min_value=1, max_value=settings.FAKER_ADMIN_MAX_LIMIT
+    )
+    seed = forms.IntegerField(required=False, min_value=0)
+    vary = forms.MultipleChoiceField(
+        label=gettext_lazy("Varying fields"),
+        required=False,
+        widget=forms.CheckboxSelectMultiple,
+        help_text=gettext_lazy(
+            "Generated by the factory for every copy instead of being copied. Unique fields always vary."
+        )
+    )
+
+    def __init__(self, *args, factory_class: Type[DjangoModelFactory], **kwargs) -> None:
+        """
+        Initializes the form, offering the fields the factory declares as varying fields.
+
+        Args:
+            - factory_class (Type[DjangoModelFactory]): The factory class of the model.
+            - *args: Additional positional arguments.
+            - **kwargs: Additional keyword arguments.
+        """
+        from django_faker_admin.clone import get_unique_fields
+
+        super().__init__(*args, **kwargs)
+        model = factory_class._meta.model
+        declarations = factory_class._meta.pre_declarations.declarations
+        unique_fields = get_unique_fields(model)
+        self.fields['vary'].choices = [
+            (field.name, field.verbose_name) for field in model._meta.concrete_fields
+            if field.name in declarations and not field.is_relation and field.name not in unique_fields
+        ]
+
+
+class FakerFanOutForm(forms.Form):
+    """
+    The options of the "generate children" action: the relation to populate and the number of children per parent.
+    """
+    relation = forms.ChoiceField(label=gettext_lazy("Children"))
+    min_count = forms.IntegerField(
+        label=gettext_lazy("Minimum per parent"), min_value=0, max_value=settings.FAKER_ADMIN_MAX_LIMIT
+    )
+    max_count = forms.IntegerField(
+        label=gettext_lazy("Maximum per parent"), min_value=0, max_value=settings.FAKER_ADMIN_MAX_LIMIT
+    )
+    seed = forms.IntegerField(required=False, min_value=0)
+    all_rows = forms.BooleanField(
+        label=gettext_lazy("All rows"),
+        required=False,
+        help_text=gettext_lazy("Generate children for every row of the table, not only the selected ones.")
+    )
+
+    def __init__(self, *args, relations: Dict[str, str], **kwargs) -> None:
+        """
+        Initializes the form with the relations the user may populate.
+
+        Args:
+            - relations (dict): The labels of the relations, by ``app_label.model_name:field_name`` key.
+            - *args: Additional positional arguments.
+            - **kwargs: Additional keyword arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self.fields['relation'].choices = list(relations.items())
+
+    def clean(self):
+        """
+        Validates that the minimum number of children does not exceed the maximum.
+
+        Returns:
+            - dict: The cleaned data.
+
+        Raises:
+            - ValidationError: If the minimum exceeds the maximum.
+        """
+        cleaned_data = super().clean()
+        low, high = cleaned_data.get('min_count'), cleaned_data.get('max_count')
+        if low is not None and high is not None and low > high:
+            raise forms.ValidationError(gettext_lazy("The minimum should not exceed the maximum."))
+        return cleaned_data
+
+
+class FakerPurgeView(FormView):
+    """
+    A view to delete the dummy data of a given model.
+
+    Only the rows created by population runs are deleted, in chunks ordered by primary key, which stays usable on
+    tables where the admin's "delete selected" action would have to load and render every object.
+    """
+    #: ModelAdmin instance for the model to be purged
+    model_admin: ModelAdmin = None
+    #: Template name for the view
+    template_name = 'admin/faker_purge.html'
+
+    class form_class(forms.Form):
+        fast = forms.BooleanField(
+            required=False,
+            label=gettext_lazy("Fast delete"),
+            help_text=gettext_lazy(
+                "Delete with raw SQL, skipping delete signals, when no other table cascades from this one."
+            )
+        )
+
+    def __init__(self, model_admin: ModelAdmin, **kwargs) -> None:
+        """
+        Initializes the view with the model admin.
+
+        Args:
+            - model_admin (ModelAdmin): The admin class for the model to be purged.
+            - **kwargs: Additional keyword arguments.
+        """
+        super().__init__(**kwargs)
+        self.model_admin = model_admin
+        self.model = self.model_admin.model
+
+    def has_delete_permission(self, request):
+        """
+        Checks if the user has permission to delete objects of the model.
+
+        Args:
+            - request: The HTTP request object.
+
+        Returns:
+            - bool: True if the user has permission, False otherwise.
+        """
+        return request.user.has_perm(f"{self.model._meta.app_label}.delete_{self.model._meta.model_name}")
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Handles the HTTP request and checks for permissions.
+
+        Raises:
+            - PermissionDenied: If the user does not have permission to delete objects of the model.
+        """
+        if not self.has_delete_permission(request):
+            raise PermissionDenied(
+                gettext_lazy("You don't have permission to preform this action.")
+            )
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_database(self):
+        """
+        Returns the database alias the dummy data is purged from, the one the admin's population runs write to.
+
+        Returns:
+            - str: The admin's `faker_database`, otherwise the alias its factory writes to, otherwise the alias picked
+              by the database routers.
+        """
+        database = getattr(self.model_admin, 'faker_database', None)
+        factory_class = getattr(self.model_admin, 'factory_class', None)
+        if factory_class is None:
+            return database or router.db_for_write(self.model)
+        return resolve_database(factory_class, database)
+
+    def get_context_data(self, **kwargs):
+        """
+        Adds the number of tracked rows to the context data.
+
+        Returns:
+            - dict: Context data including the `generated_count`.
+        """
+        from django_faker_admin.tracking import count_generated
+
+        context = super().get_context_data(**kwargs)
+        context['generated_count'] = count_generated(self.model, self.get_database())
+        return context
+
+    def form_valid(self, form):
+        """
+        Deletes the dummy data of the model.
+
+        Args:
+            - form: The submitted form with valid data.
+
+        Returns:
+            - HttpResponseRedirect: A redirect response to the success URL.
+        """
+        from django_faker_admin.purge import purge
+
+        deleted = purge(self.model, fast=form.cleaned_data['fast'], using=self.get_database())
+        self.model_admin.message_user(
+            self.request,
+            ngettext(
+                "%d %s object was successfully deleted.",
+                "%d %s objects were successfully deleted.",
+                deleted,
+            ) % (deleted, self.model._meta.model_name),
+            fail_silently=True
+        )
+        return super().form_valid(form)
+
+    def get_success_url(self):
+        """
+        Returns the URL to redirect to after deleting the dummy data.
+
+        Returns:
+            - str: The URL of the model's change list.
+        """
         info = self.model._meta.app_label, self.model._meta.model_name
         return reverse('admin:%s_%s_changelist' % info)
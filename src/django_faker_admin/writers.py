@@ -0,0 +1,120 @@
+import queue
+import threading
+from typing import Any, Callable, List
+
+from django.db import connections
+
+
+class WriterPool:
+    """
+    Writes chunks of objects to the database from several worker threads.
+
+    Chunks submitted with `submit` go onto a bounded queue, so the producer never gets more than `max_pending` chunks
+    ahead of the writers. Each worker thread drains the queue and calls `write` with every chunk it takes. Django
+    connections are per thread, so every worker writes through its own connection, which it closes when it stops.
+
+    The first exception raised by a worker stops the pool: the remaining chunks are discarded, `submit` raises the
+    exception, and so does `close` if it has not been raised yet. Used as a context manager, the pool is closed on exit.
+    """
+    #: Sentinel telling a worker thread to stop.
+    stop = object()
+
+    def __init__(self, write: Callable[[List[Any]], Any], workers: int, max_pending: int = None) -> None:
+        """
+        Initializes the pool.
+
+        Args:
+            - write (Callable): Called by the workers with every chunk. It must be thread-safe.
+            - workers (int): The number of worker threads.
+            - max_pending (int): The maximum number of queued chunks. Defaults to twice the number of workers.
+
+        Raises:
+            - ValueError: If the number of workers is not positive.
+        """
+        if workers < 1:
+            raise ValueError("A writer pool needs at least one worker.")
+        self.write = write
+        self.workers = workers
+        self.queue = queue.Queue(maxsize=max_pending or 2 * workers)
+        self.threads = []
+        self.error = None
+        self.error_raised = False
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> 'WriterPool':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Do not mask the exception that is already propagating
+        self.close(raise_error=exc_type is None)
+
+    def start(self) -> None:
+        """
+        Starts the worker threads.
+        """
+        for index in range(self.workers):
+            thread = threading.Thread(target=self.work, name=f'faker-writer-{index}', daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def work(self) -> None:
+        """
+        The loop of a worker thread: writes queued chunks until it gets the stop sentinel.
+        """
+        try:
+            while True:
+                chunk = self.queue.get()
+                try:
+                    if chunk is self.stop:
+                        return
+                    # After a failure, chunks are only taken off the queue, so that the producer never blocks
+                    if self.error is None:
+                        self.write(chunk)
+                except BaseException as e:
+                    with self.lock:
+                        if self.error is None:
+                            self.error = e
+                finally:
+                    self.queue.task_done()
+        finally:
+            connections.close_all()
+
+    def raise_error(self) -> None:
+        """
+        Raises the exception of the first failed worker, once.
+        """
+        if self.error is not None and not self.error_raised:
+            self.error_raised = True
+            raise self.error
+
+    def submit(self, chunk: List[Any]) -> None:
+        """
+        Queues a chunk for writing, blocking while the queue is full.
+
+        Args:
+            - chunk (list): The objects to write.
+
+        Raises:
+            - Exception: The exception of a failed worker, if any.
+        """
+        self.raise_error()
+        self.queue.put(chunk)
+
+    def close(self, raise_error: bool = True) -> None:
+        """
+        Waits for the queued chunks to be written and stops the worker threads.
+
+        Args:
+            - raise_error (bool): Whether to raise the exception of a failed worker.
+
+        Raises:
+            - Exception: The exception of a failed worker, if any and not raised yet.
+        """
+        for _ in self.threads:
+            self.queue.put(self.stop)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        if raise_error:
+            self.raise_error()
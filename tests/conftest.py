@@ -10,6 +10,8 @@ os.environ['DJANGO_SETTINGS_MODULE'] = 'tests.testproject_settings'
 # Initialize Django before fixtures
 django.setup()
 
+pytest_plugins = ['django_faker_admin.pytest_plugin']
+
 
 @pytest.fixture
 def mock_settings(monkeypatch):
@@ -22,6 +24,9 @@ def mock_settings(monkeypatch):
         FAKER_ADMIN_URL = 'faker-admin/'
         FAKER_ADMIN_TEMPLATE_NAME = 'faker_admin.html'
         FAKER_ADMIN_CHANGE_LIST_TEMPLATE = 'faker_change_list.html'
+        FAKER_ADMIN_STRATEGY = 'per_row'
+        FAKER_ADMIN_RELATION_WIDGET_THRESHOLD = 100
+        FAKER_ADMIN_PER_ROW_WARNING_THRESHOLD = 1000
 
     mock_settings_obj = MockSettings()
     monkeypatch.setattr('django_faker_admin.conf.settings', mock_settings_obj)
@@ -35,3 +40,12 @@ def check_settings_function(mock_settings):
     """
     from django_faker_admin.checks import check_settings
     return check_settings
+
+
+@pytest.fixture
+def check_model_admin_function(mock_settings):
+    """
+    Import the check_model_admin function after mocking settings.
+    """
+    from django_faker_admin.checks import check_model_admin
+    return check_model_admin
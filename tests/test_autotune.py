@@ -0,0 +1,72 @@
+from django.test import TestCase
+from django.core.management import call_command
+
+from django_faker_admin.autotune import ChunkSizeTuner
+from django_faker_admin.bulk import BulkGenerator, generate
+from django_faker_admin.models import TunedChunkSize
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory
+
+
+class ChunkSizeTunerTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    def get_tuner(self):
+        return ChunkSizeTuner(TestModel, using='default', target_latency=1, min_size=10, max_size=1000)
+
+    def test_grows_when_chunks_are_fast(self):
+        tuner = self.get_tuner()
+        tuner.chunk_size = 100
+
+        # 100 rows in 0.1s is 1000 rows/s, the size grows by at most a factor of two per chunk
+        self.assertEqual(tuner.record(rows=100, elapsed=0.1), 200)
+        self.assertEqual(tuner.record(rows=200, elapsed=0.2), 400)
+
+    def test_shrinks_when_chunks_are_slow(self):
+        tuner = self.get_tuner()
+        tuner.chunk_size = 100
+
+        # 100 rows in 1.25s is 80 rows/s
+        self.assertEqual(tuner.record(rows=100, elapsed=1.25), 80)
+
+    def test_stays_within_limits(self):
+        tuner = self.get_tuner()
+        tuner.chunk_size = 900
+
+        self.assertEqual(tuner.record(rows=900, elapsed=0.01), 1000)
+
+        tuner = self.get_tuner()
+        tuner.chunk_size = 15
+        self.assertEqual(tuner.record(rows=15, elapsed=100), 10)
+
+    def test_next_run_starts_from_saved_size(self):
+        tuner = self.get_tuner()
+        tuner.chunk_size = 100
+        tuner.record(rows=100, elapsed=0.1)
+        tuner.save()
+
+        self.assertEqual(self.get_tuner().chunk_size, 200)
+
+    def test_unmeasured_tuner_is_not_saved(self):
+        self.get_tuner().save()
+
+        self.assertFalse(TunedChunkSize.objects.exists())
+
+    def test_generator_autotune(self):
+        generator = BulkGenerator(factory_class=TestModelFactory, size=120, autotune=True)
+
+        generator.run()
+
+        self.assertEqual(TestModel.objects.count(), 120)
+        self.assertEqual(TunedChunkSize.objects.get().chunk_size, generator.chunk_size)
+
+    def test_generate_does_not_autotune_by_default(self):
+        generate(TestModelFactory, 120, strategy='bulk', use_snapshots=False)
+
+        self.assertFalse(TunedChunkSize.objects.exists())
@@ -0,0 +1,189 @@
+from io import StringIO
+
+from django.test import TestCase, TransactionTestCase
+from django.core.management import call_command, CommandError
+from django.contrib.contenttypes.models import ContentType
+
+from django_faker_admin.bulk import (
+    BulkGenerator, ManyToManyFiller, BULK_STRATEGY, PER_ROW_STRATEGY, generate, generate_sharded, resolve_database,
+    split_size
+)
+from django_faker_admin.tracking import count_generated
+
+from tests.testapp.models import TestModel, TestTag, TestChildModel
+from tests.testapp.factory import TestModelFactory, TestChildModelFactory
+
+
+class BulkGeneratorTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    def test_run_creates_objects(self):
+        generator = BulkGenerator(factory_class=TestModelFactory, size=7, chunk_size=3)
+
+        written = generator.run()
+
+        self.assertEqual(written, 7)
+        self.assertEqual(TestModel.objects.count(), 7)
+
+    def test_run_calls_chunk_callbacks(self):
+        generator = BulkGenerator(factory_class=TestModelFactory, size=7, chunk_size=3)
+        chunks = []
+        generator.chunk_callbacks.append(lambda objs: chunks.append(len(objs)))
+
+        generator.run()
+
+        self.assertEqual(chunks, [3, 3, 1])
+
+    def test_run_applies_overrides(self):
+        generator = BulkGenerator(factory_class=TestModelFactory, size=4, overrides={'name': 'Bulk'})
+
+        generator.run()
+
+        self.assertEqual(TestModel.objects.filter(name='Bulk').count(), 4)
+
+    def test_seed_is_reproducible(self):
+        BulkGenerator(factory_class=TestModelFactory, size=3, seed=42).run()
+        BulkGenerator(factory_class=TestModelFactory, size=3, seed=42).run()
+
+        names = list(TestModel.objects.order_by('pk').values_list('name', flat=True))
+        self.assertEqual(names[:3], names[3:])
+
+    def test_generate_per_row_strategy(self):
+        written = generate(TestModelFactory, size=2, strategy=PER_ROW_STRATEGY)
+
+        self.assertEqual(written, 2)
+        self.assertEqual(TestModel.objects.count(), 2)
+
+    def test_generate_bulk_strategy(self):
+        written = generate(TestModelFactory, size=5, strategy=BULK_STRATEGY, use_snapshots=False)
+
+        self.assertEqual(written, 5)
+        self.assertEqual(TestModel.objects.count(), 5)
+
+    def test_populate_command(self):
+        out = StringIO()
+
+        call_command('faker_populate', 'testapp.TestModel', '--size', '6', '--no-snapshot', stdout=out)
+
+        self.assertEqual(TestModel.objects.count(), 6)
+        self.assertIn('6 testapp.TestModel objects', out.getvalue())
+
+    def test_m2m_fan_out(self):
+        TestTag.objects.bulk_create(TestTag(name=f'Tag {i}') for i in range(10))
+        generator = BulkGenerator(
+            factory_class=TestChildModelFactory,
+            size=20,
+            chunk_size=8,
+            m2m_fan_out={'tags': (2, 4)}
+        )
+
+        generator.run()
+
+        counts = [child.tags.count() for child in TestChildModel.objects.all()]
+        self.assertEqual(len(counts), 20)
+        self.assertTrue(all(2 <= count <= 4 for count in counts))
+
+    def test_m2m_fan_out_is_capped_by_pool(self):
+        TestTag.objects.create(name='Only')
+
+        BulkGenerator(factory_class=TestChildModelFactory, size=3, m2m_fan_out={'tags': 5}).run()
+
+        self.assertEqual(TestChildModel.tags.through.objects.count(), 3)
+
+    def test_m2m_filler_rejects_other_fields(self):
+        with self.assertRaises(ValueError):
+            ManyToManyFiller(TestChildModel, 'parent', fan_out=1, using='default')
+
+    def test_populate_command_m2m(self):
+        TestTag.objects.bulk_create(TestTag(name=f'Tag {i}') for i in range(3))
+
+        call_command('faker_populate', 'testapp.TestChildModel', '--size', '4', '--m2m', 'tags=1', stdout=StringIO())
+
+        self.assertEqual(TestChildModel.tags.through.objects.count(), 4)
+
+    def test_populate_command_invalid_m2m(self):
+        with self.assertRaises(CommandError):
+            call_command('faker_populate', 'testapp.TestChildModel', '--size', '4', '--m2m', 'tags', stdout=StringIO())
+
+
+class ShardedGenerationTestCase(TransactionTestCase):
+    databases = {'shard1', 'shard2'}
+
+    @classmethod
+    def setUpClass(cls):
+        for alias in sorted(cls.databases):
+            call_command('migrate', database=alias, verbosity=0)
+
+        super().setUpClass()
+
+    def setUp(self):
+        # Flushing a database between tests drops its content types, but not the cached ones
+        ContentType.objects.clear_cache()
+
+    def test_split_size(self):
+        self.assertEqual(split_size(10, 3), [4, 3, 3])
+        self.assertEqual(split_size(1, 2), [1, 0])
+
+    def test_resolve_database(self):
+        self.assertEqual(resolve_database(TestModelFactory), 'default')
+        self.assertEqual(resolve_database(TestModelFactory, 'shard1'), 'shard1')
+
+    def test_generate_on_database(self):
+        for strategy in (BULK_STRATEGY, PER_ROW_STRATEGY):
+            generate(TestModelFactory, size=4, strategy=strategy, using='shard1', use_snapshots=False)
+
+        self.assertEqual(TestModel.objects.using('shard1').count(), 8)
+        self.assertEqual(count_generated(TestModel, using='shard1'), 8)
+
+    def test_generate_sharded(self):
+        written = generate_sharded(TestModelFactory, 9, ['shard1', 'shard2'], seed=3, use_snapshots=False)
+
+        self.assertEqual(written, {'shard1': 5, 'shard2': 4})
+        self.assertEqual(TestModel.objects.using('shard1').count(), 5)
+        self.assertEqual(TestModel.objects.using('shard2').count(), 4)
+
+    def test_seeded_sharded_runs_are_reproducible(self):
+        def get_names():
+            return {
+                alias: list(TestModel.objects.using(alias).order_by('pk').values_list('name', flat=True))
+                for alias in ('shard1', 'shard2')
+            }
+
+        def delete_rows():
+            for alias in ('shard1', 'shard2'):
+                TestModel.objects.using(alias).all().delete()
+
+        options = {'strategy': BULK_STRATEGY, 'chunk_size': 20, 'use_snapshots': False}
+        generate_sharded(TestModelFactory, 400, ['shard1', 'shard2'], seed=7, **options)
+        first = get_names()
+        delete_rows()
+        generate_sharded(TestModelFactory, 400, ['shard1', 'shard2'], seed=7, **options)
+
+        self.assertEqual(get_names(), first)
+        # Every shard gets the rows of a run alone with its seed
+        delete_rows()
+        generate(TestModelFactory, 200, seed=8, using='shard2', **options)
+        self.assertEqual(get_names()['shard2'], first['shard2'])
+
+    def test_generate_sharded_rejects_duplicates(self):
+        with self.assertRaises(ValueError):
+            generate_sharded(TestModelFactory, 9, ['shard1', 'shard1'])
+
+    def test_populate_command_databases(self):
+        out = StringIO()
+        call_command(
+            'faker_populate', 'testapp.TestModel', size=6, database=['shard1', 'shard2'], use_snapshots=False,
+            stdout=out
+        )
+
+        self.assertIn("in 'shard2'", out.getvalue())
+        self.assertEqual(TestModel.objects.using('shard2').count(), 3)
+
+    def test_populate_command_unknown_database(self):
+        with self.assertRaises(CommandError):
+            call_command('faker_populate', 'testapp.TestModel', size=1, database=['missing'])
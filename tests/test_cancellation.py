@@ -0,0 +1,117 @@
+import tempfile
+from unittest import mock
+
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase
+
+from django_faker_admin.bulk import BulkGenerator, generate, resume
+from django_faker_admin.conf import settings
+from django_faker_admin.models import PopulationRun
+from django_faker_admin.snapshots import get_snapshot_cache
+from django_faker_admin.tracking import request_cancel
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory
+
+
+User = get_user_model()
+
+
+def cancel_after(chunks):
+    """
+    Patches `BulkGenerator.insert_chunk` to request the cancellation of the run after the first `chunks` chunks, as
+    another request would.
+    """
+    insert_chunk = BulkGenerator.insert_chunk
+    calls = []
+
+    def side_effect(self, objs):
+        created = insert_chunk(self, objs)
+        calls.append(len(created))
+        if len(calls) == chunks:
+            request_cancel(PopulationRun.objects.latest('pk'))
+        return created
+
+    return mock.patch.object(BulkGenerator, 'insert_chunk', autospec=True, side_effect=side_effect)
+
+
+class CancellationTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+
+    def create_run(self, **kwargs):
+        return PopulationRun.objects.create(
+            content_type=ContentType.objects.get_for_model(TestModel), size=10, strategy='bulk', **kwargs
+        )
+
+    def test_run_stops_between_chunks(self):
+        with cancel_after(2):
+            written = generate(TestModelFactory, size=20, strategy='bulk', chunk_size=4, use_snapshots=False)
+
+        run = PopulationRun.objects.get()
+        self.assertEqual(written, 8)
+        self.assertEqual(run.status, PopulationRun.Status.CANCELLED)
+        self.assertEqual(run.rows_written, 8)
+        self.assertEqual(TestModel.objects.count(), 8)
+
+    def test_cancelled_run_leaves_no_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_SNAPSHOT_DIR=directory):
+                with cancel_after(1):
+                    generate(TestModelFactory, size=12, strategy='bulk', chunk_size=4, seed=5)
+                cache = get_snapshot_cache()
+
+                self.assertFalse(cache.has(cache.get_key(TestModelFactory, size=12, seed=5)))
+                self.assertEqual(list(cache.directory.iterdir()), [])
+
+    def test_cancelled_run_can_be_resumed(self):
+        with cancel_after(1):
+            generate(TestModelFactory, size=12, strategy='bulk', chunk_size=4, use_snapshots=False)
+
+        run = PopulationRun.objects.get()
+        resume(run)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, PopulationRun.Status.FINISHED)
+        self.assertEqual(TestModel.objects.count(), 12)
+
+    def test_request_cancel_only_applies_to_running_runs(self):
+        self.assertTrue(request_cancel(self.create_run()))
+        self.assertFalse(request_cancel(self.create_run(status=PopulationRun.Status.FINISHED)))
+
+    def test_status_page_has_cancel_button(self):
+        running = self.create_run()
+        finished = self.create_run(status=PopulationRun.Status.FINISHED)
+
+        response = self.client.get(reverse('admin:django_faker_admin_populationrun_change', args=(running.pk,)))
+        self.assertContains(response, 'population-run-cancel')
+
+        response = self.client.get(reverse('admin:django_faker_admin_populationrun_change', args=(finished.pk,)))
+        self.assertNotContains(response, 'population-run-cancel')
+
+    def test_cancel_view(self):
+        run = self.create_run()
+        url = reverse('admin:django_faker_admin_populationrun_cancel', args=(run.pk,))
+
+        self.assertEqual(self.client.get(url).status_code, 405)
+        response = self.client.post(url)
+
+        run.refresh_from_db()
+        self.assertRedirects(response, reverse('admin:django_faker_admin_populationrun_change', args=(run.pk,)))
+        self.assertTrue(run.cancel_requested)
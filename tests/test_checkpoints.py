@@ -0,0 +1,200 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.admin import site
+from django.contrib.auth import get_user_model
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.management import call_command, CommandError
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from django_faker_admin.admin import PopulationRunAdmin
+from django_faker_admin.bulk import BulkGenerator, generate, resume
+from django_faker_admin.conf import settings
+from django_faker_admin.jobs import enqueue_resume, run_job
+from django_faker_admin.models import PopulationJob, PopulationRun
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory
+
+
+User = get_user_model()
+
+
+def interrupt_after(chunks):
+    """
+    Patches `BulkGenerator.insert_chunk` to fail on the chunk following the first `chunks` ones.
+    """
+    insert_chunk = BulkGenerator.insert_chunk
+    calls = []
+
+    def side_effect(self, objs):
+        calls.append(len(objs))
+        if len(calls) > chunks:
+            raise RuntimeError("Worker restarted")
+        return insert_chunk(self, objs)
+
+    return mock.patch.object(BulkGenerator, 'insert_chunk', autospec=True, side_effect=side_effect)
+
+
+class CheckpointTestCase(TestCase):
+    factory = RequestFactory()
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def interrupted_run(self, size=20, chunks=2, **kwargs):
+        with interrupt_after(chunks), self.assertRaises(RuntimeError):
+            generate(TestModelFactory, size=size, strategy='bulk', chunk_size=4, use_snapshots=False, **kwargs)
+        return PopulationRun.objects.latest('pk')
+
+    def test_checkpoint_after_every_chunk(self):
+        generate(TestModelFactory, size=10, strategy='bulk', chunk_size=4, use_snapshots=False)
+
+        run = PopulationRun.objects.get()
+        self.assertEqual(run.status, PopulationRun.Status.FINISHED)
+        self.assertEqual(run.chunks_written, 3)
+        self.assertEqual(run.rows_written, 10)
+        self.assertIsNotNone(run.random_state)
+
+    def test_interrupted_run_keeps_its_checkpoint(self):
+        run = self.interrupted_run()
+
+        self.assertEqual(run.status, PopulationRun.Status.FAILED)
+        self.assertEqual(run.chunks_written, 2)
+        self.assertEqual(run.rows_written, 8)
+        self.assertEqual(TestModel.objects.count(), 8)
+
+    def test_resume_continues_without_duplicates(self):
+        generate(TestModelFactory, size=20, strategy='bulk', chunk_size=4, seed=11, use_snapshots=False)
+        expected = list(TestModel.objects.order_by('pk').values_list('name', 'description'))
+        TestModel.objects.all().delete()
+
+        run = self.interrupted_run(seed=11, overrides={})
+        written = resume(run)
+
+        run.refresh_from_db()
+        self.assertEqual(written, 20)
+        self.assertEqual(run.status, PopulationRun.Status.FINISHED)
+        self.assertEqual(run.rows_written, 20)
+        self.assertEqual(list(TestModel.objects.order_by('pk').values_list('name', 'description')), expected)
+        self.assertEqual(sum(r.end_pk - r.start_pk + 1 for r in run.ranges.all()), 20)
+
+    def test_resume_keeps_overrides(self):
+        run = self.interrupted_run(overrides={'name': 'Kept'})
+
+        resume(run)
+
+        self.assertEqual(TestModel.objects.filter(name='Kept').count(), 20)
+
+    def test_finished_run_cannot_be_resumed(self):
+        generate(TestModelFactory, size=2, strategy='bulk', use_snapshots=False)
+
+        with self.assertRaises(ValueError):
+            resume(PopulationRun.objects.get())
+
+    def test_running_run_is_resumed_once_stale(self):
+        run = self.interrupted_run()
+        PopulationRun.objects.filter(pk=run.pk).update(status=PopulationRun.Status.RUNNING, updated_at=timezone.now())
+
+        with self.assertRaisesMessage(ValueError, 'is still running'):
+            resume(run)
+        self.assertEqual(TestModel.objects.count(), 8)
+
+        PopulationRun.objects.filter(pk=run.pk).update(updated_at=timezone.now() - timedelta(minutes=10))
+        self.assertEqual(resume(run), 20)
+        self.assertEqual(TestModel.objects.count(), 20)
+
+    def test_per_row_run_cannot_be_resumed(self):
+        run = PopulationRun.objects.create(content_type_id=1, size=3, strategy='per_row')
+
+        with self.assertRaises(ValueError):
+            resume(run)
+
+    def test_populate_command_resume(self):
+        run = self.interrupted_run()
+        out = StringIO()
+
+        call_command('faker_populate', 'testapp.TestModel', resume=run.pk, stdout=out)
+
+        self.assertIn("12 testapp.TestModel objects were successfully created, 20 in total", out.getvalue())
+        self.assertEqual(TestModel.objects.count(), 20)
+
+    def test_populate_command_requires_size(self):
+        with self.assertRaises(CommandError):
+            call_command('faker_populate', 'testapp.TestModel')
+
+    def test_admin_resume_action(self):
+        run = self.interrupted_run()
+        request = self.factory.post('/')
+        request.user = self.superuser
+        request.session = {}
+        request._messages = FallbackStorage(request)
+
+        PopulationRunAdmin(PopulationRun, site).resume_runs(request, PopulationRun.objects.filter(pk=run.pk))
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, PopulationRun.Status.FINISHED)
+        self.assertEqual(TestModel.objects.count(), 20)
+
+    def get_action_request(self):
+        request = self.factory.post('/')
+        request.user = self.superuser
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return request
+
+    def test_admin_resume_action_resumes_a_single_run(self):
+        self.interrupted_run()
+        self.interrupted_run()
+        request = self.get_action_request()
+
+        PopulationRunAdmin(PopulationRun, site).resume_runs(request, PopulationRun.objects.all())
+
+        messages = [str(message) for message in request._messages]
+        self.assertEqual(
+            messages, ["Select a single run: runs are resumed inside the request, unless they are queued."]
+        )
+        self.assertEqual(TestModel.objects.count(), 16)
+
+    def test_admin_resume_action_queues_runs(self):
+        runs = [self.interrupted_run(), self.interrupted_run()]
+        request = self.get_action_request()
+
+        with mock.patch.dict(settings.explicit_overridden_settings, {'FAKER_ADMIN_USE_QUEUE': True}):
+            PopulationRunAdmin(PopulationRun, site).resume_runs(request, PopulationRun.objects.all())
+            with self.assertRaisesMessage(ValueError, 'is already queued'):
+                enqueue_resume(runs[0])
+
+        self.assertEqual(TestModel.objects.count(), 16)
+        self.assertEqual(sorted(PopulationJob.objects.values_list('run_pk', flat=True)), [run.pk for run in runs])
+        for job in PopulationJob.objects.all():
+            self.assertEqual(run_job(job), 20)
+        self.assertEqual(TestModel.objects.count(), 40)
+        self.assertEqual(
+            set(PopulationRun.objects.values_list('status', flat=True)), {PopulationRun.Status.FINISHED}
+        )
+
+    def test_admin_resume_action_skips_running_runs(self):
+        run = self.interrupted_run()
+        PopulationRun.objects.filter(pk=run.pk).update(status=PopulationRun.Status.RUNNING, updated_at=timezone.now())
+        request = self.factory.post('/')
+        request.user = self.superuser
+        request.session = {}
+        request._messages = FallbackStorage(request)
+
+        PopulationRunAdmin(PopulationRun, site).resume_runs(request, PopulationRun.objects.filter(pk=run.pk))
+
+        messages = [str(message) for message in request._messages]
+        self.assertEqual(messages, [f"Population run #{run.pk} is still running."])
+        self.assertEqual(TestModel.objects.count(), 8)
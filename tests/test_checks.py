@@ -1,3 +1,15 @@
+import factory
+from django.apps import apps
+from django.contrib.admin import AdminSite
+from django.db.models.signals import post_save
+
+from django_faker_admin.checks import check_model_admins, get_subfactory_depth
+
+from tests.testapp.admin import TestModelAdmin, TestChildModelAdmin
+from tests.testapp.factory import TestModelFactory, TestChildModelFactory
+from tests.testapp.models import TestModel, TestChildModel
+
+
 
 def test_all_settings_valid(check_settings_function):
     """
@@ -127,3 +139,114 @@ def test_warning_message_contents(mock_settings, check_settings_function):
     assert "FAKER_ADMIN_MAX_LIMIT" in warning.msg
     assert "positive integer" in warning.msg
     assert "FAKER_ADMIN_MAX_LIMIT" in warning.hint
+
+
+def test_fast_admin_has_no_warnings(check_model_admin_function):
+    """
+    Test that a plain factory on a model without relations raises no performance warning.
+    """
+    model_admin = TestModelAdmin(TestModel, AdminSite())
+    assert check_model_admin_function(model_admin) == []
+
+
+def test_relation_fields_without_widgets(check_model_admin_function):
+    """
+    Test that relation fields of the populate form without raw id or autocomplete widgets are reported.
+    """
+    model_admin = TestChildModelAdmin(TestChildModel, AdminSite())
+    warnings = [
+        warning for warning in check_model_admin_function(model_admin) if warning.id == 'django_faker_admin.W005'
+    ]
+
+    assert len(warnings) == 2
+    assert "'parent'" in warnings[0].msg
+    assert "'tags'" in warnings[1].msg
+    assert warnings[0].obj is TestChildModelAdmin
+
+
+def test_relation_fields_with_raw_id_fields(check_model_admin_function):
+    """
+    Test that relation fields listed in raw_id_fields are not reported.
+    """
+    class RawIdChildAdmin(TestChildModelAdmin):
+        raw_id_fields = ('parent', 'tags')
+
+    warnings = check_model_admin_function(RawIdChildAdmin(TestChildModel, AdminSite()))
+    assert 'django_faker_admin.W005' not in [warning.id for warning in warnings]
+
+
+def test_subfactory_chain(check_model_admin_function):
+    """
+    Test that factories creating SubFactory objects are reported with the length of their chain.
+    """
+    class NestedChildFactory(TestChildModelFactory):
+        sibling = factory.SubFactory(TestChildModelFactory)
+
+    class NestedChildAdmin(TestChildModelAdmin):
+        factory_class = NestedChildFactory
+
+    assert get_subfactory_depth(TestModelFactory) == 0
+    assert get_subfactory_depth(TestChildModelFactory) == 1
+    assert get_subfactory_depth(NestedChildFactory) == 2
+
+    warnings = check_model_admin_function(NestedChildAdmin(TestChildModel, AdminSite()))
+    warning = next(warning for warning in warnings if warning.id == 'django_faker_admin.W006')
+    assert "chain of 2" in warning.msg
+
+
+def test_post_generation(check_model_admin_function):
+    """
+    Test that factories with post-generation declarations are reported.
+    """
+    class PostGenerationFactory(TestModelFactory):
+        @factory.post_generation
+        def notes(obj, create, extracted, **kwargs):
+            pass
+
+    class PostGenerationAdmin(TestModelAdmin):
+        factory_class = PostGenerationFactory
+
+    warnings = check_model_admin_function(PostGenerationAdmin(TestModel, AdminSite()))
+    assert [warning.id for warning in warnings] == ['django_faker_admin.W007']
+    assert 'notes' in warnings[0].msg
+
+
+def test_per_row_max_limit(mock_settings, check_model_admin_function):
+    """
+    Test that a high FAKER_ADMIN_MAX_LIMIT is reported for the per-row strategy only.
+    """
+    mock_settings.FAKER_ADMIN_MAX_LIMIT = 5000
+
+    class BulkAdmin(TestModelAdmin):
+        faker_strategy = 'bulk'
+
+    warnings = check_model_admin_function(TestModelAdmin(TestModel, AdminSite()))
+    assert [warning.id for warning in warnings] == ['django_faker_admin.W008']
+    assert check_model_admin_function(BulkAdmin(TestModel, AdminSite())) == []
+
+
+def test_per_row_post_save_receivers(check_model_admin_function):
+    """
+    Test that post_save receivers are reported for the per-row strategy.
+    """
+    def receiver(sender, **kwargs):
+        pass
+
+    post_save.connect(receiver, sender=TestModel)
+    try:
+        warnings = check_model_admin_function(TestModelAdmin(TestModel, AdminSite()))
+    finally:
+        post_save.disconnect(receiver, sender=TestModel)
+
+    assert [warning.id for warning in warnings] == ['django_faker_admin.W009']
+
+
+def test_check_model_admins():
+    """
+    Test that the registered faker-enabled admins are checked.
+    """
+    warnings = check_model_admins(None)
+    assert any(
+        warning.id == 'django_faker_admin.W006' and warning.obj is TestChildModelAdmin for warning in warnings
+    )
+    assert check_model_admins([apps.get_app_config('auth')]) == []
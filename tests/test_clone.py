@@ -0,0 +1,129 @@
+import factory
+from django.urls import reverse
+from django.contrib.admin import helpers
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from django_faker_admin.clone import CLONE_STRATEGY, clone, get_varying_fields
+from django_faker_admin.models import PopulationRun
+from django_faker_admin.purge import purge
+
+from tests.testapp.models import TestModel, TestChildModel, TestParentModel
+from tests.testapp.factory import TestModelFactory, TestChildModelFactory
+
+
+User = get_user_model()
+
+
+class NamedChildModelFactory(factory.django.DjangoModelFactory):
+    # Reads the copied relation by its name
+    name = factory.LazyAttribute(lambda o: f"Child of {o.parent.name}")
+    parent = None
+
+    class Meta:
+        model = TestChildModel
+
+
+class CloneTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def test_copies_fields_and_generates_varying_ones(self):
+        sources = [TestModel.objects.create(name=f'Source {i}', description=f'Text {i}') for i in range(3)]
+
+        written = clone(TestModelFactory, TestModel.objects.all(), times=4, vary=['name'], chunk_size=5)
+
+        self.assertEqual(written, 12)
+        self.assertEqual(TestModel.objects.count(), 15)
+        copies = TestModel.objects.exclude(pk__in=[source.pk for source in sources])
+        for source in sources:
+            self.assertEqual(copies.filter(description=source.description).count(), 4)
+        self.assertFalse(copies.filter(name__startswith='Source').exists())
+
+    def test_copies_are_not_cloned_again(self):
+        TestModel.objects.create(name='Source', description='Text')
+
+        written = clone(TestModelFactory, TestModel.objects.all(), times=3, chunk_size=1)
+
+        self.assertEqual(written, 3)
+        self.assertEqual(TestModel.objects.filter(name='Source').count(), 4)
+
+    def test_seeded_clones_are_reproducible(self):
+        source = TestModel.objects.create(name='Source', description='Text')
+        names = TestModel.objects.exclude(pk=source.pk).order_by('pk').values_list('name', flat=True)
+
+        clone(TestModelFactory, TestModel.objects.filter(pk=source.pk), times=3, vary=['name'], seed=7)
+        first = list(names.all())
+        clone(TestModelFactory, TestModel.objects.filter(pk=source.pk), times=3, vary=['name'], seed=7)
+        second = list(names.all())[3:]
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(first, second)
+
+    def test_uncompiled_factory_keeps_relations(self):
+        parent = TestParentModel.objects.create(name='Parent')
+        TestChildModel.objects.create(name='Child', parent=parent)
+
+        clone(TestChildModelFactory, TestChildModel.objects.all(), times=2, vary=['name'])
+
+        self.assertEqual(TestParentModel.objects.count(), 1)
+        self.assertEqual(parent.children.count(), 3)
+        self.assertEqual(parent.children.filter(name='Child').count(), 1)
+
+    def test_declarations_read_copied_relations(self):
+        parent = TestParentModel.objects.create(name='Parent')
+        TestChildModel.objects.create(name='Child', parent=parent)
+
+        clone(NamedChildModelFactory, TestChildModel.objects.all(), times=2, vary=['name'])
+
+        self.assertEqual(list(parent.children.order_by('pk').values_list('name', flat=True)), [
+            'Child', 'Child of Parent', 'Child of Parent'
+        ])
+
+    def test_invalid_varying_fields(self):
+        with self.assertRaises(ValueError):
+            get_varying_fields(TestChildModel, ['parent'])
+        with self.assertRaises(ValueError):
+            get_varying_fields(TestModel, ['missing'])
+        with self.assertRaises(ValueError):
+            clone(TestChildModelFactory, TestChildModel.objects.all(), times=2, vary=['id'])
+        self.assertFalse(PopulationRun.objects.exists())
+
+    def test_copies_are_tracked(self):
+        TestModel.objects.create(name='Source', description='Text')
+
+        clone(TestModelFactory, TestModel.objects.all(), times=5)
+
+        run = PopulationRun.objects.get()
+        self.assertEqual(run.strategy, CLONE_STRATEGY)
+        self.assertEqual(run.status, PopulationRun.Status.FINISHED)
+        self.assertEqual(run.rows_written, 5)
+        self.assertEqual(purge(TestModel), 5)
+        self.assertEqual(TestModel.objects.get().name, 'Source')
+
+    def test_clone_action(self):
+        source = TestModel.objects.create(name='Source', description='Text')
+        url = reverse('admin:testapp_testmodel_changelist')
+        self.client.force_login(self.superuser)
+        data = {'action': 'clone_selected', helpers.ACTION_CHECKBOX_NAME: [source.pk]}
+
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'clone-selected-form')
+        self.assertEqual(TestModel.objects.count(), 1)
+
+        response = self.client.post(url, {**data, 'post': 'yes', 'times': 3, 'vary': ['name']})
+        self.assertRedirects(response, url, fetch_redirect_response=False)
+        self.assertEqual(TestModel.objects.filter(description='Text').count(), 4)
+        self.assertEqual(TestModel.objects.filter(name='Source').count(), 1)
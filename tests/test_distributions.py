@@ -0,0 +1,229 @@
+import random
+from collections import Counter
+from unittest import mock
+
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from django_faker_admin.bulk import generate, resume
+from django_faker_admin.conf import settings
+from django_faker_admin.distributions import (
+    AliasTable, DistributionSampler, format_parameters, get_distribution_fields, get_distribution_samplers,
+    get_distribution_values, get_weights, parse_distribution
+)
+from django_faker_admin.models import PopulationRun
+
+from tests.testapp.models import TestCustomerModel, TestModel, TestOrderModel
+from tests.testapp.factory import TestModelFactory, TestOrderModelFactory
+
+from tests.test_checkpoints import interrupt_after
+
+
+User = get_user_model()
+
+
+class AliasTableTestCase(TestCase):
+
+    def test_frequencies_follow_the_weights(self):
+        table = AliasTable([1, 0, 3, 6])
+        randgen = random.Random(0)
+
+        counts = Counter(table.sample(randgen) for _ in range(20000))
+
+        self.assertNotIn(1, counts)
+        for index, weight in ((0, 0.1), (2, 0.3), (3, 0.6)):
+            self.assertAlmostEqual(counts[index] / 20000, weight, delta=0.02)
+
+    def test_invalid_weights(self):
+        for weights in ([], [0, 0], [1, -1]):
+            with self.assertRaises(ValueError):
+                AliasTable(weights)
+
+    def test_weights(self):
+        values = ['a', 'b', 'c', 'd']
+        self.assertEqual(get_weights('uniform', values), [1.0] * 4)
+        self.assertEqual(get_weights({'kind': 'zipf', 'exponent': 1}, values), [1.0, 0.5, 1 / 3, 0.25])
+        normal = get_weights({'kind': 'normal', 'mean': 0.5, 'stddev': 0.1}, values)
+        self.assertEqual(normal[1], normal[2])
+        self.assertGreater(normal[1], normal[0] * 10)
+        self.assertEqual(get_weights({'kind': 'weights', 'weights': {'b': 2, 'd': 1}}, values), [0.0, 2.0, 0.0, 1.0])
+        with self.assertRaisesMessage(ValueError, 'Unknown value(s) e.'):
+            get_weights({'kind': 'weights', 'weights': {'b': 2, 'e': 1}}, values)
+        with self.assertRaises(ValueError):
+            get_weights('pareto', values)
+
+    def test_zipf_makes_hot_values(self):
+        sampler = DistributionSampler(range(100), {'kind': 'zipf', 'exponent': 1.2})
+        randgen = random.Random(3)
+
+        counts = Counter(sampler(randgen) for _ in range(10000))
+
+        self.assertGreater(counts[0], counts[1] > counts[10])
+        # The 10 hottest values out of 100 get most of the draws
+        self.assertGreater(sum(counts[value] for value in range(10)), 6000)
+
+    def test_parse_and_format(self):
+        self.assertEqual(parse_distribution('zipf', '1.5'), {'kind': 'zipf', 'exponent': 1.5})
+        self.assertEqual(parse_distribution('zipf'), {'kind': 'zipf', 'exponent': 1.0})
+        self.assertEqual(parse_distribution('normal', '0.2, 0.05'), {'kind': 'normal', 'mean': 0.2, 'stddev': 0.05})
+        weights = parse_distribution('weights', 'paid=8, refunded=1')
+        self.assertEqual(weights, {'kind': 'weights', 'weights': {'paid': 8.0, 'refunded': 1.0}})
+        self.assertEqual(format_parameters(weights), 'paid=8, refunded=1')
+        self.assertEqual(format_parameters({'kind': 'normal', 'mean': 0.2, 'stddev': 0.05}), '0.2, 0.05')
+        for kind, parameters in (('weights', 'paid'), ('weights', ''), ('normal', '0.5, 0'), ('zipf', 'x')):
+            with self.assertRaises(ValueError):
+                parse_distribution(kind, parameters)
+
+
+class DistributionsTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+        cls.url = reverse('admin:testapp_testordermodel_populate_dummy_data')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def setUp(self):
+        self.customers = TestCustomerModel.objects.bulk_create(
+            TestCustomerModel(name=f'Customer {i}') for i in range(20)
+        )
+
+    def test_distribution_fields(self):
+        self.assertEqual([field.name for field in get_distribution_fields(TestOrderModel)], ['customer', 'status'])
+        self.assertEqual(get_distribution_fields(TestModel), [])
+        with self.assertRaises(ValueError):
+            get_distribution_samplers(TestModel, {'name': 'uniform'}, 'default')
+
+    def test_skewed_foreign_keys_point_at_existing_rows(self):
+        written = generate(
+            TestOrderModelFactory, 1000, seed=1, strategy='bulk', chunk_size=100,
+            distributions={'customer': {'kind': 'zipf', 'exponent': 1.5}, 'status': {'kind': 'weights', 'weights': {
+                'paid': 3, 'shipped': 1,
+            }}}
+        )
+
+        self.assertEqual(written, 1000)
+        # No customer was created by the SubFactory
+        self.assertEqual(TestCustomerModel.objects.count(), 20)
+        per_customer = Counter(TestOrderModel.objects.values_list('customer_id', flat=True))
+        self.assertEqual(per_customer.most_common(1)[0][0], self.customers[0].pk)
+        self.assertGreater(per_customer[self.customers[0].pk], 3 * per_customer[self.customers[5].pk])
+        statuses = Counter(TestOrderModel.objects.values_list('status', flat=True))
+        self.assertEqual(set(statuses), {'paid', 'shipped'})
+        self.assertGreater(statuses['paid'], 2 * statuses['shipped'])
+        run = PopulationRun.objects.get()
+        self.assertEqual(run.options['distributions']['customer'], {'kind': 'zipf', 'exponent': 1.5})
+
+    def test_seeded_runs_are_reproducible(self):
+        rows = TestOrderModel.objects.order_by('pk').values_list('customer_id', 'status')
+        distributions = {'customer': 'zipf', 'status': 'uniform'}
+
+        generate(TestOrderModelFactory, 50, seed=4, strategy='bulk', distributions=distributions)
+        first = list(rows.all())
+        TestOrderModel.objects.all().delete()
+        generate(TestOrderModelFactory, 50, seed=4, strategy='bulk', distributions=distributions)
+
+        self.assertEqual(list(rows.all()), first)
+
+    def test_interrupted_run_resumes_with_its_distributions(self):
+        with interrupt_after(2), self.assertRaises(RuntimeError):
+            generate(
+                TestOrderModelFactory, 30, seed=2, strategy='bulk', chunk_size=10, writers=1,
+                distributions={'status': {'kind': 'weights', 'weights': {'refunded': 1}}}
+            )
+
+        self.assertEqual(resume(PopulationRun.objects.get(), writers=1), 30)
+        self.assertEqual(set(TestOrderModel.objects.values_list('status', flat=True)), {'refunded'})
+
+    def test_invalid_distributions(self):
+        with self.assertRaises(ValueError):
+            generate(TestOrderModelFactory, 5, strategy='per_row', distributions={'status': 'uniform'})
+        with self.assertRaises(ValueError):
+            generate(TestModelFactory, 5, strategy='bulk', distributions={'name': 'uniform'})
+        with self.assertRaises(ValueError):
+            generate(
+                TestOrderModelFactory, 5, strategy='bulk',
+                distributions={'status': {'kind': 'weights', 'weights': {'unknown': 1}}}
+            )
+        TestCustomerModel.objects.all().delete()
+        with self.assertRaises(ValueError):
+            generate(TestOrderModelFactory, 5, strategy='bulk', distributions={'customer': 'uniform'})
+        self.assertFalse(PopulationRun.objects.exists())
+
+    def test_foreign_keys_point_at_a_limited_number_of_rows(self):
+        field = TestOrderModel._meta.get_field('customer')
+
+        self.assertEqual(len(get_distribution_values(field, 'default', max_rows=20)), 20)
+        with self.assertRaises(ValueError):
+            get_distribution_values(field, 'default', max_rows=19)
+        with mock.patch.dict(settings.explicit_overridden_settings, {'FAKER_ADMIN_DISTRIBUTION_MAX_ROWS': 10}):
+            with self.assertRaisesMessage(ValueError, 'more than 10 rows'):
+                generate(TestOrderModelFactory, 5, strategy='bulk', distributions={'customer': 'uniform'})
+        with mock.patch.dict(settings.explicit_overridden_settings, {'FAKER_ADMIN_DISTRIBUTION_MAX_ROWS': None}):
+            self.assertEqual(len(get_distribution_values(field, 'default')), 20)
+
+    def test_populate_form_distributions(self):
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(self.url)
+        self.assertContains(response, 'name="distribution_customer_0"')
+        self.assertContains(response, 'name="distribution_status_0"')
+        # The admin's distributions are the initial values
+        self.assertContains(response, '<option value="zipf" selected>')
+        self.assertContains(response, 'value="1.5"')
+
+        response = self.client.post(self.url, {
+            'size': 40,
+            'distribution_customer_0': 'weights',
+            'distribution_customer_1': f'{self.customers[3].pk}=1',
+            'distribution_status_0': 'uniform',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(set(TestOrderModel.objects.values_list('customer_id', flat=True)), {self.customers[3].pk})
+        self.assertEqual(TestCustomerModel.objects.count(), 20)
+        self.assertEqual(PopulationRun.objects.get().options['distributions'], {
+            'customer': {'kind': 'weights', 'weights': {str(self.customers[3].pk): 1.0}},
+            'status': {'kind': 'uniform'},
+        })
+
+    def test_populate_form_falls_back_to_the_factory(self):
+        self.client.force_login(self.superuser)
+
+        self.client.post(self.url, {'size': 10, 'distribution_status_0': ''})
+
+        self.assertEqual(TestOrderModel.objects.count(), 10)
+        self.assertEqual(PopulationRun.objects.get().options['distributions'], None)
+
+    def test_populate_form_errors(self):
+        self.client.force_login(self.superuser)
+
+        response = self.client.post(self.url, {
+            'size': 10, 'distribution_status_0': 'weights', 'distribution_status_1': 'paid',
+        })
+        self.assertContains(response, 'Invalid weight')
+        response = self.client.post(self.url, {
+            'size': 10, 'distribution_status_0': 'weights', 'distribution_status_1': 'paid=1, lost=2',
+        })
+        self.assertContains(response, 'Unknown value(s) lost.')
+        response = self.client.post(self.url, {
+            'size': 10, 'customer': self.customers[0].pk, 'distribution_customer_0': 'zipf',
+        })
+        self.assertContains(response, 'Set either a value or a distribution, not both.')
+        self.assertFalse(TestOrderModel.objects.exists())
+
+    def test_per_row_populate_form_has_no_distributions(self):
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(reverse('admin:testapp_testchildmodel_populate_dummy_data'))
+
+        self.assertNotContains(response, 'distribution_customer')
@@ -0,0 +1,36 @@
+from unittest import mock
+
+import factory
+from django.apps import apps
+from django.test import SimpleTestCase
+
+from django_faker_admin.conf import settings
+from django_faker_admin.fakers import registry, get_faker
+from django_faker_admin.plans import compile_plan
+
+from tests.testapp.factory import TestModelFactory
+
+
+class FakerRegistryTestCase(SimpleTestCase):
+
+    def test_instances_are_shared(self):
+        self.assertIs(get_faker('en_US'), get_faker('en_US'))
+        self.assertIs(get_faker(), get_faker(factory.Faker._DEFAULT_LOCALE))
+
+    def test_instances_are_shared_with_factory_boy(self):
+        self.assertIs(get_faker('fr_FR'), factory.Faker._get_faker('fr_FR'))
+
+    def test_prewarm_on_ready(self):
+        with mock.patch.dict(factory.Faker._FAKER_REGISTRY, clear=True):
+            with mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_FAKER_LOCALES=['de_DE', 'it_IT']):
+                apps.get_app_config('django_faker_admin').ready()
+
+            self.assertEqual(set(registry.instances), {'de_DE', 'it_IT'})
+
+    def test_plans_use_the_registry(self):
+        plan = compile_plan(TestModelFactory)
+
+        with mock.patch.object(registry, 'get', wraps=registry.get) as get:
+            plan.build(1)
+
+        self.assertTrue(get.called)
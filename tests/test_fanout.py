@@ -0,0 +1,140 @@
+from io import StringIO
+
+from django.db.models import Count
+from django.urls import reverse
+from django.contrib.admin import helpers
+from django.contrib.auth import get_user_model
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from django_faker_admin.fanout import FAN_OUT_STRATEGY, fan_out, get_fan_out_relations
+from django_faker_admin.models import PopulationRun
+from django_faker_admin.purge import purge
+
+from tests.testapp.models import TestChildModel, TestParentModel
+from tests.testapp.factory import TestChildModelFactory, TestModelFactory
+
+
+User = get_user_model()
+
+
+class FanOutTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def setUp(self):
+        self.parents = [TestParentModel.objects.create(name=f'Parent {i}') for i in range(4)]
+
+    def get_counts(self):
+        return dict(TestParentModel.objects.annotate(count=Count('children')).values_list('pk', 'count'))
+
+    def test_children_per_parent(self):
+        written = fan_out(TestChildModelFactory, 'parent', TestParentModel.objects.all(), counts=(2, 5), chunk_size=3)
+
+        counts = self.get_counts()
+        self.assertEqual(written, sum(counts.values()))
+        self.assertEqual(TestChildModel.objects.count(), written)
+        self.assertTrue(all(2 <= count <= 5 for count in counts.values()))
+        # The SubFactory of the parent is not used
+        self.assertEqual(TestParentModel.objects.count(), 4)
+
+    def test_selected_parents_only(self):
+        selected = TestParentModel.objects.filter(pk__in=[self.parents[0].pk, self.parents[2].pk])
+
+        written = fan_out(TestChildModelFactory, 'parent', selected, counts=3)
+
+        self.assertEqual(written, 6)
+        self.assertEqual(self.get_counts(), {
+            self.parents[0].pk: 3, self.parents[1].pk: 0, self.parents[2].pk: 3, self.parents[3].pk: 0,
+        })
+
+    def test_seeded_fan_out_is_reproducible(self):
+        rows = TestChildModel.objects.order_by('pk').values_list('parent_id', 'name')
+
+        fan_out(TestChildModelFactory, 'parent', TestParentModel.objects.all(), counts=(0, 6), seed=5)
+        first = list(rows.all())
+        TestChildModel.objects.all().delete()
+        fan_out(TestChildModelFactory, 'parent', TestParentModel.objects.all(), counts=(0, 6), seed=5)
+
+        self.assertEqual(list(rows.all()), first)
+
+    def test_run_is_tracked(self):
+        written = fan_out(TestChildModelFactory, 'parent', TestParentModel.objects.all(), counts=(1, 3))
+
+        run = PopulationRun.objects.get()
+        self.assertEqual(run.strategy, FAN_OUT_STRATEGY)
+        self.assertEqual(run.status, PopulationRun.Status.FINISHED)
+        self.assertEqual(run.size, written)
+        self.assertEqual(run.rows_written, written)
+        self.assertEqual(purge(TestChildModel), written)
+
+    def test_invalid_fan_out(self):
+        with self.assertRaises(ValueError):
+            fan_out(TestChildModelFactory, 'tags', TestParentModel.objects.all(), counts=1)
+        with self.assertRaises(ValueError):
+            fan_out(TestChildModelFactory, 'parent', TestChildModel.objects.all(), counts=1)
+        with self.assertRaises(ValueError):
+            fan_out(TestChildModelFactory, 'parent', TestParentModel.objects.all(), counts=(3, 1))
+        with self.assertRaises(ValueError):
+            fan_out(TestModelFactory, 'parent', TestParentModel.objects.all(), counts=1)
+        self.assertFalse(PopulationRun.objects.exists())
+
+    def test_fan_out_relations(self):
+        self.assertEqual(
+            [(field.model, field.name) for field in get_fan_out_relations(TestParentModel)],
+            [(TestChildModel, 'parent')]
+        )
+
+    def test_generate_children_action(self):
+        url = reverse('admin:testapp_testparentmodel_changelist')
+        self.client.force_login(self.superuser)
+        data = {'action': 'generate_children', helpers.ACTION_CHECKBOX_NAME: [self.parents[0].pk]}
+
+        response = self.client.post(url, data)
+        self.assertContains(response, 'generate-children-form')
+        self.assertContains(response, 'testapp.testchildmodel:parent')
+
+        response = self.client.post(url, {
+            **data, 'post': 'yes', 'relation': 'testapp.testchildmodel:parent', 'min_count': 2, 'max_count': 2,
+        })
+        self.assertRedirects(response, url, fetch_redirect_response=False)
+        self.assertEqual(self.get_counts()[self.parents[0].pk], 2)
+        self.assertEqual(TestChildModel.objects.count(), 2)
+
+        self.client.post(url, {
+            **data, 'post': 'yes', 'relation': 'testapp.testchildmodel:parent', 'min_count': 1, 'max_count': 1,
+            'all_rows': 'on',
+        })
+        self.assertEqual(TestChildModel.objects.count(), 6)
+
+    def test_generate_children_invalid_counts(self):
+        url = reverse('admin:testapp_testparentmodel_changelist')
+        self.client.force_login(self.superuser)
+
+        response = self.client.post(url, {
+            'action': 'generate_children', helpers.ACTION_CHECKBOX_NAME: [self.parents[0].pk], 'post': 'yes',
+            'relation': 'testapp.testchildmodel:parent', 'min_count': 5, 'max_count': 2,
+        })
+
+        self.assertContains(response, 'The minimum should not exceed the maximum.')
+        self.assertFalse(TestChildModel.objects.exists())
+
+    def test_populate_command_per_parent(self):
+        out = StringIO()
+
+        call_command('faker_populate', 'testapp.TestChildModel', '--per-parent', 'parent=2', stdout=out)
+
+        self.assertEqual(TestChildModel.objects.count(), 8)
+        self.assertIn('8 testapp.TestChildModel objects', out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command('faker_populate', 'testapp.TestChildModel', '--per-parent', 'parent')
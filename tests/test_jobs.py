@@ -0,0 +1,230 @@
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from django_faker_admin.bulk import BulkGenerator
+from django_faker_admin.conf import settings
+from django_faker_admin.jobs import Worker, claim_job, enqueue, heartbeat, requeue_stalled, run_job
+from django_faker_admin.models import PopulationJob, PopulationRun
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory
+from tests.test_checkpoints import interrupt_after
+
+
+User = get_user_model()
+
+
+class JobTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def get_worker(self, name='worker-1', **kwargs):
+        kwargs.setdefault('heartbeat_interval', 3600)
+        return Worker(name=name, **kwargs)
+
+    def test_enqueue(self):
+        job = enqueue(TestModelFactory, 5, overrides={'name': 'Queued'}, seed=3, strategy='bulk')
+
+        self.assertEqual(job.status, PopulationJob.Status.QUEUED)
+        self.assertEqual(job.factory_path, 'tests.testapp.factory.TestModelFactory')
+        self.assertEqual(job.content_type.model_class(), TestModel)
+        self.assertEqual(job.options['seed'], 3)
+        self.assertFalse(TestModel.objects.exists())
+
+    def test_worker_runs_queued_jobs(self):
+        first = enqueue(TestModelFactory, 5, overrides={'name': 'Queued'}, strategy='bulk', chunk_size=2)
+        second = enqueue(TestModelFactory, 3)
+
+        processed = self.get_worker().run(burst=True)
+
+        self.assertEqual(processed, 2)
+        self.assertEqual(TestModel.objects.count(), 8)
+        self.assertEqual(TestModel.objects.filter(name='Queued').count(), 5)
+        for job, size in ((first, 5), (second, 3)):
+            job.refresh_from_db()
+            self.assertEqual(job.status, PopulationJob.Status.FINISHED)
+            self.assertEqual(job.rows_written, size)
+            self.assertEqual(job.attempts, 1)
+            self.assertEqual(job.worker, 'worker-1')
+            self.assertEqual(PopulationRun.objects.get(pk=job.run_pk).status, PopulationRun.Status.FINISHED)
+
+    def test_claim_job_is_exclusive(self):
+        job = enqueue(TestModelFactory, 1)
+
+        claimed = claim_job('worker-1')
+
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.status, PopulationJob.Status.RUNNING)
+        self.assertIsNone(claim_job('worker-2'))
+
+    def test_heartbeat(self):
+        enqueue(TestModelFactory, 1)
+        job = claim_job('worker-1')
+
+        self.assertTrue(heartbeat(job))
+        PopulationJob.objects.filter(pk=job.pk).update(worker='worker-2')
+        self.assertFalse(heartbeat(job))
+
+    def test_requeue_stalled(self):
+        enqueue(TestModelFactory, 1)
+        enqueue(TestModelFactory, 1)
+        stalled = claim_job('worker-1')
+        alive = claim_job('worker-2')
+        PopulationJob.objects.filter(pk=stalled.pk).update(heartbeat_at=timezone.now() - timedelta(minutes=5))
+
+        self.assertEqual(requeue_stalled(60), 1)
+
+        stalled.refresh_from_db()
+        alive.refresh_from_db()
+        self.assertEqual(stalled.status, PopulationJob.Status.QUEUED)
+        self.assertEqual(stalled.worker, '')
+        self.assertEqual(alive.status, PopulationJob.Status.RUNNING)
+
+    def test_job_stalling_too_often_fails(self):
+        enqueue(TestModelFactory, 1)
+        job = claim_job('worker-1')
+        PopulationJob.objects.filter(pk=job.pk).update(
+            attempts=3, heartbeat_at=timezone.now() - timedelta(minutes=5)
+        )
+
+        self.assertEqual(requeue_stalled(60, max_attempts=3), 0)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, PopulationJob.Status.FAILED)
+        self.assertIn('stalled 3 times', job.error)
+
+    def test_stalled_job_resumes_its_run(self):
+        enqueue(TestModelFactory, 20, seed=11, strategy='bulk', chunk_size=4)
+        job = claim_job('worker-1')
+        with interrupt_after(2), self.assertRaises(RuntimeError):
+            run_job(job)
+        PopulationJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(minutes=5))
+
+        self.assertEqual(self.get_worker('worker-2', stall_timeout=60).run(burst=True), 1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, PopulationJob.Status.FINISHED)
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(job.rows_written, 20)
+        self.assertEqual(TestModel.objects.count(), 20)
+        self.assertEqual(PopulationRun.objects.count(), 1)
+
+    def test_worker_losing_its_job_stops_the_run(self):
+        job = enqueue(TestModelFactory, 20, seed=11, strategy='bulk', chunk_size=4)
+        insert_chunk = BulkGenerator.insert_chunk
+
+        def slow_insert_chunk(self, objs):
+            time.sleep(0.1)
+            return insert_chunk(self, objs)
+
+        with mock.patch('django_faker_admin.jobs.heartbeat', return_value=False):
+            with mock.patch.object(BulkGenerator, 'insert_chunk', autospec=True, side_effect=slow_insert_chunk):
+                self.get_worker(heartbeat_interval=0.01).run_once()
+
+        job.refresh_from_db()
+        run = PopulationRun.objects.get()
+        self.assertEqual(job.status, PopulationJob.Status.RUNNING)
+        self.assertEqual(run.status, PopulationRun.Status.CANCELLED)
+        self.assertLess(run.rows_written, 20)
+        self.assertEqual(TestModel.objects.count(), run.rows_written)
+
+        # The job stalls, and the next worker resumes the cancelled run
+        PopulationJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(minutes=5))
+        self.get_worker('worker-2', stall_timeout=60).run(burst=True)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, PopulationJob.Status.FINISHED)
+        self.assertEqual(TestModel.objects.count(), 20)
+        self.assertEqual(PopulationRun.objects.get().status, PopulationRun.Status.FINISHED)
+
+    def test_failed_job_records_the_error(self):
+        job = enqueue(TestModelFactory, 5, strategy='bulk', chunk_size=2)
+
+        with interrupt_after(1):
+            self.get_worker().run(burst=True)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, PopulationJob.Status.FAILED)
+        self.assertIn('Worker restarted', job.error)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_interrupted_worker_requeues_its_job(self):
+        job = enqueue(TestModelFactory, 5)
+
+        with mock.patch('django_faker_admin.jobs.run_job', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.get_worker().run_once()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, PopulationJob.Status.QUEUED)
+        self.assertEqual(job.attempts, 1)
+
+    def test_worker_command(self):
+        enqueue(TestModelFactory, 4)
+        out = StringIO()
+
+        call_command(
+            'faker_worker', '--burst', '--name', 'command-worker', '--heartbeat-interval', '3600',
+            '--stall-timeout', '7200', stdout=out
+        )
+
+        self.assertEqual(TestModel.objects.count(), 4)
+        self.assertIn('finished', out.getvalue())
+        self.assertEqual(PopulationJob.objects.get().worker, 'command-worker')
+
+    def test_populate_command_enqueue(self):
+        call_command(
+            'faker_populate', 'testapp.TestModel', '--size', '7', '--enqueue', '--seed', '2', stdout=StringIO()
+        )
+
+        job = PopulationJob.objects.get()
+        self.assertEqual(job.size, 7)
+        self.assertEqual(job.options['seed'], 2)
+        self.assertFalse(TestModel.objects.exists())
+
+    def test_populate_command_cannot_enqueue_a_profile(self):
+        with self.assertRaisesMessage(CommandError, "'--profile' is not supported with '--enqueue'."):
+            call_command(
+                'faker_populate', 'testapp.TestModel', '--size', '7', '--enqueue', '--profile', stdout=StringIO()
+            )
+
+        self.assertFalse(PopulationJob.objects.exists())
+
+    def test_view_cannot_enqueue_a_profile(self):
+        self.client.force_login(self.superuser)
+        url = reverse('admin:testapp_testmodel_populate_dummy_data')
+
+        with mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_USE_QUEUE=True):
+            response = self.client.post(url, {'size': 6, 'profile': 'on'})
+
+        self.assertContains(response, 'A queued population cannot be profiled.')
+        self.assertFalse(PopulationJob.objects.exists())
+
+    def test_view_enqueues_with_use_queue(self):
+        self.client.force_login(self.superuser)
+        url = reverse('admin:testapp_testmodel_populate_dummy_data')
+
+        with mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_USE_QUEUE=True):
+            response = self.client.post(url, {'size': 6}, follow=True)
+
+        self.assertEqual(PopulationJob.objects.get().size, 6)
+        self.assertFalse(TestModel.objects.exists())
+        self.assertContains(response, '1 population job was queued.')
@@ -0,0 +1,187 @@
+import json
+import random
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.db import connection
+from django.utils import timezone
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_faker_admin.bulk import generate
+from django_faker_admin.learning import (
+    get_profiled_fields, get_value_samplers, learn_value_profile, load_value_profile, save_value_profile
+)
+from django_faker_admin.models import PopulationRun
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory
+
+
+class LearningTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    def setUp(self):
+        names = ['Alice'] * 5 + ['Bob'] * 3 + ['Carol', 'Dave']
+        TestModel.objects.bulk_create(
+            TestModel(name=name, description='x' * (10 + index)) for index, name in enumerate(names)
+        )
+
+    def create_runs(self):
+        content_type = ContentType.objects.get_for_model(TestModel)
+        now = timezone.now()
+        PopulationRun.objects.bulk_create(
+            PopulationRun(
+                content_type=content_type,
+                size=size,
+                strategy='bulk',
+                status=PopulationRun.Status.FINISHED if index % 2 else PopulationRun.Status.FAILED,
+                finished_at=now - timedelta(days=index) if index % 4 else None,
+            )
+            for index, size in enumerate([10, 10, 10, 20, 50, 100, 100, 1000])
+        )
+
+    def test_profiled_fields(self):
+        self.assertEqual([field.name for field in get_profiled_fields(TestModel)], ['name', 'description'])
+        fields = [field.name for field in get_profiled_fields(PopulationRun)]
+        self.assertIn('size', fields)
+        self.assertNotIn('content_type', fields)
+        self.assertNotIn('created_at', fields)
+        self.assertNotIn('id', fields)
+
+    def test_learn_text_fields(self):
+        profile = learn_value_profile(TestModel, bins=4)
+
+        self.assertEqual(profile['model'], 'testapp.testmodel')
+        self.assertEqual(profile['rows'], 10)
+        name = profile['fields']['name']
+        self.assertEqual(name['kind'], 'text')
+        self.assertEqual(name['nulls'], 0.0)
+        self.assertEqual(name['distinct'], 4)
+        # Values seen once are not kept
+        self.assertEqual(name['top'], [['Alice', 5], ['Bob', 3]])
+        lengths = profile['fields']['description']['lengths']
+        self.assertEqual(lengths['edges'], [10.0, 12.25, 14.5, 16.75, 19.0])
+        self.assertEqual(lengths['counts'], [3, 2, 2, 3])
+
+    def test_learn_numbers_and_datetimes(self):
+        self.create_runs()
+
+        profile = learn_value_profile(PopulationRun, fields=['size', 'status', 'finished_at'], bins=5)
+
+        size = profile['fields']['size']
+        self.assertEqual(size['top'], [[10, 3], [100, 2]])
+        self.assertEqual(size['histogram']['edges'][0], 10.0)
+        self.assertEqual(size['histogram']['edges'][-1], 1000.0)
+        self.assertEqual(sum(size['histogram']['counts']), 8)
+        self.assertEqual(profile['fields']['status']['distinct'], 2)
+        finished_at = profile['fields']['finished_at']
+        self.assertEqual(finished_at['kind'], 'datetime')
+        self.assertEqual(finished_at['nulls'], 0.25)
+        self.assertEqual(sum(finished_at['histogram']['counts']), 6)
+
+    def test_learning_only_runs_aggregate_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            learn_value_profile(TestModel)
+
+        self.assertTrue(queries.captured_queries)
+        for query in queries.captured_queries:
+            self.assertTrue(any(name in query['sql'] for name in ('COUNT(', 'MIN(')), query['sql'])
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            learn_value_profile(TestModel, fields=['id'])
+
+    def test_samplers(self):
+        self.create_runs()
+        profile = learn_value_profile(PopulationRun, fields=['size', 'status', 'finished_at'])
+        samplers = get_value_samplers(PopulationRun, profile)
+        randgen = random.Random(1)
+
+        statuses = {samplers['status'](randgen, '') for _ in range(200)}
+        self.assertEqual(statuses, {PopulationRun.Status.FINISHED, PopulationRun.Status.FAILED})
+        sizes = [samplers['size'](randgen, 0) for _ in range(500)]
+        self.assertTrue(all(10 <= size <= 1000 for size in sizes))
+        self.assertTrue(all(isinstance(size, int) for size in sizes))
+        # 10 and 100 are 5 rows out of 8
+        self.assertGreater(sum(size in (10, 100) for size in sizes), 250)
+        finished = [samplers['finished_at'](randgen, None) for _ in range(500)]
+        self.assertTrue(50 < finished.count(None) < 200)
+        self.assertTrue(all(value is None or timezone.is_aware(value) for value in finished))
+
+    def test_samplers_do_not_draw_the_most_frequent_values_twice(self):
+        self.create_runs()
+        profile = learn_value_profile(PopulationRun, fields=['size'])
+        sampler = get_value_samplers(PopulationRun, profile)['size']
+        randgen = random.Random(2)
+
+        sizes = [sampler(randgen, 0) for _ in range(2000)]
+        # The two rows of 100 are its whole bucket, which the histogram no longer draws from
+        self.assertFalse([size for size in sizes if 60 <= size < 109 and size != 100])
+        self.assertAlmostEqual(sizes.count(100) / len(sizes), 2 / 8, delta=0.04)
+
+    def test_samplers_of_another_model(self):
+        profile = learn_value_profile(TestModel)
+
+        with self.assertRaises(ValueError):
+            get_value_samplers(PopulationRun, profile)
+
+    def test_generate_from_profile(self):
+        profile = learn_value_profile(TestModel, fields=['name', 'description'], top=2)
+        profile['fields']['name']['distinct'] = 2
+        TestModel.objects.all().delete()
+
+        written = generate(TestModelFactory, 40, seed=3, strategy='bulk', chunk_size=7, value_profile=profile)
+
+        self.assertEqual(written, 40)
+        self.assertEqual(set(TestModel.objects.values_list('name', flat=True)), {'Alice', 'Bob'})
+        self.assertTrue(all(10 <= len(text) <= 19 for text in TestModel.objects.values_list('description', flat=True)))
+        self.assertEqual(PopulationRun.objects.get().options['value_profile'], profile)
+
+    def test_per_row_strategy_is_not_supported(self):
+        with self.assertRaises(ValueError):
+            generate(TestModelFactory, 5, strategy='per_row', value_profile=learn_value_profile(TestModel))
+        self.assertFalse(PopulationRun.objects.exists())
+
+    def test_learn_and_populate_commands(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'profile.json'
+            out = StringIO()
+
+            call_command('faker_learn', 'testapp.TestModel', '--field', 'name', '--output', str(path), stdout=out)
+            self.assertIn('1 fields of 10 testapp.TestModel rows', out.getvalue())
+            self.assertEqual(load_value_profile(path)['fields']['name']['top'], [['Alice', 5], ['Bob', 3]])
+
+            call_command(
+                'faker_populate', 'testapp.TestModel', '--size', '20', '--value-profile', str(path), stdout=out
+            )
+            self.assertEqual(TestModel.objects.count(), 30)
+
+            path.write_text('{}')
+            with self.assertRaises(CommandError):
+                call_command('faker_populate', 'testapp.TestModel', '--size', '5', '--value-profile', str(path))
+
+        out = StringIO()
+        call_command('faker_learn', 'testapp.TestModel', '--bins', '2', stdout=out)
+        self.assertEqual(json.loads(out.getvalue())['rows'], 30)
+
+    def test_save_and_load(self):
+        self.create_runs()
+        profile = learn_value_profile(PopulationRun, fields=['finished_at'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'profile.json'
+            save_value_profile(profile, path)
+            loaded = load_value_profile(path)
+
+        self.assertEqual(loaded['fields']['finished_at']['histogram'], profile['fields']['finished_at']['histogram'])
+        self.assertEqual(get_value_samplers(PopulationRun, loaded).keys(), {'finished_at'})
@@ -0,0 +1,149 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from django_faker_admin.load import LOAD_STRATEGY, LoadGenerator, LoadReport, TokenBucket, generate_load
+from django_faker_admin.models import PopulationRun
+from django_faker_admin.purge import purge
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory
+
+
+class VirtualClock:
+    """
+    A clock that only moves forward when slept on, so that pacing can be tested without waiting.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.waits = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.waits.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTestCase(TestCase):
+
+    def test_paces_events(self):
+        bucket = TokenBucket(rate=10, now=0)
+
+        self.assertEqual(bucket.consume(0), 0)
+        self.assertAlmostEqual(bucket.consume(0), 0.1)
+        self.assertAlmostEqual(bucket.consume(0.05), 0.05)
+        self.assertEqual(bucket.consume(0.1), 0)
+        self.assertAlmostEqual(bucket.consume(0.1, cost=0.5), 0.05)
+
+    def test_capacity_bounds_bursts(self):
+        bucket = TokenBucket(rate=10, capacity=3, now=0)
+
+        waits = [bucket.consume(100) for _ in range(4)]
+
+        self.assertEqual(waits[:3], [0, 0, 0])
+        self.assertAlmostEqual(waits[3], 0.1)
+
+    def test_set_rate(self):
+        bucket = TokenBucket(rate=1, now=0)
+        bucket.consume(0)
+        bucket.set_rate(3, 0.5)
+
+        # Half a second at a mean rate of two tokens per second
+        self.assertEqual(bucket.consume(0.5), 0)
+
+    def test_rejects_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class LoadGeneratorTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    def get_generator(self, **kwargs):
+        generator = LoadGenerator(TestModelFactory, **kwargs)
+        self.clock = VirtualClock()
+        generator.clock = self.clock.time
+        generator.sleep = self.clock.sleep
+        return generator
+
+    def test_inserts_at_target_rate(self):
+        report = self.get_generator(rate=50, duration=2).run()
+
+        self.assertAlmostEqual(report.rows, 100, delta=1)
+        self.assertEqual(TestModel.objects.count(), report.rows)
+        self.assertAlmostEqual(report.achieved_rate, 50, delta=0.5)
+        self.assertAlmostEqual(report.accuracy, 1, delta=0.01)
+        self.assertEqual(len(report.latencies), report.rows)
+
+    def test_ramp_up(self):
+        generator = self.get_generator(rate=100, duration=2, ramp_up=2)
+        report = generator.run()
+
+        self.assertAlmostEqual(generator.expected_rows(2), 100)
+        self.assertAlmostEqual(report.rows, 100, delta=2)
+        # The rate grows, so the waits shrink
+        self.assertGreater(self.clock.waits[1], self.clock.waits[-1])
+
+    def test_jitter_keeps_the_average_rate(self):
+        generator = self.get_generator(rate=50, duration=4, jitter=0.5, seed=3)
+        report = generator.run()
+
+        self.assertAlmostEqual(report.achieved_rate, 50, delta=2)
+        self.assertGreater(len(set(round(wait, 6) for wait in self.clock.waits)), 1)
+
+    def test_flush_and_cancel(self):
+        generator = self.get_generator(rate=10, duration=10, flush_interval=1)
+        flushed = []
+        generator.flush = flushed.append
+        generator.cancel_check = lambda: len(flushed) == 2
+        report = generator.run()
+
+        self.assertTrue(generator.cancelled)
+        self.assertEqual(sum(len(objs) for objs in flushed), report.rows)
+        self.assertLess(report.rows, 30)
+
+    def test_rejects_invalid_arguments(self):
+        for kwargs in ({'rate': 0, 'duration': 1}, {'rate': 1, 'duration': 1, 'jitter': 1},
+                       {'rate': 1, 'duration': 1, 'ramp_up': -1}):
+            with self.assertRaises(ValueError):
+                LoadGenerator(TestModelFactory, **kwargs)
+
+    def test_report_percentiles(self):
+        report = LoadReport(target_rate=1, expected_rows=4, rows=4, elapsed=4, latencies=[0.4, 0.1, 0.3, 0.2])
+
+        self.assertEqual(report.percentile(50), 0.2)
+        self.assertEqual(report.percentile(100), 0.4)
+        self.assertEqual(report.as_dict()['latency_p90'], 0.4)
+        self.assertEqual(report.achieved_rate, 1)
+
+    def test_generate_load_is_tracked(self):
+        report = generate_load(TestModelFactory, rate=200, duration=0.2)
+
+        run = PopulationRun.objects.get()
+        self.assertEqual(run.strategy, LOAD_STRATEGY)
+        self.assertEqual(run.status, PopulationRun.Status.FINISHED)
+        self.assertEqual(run.rows_written, report.rows)
+        self.assertEqual(purge(TestModel), report.rows)
+
+    def test_load_command(self):
+        out = StringIO()
+        call_command('faker_load', 'testapp.TestModel', '--rate', '100', '--duration', '0.2', stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('objects were successfully created', output)
+        self.assertIn('rows/s achieved', output)
+        self.assertIn('p99', output)
+
+    def test_load_command_invalid_rate(self):
+        with self.assertRaises(CommandError):
+            call_command('faker_load', 'testapp.TestModel', '--rate', '0', '--duration', '1', stdout=StringIO())
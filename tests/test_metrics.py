@@ -0,0 +1,136 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from django_faker_admin.bulk import generate
+from django_faker_admin.conf import settings
+from django_faker_admin.metrics import (
+    CHUNK_INSERT_DURATION, ROWS_GENERATED, RUNS, Counter, Histogram, Registry, registry, render_metrics
+)
+from django_faker_admin.models import PopulationRun
+
+from tests.testapp.factory import TestModelFactory
+from tests.test_checkpoints import interrupt_after
+
+
+User = get_user_model()
+
+
+class MetricsTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+        cls.url = reverse('admin:django_faker_admin_populationrun_metrics')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+        cls.staff = User.objects.create(username='staff', email='b@a.com', password='yyy', is_staff=True)
+
+    def setUp(self):
+        registry.reset()
+
+    def get_value(self, metric, index=0, **labels):
+        values = registry.collect().get(metric.name, {}).get(metric.get_labels(labels))
+        return values[index] if values else 0
+
+    def test_render_counter_and_histogram(self):
+        local = Registry()
+        counter = Counter('rows_total', "Rows.", ['model'], registry=local)
+        histogram = Histogram('latency_seconds', "Latency.", ['model'], buckets=(0.1, 1), registry=local)
+
+        counter.inc(3, model='app."m"')
+        histogram.observe(0.5, model='app.m')
+        histogram.observe(2, model='app.m')
+
+        text = local.render()
+        self.assertIn('# TYPE rows_total counter\n', text)
+        self.assertIn('rows_total{model="app.\\"m\\""} 3.0\n', text)
+        self.assertIn('# TYPE latency_seconds histogram\n', text)
+        self.assertIn('latency_seconds_bucket{model="app.m",le="0.1"} 0.0\n', text)
+        self.assertIn('latency_seconds_bucket{model="app.m",le="1.0"} 1.0\n', text)
+        self.assertIn('latency_seconds_bucket{model="app.m",le="+Inf"} 2.0\n', text)
+        self.assertIn('latency_seconds_sum{model="app.m"} 2.5\n', text)
+        self.assertIn('latency_seconds_count{model="app.m"} 2.0\n', text)
+
+    def test_labels_are_checked(self):
+        with self.assertRaises(ValueError):
+            ROWS_GENERATED.inc(model='testapp.testmodel', strategy='bulk')
+
+    def test_bulk_run_is_measured(self):
+        generate(TestModelFactory, 10, strategy='bulk', chunk_size=4, use_snapshots=False)
+
+        self.assertEqual(self.get_value(ROWS_GENERATED, model='testapp.testmodel'), 10)
+        self.assertEqual(self.get_value(CHUNK_INSERT_DURATION, index=-1, model='testapp.testmodel'), 3)
+        self.assertEqual(self.get_value(RUNS, model='testapp.testmodel', strategy='bulk', status='finished'), 1)
+
+    def test_failed_run_is_counted(self):
+        with interrupt_after(1), self.assertRaises(RuntimeError):
+            generate(TestModelFactory, 10, strategy='bulk', chunk_size=4, use_snapshots=False)
+
+        self.assertEqual(self.get_value(ROWS_GENERATED, model='testapp.testmodel'), 4)
+        self.assertEqual(self.get_value(RUNS, model='testapp.testmodel', strategy='bulk', status='failed'), 1)
+
+    def test_processes_are_aggregated_through_files(self):
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_METRICS_DIR=directory):
+            generate(TestModelFactory, 5, strategy='per_row')
+            # The file of another process
+            Path(directory, 'faker-metrics-other-1.json').write_text(json.dumps({
+                ROWS_GENERATED.name: [[['testapp.testmodel'], [7]]],
+            }))
+
+            self.assertEqual(self.get_value(ROWS_GENERATED, model='testapp.testmodel'), 12)
+            registry.reset()
+            self.assertEqual(self.get_value(ROWS_GENERATED, model='testapp.testmodel'), 7)
+
+    def test_files_are_flushed_periodically(self):
+        local = Registry(flush_interval=3600)
+        counter = Counter('rows_total', "Rows.", ['model'], registry=local)
+
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_METRICS_DIR=directory):
+            path = local.get_path(Path(directory))
+            counter.inc(model='a')
+            counter.inc(model='a')
+
+            self.assertEqual(json.loads(path.read_text()), {'rows_total': [[['a'], [1.0]]]})
+            local.flush()
+            self.assertEqual(json.loads(path.read_text()), {'rows_total': [[['a'], [2.0]]]})
+
+            counter.inc(model='a')
+            self.assertEqual(local.collect(), {'rows_total': {('a',): [3.0]}})
+
+    def test_endpoint(self):
+        generate(TestModelFactory, 5, strategy='bulk', use_snapshots=False)
+        PopulationRun.objects.create(
+            content_type=PopulationRun.objects.get().content_type, size=5, strategy='bulk'
+        )
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        text = response.content.decode()
+        self.assertIn('faker_admin_rows_generated_total{model="testapp.testmodel"} 5.0', text)
+        self.assertIn('faker_admin_active_runs{model="testapp.testmodel"} 1.0', text)
+        self.assertEqual(text, render_metrics())
+
+    def test_endpoint_is_protected(self):
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+        self.client.force_login(self.staff)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
@@ -0,0 +1,158 @@
+from unittest import mock
+
+from django.db import connection
+from django.urls import reverse
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_faker_admin.bulk import generate
+from django_faker_admin.conf import settings
+from django_faker_admin.pagination import (
+    ApproximateCountChangeList, ApproximateCountPaginator, get_approximate_count, get_cached_count, get_count_cache,
+    get_estimated_count, invalidate_counts
+)
+from django_faker_admin import FakerModelAdminMixin
+from django_faker_admin.purge import purge
+
+from tests.testapp.models import TestCustomerModel, TestOrderModel
+from tests.testapp.factory import TestOrderModelFactory
+
+
+User = get_user_model()
+
+
+class TitledChangeList(ChangeList):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.title = 'Titled orders'
+
+
+class TitledOrderModelAdmin(admin.ModelAdmin):
+
+    def get_changelist(self, request, **kwargs):
+        return TitledChangeList
+
+
+class ApproximateTitledOrderModelAdmin(FakerModelAdminMixin, TitledOrderModelAdmin):
+    factory_class = TestOrderModelFactory
+    faker_approximate_count = True
+
+
+class ApproximateCountTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+        cls.url = reverse('admin:testapp_testordermodel_changelist')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def setUp(self):
+        get_count_cache().clear()
+        self.customer = TestCustomerModel.objects.create(name='Customer')
+        self.add_orders(30)
+
+    def add_orders(self, count, status='paid'):
+        TestOrderModel.objects.bulk_create(TestOrderModel(customer=self.customer, status=status) for _ in range(count))
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def test_estimated_count(self):
+        self.assertIsNone(get_estimated_count(TestOrderModel, 'default'))
+
+        self.analyze()
+
+        self.assertEqual(get_estimated_count(TestOrderModel, 'default'), 30)
+
+    def test_cached_count(self):
+        orders = TestOrderModel.objects.all()
+        self.assertEqual(get_cached_count(orders), 30)
+
+        self.add_orders(5, status='new')
+
+        self.assertEqual(get_cached_count(orders), 30)
+        # Every filter has its own count
+        self.assertEqual(get_cached_count(orders.filter(status='new')), 5)
+        self.assertEqual(get_cached_count(orders.none()), 0)
+        invalidate_counts(TestOrderModel, 'default')
+        self.assertEqual(get_cached_count(orders), 35)
+
+    def test_cached_count_expires(self):
+        with mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_COUNT_CACHE_TTL=0):
+            self.assertEqual(get_cached_count(TestOrderModel.objects.all()), 30)
+            self.add_orders(5)
+            self.assertEqual(get_cached_count(TestOrderModel.objects.all()), 35)
+
+    def test_population_runs_invalidate_counts(self):
+        orders = TestOrderModel.objects.all()
+        get_cached_count(orders)
+
+        generate(TestOrderModelFactory, 10, strategy='bulk')
+        self.assertEqual(get_cached_count(orders), 40)
+
+        purge(TestOrderModel)
+        self.assertEqual(get_cached_count(orders), 30)
+
+    def test_estimates_only_count_large_tables(self):
+        self.analyze()
+        self.add_orders(10, status='new')
+        orders = TestOrderModel.objects.all()
+
+        self.assertEqual(get_approximate_count(orders), 40)
+        with mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_ESTIMATED_COUNT_THRESHOLD=20):
+            self.assertEqual(get_approximate_count(orders), 30)
+            self.assertEqual(get_approximate_count(orders.filter(status='new')), 10)
+        with mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_ESTIMATED_COUNT_THRESHOLD=None):
+            self.assertEqual(get_approximate_count(orders), 40)
+
+    def test_paginator(self):
+        self.assertEqual(ApproximateCountPaginator(TestOrderModel.objects.order_by('pk'), 10).num_pages, 3)
+        self.assertEqual(ApproximateCountPaginator(list(range(25)), 10).count, 25)
+
+    def test_change_list_counts_once(self):
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(self.url, {'status__exact': 'paid'})
+        self.assertContains(response, '30 test order models')
+
+        self.add_orders(5)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'status__exact': 'paid'})
+
+        self.assertContains(response, '30 test order models')
+        self.assertFalse([query['sql'] for query in queries.captured_queries if 'COUNT(' in query['sql']])
+
+    def test_change_list_keeps_the_admin_change_list(self):
+        model_admin = ApproximateTitledOrderModelAdmin(TestOrderModel, admin.site)
+        request = RequestFactory().get(self.url)
+        request.user = self.superuser
+
+        changelist = model_admin.get_changelist(request)
+        self.assertTrue(issubclass(changelist, ApproximateCountChangeList))
+        self.assertTrue(issubclass(changelist, TitledChangeList))
+
+        model_admin.get_changelist_instance(request)
+        self.add_orders(5)
+        with CaptureQueriesContext(connection) as queries:
+            changelist = model_admin.get_changelist_instance(request)
+
+        self.assertEqual(changelist.title, 'Titled orders')
+        self.assertEqual(changelist.full_result_count, 30)
+        self.assertFalse([query['sql'] for query in queries.captured_queries if 'COUNT(' in query['sql']])
+
+        model_admin.faker_approximate_count = False
+        self.assertIs(model_admin.get_changelist(request), TitledChangeList)
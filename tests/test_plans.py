@@ -0,0 +1,107 @@
+import factory
+import factory.random
+from django.test import TestCase
+from django.core.management import call_command
+
+from django_faker_admin.bulk import BulkGenerator, generate
+from django_faker_admin.plans import GenerationPlan, compile_plan, get_plan
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory, TestChildModelFactory
+
+
+class SequenceModelFactory(factory.django.DjangoModelFactory):
+    # Reads a field declared after it
+    description = factory.LazyAttribute(lambda o: f"About {o.name}")
+    name = factory.Sequence(lambda n: f"Name {n}")
+
+    class Meta:
+        model = TestModel
+
+
+class PostGenerationModelFactory(factory.django.DjangoModelFactory):
+    name = factory.Faker('name')
+
+    @factory.post_generation
+    def touch(obj, create, extracted, **kwargs):
+        pass
+
+    class Meta:
+        model = TestModel
+
+
+class GenerationPlanTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    def test_compiles_supported_factories(self):
+        plan = compile_plan(TestModelFactory)
+
+        self.assertIsInstance(plan, GenerationPlan)
+        self.assertEqual(list(plan.steps), ['name', 'description'])
+
+    def test_falls_back_for_unsupported_factories(self):
+        self.assertIsNone(compile_plan(TestChildModelFactory))
+        self.assertIsNone(compile_plan(PostGenerationModelFactory))
+
+    def test_plan_is_cached(self):
+        self.assertIs(get_plan(TestModelFactory), get_plan(TestModelFactory))
+
+    def test_builds_the_same_objects_as_the_factory(self):
+        factory.random.reseed_random(7)
+        expected = [(obj.name, obj.description) for obj in TestModelFactory.build_batch(5)]
+
+        factory.random.reseed_random(7)
+        built = [(obj.name, obj.description) for obj in get_plan(TestModelFactory).build(5)]
+
+        self.assertEqual(built, expected)
+
+    def test_follows_the_default_locale(self):
+        plan = get_plan(TestModelFactory)
+
+        with factory.Faker.override_default_locale('ja_JP'):
+            factory.random.reseed_random(7)
+            expected = [obj.name for obj in TestModelFactory.build_batch(3)]
+            factory.random.reseed_random(7)
+            built = [obj.name for obj in plan.build(3)]
+
+        self.assertEqual(built, expected)
+        self.assertNotEqual([obj.name for obj in plan.build(3)], expected)
+
+    def test_sequences_and_lazy_attributes(self):
+        SequenceModelFactory.reset_sequence(0)
+
+        objs = get_plan(SequenceModelFactory).build(2)
+
+        self.assertEqual([obj.name for obj in objs], ['Name 0', 'Name 1'])
+        self.assertEqual(objs[1].description, 'About Name 1')
+        # The factory carries on with the same counter
+        self.assertEqual(SequenceModelFactory.build().name, 'Name 2')
+
+    def test_overrides(self):
+        plan = get_plan(TestModelFactory)
+
+        objs = plan.build(3, {'name': 'Fixed'})
+
+        self.assertEqual({obj.name for obj in objs}, {'Fixed'})
+        self.assertFalse(plan.supports({'name': factory.Faker('name')}))
+
+    def test_create(self):
+        objs = get_plan(TestModelFactory).create(3)
+
+        self.assertTrue(all(obj.pk for obj in objs))
+        self.assertEqual(TestModel.objects.count(), 3)
+
+    def test_used_by_the_bulk_engine(self):
+        self.assertIsNotNone(BulkGenerator(TestModelFactory, size=1).plan)
+        self.assertIsNone(BulkGenerator(TestModelFactory, size=1, overrides={'name': factory.Faker('name')}).plan)
+
+    def test_generate_per_row(self):
+        written = generate(SequenceModelFactory, size=4, strategy='per_row')
+
+        self.assertEqual(written, 4)
+        self.assertEqual(TestModel.objects.filter(description__startswith='About Name').count(), 4)
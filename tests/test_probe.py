@@ -0,0 +1,88 @@
+from io import StringIO
+
+from django.contrib.admin import site
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from django_faker_admin.probe import ProbeResult, probe_changelist, probe_population
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory
+
+
+class ProbeTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+        cls.model_admin = site._registry[TestModel]
+
+    def test_probe_changelist(self):
+        TestModelFactory.create_batch(4)
+
+        result = probe_changelist(self.model_admin, repeat=2)
+
+        self.assertEqual(result.rows, 4)
+        self.assertEqual(len(result.latencies), 2)
+        self.assertGreater(result.query_count, 0)
+        self.assertEqual(len(result.queries), 2 * result.query_count)
+        self.assertIn('testapp_testmodel', ' '.join(sql for _, _, sql in result.queries))
+
+    def test_probe_search(self):
+        TestModelFactory.create_batch(3)
+        TestModelFactory.create(name='Needle')
+
+        result = probe_changelist(self.model_admin, params={'q': 'Needle'}, repeat=1)
+
+        self.assertEqual(result.rows, 1)
+
+    def test_probe_population(self):
+        results = probe_population(self.model_admin, steps=2, step_size=5, repeat=1, seed=1)
+
+        self.assertEqual([result.rows for result in results], [0, 5, 10])
+
+    def test_slowest_queries_are_distinct(self):
+        result = ProbeResult(
+            rows=0, latencies=[1.0], query_count=2,
+            queries=[(0.1, 'default', 'A'), (0.3, 'default', 'A'), (0.2, 'default', 'B')]
+        )
+
+        self.assertEqual(result.get_slowest_queries(), [(0.3, 'default', 'A'), (0.2, 'default', 'B')])
+        self.assertEqual(result.as_dict()['slowest_query'], 'A')
+
+    def test_rejects_invalid_repeat(self):
+        with self.assertRaises(ValueError):
+            probe_changelist(self.model_admin, repeat=0)
+
+    def test_probe_command(self):
+        TestModelFactory.create_batch(2)
+        out = StringIO()
+
+        call_command('faker_probe', 'testapp.TestModel', '--repeat', '1', stdout=out)
+
+        self.assertIn('2 rows:', out.getvalue())
+        self.assertIn('[default]', out.getvalue())
+
+    def test_probe_command_csv_steps(self):
+        out = StringIO()
+
+        call_command(
+            'faker_probe', 'testapp.TestModel', '--steps', '2', '--step-size', '3', '--repeat', '1', '--csv',
+            stdout=out
+        )
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], 'rows,latency_ms,latency_max_ms,queries,slowest_query_ms')
+        self.assertEqual([line.split(',')[0] for line in lines[1:]], ['0', '3', '6'])
+
+    def test_probe_command_invalid_options(self):
+        with self.assertRaises(CommandError):
+            call_command('faker_probe', 'testapp.TestModel', '--steps', '2', stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command('faker_probe', 'testapp.TestModel', '--param', 'q', stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command('faker_probe', 'auth.Group', stdout=StringIO())
@@ -0,0 +1,102 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase
+
+from django_faker_admin.conf import settings
+from django_faker_admin.models import PopulationRun
+from django_faker_admin.profiling import profile_generate
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory
+
+
+User = get_user_model()
+
+
+class ProfilingTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+        cls.url = reverse('admin:testapp_testmodel_populate_dummy_data')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+        cls.orduser = User.objects.create(
+            username='ord', email='b@a.com', password='yyy', is_staff=True
+        )
+        cls.orduser.user_permissions.add(
+            *Permission.objects.filter(content_type=ContentType.objects.get_for_model(TestModel))
+        )
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        patcher = mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_PROFILE_DIR=directory.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_profile_generate(self):
+        written, run, path = profile_generate(TestModelFactory, 10, strategy='bulk', chunk_size=4, seed=1)
+
+        self.assertEqual(written, 10)
+        self.assertEqual(TestModel.objects.count(), 10)
+        self.assertEqual(path.parent, self.directory)
+        self.assertTrue(path.exists())
+        run = PopulationRun.objects.get(pk=run.pk)
+        self.assertEqual(run.status, PopulationRun.Status.FINISHED)
+        self.assertEqual(run.profile_path, str(path))
+        self.assertIn('cumulative', run.profile_stats)
+        self.assertIn('insert_chunk', run.profile_stats)
+
+    def test_profile_field_is_for_superusers(self):
+        self.client.force_login(self.superuser)
+        self.assertContains(self.client.get(self.url), 'name="profile"')
+
+        self.client.force_login(self.orduser)
+        self.assertNotContains(self.client.get(self.url), 'name="profile"')
+
+    def test_profiled_population_redirects_to_the_run(self):
+        self.client.force_login(self.superuser)
+
+        response = self.client.post(self.url, {'size': 5, 'profile': 'on'}, follow=True)
+
+        run = PopulationRun.objects.get()
+        self.assertRedirects(response, reverse('admin:django_faker_admin_populationrun_change', args=(run.pk,)))
+        self.assertContains(response, 'population-run-profile')
+        self.assertContains(response, 'The profile was saved to')
+        self.assertEqual(TestModel.objects.count(), 5)
+        self.assertEqual(len(list(self.directory.glob('*.prof'))), 1)
+
+    def test_ordinary_users_cannot_profile(self):
+        self.client.force_login(self.orduser)
+
+        self.client.post(self.url, {'size': 5, 'profile': 'on'})
+
+        self.assertEqual(TestModel.objects.count(), 5)
+        self.assertEqual(PopulationRun.objects.get().profile_stats, '')
+        self.assertFalse(list(self.directory.glob('*.prof')))
+
+    def test_populate_command_profile(self):
+        out = StringIO()
+
+        call_command('faker_populate', 'testapp.TestModel', '--size', '6', '--profile', stdout=out)
+
+        self.assertIn('cumulative', out.getvalue())
+        self.assertIn('Profile saved to', out.getvalue())
+        self.assertEqual(TestModel.objects.count(), 6)
@@ -0,0 +1,162 @@
+from io import StringIO
+
+from django.urls import reverse_lazy
+from django.contrib.admin import site
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.exceptions import PermissionDenied
+from django.test import RequestFactory, TestCase
+from bs4 import BeautifulSoup
+
+from django_faker_admin.bulk import generate
+from django_faker_admin.purge import purge, iter_windows, can_skip_collection
+from django_faker_admin.tracking import count_generated
+
+from tests.testapp.models import TestModel
+from tests.testapp.admin import TestModelAdmin
+from tests.testapp.factory import TestModelFactory
+
+
+User = get_user_model()
+
+
+class PurgeTestCase(TestCase):
+    factory = RequestFactory()
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+        info = TestModel._meta.app_label, TestModel._meta.model_name
+        cls.list_url = reverse_lazy('admin:%s_%s_changelist' % info)
+        cls.purge_url = reverse_lazy('admin:%s_%s_purge_dummy_data' % info)
+
+        cls.model_admin = TestModelAdmin(TestModel, site)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+        cls.orduser = User.objects.create(
+            username='ord', email='b@a.com', password='yyy', is_staff=True
+        )
+
+    def setUp(self):
+        self.real = TestModel.objects.create(name='Real', description='Not generated')
+        generate(TestModelFactory, size=12, strategy='bulk', chunk_size=5, use_snapshots=False)
+
+    def test_iter_windows(self):
+        self.assertEqual(list(iter_windows([(1, 5), (8, 8)], chunk_size=2)), [(1, 2), (3, 4), (5, 5), (8, 8)])
+
+    def test_can_skip_collection(self):
+        self.assertTrue(can_skip_collection(TestModel))
+        self.assertFalse(can_skip_collection(User))
+
+    def test_purge_keeps_real_rows(self):
+        deleted = purge(TestModel, chunk_size=4)
+
+        self.assertEqual(deleted, 12)
+        self.assertEqual(list(TestModel.objects.all()), [self.real])
+        self.assertEqual(count_generated(TestModel), 0)
+
+    def test_fast_purge_keeps_real_rows(self):
+        deleted = purge(TestModel, chunk_size=4, fast=True)
+
+        self.assertEqual(deleted, 12)
+        self.assertEqual(list(TestModel.objects.all()), [self.real])
+
+    def test_purge_command(self):
+        out = StringIO()
+
+        call_command('faker_purge', 'testapp.TestModel', '--fast', stdout=out)
+
+        self.assertEqual(list(TestModel.objects.all()), [self.real])
+        self.assertIn('12 testapp.TestModel objects', out.getvalue())
+
+    def test_purge_href_exist(self):
+        request = self.factory.get(self.list_url)
+        request.user = self.superuser
+
+        cl = self.model_admin.changelist_view(request=request)
+        cl.render()
+
+        soup = BeautifulSoup(cl.content, 'html.parser')
+        purge_tag = soup.find('a', class_='dummy-data-purge-href')
+
+        self.assertIsNotNone(purge_tag)
+        self.assertEqual(purge_tag['href'], 'purge-dummy-data/')
+
+    def test_purge_view_get(self):
+        request = self.factory.get(self.purge_url)
+        request.user = self.superuser
+
+        response = self.model_admin.faker_purge_view(request=request)
+        response.render()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data['generated_count'], 12)
+
+    def test_purge_view_post(self):
+        request = self.factory.post(self.purge_url, data={'fast': 'on'})
+        request.user = self.superuser
+
+        response = self.model_admin.faker_purge_view(request=request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(list(TestModel.objects.all()), [self.real])
+
+    def test_purge_view_no_perm(self):
+        request = self.factory.post(self.purge_url)
+        request.user = self.orduser
+
+        with self.assertRaises(PermissionDenied):
+            self.model_admin.faker_purge_view(request=request)
+
+        self.assertEqual(TestModel.objects.count(), 13)
+
+
+class PurgeDatabaseTestCase(TestCase):
+    databases = {'default', 'shard1'}
+    factory = RequestFactory()
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+        call_command('migrate', database='shard1', verbosity=0)
+
+        super().setUpClass()
+
+        cls.purge_url = reverse_lazy('admin:testapp_testmodel_purge_dummy_data')
+
+        class ShardModelAdmin(TestModelAdmin):
+            faker_database = 'shard1'
+
+        cls.model_admin = ShardModelAdmin(TestModel, site)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def setUp(self):
+        generate(TestModelFactory, size=6, strategy='bulk', using='shard1', use_snapshots=False)
+        generate(TestModelFactory, size=2, strategy='bulk', use_snapshots=False)
+
+    def test_purge_view_uses_the_admin_database(self):
+        request = self.factory.get(self.purge_url)
+        request.user = self.superuser
+        response = self.model_admin.faker_purge_view(request=request)
+        response.render()
+        self.assertEqual(response.context_data['generated_count'], 6)
+
+        request = self.factory.post(self.purge_url)
+        request.user = self.superuser
+        response = self.model_admin.faker_purge_view(request=request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(TestModel.objects.using('shard1').count(), 0)
+        self.assertEqual(TestModel.objects.count(), 2)
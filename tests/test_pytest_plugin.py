@@ -0,0 +1,91 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.contrib.contenttypes.models import ContentType
+
+from django_faker_admin.pytest_plugin import (
+    DatabaseSnapshotCache, faker_db_cache, get_database_key, populate_database, resolve_populations
+)
+
+from tests.testapp.models import TestModel, TestParentModel
+from tests.testapp.factory import TestModelFactory, TestParentModelFactory
+
+
+@pytest.fixture
+def flushed_db():
+    """
+    Leave an empty database to the test cases that follow.
+    """
+    yield
+    call_command('flush', interactive=False, verbosity=0)
+    ContentType.objects.clear_cache()
+
+
+@pytest.fixture
+def snapshot_cache(tmp_path):
+    return DatabaseSnapshotCache(tmp_path)
+
+
+def get_rows():
+    return (
+        list(TestModel.objects.order_by('pk').values_list('pk', 'name', 'description')),
+        list(TestParentModel.objects.order_by('pk').values_list('pk', 'name')),
+    )
+
+
+def test_miss_then_hit_restores_the_same_rows(flushed_db, snapshot_cache):
+    populations = [(TestModelFactory, 12), ('testapp.TestParentModel', 5)]
+
+    assert populate_database(populations, seed=3, cache=snapshot_cache) is False
+    populated = get_rows()
+    assert (len(populated[0]), len(populated[1])) == (12, 5)
+    assert len(list(snapshot_cache.directory.glob('*.sqlite3'))) == 1
+
+    TestModel.objects.all().delete()
+    TestModelFactory.create()
+
+    assert populate_database(populations, seed=3, cache=snapshot_cache) is True
+    assert get_rows() == populated
+
+
+def test_populate_without_cache(flushed_db):
+    TestModelFactory.create_batch(3)
+
+    assert populate_database([(TestModel, 4)], seed=1) is False
+
+    assert TestModel.objects.count() == 4
+
+
+def test_database_key():
+    populations = resolve_populations([(TestModelFactory, 10)])
+
+    assert resolve_populations([('testapp.TestModel', 10)]) == populations
+    key = get_database_key(populations, seed=0)
+    assert get_database_key(populations, seed=0) == key
+    assert get_database_key(populations, seed=1) != key
+    assert get_database_key(resolve_populations([(TestModelFactory, 11)]), seed=0) != key
+    assert get_database_key(resolve_populations([(TestParentModelFactory, 10)]), seed=0) != key
+
+
+def test_restore_of_unknown_key(snapshot_cache):
+    assert snapshot_cache.restore('missing') is False
+
+
+def test_faker_populate_fixture(flushed_db, faker_populate):
+    faker_populate([(TestParentModelFactory, 7)], seed=2)
+
+    assert TestParentModel.objects.count() == 7
+    assert not TestModel.objects.exists()
+
+
+def test_cache_without_cache_provider():
+    class Config:
+        # As with ``-p no:cacheprovider``: no ``cache`` attribute
+        def getoption(self, name):
+            return None
+
+    cache = faker_db_cache.__wrapped__(Config())
+
+    assert cache.directory == Path(tempfile.gettempdir()) / 'django_faker_admin_databases'
@@ -0,0 +1,76 @@
+import tempfile
+
+from django.test import TestCase
+from django.core.management import call_command
+
+from django_faker_admin.bulk import BulkGenerator
+from django_faker_admin.snapshots import SnapshotCache
+
+from tests.testapp.models import TestModel
+from tests.testapp.factory import TestModelFactory
+
+
+class SnapshotCacheTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = SnapshotCache(directory=self.directory.name, max_size=10 * 1024 * 1024)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_snapshot(self, key, size):
+        generator = BulkGenerator(factory_class=TestModelFactory, size=size, seed=1)
+        with self.cache.writer(key, model=TestModel) as writer:
+            generator.chunk_callbacks.append(writer.write_chunk)
+            generator.run()
+
+    def test_key_depends_on_run(self):
+        key = self.cache.get_key(TestModelFactory, size=10, seed=1)
+
+        self.assertEqual(key, self.cache.get_key(TestModelFactory, size=10, seed=1))
+        self.assertNotEqual(key, self.cache.get_key(TestModelFactory, size=10, seed=2))
+        self.assertNotEqual(key, self.cache.get_key(TestModelFactory, size=11, seed=1))
+        self.assertNotEqual(key, self.cache.get_key(TestModelFactory, size=10, seed=1, overrides={'name': 'A'}))
+
+    def test_supports_plain_factory(self):
+        self.assertTrue(self.cache.supports(TestModelFactory))
+
+    def test_write_and_load(self):
+        key = self.cache.get_key(TestModelFactory, size=5, seed=1)
+        self.write_snapshot(key, size=5)
+        generated = list(TestModel.objects.order_by('pk').values_list('name', 'description'))
+
+        self.assertTrue(self.cache.has(key))
+
+        TestModel.objects.all().delete()
+        written = self.cache.load(key, model=TestModel, using='default', chunk_size=2)
+
+        self.assertEqual(written, 5)
+        self.assertEqual(list(TestModel.objects.order_by('pk').values_list('name', 'description')), generated)
+
+    def test_failed_run_leaves_no_snapshot(self):
+        key = self.cache.get_key(TestModelFactory, size=5, seed=1)
+
+        with self.assertRaises(RuntimeError):
+            with self.cache.writer(key, model=TestModel):
+                raise RuntimeError
+
+        self.assertFalse(self.cache.has(key))
+        self.assertEqual(list(self.cache.directory.iterdir()), [])
+
+    def test_evict_removes_oldest_snapshots(self):
+        self.write_snapshot('old', size=50)
+        self.write_snapshot('new', size=50)
+        self.cache.max_size = self.cache.get_path('new').stat().st_size
+
+        removed = self.cache.evict()
+
+        self.assertEqual(removed, [self.cache.get_path('old')])
+        self.assertTrue(self.cache.has('new'))
@@ -0,0 +1,233 @@
+import random
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from django_faker_admin.bulk import generate, resume
+from django_faker_admin.models import PopulationRun
+from django_faker_admin.timeseries import TimeSeries, get_timestamp_fields, normalize_time_series
+
+from tests.testapp.models import TestModel, TestOrderModel
+from tests.testapp.factory import TestModelFactory, TestOrderModelFactory
+
+from tests.test_checkpoints import interrupt_after
+
+
+User = get_user_model()
+
+START = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+END = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class TimeSeriesTestCase(TestCase):
+
+    def get_timestamps(self, curve, size=2000, start=START, end=END):
+        time_series = TimeSeries(TestOrderModel, {'start': start, 'end': end, 'curve': curve}, size)
+        randgen = random.Random(0)
+        return [time_series.get_timestamp(position, randgen) for position in range(size)]
+
+    def test_timestamps_increase_within_the_range(self):
+        for curve in ('constant', 'linear', 'exponential', 'daily'):
+            timestamps = self.get_timestamps(curve)
+
+            self.assertEqual(timestamps, sorted(timestamps), curve)
+            self.assertGreaterEqual(timestamps[0], START)
+            self.assertLessEqual(timestamps[-1], END)
+
+    def test_curves(self):
+        middle = START + (END - START) / 2
+
+        def share_of_first_half(timestamps):
+            return sum(timestamp < middle for timestamp in timestamps) / len(timestamps)
+
+        self.assertAlmostEqual(share_of_first_half(self.get_timestamps('constant')), 0.5, delta=0.01)
+        # From a rate of 1 to 10: the first half holds 1.625 out of 5.5
+        self.assertAlmostEqual(share_of_first_half(self.get_timestamps('linear')), 1.625 / 5.5, delta=0.01)
+        self.assertLess(share_of_first_half(self.get_timestamps('exponential')), 0.3)
+        daytime = [timestamp for timestamp in self.get_timestamps('daily') if 9 <= timestamp.hour < 19]
+        self.assertGreater(len(daytime), 0.7 * 2000)
+
+    def test_normalize(self):
+        self.assertEqual(normalize_time_series({'start': '2024-01-01', 'end': '2024-02-01T12:00'}), {
+            'start': '2024-01-01T00:00:00+00:00',
+            'end': '2024-02-01T12:00:00+00:00',
+            'curve': 'constant',
+            'growth': 10.0,
+            'fields': None,
+        })
+        for time_series in (
+            {'start': '2024-01-01'},
+            {'start': '2024-02-01', 'end': '2024-01-01'},
+            {'start': 'yesterday', 'end': '2024-01-01'},
+            {'start': '2024-01-01', 'end': '2024-02-01', 'curve': 'weekly'},
+            {'start': '2024-01-01', 'end': '2024-02-01', 'growth': -1},
+        ):
+            with self.assertRaises(ValueError):
+                normalize_time_series(time_series)
+
+    def test_timestamp_fields(self):
+        self.assertEqual(
+            [field.name for field in get_timestamp_fields(TestOrderModel)], ['created_at', 'updated_at']
+        )
+        self.assertEqual(get_timestamp_fields(TestModel), [])
+        with self.assertRaises(ValueError):
+            get_timestamp_fields(TestOrderModel, ['status'])
+        with self.assertRaises(ValueError):
+            TimeSeries(TestModel, {'start': START, 'end': END}, 10)
+
+    def test_overlapping_runs_turn_auto_now_off_for_their_thread(self):
+        field = TestOrderModel._meta.get_field('created_at')
+        order = TestOrderModel(created_at=START)
+        first, second = (
+            TimeSeries(TestOrderModel, {'start': START, 'end': END}, 10).disable_auto_now() for _ in range(2)
+        )
+
+        first.__enter__()
+        second.__enter__()
+        first.__exit__(None, None, None)
+        # The fields stay off for the run still going, but only in its thread, and their flags are untouched
+        self.assertEqual(field.pre_save(order, True), START)
+        self.assertTrue(field.auto_now_add)
+        values = []
+        thread = threading.Thread(target=lambda: values.append(field.pre_save(TestOrderModel(), True)))
+        thread.start()
+        thread.join()
+        self.assertGreater(values[0], END)
+        second.__exit__(None, None, None)
+        self.assertGreater(field.pre_save(order, True), END)
+
+
+class TimeSeriesGenerationTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+        cls.url = reverse('admin:testapp_testordermodel_populate_dummy_data')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def assertInTimeOrder(self, start=START, end=END):
+        rows = list(TestOrderModel.objects.order_by('pk').values_list('created_at', 'updated_at'))
+        created = [created_at for created_at, _ in rows]
+        self.assertEqual(created, sorted(created))
+        self.assertTrue(all(start <= created_at <= end for created_at in created))
+        self.assertTrue(all(created_at == updated_at for created_at, updated_at in rows))
+
+    def test_generate_overrides_auto_now(self):
+        written = generate(
+            TestOrderModelFactory, 300, seed=1, strategy='bulk', chunk_size=40, writers=4,
+            time_series={'start': START, 'end': END, 'curve': 'linear'}
+        )
+
+        self.assertEqual(written, 300)
+        self.assertInTimeOrder()
+        self.assertEqual(PopulationRun.objects.get().options['time_series'], {
+            'start': START.isoformat(), 'end': END.isoformat(), 'curve': 'linear', 'growth': 10.0, 'fields': None,
+        })
+        # auto_now_add is back once the run is over
+        order = TestOrderModelFactory()
+        self.assertGreater(order.created_at, END)
+
+    def test_explicit_fields(self):
+        generate(
+            TestOrderModelFactory, 20, strategy='bulk',
+            time_series={'start': '2020-01-01', 'end': '2020-01-02', 'fields': ['created_at']}
+        )
+
+        created_at, updated_at = TestOrderModel.objects.values_list('created_at', 'updated_at').first()
+        self.assertEqual(created_at.date().isoformat(), '2020-01-01')
+        # Left to auto_now
+        self.assertGreater(updated_at, END)
+
+    def test_interrupted_run_resumes_in_time_order(self):
+        with interrupt_after(2), self.assertRaises(RuntimeError):
+            generate(
+                TestOrderModelFactory, 50, seed=2, strategy='bulk', chunk_size=10,
+                time_series={'start': START, 'end': END, 'curve': 'exponential'}
+            )
+        self.assertEqual(TestOrderModel.objects.count(), 20)
+
+        self.assertEqual(resume(PopulationRun.objects.get()), 50)
+        self.assertInTimeOrder()
+        # The resumed rows carry on from the committed ones, up to the end of the range
+        self.assertGreater(TestOrderModel.objects.latest('pk').created_at, END - timedelta(days=30))
+
+    def test_invalid_time_series(self):
+        with self.assertRaises(ValueError):
+            generate(TestOrderModelFactory, 5, strategy='per_row', time_series={'start': START, 'end': END})
+        with self.assertRaises(ValueError):
+            generate(TestModelFactory, 5, strategy='bulk', time_series={'start': START, 'end': END})
+        self.assertFalse(PopulationRun.objects.exists())
+
+    def test_populate_form(self):
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(self.url)
+        self.assertContains(response, 'name="time_series_curve"')
+
+        response = self.client.post(self.url, {
+            'size': 30,
+            'time_series_curve': 'daily',
+            'time_series_start': '2024-01-01 00:00',
+            'time_series_end': '2024-12-31 00:00',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(TestOrderModel.objects.count(), 30)
+        self.assertInTimeOrder(end=datetime(2024, 12, 31, tzinfo=dt_timezone.utc))
+        self.assertEqual(PopulationRun.objects.get().options['time_series']['curve'], 'daily')
+
+    def test_populate_form_without_time_series(self):
+        self.client.force_login(self.superuser)
+
+        self.client.post(self.url, {'size': 5, 'time_series_start': '2024-01-01 00:00'})
+
+        self.assertGreater(TestOrderModel.objects.earliest('pk').created_at, END)
+        self.assertIsNone(PopulationRun.objects.get().options['time_series'])
+
+    def test_populate_form_errors(self):
+        self.client.force_login(self.superuser)
+
+        response = self.client.post(self.url, {'size': 5, 'time_series_curve': 'linear'})
+
+        self.assertContains(response, 'A time series needs the start and the end of its date range.')
+        self.assertFalse(TestOrderModel.objects.exists())
+
+    def test_per_row_populate_form_has_no_time_series(self):
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(reverse('admin:testapp_testchildmodel_populate_dummy_data'))
+
+        self.assertNotContains(response, 'time_series_curve')
+
+    def test_populate_command(self):
+        out = StringIO()
+
+        call_command(
+            'faker_populate', 'testapp.TestOrderModel', '--size', '25', '--time-series', '2024-01-01', '2025-01-01',
+            '--curve', 'exponential', '--growth', '3', stdout=out
+        )
+
+        self.assertIn('25 testapp.TestOrderModel objects', out.getvalue())
+        self.assertInTimeOrder()
+        self.assertEqual(PopulationRun.objects.get().options['time_series']['growth'], 3.0)
+        with self.assertRaises(CommandError):
+            call_command(
+                'faker_populate', 'testapp.TestOrderModel', '--size', '5', '--time-series', '2025-01-01', '2024-01-01'
+            )
+        with self.assertRaises(CommandError):
+            call_command(
+                'faker_populate', 'testapp.TestOrderModel', '--size', '5', '--strategy', 'per_row',
+                '--time-series', '2024-01-01', '2025-01-01'
+            )
@@ -0,0 +1,89 @@
+from django.urls import reverse_lazy
+from django.contrib.admin import site
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase
+
+from django_faker_admin.bulk import generate
+from django_faker_admin.filters import GeneratedListFilter
+from django_faker_admin.tracking import (
+    to_ranges, compact_ranges, count_generated, generated_condition, get_generated_ranges, start_run
+)
+
+from tests.testapp.models import TestModel
+from tests.testapp.admin import TestModelAdmin
+from tests.testapp.factory import TestModelFactory
+
+
+User = get_user_model()
+
+
+class TrackingTestCase(TestCase):
+    factory = RequestFactory()
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate')
+
+        super().setUpClass()
+
+        info = TestModel._meta.app_label, TestModel._meta.model_name
+        cls.list_url = reverse_lazy('admin:%s_%s_changelist' % info)
+
+        cls.model_admin = TestModelAdmin(TestModel, site)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="super", email="a@b.com", password="xxx"
+        )
+
+    def test_to_ranges(self):
+        self.assertEqual(to_ranges([5, 1, 2, 3, 7, 8]), [(1, 3), (5, 5), (7, 8)])
+        self.assertEqual(to_ranges([]), [])
+
+    def test_bulk_run_is_stored_as_one_range(self):
+        generate(TestModelFactory, size=25, strategy='bulk', chunk_size=4, use_snapshots=False)
+
+        ranges = get_generated_ranges(TestModel)
+
+        self.assertEqual(ranges.count(), 1)
+        self.assertEqual(count_generated(TestModel), 25)
+
+    def test_compact_ranges(self):
+        run, _ = start_run(TestModel, size=9, strategy='bulk')
+        for start, end in ((7, 9), (1, 3), (11, 12), (4, 6)):
+            run.ranges.create(content_type_id=run.content_type_id, start_pk=start, end_pk=end)
+
+        self.assertEqual(compact_ranges(run), 2)
+        self.assertEqual(list(get_generated_ranges(TestModel).values_list('start_pk', 'end_pk')), [(1, 9), (11, 12)])
+        self.assertEqual(compact_ranges(run), 0)
+
+    def test_per_row_run_is_tracked(self):
+        generate(TestModelFactory, size=3, strategy='per_row')
+
+        self.assertEqual(count_generated(TestModel), 3)
+
+    def test_generated_condition(self):
+        real = TestModel.objects.create(name='Real', description='Not generated')
+        generate(TestModelFactory, size=5, strategy='bulk', use_snapshots=False)
+
+        self.assertEqual(TestModel.objects.filter(generated_condition(TestModel)).count(), 5)
+        self.assertEqual(list(TestModel.objects.exclude(generated_condition(TestModel))), [real])
+
+    def test_list_filter(self):
+        TestModel.objects.create(name='Real', description='Not generated')
+        generate(TestModelFactory, size=5, strategy='bulk', use_snapshots=False)
+
+        request = self.factory.get(self.list_url)
+        request.user = self.superuser
+        self.assertIn(GeneratedListFilter, self.model_admin.get_list_filter(request))
+
+        for value, expected in (('yes', 5), ('no', 1)):
+            request = self.factory.get(self.list_url, {'generated': value})
+            request.user = self.superuser
+
+            response = self.model_admin.changelist_view(request=request)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.context_data['cl'].result_count, expected)
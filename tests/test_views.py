@@ -1,4 +1,7 @@
+from unittest import mock
+
 from django.urls import reverse_lazy
+from django.contrib.admin import widgets
 from django.contrib.admin import site
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
@@ -8,11 +11,12 @@ from django.core.exceptions import PermissionDenied
 from django.test import RequestFactory, TestCase
 
 from django_faker_admin.conf import settings
+from django_faker_admin.models import PopulationRun
 from django_faker_admin.views import FakerAdminView
 
-from tests.testapp.models import TestModel
-from tests.testapp.admin import TestModelAdmin
-from tests.testapp.factory import TestModelFactory
+from tests.testapp.models import TestModel, TestParentModel, TestChildModel, TestFlagModel
+from tests.testapp.admin import TestModelAdmin, TestChildModelAdmin, TestFlagModelAdmin
+from tests.testapp.factory import TestModelFactory, TestChildModelFactory, TestFlagModelFactory
 
 
 User = get_user_model()
@@ -304,3 +308,117 @@ class FakerAdminViewTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn('form', response.context_data)
         self.assertIn('size', response.context_data['form'].fields)
+
+    def test_databases_field(self):
+        view = FakerAdminView(model_admin=self.model_admin, factory_class=TestModelFactory, database='shard1')
+
+        form = view.get_form_class()()
+
+        self.assertEqual(list(form.fields)[:3], ['size', 'seed', 'databases'])
+        self.assertIn(('shard2', 'shard2'), form.fields['databases'].choices)
+        self.assertEqual(form.fields['databases'].initial, ['shard1'])
+
+    def test_bulk_strategy_creates_objects(self):
+        view = FakerAdminView.as_view(
+            model_admin=self.model_admin,
+            factory_class=TestModelFactory,
+            strategy='bulk'
+        )
+
+        request = self.factory.post('/', data={'size': 4, 'name': 'Bulk Test'})
+        request.user = self.superuser
+
+        response = view(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(TestModel.objects.filter(name='Bulk Test').count(), 4)
+
+    def test_seed_zero_is_kept(self):
+        view = FakerAdminView.as_view(
+            model_admin=self.model_admin,
+            factory_class=TestModelFactory,
+            strategy='bulk'
+        )
+
+        request = self.factory.post('/', data={'size': 2, 'seed': 0})
+        request.user = self.superuser
+
+        view(request)
+
+        self.assertEqual(PopulationRun.objects.get().seed, 0)
+
+    def test_untouched_boolean_is_left_to_the_factory(self):
+        flag_admin = TestFlagModelAdmin(TestFlagModel, site)
+        view = FakerAdminView.as_view(model_admin=flag_admin, factory_class=TestFlagModelFactory)
+
+        # The unchecked checkbox cleans to False, the initial value of the field, while the factory sets True
+        request = self.factory.post('/', data={'size': 2})
+        request.user = self.superuser
+        view(request)
+
+        self.assertEqual(list(TestFlagModel.objects.values_list('active', flat=True)), [True, True])
+
+    def get_child_form(self, child_admin=None):
+        view = FakerAdminView(
+            model_admin=child_admin or TestChildModelAdmin(TestChildModel, site),
+            factory_class=TestChildModelFactory
+        )
+        view.request = self.factory.get('/')
+        view.request.user = self.superuser
+        return view.get_form_class()()
+
+    def test_small_relation_uses_select(self):
+        TestParentModel.objects.create(name='Parent')
+
+        form = self.get_child_form()
+
+        self.assertIsInstance(form.fields['parent'].widget.widget, widgets.forms.Select)
+        self.assertNotIsInstance(form.fields['parent'].widget.widget, widgets.AutocompleteSelect)
+
+    def test_large_relation_uses_autocomplete(self):
+        TestParentModel.objects.bulk_create(TestParentModel(name=f'Parent {i}') for i in range(3))
+
+        with mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_RELATION_WIDGET_THRESHOLD=2):
+            form = self.get_child_form()
+
+        self.assertIsInstance(form.fields['parent'].widget.widget, widgets.AutocompleteSelect)
+
+    def test_raw_id_fields_are_honored(self):
+        child_admin = TestChildModelAdmin(TestChildModel, site)
+        child_admin.raw_id_fields = ('parent',)
+
+        form = self.get_child_form(child_admin)
+
+        self.assertIsInstance(form.fields['parent'].widget, widgets.ForeignKeyRawIdWidget)
+
+
+class FakerAdminViewDatabaseTestCase(TestCase):
+    databases = {'default', 'shard1'}
+    factory = RequestFactory()
+
+    @classmethod
+    def setUpClass(cls):
+        for alias in sorted(cls.databases):
+            call_command('migrate', database=alias, verbosity=0)
+
+        super().setUpClass()
+
+    def get_child_form(self, request, **kwargs):
+        view = FakerAdminView(
+            model_admin=TestChildModelAdmin(TestChildModel, site), factory_class=TestChildModelFactory, **kwargs
+        )
+        view.request = request
+        view.request.user = User(is_superuser=True)
+        return view.get_form_class()()
+
+    def test_large_relation_is_counted_on_the_target_database(self):
+        TestParentModel.objects.using('shard1').bulk_create(TestParentModel(name=f'Parent {i}') for i in range(3))
+
+        with mock.patch.dict(settings.explicit_overridden_settings, FAKER_ADMIN_RELATION_WIDGET_THRESHOLD=2):
+            default_form = self.get_child_form(self.factory.get('/'))
+            view_form = self.get_child_form(self.factory.get('/'), database='shard1')
+            selected_form = self.get_child_form(self.factory.post('/', {'databases': ['shard1']}))
+
+        self.assertNotIsInstance(default_form.fields['parent'].widget.widget, widgets.AutocompleteSelect)
+        self.assertIsInstance(view_form.fields['parent'].widget.widget, widgets.AutocompleteSelect)
+        self.assertIsInstance(selected_form.fields['parent'].widget.widget, widgets.AutocompleteSelect)
@@ -0,0 +1,123 @@
+import threading
+
+from django.db import connections
+from django.test import SimpleTestCase, TransactionTestCase
+from django.core.management import call_command
+from django.contrib.contenttypes.models import ContentType
+
+from django_faker_admin.bulk import BulkGenerator, generate
+from django_faker_admin.tracking import count_generated, get_generated_ranges, to_ranges
+from django_faker_admin.writers import WriterPool
+
+from tests.testapp.models import TestModel, TestTag, TestParentModel, TestChildModel
+from tests.testapp.factory import TestModelFactory, TestChildModelFactory
+
+
+class WriterPoolTestCase(SimpleTestCase):
+
+    def test_writes_every_chunk(self):
+        written = []
+        lock = threading.Lock()
+
+        def write(chunk):
+            with lock:
+                written.extend(chunk)
+
+        with WriterPool(write, workers=3, max_pending=2) as pool:
+            for index in range(10):
+                pool.submit([index])
+
+        self.assertEqual(sorted(written), list(range(10)))
+        self.assertEqual(pool.threads, [])
+
+    def test_uses_worker_threads(self):
+        names = set()
+
+        with WriterPool(lambda chunk: names.add(threading.current_thread().name), workers=2) as pool:
+            for index in range(4):
+                pool.submit([index])
+
+        self.assertTrue(names)
+        self.assertNotIn(threading.current_thread().name, names)
+
+    def test_surfaces_worker_errors(self):
+        def write(chunk):
+            raise RuntimeError("Boom")
+
+        with self.assertRaisesMessage(RuntimeError, "Boom"):
+            with WriterPool(write, workers=2) as pool:
+                for index in range(20):
+                    pool.submit([index])
+
+        self.assertEqual(pool.threads, [])
+
+    def test_requires_a_worker(self):
+        with self.assertRaises(ValueError):
+            WriterPool(lambda chunk: None, workers=0)
+
+
+class ParallelWritersTestCase(TransactionTestCase):
+    # A file-backed SQLite database in WAL mode, see the test settings
+    databases = {'shard1'}
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate', database='shard1', verbosity=0)
+
+        super().setUpClass()
+
+    def setUp(self):
+        ContentType.objects.clear_cache()
+
+    def test_database_is_in_wal_mode(self):
+        with connections['shard1'].cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            self.assertEqual(cursor.fetchone()[0], 'wal')
+
+    def test_run_with_writers(self):
+        generator = BulkGenerator(TestModelFactory, size=40, chunk_size=5, using='shard1', writers=4)
+
+        written = generator.run()
+
+        self.assertEqual(written, 40)
+        self.assertEqual(TestModel.objects.using('shard1').count(), 40)
+
+    def test_generate_with_writers_is_tracked(self):
+        generate(
+            TestModelFactory, size=30, strategy='bulk', chunk_size=3, using='shard1', use_snapshots=False, writers=3
+        )
+
+        pks = set(TestModel.objects.using('shard1').values_list('pk', flat=True))
+        tracked = set()
+        for start, end in get_generated_ranges(TestModel, 'shard1').values_list('start_pk', 'end_pk'):
+            tracked.update(range(start, end + 1))
+
+        self.assertEqual(tracked, pks)
+        self.assertEqual(count_generated(TestModel, using='shard1'), 30)
+        # Adjacent chunks of different writers are merged once the run is over
+        self.assertEqual(get_generated_ranges(TestModel, 'shard1').count(), len(to_ranges(pks)))
+
+    def test_seeded_run_with_writers_and_m2m_is_reproducible(self):
+        TestTag.objects.using('shard1').bulk_create(TestTag(name=f'Tag {i}') for i in range(20))
+        parent = TestParentModel.objects.using('shard1').create(name='Parent')
+        children = TestChildModel.objects.using('shard1')
+
+        def get_links():
+            return sorted(
+                (child.name, tuple(sorted(tag.name for tag in child.tags.all())))
+                for child in children.prefetch_related('tags')
+            )
+
+        def run():
+            BulkGenerator(
+                TestChildModelFactory, size=60, seed=5, chunk_size=5, using='shard1', writers=4,
+                m2m_fan_out={'tags': (1, 5)}, samplers={'parent_id': lambda randgen, value: parent.pk}
+            ).run()
+
+        run()
+        first = get_links()
+        children.all().delete()
+        run()
+
+        self.assertEqual(len(first), 60)
+        self.assertEqual(get_links(), first)
@@ -1,8 +1,10 @@
 from django.contrib import admin
 from django_faker_admin import FakerModelAdminMixin
 
-from .models import TestModel
-from .factory import TestModelFactory
+from .models import TestModel, TestParentModel, TestChildModel, TestFlagModel, TestOrderModel
+from .factory import (
+    TestModelFactory, TestParentModelFactory, TestChildModelFactory, TestFlagModelFactory, TestOrderModelFactory
+)
 
 
 @admin.register(TestModel)
@@ -10,3 +12,31 @@ class TestModelAdmin(FakerModelAdminMixin, admin.ModelAdmin):
     factory_class = TestModelFactory
     list_display = ('id', 'name', 'description')
     search_fields = ('name', 'description')
+
+
+@admin.register(TestParentModel)
+class TestParentModelAdmin(FakerModelAdminMixin, admin.ModelAdmin):
+    factory_class = TestParentModelFactory
+    search_fields = ('name',)
+
+
+@admin.register(TestChildModel)
+class TestChildModelAdmin(FakerModelAdminMixin, admin.ModelAdmin):
+    factory_class = TestChildModelFactory
+    list_display = ('id', 'name', 'parent')
+
+
+@admin.register(TestFlagModel)
+class TestFlagModelAdmin(FakerModelAdminMixin, admin.ModelAdmin):
+    factory_class = TestFlagModelFactory
+    list_display = ('id', 'name', 'active')
+
+
+@admin.register(TestOrderModel)
+class TestOrderModelAdmin(FakerModelAdminMixin, admin.ModelAdmin):
+    factory_class = TestOrderModelFactory
+    faker_strategy = 'bulk'
+    faker_distributions = {'status': {'kind': 'zipf', 'exponent': 1.5}}
+    raw_id_fields = ('customer',)
+    faker_approximate_count = True
+    list_display = ('id', 'customer', 'status', 'created_at')
@@ -1,6 +1,6 @@
 import factory
 
-from .models import TestModel
+from .models import TestModel, TestParentModel, TestChildModel, TestFlagModel, TestCustomerModel, TestOrderModel
 
 
 class TestModelFactory(factory.django.DjangoModelFactory):
@@ -9,3 +9,41 @@ class TestModelFactory(factory.django.DjangoModelFactory):
 
     class Meta:
         model = TestModel
+
+
+class TestParentModelFactory(factory.django.DjangoModelFactory):
+    name = factory.Faker('company')
+
+    class Meta:
+        model = TestParentModel
+
+
+class TestChildModelFactory(factory.django.DjangoModelFactory):
+    name = factory.Faker('name')
+    parent = factory.SubFactory(TestParentModelFactory)
+
+    class Meta:
+        model = TestChildModel
+
+
+class TestFlagModelFactory(factory.django.DjangoModelFactory):
+    name = factory.Faker('name')
+    active = True
+
+    class Meta:
+        model = TestFlagModel
+
+
+class TestCustomerModelFactory(factory.django.DjangoModelFactory):
+    name = factory.Faker('name')
+
+    class Meta:
+        model = TestCustomerModel
+
+
+class TestOrderModelFactory(factory.django.DjangoModelFactory):
+    customer = factory.SubFactory(TestCustomerModelFactory)
+    status = factory.Faker('random_element', elements=[value for value, _ in TestOrderModel.Status.choices])
+
+    class Meta:
+        model = TestOrderModel
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-19 02:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testapp', '0002_testparentmodel_testchildmodel'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TestTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='testchildmodel',
+            name='tags',
+            field=models.ManyToManyField(blank=True, related_name='children', to='testapp.testtag'),
+        ),
+    ]
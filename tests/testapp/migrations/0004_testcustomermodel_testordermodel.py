@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-19 03:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testapp', '0003_testtag_testchildmodel_tags'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TestCustomerModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TestOrderModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('new', 'New'), ('paid', 'Paid'), ('shipped', 'Shipped'), ('refunded', 'Refunded')], default='new', max_length=20)),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='orders', to='testapp.testcustomermodel')),
+            ],
+        ),
+    ]
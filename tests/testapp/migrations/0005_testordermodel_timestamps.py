@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-19 04:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testapp', '0004_testcustomermodel_testordermodel'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testordermodel',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='testordermodel',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-19 03:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testapp', '0005_testordermodel_timestamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TestFlagModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('active', models.BooleanField(default=False)),
+            ],
+        ),
+    ]
@@ -7,3 +7,58 @@ class TestModel(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class TestParentModel(models.Model):
+    name = models.CharField(max_length=100)
+
+    def __str__(self):
+        return self.name
+
+
+class TestTag(models.Model):
+    name = models.CharField(max_length=50)
+
+    def __str__(self):
+        return self.name
+
+
+class TestChildModel(models.Model):
+    name = models.CharField(max_length=100)
+    parent = models.ForeignKey(TestParentModel, on_delete=models.CASCADE, related_name='children')
+    tags = models.ManyToManyField(TestTag, blank=True, related_name='children')
+
+    def __str__(self):
+        return self.name
+
+
+class TestFlagModel(models.Model):
+    name = models.CharField(max_length=100)
+    active = models.BooleanField(default=False)
+
+    def __str__(self):
+        return self.name
+
+
+class TestCustomerModel(models.Model):
+    name = models.CharField(max_length=100)
+
+    def __str__(self):
+        return self.name
+
+
+class TestOrderModel(models.Model):
+
+    class Status(models.TextChoices):
+        NEW = 'new', 'New'
+        PAID = 'paid', 'Paid'
+        SHIPPED = 'shipped', 'Shipped'
+        REFUNDED = 'refunded', 'Refunded'
+
+    customer = models.ForeignKey(TestCustomerModel, on_delete=models.CASCADE, related_name='orders')
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.NEW)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'{self.customer} {self.status}'
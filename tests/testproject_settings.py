@@ -78,7 +78,21 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    },
+    'shard1': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db_shard1.sqlite3',
+        # Concurrent writer threads need WAL mode and write transactions that take the lock up-front
+        'OPTIONS': {
+            'init_command': 'PRAGMA journal_mode=WAL;',
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
+    },
+    'shard2': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db_shard2.sqlite3',
+    },
 }
 
 